@@ -0,0 +1,110 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * 
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 0.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+
+import * as runtime from '../runtime';
+import type {
+  ReportJob,
+  ReportJobRequest,
+} from '../models/index';
+import {
+    ReportJobFromJSON,
+    ReportJobToJSON,
+    ReportJobRequestFromJSON,
+    ReportJobRequestToJSON,
+} from '../models/index';
+
+export interface CoreReportJobsCreateRequest {
+    reportJobRequest: ReportJobRequest;
+}
+
+export interface CoreReportJobsRetrieveRequest {
+    id: number;
+}
+
+/**
+ * 
+ */
+export class CoreApi extends runtime.BaseAPI {
+
+    /**
+     * Verify that the current user is authenticated.
+     */
+    async coreReportJobsCreateRaw(requestParameters: CoreReportJobsCreateRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<ReportJob>> {
+        if (requestParameters['reportJobRequest'] == null) {
+            throw new runtime.RequiredError(
+                'reportJobRequest',
+                'Required parameter "reportJobRequest" was null or undefined when calling coreReportJobsCreate().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+        const response = await this.request({
+            path: `/core/report_jobs`,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: ReportJobRequestToJSON(requestParameters['reportJobRequest']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => ReportJobFromJSON(jsonValue));
+    }
+
+    /**
+     * Verify that the current user is authenticated.
+     */
+    async coreReportJobsCreate(requestParameters: CoreReportJobsCreateRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<ReportJob> {
+        const response = await this.coreReportJobsCreateRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * Verify that the current user is authenticated.
+     */
+    async coreReportJobsRetrieveRaw(requestParameters: CoreReportJobsRetrieveRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<ReportJob>> {
+        if (requestParameters['id'] == null) {
+            throw new runtime.RequiredError(
+                'id',
+                'Required parameter "id" was null or undefined when calling coreReportJobsRetrieve().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        const response = await this.request({
+            path: `/core/report_jobs/{id}`.replace(`{${"id"}}`, encodeURIComponent(String(requestParameters['id']))),
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => ReportJobFromJSON(jsonValue));
+    }
+
+    /**
+     * Verify that the current user is authenticated.
+     */
+    async coreReportJobsRetrieve(requestParameters: CoreReportJobsRetrieveRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<ReportJob> {
+        const response = await this.coreReportJobsRetrieveRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+}
@@ -18,6 +18,7 @@ import type {
   Column,
   DatapointExport,
   Dataset,
+  DatasetGraphSeriesPoint,
 } from '../models/index';
 import {
     ColumnFromJSON,
@@ -26,6 +27,8 @@ import {
     DatapointExportToJSON,
     DatasetFromJSON,
     DatasetToJSON,
+    DatasetGraphSeriesPointFromJSON,
+    DatasetGraphSeriesPointToJSON,
 } from '../models/index';
 
 export interface StatisticsAvailableDatasetsListRequest {
@@ -36,6 +39,7 @@ export interface StatisticsExportDatasetListRequest {
     atDate: Date;
     dataset: string;
     exportColumns: Array<string>;
+    outputFormat?: StatisticsExportDatasetListOutputFormatEnum;
 }
 
 export interface StatisticsGraphPointRetrieveRequest {
@@ -44,6 +48,12 @@ export interface StatisticsGraphPointRetrieveRequest {
     relative: boolean;
 }
 
+export interface StatisticsGraphSeriesListRequest {
+    dataset: string;
+    dates: Array<Date>;
+    relative: boolean;
+}
+
 /**
  * 
  */
@@ -177,6 +187,10 @@ export class StatisticsApi extends runtime.BaseAPI {
             queryParameters['export_columns'] = requestParameters['exportColumns'];
         }
 
+        if (requestParameters['outputFormat'] != null) {
+            queryParameters['output_format'] = requestParameters['outputFormat'];
+        }
+
         const headerParameters: runtime.HTTPHeaders = {};
 
         const response = await this.request({
@@ -260,4 +274,73 @@ export class StatisticsApi extends runtime.BaseAPI {
         return await response.value();
     }
 
+    /**
+     * Verify that the current user is authenticated.
+     */
+    async statisticsGraphSeriesListRaw(requestParameters: StatisticsGraphSeriesListRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<Array<DatasetGraphSeriesPoint>>> {
+        if (requestParameters['dataset'] == null) {
+            throw new runtime.RequiredError(
+                'dataset',
+                'Required parameter "dataset" was null or undefined when calling statisticsGraphSeriesList().'
+            );
+        }
+
+        if (requestParameters['dates'] == null) {
+            throw new runtime.RequiredError(
+                'dates',
+                'Required parameter "dates" was null or undefined when calling statisticsGraphSeriesList().'
+            );
+        }
+
+        if (requestParameters['relative'] == null) {
+            throw new runtime.RequiredError(
+                'relative',
+                'Required parameter "relative" was null or undefined when calling statisticsGraphSeriesList().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        if (requestParameters['dataset'] != null) {
+            queryParameters['dataset'] = requestParameters['dataset'];
+        }
+
+        if (requestParameters['dates'] != null) {
+            queryParameters['dates'] = requestParameters['dates'];
+        }
+
+        if (requestParameters['relative'] != null) {
+            queryParameters['relative'] = requestParameters['relative'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        const response = await this.request({
+            path: `/statistics/graph_series`,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => jsonValue.map(DatasetGraphSeriesPointFromJSON));
+    }
+
+    /**
+     * Verify that the current user is authenticated.
+     */
+    async statisticsGraphSeriesList(requestParameters: StatisticsGraphSeriesListRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<Array<DatasetGraphSeriesPoint>> {
+        const response = await this.statisticsGraphSeriesListRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
 }
+
+/**
+ * @export
+ */
+export const StatisticsExportDatasetListOutputFormatEnum = {
+    Csv: 'csv',
+    Json: 'json',
+    Ndjson: 'ndjson'
+} as const;
+export type StatisticsExportDatasetListOutputFormatEnum = typeof StatisticsExportDatasetListOutputFormatEnum[keyof typeof StatisticsExportDatasetListOutputFormatEnum];
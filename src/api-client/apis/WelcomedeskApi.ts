@@ -16,12 +16,19 @@
 import * as runtime from '../runtime';
 import type {
   ShareOwnerForWelcomeDesk,
+  WelcomeDeskEligibilitySnapshot,
 } from '../models/index';
 import {
     ShareOwnerForWelcomeDeskFromJSON,
     ShareOwnerForWelcomeDeskToJSON,
+    WelcomeDeskEligibilitySnapshotFromJSON,
+    WelcomeDeskEligibilitySnapshotToJSON,
 } from '../models/index';
 
+export interface WelcomedeskApiEligibilitySnapshotRetrieveRequest {
+    sinceVersion?: number;
+}
+
 export interface WelcomedeskApiSearchListRequest {
     searchInput: string;
 }
@@ -31,6 +38,36 @@ export interface WelcomedeskApiSearchListRequest {
  */
 export class WelcomedeskApi extends runtime.BaseAPI {
 
+    /**
+     * Lets the welcome desk keep a local copy of all members, to search them without a request per keystroke.  Without since_version, returns all members. With since_version, returns only the members whose eligibility changed after that version. The ETag contains the current version.
+     */
+    async welcomedeskApiEligibilitySnapshotRetrieveRaw(requestParameters: WelcomedeskApiEligibilitySnapshotRetrieveRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<WelcomeDeskEligibilitySnapshot>> {
+        const queryParameters: any = {};
+
+        if (requestParameters['sinceVersion'] != null) {
+            queryParameters['since_version'] = requestParameters['sinceVersion'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        const response = await this.request({
+            path: `/welcomedesk/api/eligibility_snapshot`,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => WelcomeDeskEligibilitySnapshotFromJSON(jsonValue));
+    }
+
+    /**
+     * Lets the welcome desk keep a local copy of all members, to search them without a request per keystroke.  Without since_version, returns all members. With since_version, returns only the members whose eligibility changed after that version. The ETag contains the current version.
+     */
+    async welcomedeskApiEligibilitySnapshotRetrieve(requestParameters: WelcomedeskApiEligibilitySnapshotRetrieveRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<WelcomeDeskEligibilitySnapshot> {
+        const response = await this.welcomedeskApiEligibilitySnapshotRetrieveRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
     /**
      * Verify that the current user is authenticated.
      */
@@ -1,5 +1,6 @@
 /* tslint:disable */
 /* eslint-disable */
 export * from './CoopApi';
+export * from './CoreApi';
 export * from './StatisticsApi';
 export * from './WelcomedeskApi';
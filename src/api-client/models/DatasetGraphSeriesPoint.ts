@@ -0,0 +1,75 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * 
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 0.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface DatasetGraphSeriesPoint
+ */
+export interface DatasetGraphSeriesPoint {
+    /**
+     * 
+     * @type {Date}
+     * @memberof DatasetGraphSeriesPoint
+     */
+    date: Date;
+    /**
+     * 
+     * @type {number}
+     * @memberof DatasetGraphSeriesPoint
+     */
+    value: number;
+}
+
+/**
+ * Check if a given object implements the DatasetGraphSeriesPoint interface.
+ */
+export function instanceOfDatasetGraphSeriesPoint(value: object): value is DatasetGraphSeriesPoint {
+    if (!('date' in value) || value['date'] === undefined) return false;
+    if (!('value' in value) || value['value'] === undefined) return false;
+    return true;
+}
+
+export function DatasetGraphSeriesPointFromJSON(json: any): DatasetGraphSeriesPoint {
+    return DatasetGraphSeriesPointFromJSONTyped(json, false);
+}
+
+export function DatasetGraphSeriesPointFromJSONTyped(json: any, ignoreDiscriminator: boolean): DatasetGraphSeriesPoint {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'date': (new Date(json['date'])),
+        'value': json['value'],
+    };
+}
+
+  export function DatasetGraphSeriesPointToJSON(json: any): DatasetGraphSeriesPoint {
+      return DatasetGraphSeriesPointToJSONTyped(json, false);
+  }
+
+  export function DatasetGraphSeriesPointToJSONTyped(value?: DatasetGraphSeriesPoint | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'date': ((value['date']).toISOString().substring(0,10)),
+        'value': value['value'],
+    };
+}
+
@@ -0,0 +1,164 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * 
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 0.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { StatusEnum } from './StatusEnum';
+import {
+    StatusEnumFromJSON,
+    StatusEnumFromJSONTyped,
+    StatusEnumToJSON,
+    StatusEnumToJSONTyped,
+} from './StatusEnum';
+
+/**
+ * 
+ * @export
+ * @interface ReportJob
+ */
+export interface ReportJob {
+    /**
+     * 
+     * @type {number}
+     * @memberof ReportJob
+     */
+    readonly id: number;
+    /**
+     * 
+     * @type {string}
+     * @memberof ReportJob
+     */
+    reportType: string;
+    /**
+     * 
+     * @type {any}
+     * @memberof ReportJob
+     */
+    parameters?: any | null;
+    /**
+     * 
+     * @type {StatusEnum}
+     * @memberof ReportJob
+     */
+    status?: StatusEnum;
+    /**
+     * 
+     * @type {number}
+     * @memberof ReportJob
+     */
+    readonly progress: number | null;
+    /**
+     * 
+     * @type {number}
+     * @memberof ReportJob
+     */
+    processedRows?: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof ReportJob
+     */
+    totalRows?: number | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof ReportJob
+     */
+    error?: string;
+    /**
+     * 
+     * @type {Date}
+     * @memberof ReportJob
+     */
+    readonly createdAt: Date;
+    /**
+     * 
+     * @type {Date}
+     * @memberof ReportJob
+     */
+    finishedAt?: Date | null;
+    /**
+     * 
+     * @type {Date}
+     * @memberof ReportJob
+     */
+    expiresAt?: Date | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof ReportJob
+     */
+    readonly downloadUrl: string | null;
+}
+
+
+
+/**
+ * Check if a given object implements the ReportJob interface.
+ */
+export function instanceOfReportJob(value: object): value is ReportJob {
+    if (!('id' in value) || value['id'] === undefined) return false;
+    if (!('reportType' in value) || value['reportType'] === undefined) return false;
+    if (!('progress' in value) || value['progress'] === undefined) return false;
+    if (!('createdAt' in value) || value['createdAt'] === undefined) return false;
+    if (!('downloadUrl' in value) || value['downloadUrl'] === undefined) return false;
+    return true;
+}
+
+export function ReportJobFromJSON(json: any): ReportJob {
+    return ReportJobFromJSONTyped(json, false);
+}
+
+export function ReportJobFromJSONTyped(json: any, ignoreDiscriminator: boolean): ReportJob {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'id': json['id'],
+        'reportType': json['report_type'],
+        'parameters': json['parameters'] == null ? undefined : json['parameters'],
+        'status': json['status'] == null ? undefined : StatusEnumFromJSON(json['status']),
+        'progress': json['progress'],
+        'processedRows': json['processed_rows'] == null ? undefined : json['processed_rows'],
+        'totalRows': json['total_rows'] == null ? undefined : json['total_rows'],
+        'error': json['error'] == null ? undefined : json['error'],
+        'createdAt': (new Date(json['created_at'])),
+        'finishedAt': json['finished_at'] == null ? undefined : (new Date(json['finished_at'])),
+        'expiresAt': json['expires_at'] == null ? undefined : (new Date(json['expires_at'])),
+        'downloadUrl': json['download_url'],
+    };
+}
+
+  export function ReportJobToJSON(json: any): ReportJob {
+      return ReportJobToJSONTyped(json, false);
+  }
+
+  export function ReportJobToJSONTyped(value?: Omit<ReportJob, 'id'|'progress'|'created_at'|'download_url'> | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'report_type': value['reportType'],
+        'parameters': value['parameters'],
+        'status': StatusEnumToJSON(value['status']),
+        'processed_rows': value['processedRows'],
+        'total_rows': value['totalRows'],
+        'error': value['error'],
+        'finished_at': value['finishedAt'] == null ? undefined : ((value['finishedAt'] as any).toISOString()),
+        'expires_at': value['expiresAt'] == null ? undefined : ((value['expiresAt'] as any).toISOString()),
+    };
+}
+
@@ -0,0 +1,74 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * 
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 0.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface ReportJobRequest
+ */
+export interface ReportJobRequest {
+    /**
+     * 
+     * @type {string}
+     * @memberof ReportJobRequest
+     */
+    reportType: string;
+    /**
+     * 
+     * @type {{ [key: string]: any; }}
+     * @memberof ReportJobRequest
+     */
+    parameters?: { [key: string]: any; };
+}
+
+/**
+ * Check if a given object implements the ReportJobRequest interface.
+ */
+export function instanceOfReportJobRequest(value: object): value is ReportJobRequest {
+    if (!('reportType' in value) || value['reportType'] === undefined) return false;
+    return true;
+}
+
+export function ReportJobRequestFromJSON(json: any): ReportJobRequest {
+    return ReportJobRequestFromJSONTyped(json, false);
+}
+
+export function ReportJobRequestFromJSONTyped(json: any, ignoreDiscriminator: boolean): ReportJobRequest {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'reportType': json['report_type'],
+        'parameters': json['parameters'] == null ? undefined : json['parameters'],
+    };
+}
+
+  export function ReportJobRequestToJSON(json: any): ReportJobRequest {
+      return ReportJobRequestToJSONTyped(json, false);
+  }
+
+  export function ReportJobRequestToJSONTyped(value?: ReportJobRequest | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'report_type': value['reportType'],
+        'parameters': value['parameters'],
+    };
+}
+
@@ -0,0 +1,108 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * 
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 0.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface ShoppingEligibilityForWelcomeDesk
+ */
+export interface ShoppingEligibilityForWelcomeDesk {
+    /**
+     * 
+     * @type {number}
+     * @memberof ShoppingEligibilityForWelcomeDesk
+     */
+    id: number;
+    /**
+     * 
+     * @type {string}
+     * @memberof ShoppingEligibilityForWelcomeDesk
+     */
+    readonly displayName: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof ShoppingEligibilityForWelcomeDesk
+     */
+    searchKey: string;
+    /**
+     * 
+     * @type {boolean}
+     * @memberof ShoppingEligibilityForWelcomeDesk
+     */
+    canShop: boolean;
+    /**
+     * 
+     * @type {Array<string>}
+     * @memberof ShoppingEligibilityForWelcomeDesk
+     */
+    reasonsCannotShop?: Array<string>;
+    /**
+     * 
+     * @type {Array<string>}
+     * @memberof ShoppingEligibilityForWelcomeDesk
+     */
+    warnings?: Array<string>;
+}
+
+/**
+ * Check if a given object implements the ShoppingEligibilityForWelcomeDesk interface.
+ */
+export function instanceOfShoppingEligibilityForWelcomeDesk(value: object): value is ShoppingEligibilityForWelcomeDesk {
+    if (!('id' in value) || value['id'] === undefined) return false;
+    if (!('displayName' in value) || value['displayName'] === undefined) return false;
+    if (!('searchKey' in value) || value['searchKey'] === undefined) return false;
+    if (!('canShop' in value) || value['canShop'] === undefined) return false;
+    return true;
+}
+
+export function ShoppingEligibilityForWelcomeDeskFromJSON(json: any): ShoppingEligibilityForWelcomeDesk {
+    return ShoppingEligibilityForWelcomeDeskFromJSONTyped(json, false);
+}
+
+export function ShoppingEligibilityForWelcomeDeskFromJSONTyped(json: any, ignoreDiscriminator: boolean): ShoppingEligibilityForWelcomeDesk {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'id': json['id'],
+        'displayName': json['display_name'],
+        'searchKey': json['search_key'],
+        'canShop': json['can_shop'],
+        'reasonsCannotShop': json['reasons_cannot_shop'] == null ? undefined : json['reasons_cannot_shop'],
+        'warnings': json['warnings'] == null ? undefined : json['warnings'],
+    };
+}
+
+  export function ShoppingEligibilityForWelcomeDeskToJSON(json: any): ShoppingEligibilityForWelcomeDesk {
+      return ShoppingEligibilityForWelcomeDeskToJSONTyped(json, false);
+  }
+
+  export function ShoppingEligibilityForWelcomeDeskToJSONTyped(value?: Omit<ShoppingEligibilityForWelcomeDesk, 'display_name'> | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'id': value['id'],
+        'search_key': value['searchKey'],
+        'can_shop': value['canShop'],
+        'reasons_cannot_shop': value['reasonsCannotShop'],
+        'warnings': value['warnings'],
+    };
+}
+
@@ -0,0 +1,92 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * 
+ * No description provided (generated by Openapi Generator https://github.com/openapitools/openapi-generator)
+ *
+ * The version of the OpenAPI document: 0.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { ShoppingEligibilityForWelcomeDesk } from './ShoppingEligibilityForWelcomeDesk';
+import {
+    ShoppingEligibilityForWelcomeDeskFromJSON,
+    ShoppingEligibilityForWelcomeDeskFromJSONTyped,
+    ShoppingEligibilityForWelcomeDeskToJSON,
+    ShoppingEligibilityForWelcomeDeskToJSONTyped,
+} from './ShoppingEligibilityForWelcomeDesk';
+
+/**
+ * 
+ * @export
+ * @interface WelcomeDeskEligibilitySnapshot
+ */
+export interface WelcomeDeskEligibilitySnapshot {
+    /**
+     * 
+     * @type {number}
+     * @memberof WelcomeDeskEligibilitySnapshot
+     */
+    version: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof WelcomeDeskEligibilitySnapshot
+     */
+    nbMembers: number;
+    /**
+     * 
+     * @type {Array<ShoppingEligibilityForWelcomeDesk>}
+     * @memberof WelcomeDeskEligibilitySnapshot
+     */
+    members: Array<ShoppingEligibilityForWelcomeDesk>;
+}
+
+/**
+ * Check if a given object implements the WelcomeDeskEligibilitySnapshot interface.
+ */
+export function instanceOfWelcomeDeskEligibilitySnapshot(value: object): value is WelcomeDeskEligibilitySnapshot {
+    if (!('version' in value) || value['version'] === undefined) return false;
+    if (!('nbMembers' in value) || value['nbMembers'] === undefined) return false;
+    if (!('members' in value) || value['members'] === undefined) return false;
+    return true;
+}
+
+export function WelcomeDeskEligibilitySnapshotFromJSON(json: any): WelcomeDeskEligibilitySnapshot {
+    return WelcomeDeskEligibilitySnapshotFromJSONTyped(json, false);
+}
+
+export function WelcomeDeskEligibilitySnapshotFromJSONTyped(json: any, ignoreDiscriminator: boolean): WelcomeDeskEligibilitySnapshot {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'version': json['version'],
+        'nbMembers': json['nb_members'],
+        'members': ((json['members'] as Array<any>).map(ShoppingEligibilityForWelcomeDeskFromJSON)),
+    };
+}
+
+  export function WelcomeDeskEligibilitySnapshotToJSON(json: any): WelcomeDeskEligibilitySnapshot {
+      return WelcomeDeskEligibilitySnapshotToJSONTyped(json, false);
+  }
+
+  export function WelcomeDeskEligibilitySnapshotToJSONTyped(value?: WelcomeDeskEligibilitySnapshot | null, ignoreDiscriminator: boolean = false): any {
+    if (value == null) {
+        return value;
+    }
+
+    return {
+        
+        'version': value['version'],
+        'nb_members': value['nbMembers'],
+        'members': ((value['members'] as Array<any>).map(ShoppingEligibilityForWelcomeDeskToJSON)),
+    };
+}
+
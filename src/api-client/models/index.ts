@@ -3,5 +3,11 @@
 export * from './Column';
 export * from './DatapointExport';
 export * from './Dataset';
+export * from './DatasetGraphSeriesPoint';
 export * from './MemberRegistrationRequest';
+export * from './ReportJob';
+export * from './ReportJobRequest';
 export * from './ShareOwnerForWelcomeDesk';
+export * from './ShoppingEligibilityForWelcomeDesk';
+export * from './StatusEnum';
+export * from './WelcomeDeskEligibilitySnapshot';
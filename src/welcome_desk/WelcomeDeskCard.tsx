@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from "react";
+import React, { useEffect, useMemo, useState } from "react";
 import { Card, Form } from "react-bootstrap";
 import { useApi } from "../hooks/useApi.ts";
 import {
@@ -8,31 +8,32 @@ import {
 } from "../api-client";
 import WelcomeDeskSearchResults from "./WelcomeDeskSearchResults.tsx";
 import WelcomeDeskMemberDetails from "./WelcomeDeskMemberDetails.tsx";
+import { useEligibilitySnapshot } from "./useEligibilitySnapshot.ts";
+import { searchMembers } from "./searchMembers.ts";
 
 declare let gettext: (english_text: string) => string;
 
 const WelcomeDeskCard: React.FC = () => {
   const [searchInput, setSearchInput] = useState("");
-  const [searchResults, setSearchResults] = useState<
-    ShareOwnerForWelcomeDesk[]
-  >([]);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState("");
-  const [controller, setController] = useState<AbortController>();
+  const [selectedMemberId, setSelectedMemberId] = useState<number>();
   const [selectedMember, setSelectedMember] =
     useState<ShareOwnerForWelcomeDesk>();
+  const [detailsError, setDetailsError] = useState(false);
+  const { membersById, loading, error } = useEligibilitySnapshot();
   const api = useApi(WelcomedeskApi);
 
+  const searchResults = useMemo(
+    () => searchMembers(membersById, searchInput),
+    [membersById, searchInput],
+  );
+
   useEffect(() => {
-    updateSearchResults();
+    setSelectedMemberId(
+      searchResults.length === 1 ? searchResults[0].id : undefined,
+    );
   }, [searchInput]);
 
-  function resetSearchResults() {
-    setSearchResults([]);
-    setLoading(false);
-    setError("");
-    setSelectedMember(undefined);
-  }
+  useEffect(() => updateSelectedMember(), [selectedMemberId]);
 
   function buildErrorMessage(searchInput: string) {
     return (
@@ -45,38 +46,28 @@ const WelcomeDeskCard: React.FC = () => {
     );
   }
 
-  function updateSearchResults() {
-    if (controller) controller.abort();
-
-    if (!searchInput) {
-      resetSearchResults();
-      return;
-    }
-
-    const localController = new AbortController();
-    setController(localController);
-    setLoading(true);
-    setError("");
+  function updateSelectedMember() {
     setSelectedMember(undefined);
+    setDetailsError(false);
+    if (selectedMemberId === undefined) return;
 
+    const controller = new AbortController();
+    // The details are always fetched fresh from the server,
+    // the local snapshot is only used to find the member.
     api
       .welcomedeskApiSearchList(
-        { searchInput: searchInput },
-        { signal: localController.signal },
+        { searchInput: String(selectedMemberId) },
+        { signal: controller.signal },
       )
       .then((results) => {
-        setSearchResults(results);
-        if (results.length === 1) {
-          setSelectedMember(results[0]);
-        }
-        setLoading(false);
+        setSelectedMember(results.length === 1 ? results[0] : undefined);
       })
       .catch((error: FetchError) => {
         if (error.cause && error.cause.name === "AbortError") return;
-        setError(buildErrorMessage(searchInput));
+        setDetailsError(true);
         console.log(error);
-        setLoading(false);
       });
+    return () => controller.abort();
   }
 
   return (
@@ -102,9 +93,13 @@ const WelcomeDeskCard: React.FC = () => {
         <Card.Body>
           <WelcomeDeskSearchResults
             searchResults={searchResults}
-            error={error}
-            setSelectedMember={setSelectedMember}
-            selectedMember={selectedMember}
+            error={
+              (error && membersById.size === 0) || detailsError
+                ? buildErrorMessage(searchInput)
+                : ""
+            }
+            setSelectedMemberId={setSelectedMemberId}
+            selectedMemberId={selectedMemberId}
             loading={loading}
           />
         </Card.Body>
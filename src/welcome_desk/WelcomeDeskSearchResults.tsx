@@ -1,23 +1,23 @@
 import React from "react";
 import { Alert, Spinner, Table } from "react-bootstrap";
-import { ShareOwnerForWelcomeDesk } from "../api-client";
+import { ShoppingEligibilityForWelcomeDesk } from "../api-client";
 
 declare let gettext: (english_text: string) => string;
 
 interface WelcomeDeskSearchResultsProps {
-  searchResults: ShareOwnerForWelcomeDesk[];
+  searchResults: ShoppingEligibilityForWelcomeDesk[];
   loading: boolean;
   error: string;
-  selectedMember: ShareOwnerForWelcomeDesk | undefined;
-  setSelectedMember: (member: ShareOwnerForWelcomeDesk | undefined) => void;
+  selectedMemberId: number | undefined;
+  setSelectedMemberId: (memberId: number | undefined) => void;
 }
 
 const WelcomeDeskSearchResults: React.FC<WelcomeDeskSearchResultsProps> = ({
   searchResults,
   loading,
   error,
-  selectedMember,
-  setSelectedMember,
+  selectedMemberId,
+  setSelectedMemberId,
 }) => {
   function buildSearchResults() {
     if (loading) return <Spinner />;
@@ -49,11 +49,11 @@ const WelcomeDeskSearchResults: React.FC<WelcomeDeskSearchResultsProps> = ({
             <tr
               key={member.id}
               onClick={() =>
-                setSelectedMember(
-                  selectedMember !== member ? member : undefined,
+                setSelectedMemberId(
+                  selectedMemberId !== member.id ? member.id : undefined,
                 )
               }
-              className={selectedMember === member ? "table-primary" : ""}
+              className={selectedMemberId === member.id ? "table-primary" : ""}
               style={{ cursor: "pointer" }}
             >
               <td>{member.displayName}</td>
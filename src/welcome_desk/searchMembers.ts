@@ -0,0 +1,52 @@
+import { ShoppingEligibilityForWelcomeDesk } from "../api-client";
+
+const MAX_NUMBER_OF_RESULTS = 20;
+
+// Same as MemberSearchService.normalize: "Jérôme Groß" becomes "jerome gross"
+export function normalizeSearchText(text: string): string {
+  return text
+    .normalize("NFKD")
+    .replace(/\p{M}/gu, "")
+    .toLowerCase()
+    .replace(/ß/g, "ss")
+    .split(/\s+/)
+    .filter((word) => word.length > 0)
+    .join(" ");
+}
+
+function countWordsMatchingAtStart(searchKey: string, searchWords: string[]) {
+  const keyWords = searchKey.split(" ");
+  return searchWords.filter((searchWord) =>
+    keyWords.some((keyWord) => keyWord.startsWith(searchWord)),
+  ).length;
+}
+
+export function searchMembers(
+  membersById: Map<number, ShoppingEligibilityForWelcomeDesk>,
+  searchInput: string,
+): ShoppingEligibilityForWelcomeDesk[] {
+  const normalizedInput = normalizeSearchText(searchInput);
+  if (!normalizedInput) return [];
+
+  if (/^\d+$/.test(normalizedInput)) {
+    const member = membersById.get(Number(normalizedInput));
+    return member ? [member] : [];
+  }
+
+  const searchWords = normalizedInput.split(" ");
+  return Array.from(membersById.values())
+    .filter((member) =>
+      searchWords.every((searchWord) => member.searchKey.includes(searchWord)),
+    )
+    .map((member) => ({
+      member: member,
+      score: countWordsMatchingAtStart(member.searchKey, searchWords),
+    }))
+    .sort(
+      (a, b) =>
+        b.score - a.score ||
+        a.member.displayName.localeCompare(b.member.displayName),
+    )
+    .slice(0, MAX_NUMBER_OF_RESULTS)
+    .map(({ member }) => member);
+}
@@ -0,0 +1,76 @@
+import { useEffect, useRef, useState } from "react";
+import { useApi } from "../hooks/useApi.ts";
+import {
+  ShoppingEligibilityForWelcomeDesk,
+  WelcomedeskApi,
+} from "../api-client";
+
+const SYNC_INTERVAL_IN_MILLISECONDS = 30 * 1000;
+
+// Keeps a local copy of whether each member can shop, see WelcomeDeskEligibilitySnapshotView.
+// The first request gets all members, the following ones only the members that changed since the last version.
+export function useEligibilitySnapshot() {
+  const [membersById, setMembersById] = useState<
+    Map<number, ShoppingEligibilityForWelcomeDesk>
+  >(new Map());
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState(false);
+  const version = useRef<number>();
+  const syncing = useRef(false);
+  const api = useApi(WelcomedeskApi);
+
+  useEffect(() => {
+    let localMembersById = new Map<number, ShoppingEligibilityForWelcomeDesk>();
+    let unmounted = false;
+
+    function sync() {
+      if (syncing.current) return;
+      syncing.current = true;
+
+      api
+        .welcomedeskApiEligibilitySnapshotRetrieve(
+          { sinceVersion: version.current },
+          // Always revalidate with the ETag: an unchanged snapshot costs a 304
+          { cache: "no-cache" },
+        )
+        .then((snapshot) => {
+          if (unmounted) return;
+          const updatedMembersById =
+            version.current === undefined
+              ? new Map<number, ShoppingEligibilityForWelcomeDesk>()
+              : new Map(localMembersById);
+          for (const member of snapshot.members) {
+            updatedMembersById.set(member.id, member);
+          }
+          localMembersById = updatedMembersById;
+          // Deleted members are not part of the changes:
+          // if the numbers don't match, the next sync gets all members again.
+          version.current =
+            updatedMembersById.size === snapshot.nbMembers
+              ? snapshot.version
+              : undefined;
+          setMembersById(updatedMembersById);
+          setError(false);
+          setLoading(false);
+        })
+        .catch((error) => {
+          console.log(error);
+          if (unmounted) return;
+          setError(true);
+          setLoading(false);
+        })
+        .finally(() => {
+          syncing.current = false;
+        });
+    }
+
+    sync();
+    const interval = setInterval(sync, SYNC_INTERVAL_IN_MILLISECONDS);
+    return () => {
+      unmounted = true;
+      clearInterval(interval);
+    };
+  }, []);
+
+  return { membersById, loading, error };
+}
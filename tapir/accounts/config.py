@@ -2,3 +2,4 @@
 
 feature_flag_open_door = "feature_flags.accounts.open_door"
 cache_key_open_door = "open_door"
+cache_key_ldap_group_membership = "ldap_group_membership"
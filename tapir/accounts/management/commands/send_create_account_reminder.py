@@ -1,4 +1,3 @@
-import time
 from datetime import timedelta
 
 from django.core.management import BaseCommand
@@ -17,13 +16,14 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         month_ago = timezone.now() - timedelta(days=31)
-        for owners_to_remind in ShareOwner.objects.filter(
-            user__isnull=True,
-            is_investing=False,
-            create_account_reminder_email_sent=False,
-            share_ownerships__start_date__lt=month_ago,
-        ).all():
-            self.send_create_account_reminder_for_user(owners_to_remind)
+        with SendMailService.queue_mails():
+            for owners_to_remind in ShareOwner.objects.filter(
+                user__isnull=True,
+                is_investing=False,
+                create_account_reminder_email_sent=False,
+                share_ownerships__start_date__lt=month_ago,
+            ).all():
+                self.send_create_account_reminder_for_user(owners_to_remind)
 
     @staticmethod
     def send_create_account_reminder_for_user(share_owner: ShareOwner):
@@ -34,4 +34,3 @@ class Command(BaseCommand):
             )
             share_owner.create_account_reminder_email_sent = True
             share_owner.save()
-        time.sleep(0.1)
@@ -5,11 +5,8 @@ from django.core.management import BaseCommand
 
 from tapir.accounts.models import TapirUser
 from tapir.settings import GROUP_VORSTAND
-from tapir.utils.shortcuts import (
-    get_admin_ldap_connection,
-    is_member_in_group,
-    send_file_to_storage_server,
-)
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
+from tapir.utils.shortcuts import get_group_members, send_file_to_storage_server
 from tapir.utils.user_utils import UserUtils
 
 
@@ -43,13 +40,12 @@ class Command(BaseCommand):
                 ]
             )
 
-            connection = get_admin_ldap_connection()
+            with LdapConnectionPool.borrow() as connection:
+                vorstand_member_dns = set(get_group_members(connection, GROUP_VORSTAND))
             for user in TapirUser.objects.filter(
                 allows_purchase_tracking=True, share_owner__isnull=False
             ):
-                rabatt = (
-                    18 if is_member_in_group(connection, user, GROUP_VORSTAND) else 0
-                )
+                rabatt = 18 if user.build_ldap_dn() in vorstand_member_dns else 0
                 writer.writerow(
                     [
                         user.share_owner.get_id_for_biooffice(),
@@ -10,10 +10,12 @@ from django.utils.translation import gettext_lazy as _
 from django_auth_ldap.backend import LDAPBackend, _LDAPUser
 from django_auth_ldap.config import LDAPSearch
 from ldap import modlist
-from ldap.ldapobject import LDAPObject
 from phonenumber_field.modelfields import PhoneNumberField
 
 from tapir import settings, utils
+from tapir.accounts.services.ldap_group_membership_service import (
+    LdapGroupMembershipService,
+)
 from tapir.coop.config import get_ids_of_users_registered_to_a_shift_with_capability
 from tapir.core.config import help_text_displayed_name
 from tapir.log.models import UpdateModelLogEntry
@@ -24,7 +26,8 @@ from tapir.settings import (
     REG_PERSON_OBJECT_CLASSES,
 )
 from tapir.utils.models import CountryField
-from tapir.utils.shortcuts import get_admin_ldap_connection, get_html_link
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
+from tapir.utils.shortcuts import get_html_link
 from tapir.utils.user_utils import UserUtils
 
 log = logging.getLogger(__name__)
@@ -139,15 +142,14 @@ class TapirUser(AbstractUser):
         return self.__cached_perms.get(perm, False)
 
     def __build_cached_perms(self):
+        group_names = LdapGroupMembershipService.get_group_names(self.username)
         self.__cached_perms = {}
         for (
             permission_name,
             groups_that_have_this_permission,
         ) in settings.PERMISSIONS.items():
             self.__cached_perms[permission_name] = (
-                not groups_that_have_this_permission.isdisjoint(
-                    self.get_ldap_user().group_names
-                )
+                not groups_that_have_this_permission.isdisjoint(group_names)
             )
 
     def get_member_number(self):
@@ -172,7 +174,8 @@ class TapirUser(AbstractUser):
         search = LDAPSearch(
             "ou=people,dc=supercoop,dc=de", ldap.SCOPE_SUBTREE, f"(uid={self.username})"
         )
-        result = search.execute(get_admin_ldap_connection())
+        with LdapConnectionPool.borrow() as connection:
+            result = search.execute(connection)
         if not result:
             return None
 
@@ -200,21 +203,22 @@ class TapirUser(AbstractUser):
         return user_modlist
 
     def create_ldap(self):
-        connection = get_admin_ldap_connection()
-        connection.add_s(
-            self.build_ldap_dn(), modlist.addModlist(self.build_ldap_modlist())
-        )
+        with LdapConnectionPool.borrow() as connection:
+            connection.add_s(
+                self.build_ldap_dn(), modlist.addModlist(self.build_ldap_modlist())
+            )
 
     def save(self, **kwargs):
         super().save(**kwargs)
         ldap_user = self.get_ldap_user()
         if ldap_user:
-            self.get_ldap_user().connection.modify_s(
-                self.build_ldap_dn(),
-                modlist.modifyModlist(
-                    self.build_ldap_modlist(), self.build_ldap_modlist()
-                ),
-            )
+            with LdapConnectionPool.borrow() as connection:
+                connection.modify_s(
+                    self.build_ldap_dn(),
+                    modlist.modifyModlist(
+                        self.build_ldap_modlist(), self.build_ldap_modlist()
+                    ),
+                )
         else:
             self.create_ldap()
 
@@ -222,9 +226,8 @@ class TapirUser(AbstractUser):
         # force null Django password (will use LDAP password)
         self.set_unusable_password()
 
-        ldap_user = self.get_ldap_user()
-        connection: LDAPObject = ldap_user.connection
-        connection.passwd_s(self.build_ldap_dn(), None, raw_password)
+        with LdapConnectionPool.borrow() as connection:
+            connection.passwd_s(self.build_ldap_dn(), None, raw_password)
 
     def check_password(self, raw_password):
         connection = ldap.initialize(AUTH_LDAP_SERVER_URI)
@@ -5,7 +5,6 @@ import datetime
 from django.db.models import (
     Case,
     CharField,
-    OuterRef,
     Q,
     QuerySet,
     Subquery,
@@ -15,7 +14,8 @@ from django.db.models import (
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
-from tapir.accounts.models import TapirUser, UpdateTapirUserLogEntry
+from tapir.accounts.models import TapirUser
+from tapir.log.services.attribute_history_service import AttributeHistoryService
 
 
 class CoPurchaserHistoryService:
@@ -33,13 +33,9 @@ class CoPurchaserHistoryService:
 
         queryset = queryset.annotate(
             co_purchaser_from_log_entry=Subquery(
-                UpdateTapirUserLogEntry.objects.filter(
-                    user_id=OuterRef("id"),
-                    created_date__gte=at_datetime,
-                    old_values__has_key="co_purchaser",
-                )
-                .order_by("created_date")
-                .values("old_values__co_purchaser")[:1],
+                AttributeHistoryService.get_intervals_at_datetime(
+                    TapirUser, "co_purchaser", at_datetime
+                ).values("value")[:1],
                 output_field=CharField(),
             )
         )
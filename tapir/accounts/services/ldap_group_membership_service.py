@@ -0,0 +1,64 @@
+import ldap
+from django.conf import settings
+from django.core.cache import cache
+from django_auth_ldap.config import LDAPSearch
+
+from tapir.accounts.config import cache_key_ldap_group_membership
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
+
+
+class LdapGroupMembershipService:
+    """Keeps the LDAP groups of all users in the cache, so that permission checks don't need an LDAP request.
+
+    The cache is filled with a single search over all groups in settings.LDAP_GROUPS
+    and cleared by set_group_membership. Other processes see a change at the latest after CACHE_TIMEOUT.
+    """
+
+    CACHE_TIMEOUT = 5 * 60
+
+    @classmethod
+    def get_group_names(cls, username: str) -> frozenset[str]:
+        return cls.get_group_names_by_username().get(username.lower(), frozenset())
+
+    @classmethod
+    def get_group_names_by_username(cls) -> dict[str, frozenset[str]]:
+        group_names_by_username = cache.get(cache_key_ldap_group_membership)
+        if group_names_by_username is None:
+            group_names_by_username = cls.fetch_group_names_by_username()
+            cache.set(
+                cache_key_ldap_group_membership,
+                group_names_by_username,
+                timeout=cls.CACHE_TIMEOUT,
+            )
+        return group_names_by_username
+
+    @staticmethod
+    def fetch_group_names_by_username() -> dict[str, frozenset[str]]:
+        groups_filter = "".join(
+            f"(cn={group_cn})" for group_cn in sorted(settings.LDAP_GROUPS)
+        )
+        search = LDAPSearch(
+            "ou=groups,dc=supercoop,dc=de",
+            ldap.SCOPE_SUBTREE,
+            f"(|{groups_filter})",
+            ["cn", "member"],
+        )
+
+        with LdapConnectionPool.borrow() as connection:
+            results = search.execute(connection)
+
+        group_names_by_username: dict[str, set[str]] = {}
+        for _dn, attributes in results:
+            group_cn = attributes["cn"][0]
+            for member_dn in attributes.get("member", []):
+                username = member_dn.split(",")[0].replace("uid=", "").lower()
+                group_names_by_username.setdefault(username, set()).add(group_cn)
+
+        return {
+            username: frozenset(group_names)
+            for username, group_names in group_names_by_username.items()
+        }
+
+    @staticmethod
+    def invalidate():
+        cache.delete(cache_key_ldap_group_membership)
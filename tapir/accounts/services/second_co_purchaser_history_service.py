@@ -5,7 +5,6 @@ import datetime
 from django.db.models import (
     Case,
     CharField,
-    OuterRef,
     Q,
     QuerySet,
     Subquery,
@@ -15,7 +14,8 @@ from django.db.models import (
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
-from tapir.accounts.models import TapirUser, UpdateTapirUserLogEntry
+from tapir.accounts.models import TapirUser
+from tapir.log.services.attribute_history_service import AttributeHistoryService
 
 
 class SecondCoPurchaserHistoryService:
@@ -33,13 +33,9 @@ class SecondCoPurchaserHistoryService:
 
         queryset = queryset.annotate(
             co_purchaser_2_from_log_entry=Subquery(
-                UpdateTapirUserLogEntry.objects.filter(
-                    user_id=OuterRef("id"),
-                    created_date__gte=at_datetime,
-                    old_values__has_key="co_purchaser_2",
-                )
-                .order_by("created_date")
-                .values("old_values__co_purchaser_2")[:1],
+                AttributeHistoryService.get_intervals_at_datetime(
+                    TapirUser, "co_purchaser_2", at_datetime
+                ).values("value")[:1],
                 output_field=CharField(),
             )
         )
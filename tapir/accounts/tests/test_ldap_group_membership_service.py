@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from tapir.accounts.models import TapirUser
+from tapir.accounts.services.ldap_group_membership_service import (
+    LdapGroupMembershipService,
+)
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.settings import (
+    GROUP_ACCOUNTING,
+    GROUP_MEMBER_OFFICE,
+    PERMISSION_ACCOUNTING_MANAGE,
+)
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
+from tapir.utils.shortcuts import set_group_membership
+from tapir.utils.tests_utils import TapirFactoryTestBase
+
+
+class TestLdapGroupMembershipService(TapirFactoryTestBase):
+    def test_getGroupNames_default_returnsTheGroupsOfTheUser(self):
+        user = TapirUserFactory.create(
+            is_in_member_office=True, is_in_accounting_team=True
+        )
+
+        self.assertEqual(
+            {GROUP_MEMBER_OFFICE, GROUP_ACCOUNTING},
+            LdapGroupMembershipService.get_group_names(user.username),
+        )
+
+    def test_getGroupNames_userNotInAnyGroup_returnsEmptySet(self):
+        user = TapirUserFactory.create()
+
+        self.assertEqual(
+            frozenset(), LdapGroupMembershipService.get_group_names(user.username)
+        )
+
+    def test_hasPerm_severalUsers_sendsASingleLdapRequest(self):
+        users = TapirUserFactory.create_batch(3, is_in_accounting_team=True)
+        LdapGroupMembershipService.invalidate()
+
+        with patch.object(
+            LdapConnectionPool, "borrow", wraps=LdapConnectionPool.borrow
+        ) as mock_borrow:
+            for user in users:
+                self.assertTrue(
+                    TapirUser.objects.get(id=user.id).has_perm(
+                        PERMISSION_ACCOUNTING_MANAGE
+                    )
+                )
+
+        mock_borrow.assert_called_once()
+
+    def test_hasPerm_afterGroupMembershipChanged_returnsUpdatedValue(self):
+        user = TapirUserFactory.create(is_in_accounting_team=False)
+        self.assertFalse(
+            TapirUser.objects.get(id=user.id).has_perm(PERMISSION_ACCOUNTING_MANAGE)
+        )
+
+        set_group_membership([user], GROUP_ACCOUNTING, True)
+
+        self.assertTrue(
+            TapirUser.objects.get(id=user.id).has_perm(PERMISSION_ACCOUNTING_MANAGE)
+        )
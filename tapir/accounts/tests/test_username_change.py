@@ -1,5 +1,7 @@
 from django.urls import reverse
 
+from tapir import settings
+
 from tapir.accounts.models import TapirUser
 from tapir.accounts.tests.factories.factories import TapirUserFactory
 from tapir.utils.tests_utils import TapirFactoryTestBase
@@ -56,6 +58,21 @@ class TestUsernameChange(TapirFactoryTestBase):
             self.client.login(username=self.NEW_USERNAME, password=self.OLD_USERNAME)
         )
 
+    def test_renamed_user_keeps_the_permissions_of_their_groups(self):
+        target: TapirUser = TapirUserFactory.create(
+            is_in_member_office=True, username=self.OLD_USERNAME
+        )
+        self.assertTrue(
+            TapirUser.objects.get(id=target.id).has_perm(settings.PERMISSION_COOP_VIEW)
+        )
+
+        response = self.try_update(actor=target, target=target)
+        self.assertEqual(200, response.status_code)
+
+        self.assertTrue(
+            TapirUser.objects.get(id=target.id).has_perm(settings.PERMISSION_COOP_VIEW)
+        )
+
     def try_update(self, actor: TapirUser, target: TapirUser):
         self.login_as_user(actor)
 
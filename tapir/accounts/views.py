@@ -30,6 +30,9 @@ from tapir.accounts.models import (
     TapirUser,
     UpdateTapirUserLogEntry,
 )
+from tapir.accounts.services.ldap_group_membership_service import (
+    LdapGroupMembershipService,
+)
 from tapir.coop.emails.co_purchaser_updated_mail import CoPurchaserUpdatedMail
 from tapir.coop.emails.tapir_account_created_email import (
     TapirAccountCreatedEmailBuilder,
@@ -47,8 +50,8 @@ from tapir.settings import (
     PERMISSION_COOP_ADMIN,
     PERMISSION_GROUP_MANAGE,
 )
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
 from tapir.utils.shortcuts import (
-    get_admin_ldap_connection,
     get_group_members,
     set_group_membership,
     set_header_for_file_download,
@@ -323,8 +326,12 @@ class LdapGroupListView(
         context_data = super().get_context_data(**kwargs)
 
         groups_data = {}
-        for group_cn in settings.LDAP_GROUPS:
-            group_member_dns = get_group_members(get_admin_ldap_connection(), group_cn)
+        with LdapConnectionPool.borrow() as connection:
+            group_member_dns_by_group = {
+                group_cn: get_group_members(connection, group_cn)
+                for group_cn in settings.LDAP_GROUPS
+            }
+        for group_cn, group_member_dns in group_member_dns_by_group.items():
             usernames = [
                 dn.split(",")[0].replace("uid=", "") for dn in group_member_dns
             ]
@@ -364,10 +371,12 @@ class EditUsernameView(LoginRequiredMixin, PermissionRequiredMixin, generic.Upda
         tapir_user_before = self.get_target_user()
         tapir_user_after: TapirUser = form.instance
 
-        tapir_user_before.get_ldap_user().connection.rename_s(
-            tapir_user_before.build_ldap_dn(),
-            f"uid={tapir_user_after.username}",
-        )
+        with LdapConnectionPool.borrow() as connection:
+            connection.rename_s(
+                tapir_user_before.build_ldap_dn(),
+                f"uid={tapir_user_after.username}",
+            )
+        LdapGroupMembershipService.invalidate()
 
         response = super().form_valid(form)
 
@@ -16,6 +16,7 @@ class CoopConfig(AppConfig):
     def ready(self):
         self.register_sidebar_link_groups()
         self.register_emails()
+        self.register_reports()
 
     @staticmethod
     def register_sidebar_link_groups():
@@ -97,3 +98,21 @@ class CoopConfig(AppConfig):
         TapirEmailBuilderBase.register_email(
             MembershipResignationTransferredSharesConfirmation
         )
+
+    @staticmethod
+    def register_reports():
+        from tapir.coop.services.jahresabschluss_report import JahresabschlussReport
+        from tapir.coop.services.member_status_updates_report import (
+            MemberStatusUpdatesReport,
+        )
+        from tapir.coop.services.number_of_co_purchasers_report import (
+            NumberOfCoPurchasersReport,
+        )
+        from tapir.core.services.base_report import BaseReport
+
+        for report in [
+            JahresabschlussReport,
+            MemberStatusUpdatesReport,
+            NumberOfCoPurchasersReport,
+        ]:
+            BaseReport.register_report(report)
@@ -0,0 +1,101 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from tapir.coop.models import ShareOwner
+from tapir.coop.services.member_search_service import MemberSearchService
+from tapir.welcomedesk.views import SearchMemberForWelcomeDeskView
+
+FIRST_NAMES = ["Anna", "Jérôme", "Zoë", "Mehmet", "Łukasz", "Sören", "Inès", "Paul"]
+LAST_NAMES = ["Müller", "Groß", "Ödegaard", "Nguyen", "Schäfer", "Dubois", "Kaya"]
+SEARCHES = ["mul", "jerome", "anna gro", "zoe", "soren kaya", "ines dub", "x"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the latency of the welcome desk member search. "
+        "The members created for the benchmark are rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--nb-members", type=int, default=10000)
+        parser.add_argument("--nb-runs", type=int, default=50)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_members(options["nb_members"])
+            self.stdout.write(
+                f"Searching among {ShareOwner.objects.count()} members, "
+                f"{options['nb_runs']} runs per search"
+            )
+            self.print_latencies(
+                "search document",
+                lambda search: list(
+                    ShareOwner.objects.with_name(
+                        search,
+                        limit=SearchMemberForWelcomeDeskView.MAX_NUMBER_OF_RESULTS,
+                    )
+                ),
+                options["nb_runs"],
+            )
+            self.print_latencies(
+                "unaccent icontains",
+                lambda search: list(self.search_with_unaccent(search)),
+                options["nb_runs"],
+            )
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def create_members(nb_members: int):
+        randomizer = random.Random(42)
+        share_owners = [
+            ShareOwner(
+                first_name=randomizer.choice(FIRST_NAMES),
+                last_name=randomizer.choice(LAST_NAMES),
+            )
+            for _ in range(nb_members)
+        ]
+        share_owners = ShareOwner.objects.bulk_create(share_owners)
+        for share_owner in share_owners:
+            share_owner.search_document = MemberSearchService.build_search_document(
+                share_owner
+            )
+        ShareOwner.objects.bulk_update(
+            share_owners, ["search_document"], batch_size=1000
+        )
+
+    @staticmethod
+    def search_with_unaccent(search_string: str):
+        # The search as it was done before ShareOwner.search_document, for comparison
+        combined_filters = Q()
+        for search in search_string.split(" "):
+            combined_filters &= (
+                Q(last_name__unaccent__icontains=search)
+                | Q(first_name__unaccent__icontains=search)
+                | Q(usage_name__unaccent__icontains=search)
+                | Q(user__first_name__unaccent__icontains=search)
+                | Q(user__usage_name__unaccent__icontains=search)
+                | Q(user__last_name__unaccent__icontains=search)
+                | Q(company_name__unaccent__icontains=search)
+            )
+        return ShareOwner.objects.filter(combined_filters)[
+            : SearchMemberForWelcomeDeskView.MAX_NUMBER_OF_RESULTS
+        ]
+
+    def print_latencies(self, name: str, search_function, nb_runs: int):
+        durations_in_ms = []
+        for _ in range(nb_runs):
+            for search in SEARCHES:
+                start = time.perf_counter()
+                search_function(search)
+                durations_in_ms.append((time.perf_counter() - start) * 1000)
+
+        percentiles = statistics.quantiles(durations_in_ms, n=100)
+        self.stdout.write(
+            f"{name}: p50 {percentiles[49]:.1f}ms, p95 {percentiles[94]:.1f}ms, "
+            f"max {max(durations_in_ms):.1f}ms"
+        )
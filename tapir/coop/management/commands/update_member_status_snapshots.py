@@ -0,0 +1,61 @@
+import datetime
+from argparse import ArgumentTypeError
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from tapir.coop.models import MemberStatusSnapshotDate
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
+
+
+def parse_date(date_as_string: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(date_as_string)
+    except ValueError:
+        raise ArgumentTypeError(f"Invalid date: {date_as_string}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Builds the member status snapshots used by ShareOwnerQuerySet.with_status. "
+        "Without arguments, only today's snapshot is built. "
+        "Use --start-date to backfill past dates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start-date", type=parse_date, default=None)
+        parser.add_argument("--end-date", type=parse_date, default=None)
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Compare the existing snapshots with the status computed from the history instead of building them.",
+        )
+
+    def handle(self, *args, **options):
+        end_date = options["end_date"] or timezone.now().date()
+        start_date = options["start_date"] or end_date
+
+        current_date = start_date
+        while current_date <= end_date:
+            if options["verify"]:
+                self.verify_snapshot(current_date)
+            else:
+                MemberStatusSnapshotService.build_snapshot(current_date)
+            current_date += datetime.timedelta(days=1)
+
+    def verify_snapshot(self, at_date: datetime.date):
+        if not MemberStatusSnapshotDate.objects.filter(date=at_date).exists():
+            self.stdout.write(f"{at_date}: no snapshot")
+            return
+
+        mismatches = MemberStatusSnapshotService.get_snapshot_mismatches(at_date)
+        for share_owner_id, (
+            status_in_snapshot,
+            status_from_history,
+        ) in mismatches.items():
+            self.stdout.write(
+                f"{at_date}: member #{share_owner_id} is {status_in_snapshot} in the snapshot "
+                f"but {status_from_history} according to the history"
+            )
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "coop",
+            "0055_membershippauseupdatedlogentry_coop_member_old_val_6e6554_gin_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MemberStatusSnapshotDate",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(unique=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="MemberStatusSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("sold", "Not a member"),
+                            ("investing", "Investing"),
+                            ("active", "Active"),
+                            ("paused", "Paused"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "share_owner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="status_snapshots",
+                        to="coop.shareowner",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["date", "status"], name="coop_member_date_aea15f_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("share_owner", "date"),
+                        name="member_status_snapshot_unique_member_date",
+                    )
+                ],
+            },
+        ),
+    ]
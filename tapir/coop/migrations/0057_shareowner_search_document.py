@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:26
+
+import unicodedata
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+# Copy of MemberSearchService.normalize and build_search_document at the time of this migration
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    without_accents = "".join(
+        character for character in decomposed if not unicodedata.combining(character)
+    )
+    return " ".join(without_accents.casefold().split())
+
+
+def build_search_document(share_owner) -> str:
+    parts = [
+        str(share_owner.id),
+        share_owner.first_name,
+        share_owner.last_name,
+        share_owner.usage_name,
+        share_owner.company_name,
+    ]
+    if share_owner.user is not None:
+        parts.extend(
+            [
+                share_owner.user.first_name,
+                share_owner.user.last_name,
+                share_owner.user.usage_name,
+            ]
+        )
+    return normalize(" ".join(part for part in parts if part))
+
+
+def build_search_documents(apps, schema_editor):
+    ShareOwner = apps.get_model("coop", "ShareOwner")
+    share_owners = list(ShareOwner.objects.select_related("user"))
+    for share_owner in share_owners:
+        share_owner.search_document = build_search_document(share_owner)
+    ShareOwner.objects.bulk_update(share_owners, ["search_document"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("coop", "0056_memberstatussnapshot"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="shareowner",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="shareowner",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="shareowner_search_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunPython(build_search_documents, migrations.RunPython.noop),
+    ]
@@ -2,9 +2,12 @@ import datetime
 from typing import Self
 
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Max, Min, PositiveIntegerField, Q, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -14,6 +17,10 @@ from tapir import utils
 from tapir.accounts.models import TapirUser
 from tapir.coop.config import COOP_ENTRY_AMOUNT, COOP_SHARE_PRICE
 from tapir.coop.services.investing_status_service import InvestingStatusService
+from tapir.coop.services.member_search_service import MemberSearchService
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
 from tapir.coop.services.membership_pause_service import MembershipPauseService
 from tapir.coop.services.number_of_shares_service import NumberOfSharesService
 from tapir.core.config import help_text_displayed_name
@@ -39,7 +46,14 @@ class ShareOwner(models.Model):
     """
 
     class Meta:
-        indexes = [models.Index(fields=["is_investing"])]
+        indexes = [
+            models.Index(fields=["is_investing"]),
+            GinIndex(
+                fields=["search_document"],
+                name="shareowner_search_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     # Only for owners that have a user account
     user = models.OneToOneField(
@@ -95,25 +109,18 @@ class ShareOwner(models.Model):
         _("Is willing to gift a share"), null=True, blank=True
     )
     create_account_reminder_email_sent = models.BooleanField(default=False)
+    # Maintained by MemberSearchService, see update_search_document_on_share_owner_change
+    search_document = models.TextField(default="", blank=True, editable=False)
 
     class ShareOwnerQuerySet(models.QuerySet):
-        def with_name(self, search_string: str):
-            searches = [s for s in search_string.split(" ") if s != ""]
-
-            combined_filters = Q(last_name__icontains="")
-            for search in searches:
-                word_filter = (
-                    Q(last_name__unaccent__icontains=search)
-                    | Q(first_name__unaccent__icontains=search)
-                    | Q(usage_name__unaccent__icontains=search)
-                    | Q(user__first_name__unaccent__icontains=search)
-                    | Q(user__usage_name__unaccent__icontains=search)
-                    | Q(user__last_name__unaccent__icontains=search)
-                    | Q(company_name__unaccent__icontains=search)
-                )
-                combined_filters = combined_filters & word_filter
-
-            return self.filter(combined_filters)
+        def with_name(self, search_string: str, limit: int | None = None):
+            """Every word of the search string must be in the name or member number of the member.
+            If a limit is given, returns at most that many members, best matches first.
+            """
+            queryset = MemberSearchService.filter_queryset(self, search_string)
+            if limit is None:
+                return queryset
+            return MemberSearchService.rank_queryset(queryset, search_string)[:limit]
 
         def with_status(
             self, status: str, at_datetime: datetime.datetime | datetime.date = None
@@ -123,6 +130,38 @@ class ShareOwner(models.Model):
 
             at_datetime = ensure_datetime(at_datetime)
 
+            snapshot_date = MemberStatusSnapshotService.get_usable_snapshot_date(
+                at_datetime
+            )
+            if snapshot_date is None:
+                return self.with_status_from_history(status, at_datetime)
+
+            if status == MemberStatus.SOLD:
+                return self.exclude(status_snapshots__date=snapshot_date)
+
+            if status not in [
+                MemberStatus.ACTIVE,
+                MemberStatus.INVESTING,
+                MemberStatus.PAUSED,
+            ]:
+                raise TapirException(f"Invalid status : {status}")
+
+            return self.filter(
+                status_snapshots__date=snapshot_date,
+                status_snapshots__status=status,
+            ).distinct()
+
+        def with_status_from_history(
+            self, status: str, at_datetime: datetime.datetime | datetime.date = None
+        ):
+            # Computes the status from the share ownerships, pauses and log entries instead of reading
+            # the MemberStatusSnapshot table. Used for dates that have not been snapshotted
+            # and to build and verify the snapshots.
+            if at_datetime is None:
+                at_datetime = timezone.now()
+
+            at_datetime = ensure_datetime(at_datetime)
+
             share_owners_with_nb_of_shares = NumberOfSharesService.annotate_share_owner_queryset_with_nb_of_active_shares(
                 ShareOwner.objects.all(), at_datetime.date()
             )
@@ -377,6 +416,38 @@ def get_member_status_translation(searched_status: str) -> str:
             return status[1]
 
 
+class MemberStatusSnapshot(models.Model):
+    """Materialized status of a member at the start of a given day.
+
+    Only non-sold statuses are stored: a member without a row for a snapshotted date was not a member at that date.
+    See MemberStatusSnapshotService for how the rows are built and kept up to date.
+    """
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["share_owner", "date"],
+                name="member_status_snapshot_unique_member_date",
+            )
+        ]
+        indexes = [models.Index(fields=["date", "status"])]
+
+    share_owner = models.ForeignKey(
+        ShareOwner, related_name="status_snapshots", on_delete=models.CASCADE
+    )
+    date = models.DateField(null=False, blank=False)
+    status = models.CharField(
+        max_length=16, choices=MEMBER_STATUS_CHOICES, null=False, blank=False
+    )
+
+
+class MemberStatusSnapshotDate(models.Model):
+    """Marks a date for which MemberStatusSnapshot rows have been built for all members."""
+
+    date = models.DateField(unique=True, null=False, blank=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+
 class UpdateShareOwnerLogEntry(UpdateModelLogEntry):
     template_name = "coop/log/update_share_owner_log_entry.html"
 
@@ -866,3 +937,83 @@ class MembershipResignationDeleteLogEntry(ModelLogEntry):
         return super().populate_base(
             actor=actor, share_owner=model.share_owner, model=model
         )
+
+
+@receiver(post_save, sender=ShareOwnership)
+@receiver(post_delete, sender=ShareOwnership)
+@receiver(post_save, sender=MembershipPause)
+@receiver(post_delete, sender=MembershipPause)
+def update_member_status_snapshots_on_duration_change(
+    sender, instance: ShareOwnership | MembershipPause, **kwargs
+):
+    MemberStatusSnapshotService.update_snapshots_for_member(instance.share_owner_id)
+
+
+@receiver(pre_save, sender=ShareOwner)
+def detect_investing_status_change(sender, instance: ShareOwner, **kwargs):
+    if instance.id is None:
+        return
+
+    previous_is_investing = (
+        sender.objects.filter(id=instance.id)
+        .values_list("is_investing", flat=True)
+        .first()
+    )
+    instance._investing_status_changed = (
+        previous_is_investing is not None
+        and previous_is_investing != instance.is_investing
+    )
+
+
+@receiver(post_save, sender=ShareOwner)
+def update_member_status_snapshots_on_investing_change(
+    sender, instance: ShareOwner, **kwargs
+):
+    if not getattr(instance, "_investing_status_changed", False):
+        return
+
+    instance._investing_status_changed = False
+    MemberStatusSnapshotService.update_snapshots_for_member(instance.id)
+
+
+@receiver(post_save, sender=UpdateShareOwnerLogEntry)
+def update_member_status_snapshots_on_investing_log_entry(
+    sender, instance: UpdateShareOwnerLogEntry, **kwargs
+):
+    # The past investing status is read from those log entries, see InvestingStatusService
+    if "is_investing" not in instance.old_values:
+        return
+
+    share_owner_id = instance.share_owner_id
+    if share_owner_id is None:
+        share_owner_id = (
+            ShareOwner.objects.filter(user_id=instance.user_id)
+            .values_list("id", flat=True)
+            .first()
+        )
+    if share_owner_id is None:
+        return
+
+    MemberStatusSnapshotService.update_snapshots_for_member(share_owner_id)
+
+
+@receiver(post_save, sender=ShareOwner)
+def update_search_document_on_share_owner_change(
+    sender, instance: ShareOwner, raw=False, **kwargs
+):
+    if raw:
+        return
+    MemberSearchService.update_search_documents([instance])
+
+
+@receiver(post_save, sender=TapirUser)
+def update_search_document_on_user_change(
+    sender, instance: TapirUser, raw=False, **kwargs
+):
+    if raw:
+        return
+    share_owner = ShareOwner.objects.filter(user=instance).first()
+    if share_owner is None:
+        return
+    share_owner.user = instance
+    MemberSearchService.update_search_documents([share_owner])
@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 from typing import TYPE_CHECKING
 
-from django.db.models import Case, OuterRef, Q, QuerySet, Value, When
+from django.db.models import Case, CharField, QuerySet, Subquery, Value, When
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
@@ -48,16 +48,18 @@ class InvestingStatusService:
         if at_datetime is None:
             at_datetime = timezone.now()
 
-        from tapir.coop.models import UpdateShareOwnerLogEntry
+        from tapir.coop.models import ShareOwner
+        from tapir.log.services.attribute_history_service import (
+            AttributeHistoryService,
+        )
 
         queryset = queryset.annotate(
-            was_investing_as_string=UpdateShareOwnerLogEntry.objects.filter(
-                Q(share_owner_id=OuterRef("id")) | Q(user_id=OuterRef("user_id")),
-                created_date__gte=at_datetime,
-                old_values__has_key="is_investing",
+            was_investing_as_string=Subquery(
+                AttributeHistoryService.get_intervals_at_datetime(
+                    ShareOwner, "is_investing", at_datetime
+                ).values("value")[:1],
+                output_field=CharField(),
             )
-            .order_by("created_date")
-            .values("old_values__is_investing")[:1]
         )
 
         queryset = queryset.annotate(
@@ -0,0 +1,135 @@
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable
+
+import django
+from django.db import connections
+
+from tapir.coop.services.jahresabschluss_report import JahresabschlussReport
+
+
+class JahresabschlussExportService:
+    """Writes the Jahresabschluss to a file chunk by chunk.
+
+    After each chunk, the ID of the last exported member and the size of the file are stored next to the output file.
+    If the export gets interrupted, it can be resumed from there instead of starting over.
+    """
+
+    @staticmethod
+    def get_progress_file_path(output_path: str) -> str:
+        return f"{output_path}.progress"
+
+    @classmethod
+    def load_progress(cls, output_path: str, parameters: dict) -> dict | None:
+        progress_file_path = cls.get_progress_file_path(output_path)
+        if not os.path.exists(progress_file_path) or not os.path.exists(output_path):
+            return None
+        with open(progress_file_path) as progress_file:
+            progress = json.load(progress_file)
+        if progress["parameters"] != parameters:
+            return None
+        return progress
+
+    @classmethod
+    def save_progress(
+        cls, output_path: str, parameters: dict, last_id: int, file_size: int
+    ):
+        progress_file_path = cls.get_progress_file_path(output_path)
+        with open(f"{progress_file_path}.part", "w") as progress_file:
+            json.dump(
+                {"parameters": parameters, "last_id": last_id, "file_size": file_size},
+                progress_file,
+            )
+        os.replace(f"{progress_file_path}.part", progress_file_path)
+
+    @classmethod
+    def export(
+        cls,
+        parameters: dict,
+        output_path: str,
+        chunk_size: int = JahresabschlussReport.CHUNK_SIZE,
+        workers: int = 1,
+        resume: bool = False,
+        on_progress: Callable[[int, int], None] | None = None,
+    ):
+        """on_progress gets called after each chunk with the number of finished chunks and the total number of chunks."""
+        JahresabschlussReport.validate_parameters(parameters)
+
+        progress = cls.load_progress(output_path, parameters) if resume else None
+        if progress is None:
+            with open(output_path, "w", newline="") as output_file:
+                csv.writer(output_file).writerow(
+                    JahresabschlussReport.get_header(parameters)
+                )
+            after_id = None
+        else:
+            # Rows that got written after the last saved progress are written again
+            with open(output_path, "r+") as output_file:
+                output_file.truncate(progress["file_size"])
+            after_id = progress["last_id"]
+
+        chunks = JahresabschlussReport.get_chunks(chunk_size, after_id)
+        with open(output_path, "a", newline="") as output_file:
+            writer = csv.writer(output_file)
+            for index, ((_, last_id), rows) in enumerate(
+                cls.compute_chunks(parameters, chunks, workers)
+            ):
+                writer.writerows(rows)
+                output_file.flush()
+                cls.save_progress(output_path, parameters, last_id, output_file.tell())
+                if on_progress is not None:
+                    on_progress(index + 1, len(chunks))
+
+        os.remove(cls.get_progress_file_path(output_path))
+
+    @classmethod
+    def compute_chunks(
+        cls, parameters: dict, chunks: list[tuple[int, int]], workers: int
+    ) -> Iterable[tuple[tuple[int, int], list[list]]]:
+        """Yields the chunks in order, together with their rows."""
+        if workers <= 1:
+            for first_id, last_id in chunks:
+                yield (
+                    (first_id, last_id),
+                    JahresabschlussReport.generate_rows_for_chunk(
+                        parameters, first_id, last_id
+                    ),
+                )
+            return
+
+        # The child processes must not share the database connection of the parent process.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=django.setup
+        ) as executor:
+            # Only a few chunks are computed in advance, so that the memory usage stays constant
+            # even if the output is written slower than the chunks are computed.
+            pending = deque()
+            chunks_iterator = iter(chunks)
+            for chunk in chunks_iterator:
+                pending.append((chunk, cls.submit_chunk(executor, parameters, chunk)))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+                next_chunk = next(chunks_iterator, None)
+                if next_chunk is not None:
+                    pending.append(
+                        (next_chunk, cls.submit_chunk(executor, parameters, next_chunk))
+                    )
+
+    @staticmethod
+    def submit_chunk(
+        executor: ProcessPoolExecutor, parameters: dict, chunk: tuple[int, int]
+    ):
+        first_id, last_id = chunk
+        return executor.submit(
+            JahresabschlussReport.generate_rows_for_chunk,
+            parameters,
+            first_id,
+            last_id,
+        )
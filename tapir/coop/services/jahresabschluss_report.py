@@ -0,0 +1,171 @@
+import datetime
+
+from django.utils import timezone
+
+from tapir.coop.models import ShareOwner
+from tapir.core.services.base_report import BaseReport
+from tapir.settings import PERMISSION_ACCOUNTING_VIEW
+from tapir.statistics.services.dataset_export_column_builder import (
+    DatasetExportColumnBuilder,
+)
+
+
+class JahresabschlussReport(BaseReport):
+    PARAMETER_DATE = "date"
+    CHUNK_SIZE = 500
+    COLUMNS = [
+        "member_status",
+        "is_member_since",
+        "member_number",
+        "legal_name",
+        "full_address",
+        "compulsory_share",
+        "additional_shares",
+        "currently_paid",
+        "amount_paid_for_entry_fee",
+        "amount_paid_for_shares",
+        "number_of_paid_shares",
+        "number_of_unpaid_shares",
+        "ratenzahlung",
+    ]
+
+    @classmethod
+    def get_report_type(cls) -> str:
+        return "jahresabschluss"
+
+    @classmethod
+    def get_file_name(cls, parameters: dict) -> str:
+        return f"jahresabschluss_{parameters[cls.PARAMETER_DATE]}.csv"
+
+    @classmethod
+    def validate_parameters(cls, parameters: dict):
+        date_as_string = parameters.get(cls.PARAMETER_DATE)
+        try:
+            datetime.datetime.fromisoformat(date_as_string)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid date: {date_as_string}")
+
+    @classmethod
+    def get_reference_datetime(cls, parameters: dict) -> datetime.datetime:
+        date = datetime.datetime.fromisoformat(parameters[cls.PARAMETER_DATE])
+        return timezone.now().replace(
+            year=date.year,
+            month=date.month,
+            day=date.day,
+            hour=23,
+            minute=59,
+            second=59,
+        )
+
+    @classmethod
+    def get_header(cls, parameters: dict) -> list[str]:
+        reference_datetime = cls.get_reference_datetime(parameters)
+        return [
+            f"Status am {reference_datetime.strftime('%d.%m.%Y')}",
+            "Beitrittsdatum",
+            "Mitgliedsnummer",
+            "Name",
+            "Anschrift",
+            "Pflichtanteil (#)",
+            "Weitere Anteile (#)",
+            "Zahlung (in €)",
+            "davon Eintrittsgeld (€)",
+            "davon Geschäftsguthaben (in €)",
+            f"bezahlte Geschäftsguthaben (#) am {reference_datetime.strftime('%d.%m.%Y')}",
+            f"unbezahlte Geschäftsguthaben (#) am {reference_datetime.strftime('%d.%m.%Y')}",
+            "Ratenzahlung",
+        ]
+
+    @classmethod
+    def get_required_permissions(cls) -> list[str]:
+        return [PERMISSION_ACCOUNTING_VIEW]
+
+    @classmethod
+    def get_row_count(cls, parameters: dict) -> int | None:
+        return ShareOwner.objects.count()
+
+    @classmethod
+    def get_chunks(
+        cls, chunk_size: int = CHUNK_SIZE, after_id: int | None = None
+    ) -> list[tuple[int, int]]:
+        """Returns (first_id, last_id) of each chunk of members, in ascending order."""
+        member_ids = ShareOwner.objects.order_by("id")
+        if after_id is not None:
+            member_ids = member_ids.filter(id__gt=after_id)
+        member_ids = list(member_ids.values_list("id", flat=True))
+        return [
+            (
+                member_ids[index],
+                member_ids[min(index + chunk_size, len(member_ids)) - 1],
+            )
+            for index in range(0, len(member_ids), chunk_size)
+        ]
+
+    @classmethod
+    def generate_rows(cls, parameters: dict):
+        for first_id, last_id in cls.get_chunks():
+            yield from cls.generate_rows_for_chunk(parameters, first_id, last_id)
+
+    @classmethod
+    def generate_rows_for_chunk(
+        cls, parameters: dict, first_id: int, last_id: int
+    ) -> list[list]:
+        # Annotating only one chunk at a time keeps the queries and the memory usage small.
+        reference_datetime = cls.get_reference_datetime(parameters)
+        members = DatasetExportColumnBuilder.prepare_queryset(
+            ShareOwner.objects.filter(id__gte=first_id, id__lte=last_id).order_by("id"),
+            cls.COLUMNS,
+            reference_datetime,
+        )
+
+        rows = []
+        for member in members:
+            row = cls.build_row(member, reference_datetime)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    @staticmethod
+    def build_row(member: ShareOwner, reference_datetime: datetime.datetime):
+        member_since = DatasetExportColumnBuilder.build_column_is_member_since(
+            member, reference_datetime
+        )
+        if not member_since:
+            return None
+        member_since = member_since.strftime("%d.%m.%Y")
+
+        return [
+            DatasetExportColumnBuilder.build_column_member_status(
+                member, reference_datetime
+            ),
+            member_since,
+            DatasetExportColumnBuilder.build_column_member_number(member),
+            DatasetExportColumnBuilder.build_column_legal_name(member),
+            DatasetExportColumnBuilder.build_column_full_address(member),
+            DatasetExportColumnBuilder.build_column_compulsory_share(
+                member, reference_datetime
+            ),
+            DatasetExportColumnBuilder.build_column_additional_shares(
+                member, reference_datetime
+            ),
+            DatasetExportColumnBuilder.build_column_currently_paid(
+                member, reference_datetime
+            ),
+            DatasetExportColumnBuilder.build_column_amount_paid_for_entry_fee(
+                member, reference_datetime
+            ),
+            DatasetExportColumnBuilder.build_column_amount_paid_for_shares(
+                member, reference_datetime
+            ),
+            DatasetExportColumnBuilder.build_column_number_of_paid_shares(
+                member, reference_datetime
+            ),
+            DatasetExportColumnBuilder.build_column_number_of_unpaid_shares(
+                member, reference_datetime
+            ),
+            (
+                "ja"
+                if DatasetExportColumnBuilder.build_column_ratenzahlung(member)
+                else "nein"
+            ),
+        ]
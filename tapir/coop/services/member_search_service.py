@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import unicodedata
+from typing import TYPE_CHECKING, Iterable
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Q, QuerySet
+
+if TYPE_CHECKING:
+    from tapir.coop.models import ShareOwner
+
+
+class MemberSearchService:
+    """Searching members by name goes through ShareOwner.search_document: the names of the member and of
+    their account, the company name and the member number, lowercased and without accents.
+    The column has a trigram index, which makes "contains" searches fast even with many members.
+    """
+
+    ANNOTATION_SEARCH_RANK = "search_rank"
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        # Same idea as postgres' unaccent: "Jérôme Groß" becomes "jerome gross"
+        decomposed = unicodedata.normalize("NFKD", text)
+        without_accents = "".join(
+            character
+            for character in decomposed
+            if not unicodedata.combining(character)
+        )
+        return " ".join(without_accents.casefold().split())
+
+    @classmethod
+    def build_search_document(cls, share_owner: ShareOwner) -> str:
+        parts = [
+            str(share_owner.id),
+            share_owner.first_name,
+            share_owner.last_name,
+            share_owner.usage_name,
+            share_owner.company_name,
+        ]
+        if share_owner.user is not None:
+            parts.extend(
+                [
+                    share_owner.user.first_name,
+                    share_owner.user.last_name,
+                    share_owner.user.usage_name,
+                ]
+            )
+        return cls.normalize(" ".join(part for part in parts if part))
+
+    @classmethod
+    def update_search_documents(cls, share_owners: Iterable[ShareOwner]):
+        # Must import locally to avoid import loop.
+        from tapir.coop.models import ShareOwner
+
+        share_owners_to_update = []
+        for share_owner in share_owners:
+            search_document = cls.build_search_document(share_owner)
+            if search_document == share_owner.search_document:
+                continue
+            share_owner.search_document = search_document
+            share_owners_to_update.append(share_owner)
+
+        # bulk_update doesn't send signals, which avoids updating the documents again from the post_save receiver
+        ShareOwner.objects.bulk_update(share_owners_to_update, ["search_document"])
+
+    @classmethod
+    def filter_queryset(
+        cls, queryset: QuerySet[ShareOwner], search_string: str
+    ) -> QuerySet[ShareOwner]:
+        combined_filters = Q()
+        for search in cls.normalize(search_string).split(" "):
+            if search:
+                combined_filters &= Q(search_document__contains=search)
+        return queryset.filter(combined_filters)
+
+    @classmethod
+    def rank_queryset(
+        cls, queryset: QuerySet[ShareOwner], search_string: str
+    ) -> QuerySet[ShareOwner]:
+        return queryset.annotate(
+            **{
+                cls.ANNOTATION_SEARCH_RANK: TrigramWordSimilarity(
+                    cls.normalize(search_string), "search_document"
+                )
+            }
+        ).order_by(f"-{cls.ANNOTATION_SEARCH_RANK}", "id")
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import datetime
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from tapir.utils.shortcuts import ensure_datetime
+
+if TYPE_CHECKING:
+    from tapir.coop.models import MembershipPause, ShareOwner, ShareOwnership
+
+
+class MemberStatusSnapshotService:
+    @staticmethod
+    def get_statuses_stored_in_snapshot() -> list[str]:
+        # Members that are not stored for a snapshotted date have the status MemberStatus.SOLD
+        from tapir.coop.models import MemberStatus
+
+        return [MemberStatus.ACTIVE, MemberStatus.INVESTING, MemberStatus.PAUSED]
+
+    @staticmethod
+    def get_usable_snapshot_date(
+        at_datetime: datetime.datetime,
+    ) -> datetime.date | None:
+        from tapir.coop.models import MemberStatusSnapshotDate, UpdateShareOwnerLogEntry
+
+        snapshot_date = at_datetime.date()
+        if not MemberStatusSnapshotDate.objects.filter(date=snapshot_date).exists():
+            return None
+
+        # The snapshot contains the status at the start of the day.
+        # Shares and pauses are date-based, but the investing status can change during the day.
+        snapshot_datetime = ensure_datetime(snapshot_date)
+        if snapshot_datetime == at_datetime:
+            return snapshot_date
+
+        investing_status_changed_in_between = UpdateShareOwnerLogEntry.objects.filter(
+            created_date__gte=min(snapshot_datetime, at_datetime),
+            created_date__lt=max(snapshot_datetime, at_datetime),
+            old_values__has_key="is_investing",
+        ).exists()
+        if investing_status_changed_in_between:
+            return None
+
+        return snapshot_date
+
+    @staticmethod
+    def get_snapshotted_dates(dates: list[datetime.date]) -> set[datetime.date]:
+        from tapir.coop.models import MemberStatusSnapshotDate
+
+        return set(
+            MemberStatusSnapshotDate.objects.filter(date__in=dates).values_list(
+                "date", flat=True
+            )
+        )
+
+    @classmethod
+    def count_members_by_date(
+        cls, statuses: list[str], dates: list[datetime.date]
+    ) -> dict[datetime.date, int]:
+        """Returns the number of members with one of the given statuses at the start of each date."""
+        from tapir.coop.models import MemberStatusSnapshot
+
+        snapshotted_dates = cls.get_snapshotted_dates(dates)
+        counts = {snapshot_date: 0 for snapshot_date in snapshotted_dates}
+        counts.update(
+            MemberStatusSnapshot.objects.filter(
+                date__in=snapshotted_dates, status__in=statuses
+            )
+            .values("date")
+            .annotate(count=Count("share_owner_id"))
+            .values_list("date", "count")
+        )
+        for date, member_ids in cls.compute_member_ids_by_date(
+            statuses, [date for date in dates if date not in snapshotted_dates]
+        ).items():
+            counts[date] = len(member_ids)
+        return counts
+
+    @classmethod
+    def get_member_ids_by_date(
+        cls, statuses: list[str], dates: list[datetime.date]
+    ) -> dict[datetime.date, set[int]]:
+        """Same as count_members_by_date but returns the IDs of the members."""
+        from tapir.coop.models import MemberStatusSnapshot
+
+        snapshotted_dates = cls.get_snapshotted_dates(dates)
+        member_ids_by_date = {
+            snapshot_date: set() for snapshot_date in snapshotted_dates
+        }
+        for snapshot_date, share_owner_id in MemberStatusSnapshot.objects.filter(
+            date__in=snapshotted_dates, status__in=statuses
+        ).values_list("date", "share_owner_id"):
+            member_ids_by_date[snapshot_date].add(share_owner_id)
+        member_ids_by_date.update(
+            cls.compute_member_ids_by_date(
+                statuses, [date for date in dates if date not in snapshotted_dates]
+            )
+        )
+        return member_ids_by_date
+
+    @classmethod
+    def compute_member_ids_by_date(
+        cls, statuses: list[str], dates: list[datetime.date]
+    ) -> dict[datetime.date, set[int]]:
+        """Computes the statuses from the history for dates that have not been snapshotted, usually the past dates
+        from before the snapshots were introduced. The history of all members is loaded once for all dates.
+        """
+        from tapir.coop.models import ShareOwner
+
+        member_ids_by_date = {date: set() for date in dates}
+        if not dates:
+            return member_ids_by_date
+
+        investing_changes_by_share_owner_id = (
+            cls.get_investing_status_changes_by_share_owner_id()
+        )
+        for share_owner in ShareOwner.objects.prefetch_related(
+            "share_ownerships", "membershippause_set"
+        ):
+            for date in dates:
+                status = cls.compute_status_at_date(
+                    share_ownerships=share_owner.share_ownerships.all(),
+                    pauses=share_owner.membershippause_set.all(),
+                    is_investing_now=share_owner.is_investing,
+                    investing_changes=investing_changes_by_share_owner_id[
+                        share_owner.id
+                    ],
+                    at_date=date,
+                )
+                if status in statuses:
+                    member_ids_by_date[date].add(share_owner.id)
+        return member_ids_by_date
+
+    @classmethod
+    @transaction.atomic
+    def build_snapshot(cls, at_date: datetime.date):
+        from tapir.coop.models import (
+            MemberStatusSnapshot,
+            MemberStatusSnapshotDate,
+            ShareOwner,
+        )
+
+        snapshots = []
+        for status in cls.get_statuses_stored_in_snapshot():
+            share_owner_ids = ShareOwner.objects.with_status_from_history(
+                status, at_date
+            ).values_list("id", flat=True)
+            snapshots.extend(
+                [
+                    MemberStatusSnapshot(
+                        share_owner_id=share_owner_id, date=at_date, status=status
+                    )
+                    for share_owner_id in share_owner_ids
+                ]
+            )
+
+        MemberStatusSnapshot.objects.filter(date=at_date).delete()
+        MemberStatusSnapshot.objects.bulk_create(snapshots, batch_size=1000)
+        MemberStatusSnapshotDate.objects.get_or_create(date=at_date)
+
+    @staticmethod
+    def get_snapshot_mismatches(at_date: datetime.date) -> dict[int, tuple[str, str]]:
+        """Returns {share_owner_id: (status_in_snapshot, status_from_history)} for all members where they differ."""
+        from tapir.coop.models import MemberStatus, MemberStatusSnapshot, ShareOwner
+
+        statuses_in_snapshot = dict(
+            MemberStatusSnapshot.objects.filter(date=at_date).values_list(
+                "share_owner_id", "status"
+            )
+        )
+        statuses_from_history = {}
+        for status in MemberStatusSnapshotService.get_statuses_stored_in_snapshot():
+            for share_owner_id in ShareOwner.objects.with_status_from_history(
+                status, at_date
+            ).values_list("id", flat=True):
+                statuses_from_history[share_owner_id] = status
+
+        mismatches = {}
+        for share_owner_id in (
+            statuses_in_snapshot.keys() | statuses_from_history.keys()
+        ):
+            status_in_snapshot = statuses_in_snapshot.get(
+                share_owner_id, MemberStatus.SOLD
+            )
+            status_from_history = statuses_from_history.get(
+                share_owner_id, MemberStatus.SOLD
+            )
+            if status_in_snapshot != status_from_history:
+                mismatches[share_owner_id] = (status_in_snapshot, status_from_history)
+        return mismatches
+
+    @classmethod
+    @transaction.atomic
+    def update_snapshots_for_member(
+        cls, share_owner_id: int, from_date: datetime.date | None = None
+    ):
+        from tapir.coop.models import (
+            MemberStatus,
+            MemberStatusSnapshot,
+            MemberStatusSnapshotDate,
+            ShareOwner,
+        )
+
+        snapshot_dates = MemberStatusSnapshotDate.objects.all()
+        if from_date is not None:
+            snapshot_dates = snapshot_dates.filter(date__gte=from_date)
+        snapshot_dates = list(snapshot_dates.values_list("date", flat=True))
+        if not snapshot_dates:
+            return
+
+        share_owner = (
+            ShareOwner.objects.filter(id=share_owner_id)
+            .prefetch_related("share_ownerships", "membershippause_set")
+            .first()
+        )
+        if share_owner is None:
+            return
+
+        investing_changes = cls.get_investing_status_changes(share_owner)
+        existing_statuses = dict(
+            MemberStatusSnapshot.objects.filter(
+                share_owner_id=share_owner_id, date__in=snapshot_dates
+            ).values_list("date", "status")
+        )
+
+        changed_dates = []
+        snapshots_to_create = []
+        for snapshot_date in snapshot_dates:
+            status = cls.compute_status_at_date(
+                share_ownerships=share_owner.share_ownerships.all(),
+                pauses=share_owner.membershippause_set.all(),
+                is_investing_now=share_owner.is_investing,
+                investing_changes=investing_changes,
+                at_date=snapshot_date,
+            )
+            if existing_statuses.get(snapshot_date, MemberStatus.SOLD) == status:
+                continue
+
+            changed_dates.append(snapshot_date)
+            if status != MemberStatus.SOLD:
+                snapshots_to_create.append(
+                    MemberStatusSnapshot(
+                        share_owner_id=share_owner_id, date=snapshot_date, status=status
+                    )
+                )
+
+        if not changed_dates:
+            return
+
+        MemberStatusSnapshot.objects.filter(
+            share_owner_id=share_owner_id, date__in=changed_dates
+        ).delete()
+        MemberStatusSnapshot.objects.bulk_create(snapshots_to_create)
+
+    @staticmethod
+    def get_investing_status_changes(
+        share_owner: ShareOwner,
+    ) -> list[tuple[datetime.datetime, str]]:
+        from tapir.coop.models import UpdateShareOwnerLogEntry
+
+        filters = Q(share_owner_id=share_owner.id)
+        if share_owner.user_id is not None:
+            filters |= Q(user_id=share_owner.user_id)
+
+        return list(
+            UpdateShareOwnerLogEntry.objects.filter(
+                filters, old_values__has_key="is_investing"
+            )
+            .order_by("created_date")
+            .values_list("created_date", "old_values__is_investing")
+        )
+
+    @staticmethod
+    def get_investing_status_changes_by_share_owner_id() -> (
+        dict[int, list[tuple[datetime.datetime, str]]]
+    ):
+        """Same as get_investing_status_changes, for all members at once."""
+        from tapir.coop.models import ShareOwner, UpdateShareOwnerLogEntry
+
+        share_owner_id_by_user_id = dict(
+            ShareOwner.objects.filter(user__isnull=False).values_list("user_id", "id")
+        )
+        changes_by_share_owner_id = defaultdict(list)
+        for (
+            share_owner_id,
+            user_id,
+            created_date,
+            old_value,
+        ) in (
+            UpdateShareOwnerLogEntry.objects.filter(old_values__has_key="is_investing")
+            .order_by("created_date")
+            .values_list(
+                "share_owner_id", "user_id", "created_date", "old_values__is_investing"
+            )
+        ):
+            owner_ids = {share_owner_id, share_owner_id_by_user_id.get(user_id)}
+            for owner_id in owner_ids - {None}:
+                changes_by_share_owner_id[owner_id].append((created_date, old_value))
+        return changes_by_share_owner_id
+
+    @staticmethod
+    def compute_status_at_date(
+        share_ownerships: list[ShareOwnership],
+        pauses: list[MembershipPause],
+        is_investing_now: bool,
+        investing_changes: list[tuple[datetime.datetime, str]],
+        at_date: datetime.date,
+    ) -> str:
+        # Python equivalent of ShareOwner.get_member_status
+        # that works on already loaded data, see also InvestingStatusService.
+        from tapir.coop.models import MemberStatus
+
+        if not any(
+            share_ownership.is_active(at_date) for share_ownership in share_ownerships
+        ):
+            return MemberStatus.SOLD
+
+        at_datetime = ensure_datetime(at_date)
+        was_investing = is_investing_now
+        for change_date, old_value in investing_changes:
+            if change_date < at_datetime:
+                continue
+            if old_value in ["True", "False"]:
+                was_investing = old_value == "True"
+            break
+
+        if was_investing:
+            return MemberStatus.INVESTING
+
+        if any(pause.is_active(at_date) for pause in pauses):
+            return MemberStatus.PAUSED
+
+        return MemberStatus.ACTIVE
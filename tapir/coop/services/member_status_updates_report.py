@@ -0,0 +1,46 @@
+from tapir.core.services.base_report import BaseReport
+
+
+class MemberStatusUpdatesReport(BaseReport):
+    @classmethod
+    def get_report_type(cls) -> str:
+        return "member_status_updates"
+
+    @classmethod
+    def get_file_name(cls, parameters: dict) -> str:
+        return "members_status_updates.csv"
+
+    @classmethod
+    def get_header(cls, parameters: dict) -> list[str]:
+        return [
+            "Month",
+            "new_active_members_count",
+            "new_investing_members_count",
+            "new_active_members_without_account_count",
+            "active_to_investing_count",
+            "investing_to_active_count",
+        ]
+
+    @classmethod
+    def get_required_permissions(cls) -> list[str]:
+        # Same data as on the statistics page
+        return []
+
+    @classmethod
+    def generate_rows(cls, parameters: dict):
+        # Must import locally to avoid import loop.
+        from tapir.coop.views import MemberStatusUpdatesJsonView
+
+        months = (
+            MemberStatusUpdatesJsonView.get_and_cache_dates_from_last_year_or_first_share_to_today()
+        )
+        data = MemberStatusUpdatesJsonView.get_data()
+        for index in range(len(months)):
+            yield [
+                months[index],
+                data[0][index],
+                data[1][index],
+                data[2][index],
+                data[3][index],
+                data[4][index],
+            ]
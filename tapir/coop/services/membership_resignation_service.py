@@ -7,12 +7,19 @@ from django.db.models import Q
 
 from tapir.accounts.models import TapirUser
 from tapir.coop.models import MembershipPause, MembershipResignation, ShareOwnership
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
 from tapir.shifts.models import (
     DeleteShiftAttendanceTemplateLogEntry,
     ShiftAttendance,
     ShiftAttendanceTemplate,
 )
+from tapir.shifts.services.dirty_shift_marker_service import DirtyShiftMarkerService
 from tapir.utils.shortcuts import get_timezone_aware_datetime
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
+)
 
 
 class MembershipResignationService:
@@ -39,6 +46,10 @@ class MembershipResignationService:
                 ) | Q(end_date__gte=resignation.pay_out_day)
                 shares = shares.filter(end_date_null_or_after_pay_out_day_filter)
                 shares.update(end_date=new_end_date)
+                MemberStatusSnapshotService.update_snapshots_for_member(
+                    resignation.share_owner_id, resignation.cancellation_date
+                )
+                ShoppingEligibilityService.invalidate([resignation.share_owner_id])
                 return
             case MembershipResignation.ResignationType.GIFT_TO_COOP:
                 resignation.pay_out_day = resignation.cancellation_date
@@ -58,11 +69,23 @@ class MembershipResignationService:
                     for share in shares
                 ]
                 ShareOwnership.objects.bulk_create(shares_to_create)
+                MemberStatusSnapshotService.update_snapshots_for_member(
+                    resignation.transferring_shares_to_id,
+                    resignation.cancellation_date,
+                )
+                ShoppingEligibilityService.invalidate(
+                    [resignation.transferring_shares_to_id]
+                )
             case _:
                 raise ValueError(
                     f"Unknown resignation type: {resignation.resignation_type}"
                 )
 
+        MemberStatusSnapshotService.update_snapshots_for_member(
+            resignation.share_owner_id, resignation.cancellation_date
+        )
+        ShoppingEligibilityService.invalidate([resignation.share_owner_id])
+
         tapir_user: TapirUser = getattr(resignation.share_owner, "user", None)
         if not tapir_user:
             return
@@ -98,6 +121,9 @@ class MembershipResignationService:
             slot__shift__start_time__gte=start_date,
             state__in=ShiftAttendance.STATES_WHERE_THE_MEMBER_IS_EXPECTED_TO_SHOW_UP,
         )
+        DirtyShiftMarkerService.mark_shifts_as_dirty(
+            attendances.values_list("slot__shift_id", flat=True)
+        )
         attendances.update(state=ShiftAttendance.State.CANCELLED)
 
     @classmethod
@@ -110,6 +136,10 @@ class MembershipResignationService:
         resignation.share_owner.share_ownerships.filter(
             end_date=resignation.cancellation_date
         ).update(end_date=None)
+        MemberStatusSnapshotService.update_snapshots_for_member(
+            resignation.share_owner_id, resignation.cancellation_date
+        )
+        ShoppingEligibilityService.invalidate([resignation.share_owner_id])
 
     @classmethod
     def delete_transferred_share_ownerships(cls, resignation: MembershipResignation):
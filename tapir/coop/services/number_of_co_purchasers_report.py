@@ -0,0 +1,32 @@
+from tapir.core.services.base_report import BaseReport
+
+
+class NumberOfCoPurchasersReport(BaseReport):
+    @classmethod
+    def get_report_type(cls) -> str:
+        return "number_of_co_purchasers"
+
+    @classmethod
+    def get_file_name(cls, parameters: dict) -> str:
+        return "number_of_co_purchasers_per_month.csv"
+
+    @classmethod
+    def get_header(cls, parameters: dict) -> list[str]:
+        return [
+            "month",
+            "number_of_co_purchasers",
+        ]
+
+    @classmethod
+    def get_required_permissions(cls) -> list[str]:
+        # Same data as on the statistics page
+        return []
+
+    @classmethod
+    def generate_rows(cls, parameters: dict):
+        # Must import locally to avoid import loop.
+        from tapir.coop.views import NumberOfCoPurchasersJsonView
+
+        data = NumberOfCoPurchasersJsonView.get_number_of_co_purchasers_per_month()
+        for month in data.keys():
+            yield [month, data[month]]
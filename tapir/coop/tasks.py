@@ -5,3 +5,8 @@ from django.core.management import call_command
 @shared_task
 def send_accounting_recap():
     call_command("send_accounting_recap")
+
+
+@shared_task
+def update_member_status_snapshots():
+    call_command("update_member_status_snapshots")
@@ -27,6 +27,12 @@ from tapir.utils.tests_utils import (
     TapirFactoryTestBase,
     mock_timezone_now,
 )
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
+)
+from tapir.welcomedesk.services.welcome_desk_reasons_cannot_shop_service import (
+    WelcomeDeskReasonsCannotShopService,
+)
 
 
 class TestMembershipResignationService(FeatureFlagTestMixin, TapirFactoryTestBase):
@@ -151,6 +157,39 @@ class TestMembershipResignationService(FeatureFlagTestMixin, TapirFactoryTestBas
         for share in share_owner.share_ownerships.all():
             self.assertEqual(share.end_date, self.TODAY)
 
+    def test_updateShiftsAndSharesAndPayOutDay_default_shoppingEligibilityUpdated(
+        self,
+    ):
+        actor = self.login_as_member_office_user()
+        share_owner = ShareOwnerFactory.create(nb_shares=1)
+        share_owner.share_ownerships.update(
+            start_date=self.TODAY - datetime.timedelta(days=100)
+        )
+        eligibility = ShoppingEligibilityService.get_eligibilities(
+            [share_owner.id], self.NOW
+        )[share_owner.id]
+        self.assertNotIn(
+            WelcomeDeskReasonsCannotShopService.REASON_NOT_A_MEMBER,
+            eligibility.reasons_cannot_shop,
+        )
+        resignation = MembershipResignationFactory.create(
+            share_owner=share_owner,
+            resignation_type=MembershipResignation.ResignationType.GIFT_TO_COOP,
+            cancellation_date=self.TODAY - datetime.timedelta(days=1),
+        )
+
+        MembershipResignationService.update_shifts_and_shares_and_pay_out_day(
+            resignation=resignation, actor=actor
+        )
+
+        eligibility = ShoppingEligibilityService.get_eligibilities(
+            [share_owner.id], self.NOW
+        )[share_owner.id]
+        self.assertIn(
+            WelcomeDeskReasonsCannotShopService.REASON_NOT_A_MEMBER,
+            eligibility.reasons_cannot_shop,
+        )
+
     def test_updateShiftsAndSharesAndPayOutDay_resignationTypeTransfer_newSharesCreatedForReceivingMember(
         self,
     ):
@@ -10,8 +10,12 @@ from tapir.coop.models import (
     ShareOwnership,
     UpdateShareOwnerLogEntry,
 )
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
 from tapir.coop.tests.factories import MembershipPauseFactory, ShareOwnerFactory
 from tapir.log.util import freeze_for_log
+from tapir.utils.shortcuts import ensure_datetime
 from tapir.utils.tests_utils import TapirFactoryTestBase, mock_timezone_now
 
 
@@ -182,3 +186,35 @@ class TestShareOwnerQuerySetWithStatus(
                 self.assertEqual(
                     0, queryset.count(), f"Member was expected to not be {status[0]}"
                 )
+
+
+class TestShareOwnerQuerySetWithStatusFromSnapshot(
+    ShareOwnerStatusBaseTestClass, TapirFactoryTestBase
+):
+    def assertMemberStatus(
+        self,
+        member: ShareOwner,
+        expected_status: str,
+        at_date: datetime.date | None = None,
+    ):
+        if not at_date:
+            at_date = timezone.now()
+
+        at_datetime = ensure_datetime(at_date)
+        MemberStatusSnapshotService.build_snapshot(at_datetime.date())
+        self.assertEqual(
+            at_datetime.date(),
+            MemberStatusSnapshotService.get_usable_snapshot_date(at_datetime),
+        )
+
+        for status in MEMBER_STATUS_CHOICES:
+            queryset = ShareOwner.objects.with_status(status[0], at_date)
+            if status[0] == expected_status:
+                self.assertEqual(
+                    1, queryset.count(), f"Member was expected to be {status[0]}"
+                )
+                self.assertIn(member, queryset)
+            else:
+                self.assertEqual(
+                    0, queryset.count(), f"Member was expected to not be {status[0]}"
+                )
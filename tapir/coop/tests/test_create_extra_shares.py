@@ -16,6 +16,12 @@ from tapir.coop.models import (
 )
 from tapir.coop.tests.factories import ShareOwnerFactory
 from tapir.utils.tests_utils import TapirEmailTestMixin, TapirFactoryTestBase
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
+)
+from tapir.welcomedesk.services.welcome_desk_reasons_cannot_shop_service import (
+    WelcomeDeskReasonsCannotShopService,
+)
 
 
 class TestCreateExtraShares(TapirFactoryTestBase, TapirEmailTestMixin):
@@ -66,6 +72,39 @@ class TestCreateExtraShares(TapirFactoryTestBase, TapirEmailTestMixin):
 
         self.assertEqual(7, share_owner.share_ownerships.count())
 
+    def test_create_shares_startingToday_shoppingEligibilityUpdated(self):
+        share_owner: ShareOwner = ShareOwnerFactory.create(nb_shares=1)
+        today = timezone.now().date()
+        share_owner.share_ownerships.update(
+            start_date=today - datetime.timedelta(days=100),
+            end_date=today - datetime.timedelta(days=1),
+        )
+        eligibility = ShoppingEligibilityService.get_eligibilities(
+            [share_owner.id], timezone.now()
+        )[share_owner.id]
+        self.assertIn(
+            WelcomeDeskReasonsCannotShopService.REASON_NOT_A_MEMBER,
+            eligibility.reasons_cannot_shop,
+        )
+
+        self.login_as_member_office_user()
+        self.client.post(
+            reverse(self.VIEW_NAME, args=[share_owner.id]),
+            {
+                "start_date": today,
+                "num_shares": 1,
+            },
+            follow=True,
+        )
+
+        eligibility = ShoppingEligibilityService.get_eligibilities(
+            [share_owner.id], timezone.now()
+        )[share_owner.id]
+        self.assertNotIn(
+            WelcomeDeskReasonsCannotShopService.REASON_NOT_A_MEMBER,
+            eligibility.reasons_cannot_shop,
+        )
+
     def test_create_shares_creates_log_entry(self):
         user = self.login_as_member_office_user()
         self.assertEqual(CreateShareOwnershipsLogEntry.objects.count(), 0)
@@ -0,0 +1,83 @@
+import datetime
+import os
+import tempfile
+
+from tapir.coop.models import ShareOwnership
+from tapir.coop.services.jahresabschluss_export_service import (
+    JahresabschlussExportService,
+)
+from tapir.coop.services.jahresabschluss_report import JahresabschlussReport
+from tapir.coop.tests.factories import ShareOwnerFactory
+from tapir.utils.tests_utils import TapirFactoryTestBase, mock_timezone_now
+
+
+class TestJahresabschlussExportService(TapirFactoryTestBase):
+    PARAMETERS = {JahresabschlussReport.PARAMETER_DATE: "2023-12-31"}
+
+    def setUp(self) -> None:
+        super().setUp()
+        mock_timezone_now(self, datetime.datetime(year=2024, month=2, day=1, hour=12))
+        for _ in range(5):
+            ShareOwnerFactory.create(nb_shares=2)
+        ShareOwnership.objects.update(
+            start_date=datetime.date(year=2020, month=1, day=1), end_date=None
+        )
+
+        output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(output_dir.cleanup)
+        self.output_path = os.path.join(output_dir.name, "jahresabschluss.csv")
+
+    def read_output(self) -> str:
+        with open(self.output_path) as output_file:
+            return output_file.read()
+
+    def test_export_smallChunks_sameResultAsSingleChunk(self):
+        JahresabschlussExportService.export(
+            self.PARAMETERS, self.output_path, chunk_size=100
+        )
+        single_chunk_result = self.read_output()
+
+        JahresabschlussExportService.export(
+            self.PARAMETERS, self.output_path, chunk_size=2
+        )
+
+        self.assertEqual(single_chunk_result, self.read_output())
+        self.assertEqual(6, len(single_chunk_result.splitlines()))
+        self.assertFalse(
+            os.path.exists(
+                JahresabschlussExportService.get_progress_file_path(self.output_path)
+            )
+        )
+
+    def test_export_resumeAfterInterruption_continuesFromLastFinishedChunk(self):
+        JahresabschlussExportService.export(
+            self.PARAMETERS, self.output_path, chunk_size=2
+        )
+        expected_result = self.read_output()
+
+        def interrupt_after_first_chunk(finished_chunks, _):
+            if finished_chunks == 1:
+                raise KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            JahresabschlussExportService.export(
+                self.PARAMETERS,
+                self.output_path,
+                chunk_size=2,
+                on_progress=interrupt_after_first_chunk,
+            )
+        self.assertEqual(3, len(self.read_output().splitlines()))
+
+        finished_chunks = []
+        JahresabschlussExportService.export(
+            self.PARAMETERS,
+            self.output_path,
+            chunk_size=2,
+            resume=True,
+            on_progress=lambda finished, total: finished_chunks.append(
+                (finished, total)
+            ),
+        )
+
+        self.assertEqual(expected_result, self.read_output())
+        self.assertEqual([(1, 2), (2, 2)], finished_chunks)
@@ -0,0 +1,61 @@
+from django.test import SimpleTestCase
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.coop.models import ShareOwner
+from tapir.coop.services.member_search_service import MemberSearchService
+from tapir.coop.tests.factories import ShareOwnerFactory
+from tapir.utils.tests_utils import TapirFactoryTestBase
+
+
+class TestMemberSearchServiceNormalize(SimpleTestCase):
+    def test_normalize_textWithAccentsAndUpperCase_returnsPlainLowerCase(self):
+        self.assertEqual(
+            "jerome gross zoe", MemberSearchService.normalize("  Jérôme  Groß Zoë ")
+        )
+
+
+class TestMemberSearchService(TapirFactoryTestBase):
+    def test_save_shareOwnerWithoutUser_searchDocumentContainsNamesAndNumber(self):
+        share_owner = ShareOwnerFactory.create(
+            first_name="Sören",
+            last_name="Müller",
+            usage_name="",
+            company_name="Bäckerei",
+        )
+
+        share_owner.refresh_from_db()
+        self.assertEqual(
+            f"{share_owner.id} soren muller backerei", share_owner.search_document
+        )
+
+    def test_save_userNameChanged_searchDocumentOfShareOwnerIsUpdated(self):
+        tapir_user = TapirUserFactory.create()
+
+        tapir_user.usage_name = "Inès"
+        tapir_user.save()
+
+        self.assertIn("ines", ShareOwner.objects.get(user=tapir_user).search_document)
+
+    def test_withName_searchWithoutAccents_findsMemberWithAccents(self):
+        tapir_user = TapirUserFactory.create(first_name="Jérôme", last_name="Groß")
+        TapirUserFactory.create(first_name="Anna", last_name="Schmidt")
+
+        self.assertEqual(
+            [tapir_user.share_owner],
+            list(ShareOwner.objects.with_name("jerome GROSS")),
+        )
+
+    def test_withName_withLimit_returnsBestMatchesFirst(self):
+        partial_match = ShareOwnerFactory.create(
+            first_name="Annabelle", last_name="Meyer", usage_name="", company_name=""
+        )
+        exact_match = ShareOwnerFactory.create(
+            first_name="Anna", last_name="Meyer", usage_name="", company_name=""
+        )
+        ShareOwnerFactory.create(
+            first_name="Annette", last_name="Meyer", usage_name="", company_name=""
+        )
+
+        results = list(ShareOwner.objects.with_name("anna meyer", limit=2))
+
+        self.assertEqual([exact_match, partial_match], results)
@@ -0,0 +1,191 @@
+import datetime
+
+from tapir.coop.models import (
+    MemberStatus,
+    MemberStatusSnapshot,
+    ShareOwner,
+    ShareOwnership,
+    UpdateShareOwnerLogEntry,
+)
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
+from tapir.coop.tests.factories import MembershipPauseFactory, ShareOwnerFactory
+from tapir.log.util import freeze_for_log
+from tapir.utils.shortcuts import get_timezone_aware_datetime
+from tapir.utils.tests_utils import TapirFactoryTestBase, mock_timezone_now
+
+
+class TestMemberStatusSnapshotService(TapirFactoryTestBase):
+    REFERENCE_DATE = datetime.date(year=2023, month=6, day=15)
+
+    def setUp(self) -> None:
+        super().setUp()
+        mock_timezone_now(self, datetime.datetime(year=2023, month=6, day=15, hour=12))
+
+    def create_active_member(self) -> ShareOwner:
+        share_owner = ShareOwnerFactory.create(nb_shares=1, is_investing=False)
+        ShareOwnership.objects.filter(share_owner=share_owner).update(
+            start_date=datetime.date(year=2020, month=1, day=1), end_date=None
+        )
+        return share_owner
+
+    def test_buildSnapshot_default_doesNotStoreSoldMembers(self):
+        active_member = self.create_active_member()
+        ShareOwnerFactory.create(nb_shares=0)
+
+        MemberStatusSnapshotService.build_snapshot(self.REFERENCE_DATE)
+
+        self.assertEqual(
+            {active_member.id: MemberStatus.ACTIVE},
+            dict(
+                MemberStatusSnapshot.objects.filter(
+                    date=self.REFERENCE_DATE
+                ).values_list("share_owner_id", "status")
+            ),
+        )
+
+    def test_withStatus_snapshotExists_readsFromSnapshot(self):
+        member = self.create_active_member()
+        MemberStatusSnapshotService.build_snapshot(self.REFERENCE_DATE)
+        MemberStatusSnapshot.objects.filter(share_owner=member).update(
+            status=MemberStatus.PAUSED
+        )
+
+        self.assertIn(
+            member,
+            ShareOwner.objects.with_status(MemberStatus.PAUSED, self.REFERENCE_DATE),
+        )
+        self.assertNotIn(
+            member,
+            ShareOwner.objects.with_status_from_history(
+                MemberStatus.PAUSED, self.REFERENCE_DATE
+            ),
+        )
+
+    def test_withStatus_dateNotSnapshotted_usesHistory(self):
+        member = self.create_active_member()
+        MemberStatusSnapshotService.build_snapshot(self.REFERENCE_DATE)
+
+        other_date = self.REFERENCE_DATE - datetime.timedelta(days=1)
+        self.assertIsNone(
+            MemberStatusSnapshotService.get_usable_snapshot_date(
+                get_timezone_aware_datetime(other_date, datetime.time())
+            )
+        )
+        self.assertIn(
+            member, ShareOwner.objects.with_status(MemberStatus.ACTIVE, other_date)
+        )
+
+    def test_getUsableSnapshotDate_investingStatusChangedDuringTheDay_returnsNone(
+        self,
+    ):
+        member = self.create_active_member()
+        MemberStatusSnapshotService.build_snapshot(self.REFERENCE_DATE)
+
+        old_frozen = freeze_for_log(member)
+        member.is_investing = True
+        member.save()
+        UpdateShareOwnerLogEntry().populate(
+            old_frozen, freeze_for_log(member), member, None
+        ).save()
+
+        later_that_day = get_timezone_aware_datetime(
+            self.REFERENCE_DATE, datetime.time(hour=13)
+        )
+        self.assertIsNone(
+            MemberStatusSnapshotService.get_usable_snapshot_date(later_that_day)
+        )
+        self.assertIn(
+            member,
+            ShareOwner.objects.with_status(MemberStatus.INVESTING, later_that_day),
+        )
+        self.assertIn(
+            member,
+            ShareOwner.objects.with_status(MemberStatus.ACTIVE, self.REFERENCE_DATE),
+        )
+
+    def test_shareOwnershipSaved_backdatedEndDate_snapshotUpdated(self):
+        member = self.create_active_member()
+        MemberStatusSnapshotService.build_snapshot(self.REFERENCE_DATE)
+
+        share_ownership = member.share_ownerships.get()
+        share_ownership.end_date = self.REFERENCE_DATE - datetime.timedelta(days=10)
+        share_ownership.save()
+
+        self.assertFalse(
+            MemberStatusSnapshot.objects.filter(share_owner=member).exists()
+        )
+        self.assertIn(
+            member,
+            ShareOwner.objects.with_status(MemberStatus.SOLD, self.REFERENCE_DATE),
+        )
+
+    def test_pauseCreated_coversSnapshotDate_snapshotUpdated(self):
+        member = self.create_active_member()
+        MemberStatusSnapshotService.build_snapshot(self.REFERENCE_DATE)
+
+        MembershipPauseFactory.create(
+            share_owner=member,
+            start_date=self.REFERENCE_DATE - datetime.timedelta(days=5),
+            end_date=self.REFERENCE_DATE + datetime.timedelta(days=5),
+        )
+
+        self.assertEqual(
+            MemberStatus.PAUSED,
+            MemberStatusSnapshot.objects.get(
+                share_owner=member, date=self.REFERENCE_DATE
+            ).status,
+        )
+
+    def test_getSnapshotMismatches_sharesUpdatedWithoutSignals_returnsMismatch(self):
+        member = self.create_active_member()
+        MemberStatusSnapshotService.build_snapshot(self.REFERENCE_DATE)
+        self.assertEqual(
+            {}, MemberStatusSnapshotService.get_snapshot_mismatches(self.REFERENCE_DATE)
+        )
+
+        ShareOwnership.objects.filter(share_owner=member).update(
+            start_date=self.REFERENCE_DATE + datetime.timedelta(days=1)
+        )
+
+        self.assertEqual(
+            {member.id: (MemberStatus.ACTIVE, MemberStatus.SOLD)},
+            MemberStatusSnapshotService.get_snapshot_mismatches(self.REFERENCE_DATE),
+        )
+
+    def test_countMembersByDate_datesNotSnapshotted_sameResultAsWithStatusFromHistory(
+        self,
+    ):
+        paused_member = self.create_active_member()
+        MembershipPauseFactory.create(
+            share_owner=paused_member,
+            start_date=self.REFERENCE_DATE - datetime.timedelta(days=5),
+            end_date=self.REFERENCE_DATE + datetime.timedelta(days=5),
+        )
+        investing_member = self.create_active_member()
+        old_frozen = freeze_for_log(investing_member)
+        investing_member.is_investing = True
+        investing_member.save()
+        UpdateShareOwnerLogEntry().populate(
+            old_frozen, freeze_for_log(investing_member), investing_member, None
+        ).save()
+        ShareOwnerFactory.create(nb_shares=0)
+        dates = [
+            self.REFERENCE_DATE - datetime.timedelta(days=10),
+            self.REFERENCE_DATE - datetime.timedelta(days=1),
+            self.REFERENCE_DATE + datetime.timedelta(days=1),
+        ]
+        MemberStatusSnapshotService.build_snapshot(dates[1])
+
+        for status in MemberStatusSnapshotService.get_statuses_stored_in_snapshot():
+            self.assertEqual(
+                {
+                    date: ShareOwner.objects.with_status_from_history(
+                        status, date
+                    ).count()
+                    for date in dates
+                },
+                MemberStatusSnapshotService.count_members_by_date([status], dates),
+                status,
+            )
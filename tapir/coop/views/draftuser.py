@@ -36,6 +36,9 @@ from tapir.coop.models import (
     ShareOwnership,
 )
 from tapir.coop.pdfs import CONTENT_TYPE_PDF
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
 from tapir.coop.services.number_of_shares_service import NumberOfSharesService
 from tapir.core.config import TAPIR_TABLE_CLASSES, TAPIR_TABLE_TEMPLATE
 from tapir.core.services.send_mail_service import SendMailService
@@ -44,6 +47,9 @@ from tapir.settings import PERMISSION_COOP_MANAGE
 from tapir.utils.models import copy_user_info
 from tapir.utils.shortcuts import set_header_for_file_download
 from tapir.utils.user_utils import UserUtils
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
+)
 
 
 class DraftUserCreateView(
@@ -236,6 +242,10 @@ def create_share_owner_and_shares_from_draft_user(draft_user: DraftUser) -> Shar
             for _ in range(0, draft_user.num_shares)
         ]
     )
+    MemberStatusSnapshotService.update_snapshots_for_member(
+        share_owner.id, timezone.now().date()
+    )
+    ShoppingEligibilityService.invalidate([share_owner.id])
 
     return share_owner
 
@@ -74,6 +74,9 @@ from tapir.coop.models import (
 )
 from tapir.coop.serializers import MemberRegistrationRequestSerializer
 from tapir.coop.services.investing_status_service import InvestingStatusService
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
 from tapir.coop.services.membership_pause_service import MembershipPauseService
 from tapir.coop.services.number_of_shares_service import NumberOfSharesService
 from tapir.coop.services.payment_status_service import PaymentStatusService
@@ -95,6 +98,7 @@ from tapir.shifts.models import (
     SHIFT_ATTENDANCE_MODE_CHOICES,
     SHIFT_USER_CAPABILITY_CHOICES,
     Shift,
+    ShiftAccountBalanceCheckpoint,
     ShiftAccountEntry,
     ShiftExemption,
     ShiftTemplateGroup,
@@ -102,10 +106,16 @@ from tapir.shifts.models import (
 from tapir.shifts.services.shift_attendance_mode_service import (
     ShiftAttendanceModeService,
 )
+from tapir.statistics.services.fancy_graph_cache_service import (
+    FancyGraphCacheService,
+)
 from tapir.utils.forms import DateFromToRangeFilterTapir
 from tapir.utils.models import copy_user_info
 from tapir.utils.shortcuts import set_header_for_file_download
 from tapir.utils.user_utils import UserUtils
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
+)
 
 
 class ShareOwnershipViewMixin:
@@ -202,6 +212,13 @@ class ShareOwnershipCreateMultipleView(
                 )
                 for _ in range(form.cleaned_data["num_shares"])
             )
+            MemberStatusSnapshotService.update_snapshots_for_member(
+                share_owner.id, form.cleaned_data["start_date"]
+            )
+            ShoppingEligibilityService.invalidate([share_owner.id])
+            FancyGraphCacheService.invalidate_for_model(
+                ShareOwnership, form.cleaned_data["start_date"]
+            )
 
             ExtraSharesForAccountingRecap.objects.create(
                 member=share_owner,
@@ -1134,16 +1151,21 @@ class UserProfilePDFView(
                 .filter(slot__shift__start_time__gte=cutoff_date)
                 .order_by("slot__shift__start_time")
             )
+            balance_before_cutoff = (
+                ShiftAccountBalanceCheckpoint.get_balance_at_datetime(
+                    shareowner.user.id, cutoff_date, including=False
+                )
+            )
             entries_data = [
                 {
                     "entry": entry,
-                    "balance_at_date": shareowner.user.shift_user_data.get_account_balance(
-                        at_date=entry.date
-                    ),
+                    "balance_at_date": entry.balance_at_date,
                 }
                 for entry in ShiftAccountEntry.objects.filter(
                     user=shareowner.user, date__gte=cutoff_date
-                ).order_by("-date")
+                )
+                .with_balance_at_date(initial_balance=balance_before_cutoff)
+                .order_by("-date")
             ]
 
         context.update(
@@ -19,6 +19,13 @@ from tapir.coop.models import (
     ShareOwnership,
     UpdateShareOwnerLogEntry,
 )
+from tapir.coop.services.member_status_updates_report import (
+    MemberStatusUpdatesReport,
+)
+from tapir.coop.services.number_of_co_purchasers_report import (
+    NumberOfCoPurchasersReport,
+)
+from tapir.core.services.base_report import BaseReport
 from tapir.settings import PERMISSION_COOP_VIEW
 from tapir.utils.shortcuts import (
     get_first_of_next_month,
@@ -405,41 +412,7 @@ class MemberStatusUpdatesJsonView(BaseLineChartView):
 
 
 def member_status_updates_csv_view(_):
-    response = HttpResponse(
-        content_type=CONTENT_TYPE_CSV,
-        headers={
-            "Content-Disposition": 'attachment; filename="members_status_updates.csv"'
-        },
-    )
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "Month",
-            "new_active_members_count",
-            "new_investing_members_count",
-            "new_active_members_without_account_count",
-            "active_to_investing_count",
-            "investing_to_active_count",
-        ]
-    )
-
-    months = (
-        MemberStatusUpdatesJsonView.get_and_cache_dates_from_last_year_or_first_share_to_today()
-    )
-    data = MemberStatusUpdatesJsonView.get_data()
-    for index in range(len(months)):
-        writer.writerow(
-            [
-                months[index],
-                data[0][index],
-                data[1][index],
-                data[2][index],
-                data[3][index],
-                data[4][index],
-            ]
-        )
-    return response
+    return build_csv_response_from_report(MemberStatusUpdatesReport)
 
 
 def active_members_with_account_at_end_of_month_csv_view(_):
@@ -553,23 +526,23 @@ class NumberOfCoPurchasersJsonView(BaseLineChartView):
 
 
 def number_of_co_purchasers_csv_view(_):
+    return build_csv_response_from_report(NumberOfCoPurchasersReport)
+
+
+def build_csv_response_from_report(report: type[BaseReport], parameters=None):
+    if parameters is None:
+        parameters = {}
+
     response = HttpResponse(
         content_type=CONTENT_TYPE_CSV,
         headers={
-            "Content-Disposition": 'attachment; filename="number_of_co_purchasers_per_month.csv"'
+            "Content-Disposition": f'attachment; filename="{report.get_file_name(parameters)}"'
         },
     )
 
     writer = csv.writer(response)
-    writer.writerow(
-        [
-            "month",
-            "number_of_co_purchasers",
-        ]
-    )
-
-    data = NumberOfCoPurchasersJsonView.get_number_of_co_purchasers_per_month()
-    for month in data.keys():
-        writer.writerow([month, data[month]])
+    writer.writerow(report.get_header(parameters))
+    for row in report.generate_rows(parameters):
+        writer.writerow(row)
 
     return response
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from tapir.core.services.report_job_service import ReportJobService
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes the report jobs whose result has expired, together with their files."
+    )
+
+    def handle(self, *args, **options):
+        ReportJobService.delete_expired_jobs()
@@ -0,0 +1,107 @@
+import pickle
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def unpickle_queued_mails(apps, schema_editor):
+    OutgoingMail = apps.get_model("core", "OutgoingMail")
+    OutgoingMailAttachment = apps.get_model("core", "OutgoingMailAttachment")
+
+    for mail in OutgoingMail.objects.filter(sent_at__isnull=True):
+        email = pickle.loads(mail.email)
+        mail.subject = email.subject
+        mail.body = email.body
+        mail.content_subtype = email.content_subtype
+        mail.from_email = email.from_email
+        mail.to = email.to
+        mail.save()
+        OutgoingMailAttachment.objects.bulk_create(
+            [
+                OutgoingMailAttachment(
+                    mail=mail,
+                    filename=filename,
+                    content=content.encode() if isinstance(content, str) else content,
+                    mimetype=mimetype,
+                )
+                for filename, content, mimetype in email.attachments
+            ]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_outgoingmail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="outgoingmail",
+            name="claimed_until",
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name="outgoingmail",
+            name="subject",
+            field=models.TextField(default=""),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="outgoingmail",
+            name="body",
+            field=models.TextField(default=""),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="outgoingmail",
+            name="content_subtype",
+            field=models.CharField(default="plain", max_length=32),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="outgoingmail",
+            name="from_email",
+            field=models.CharField(default="", max_length=256),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="outgoingmail",
+            name="to",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=256), default=list, size=None
+            ),
+            preserve_default=False,
+        ),
+        migrations.CreateModel(
+            name="OutgoingMailAttachment",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("filename", models.CharField(max_length=256)),
+                ("content", models.BinaryField()),
+                ("mimetype", models.CharField(max_length=128)),
+                (
+                    "mail",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attachments",
+                        to="core.outgoingmail",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(unpickle_queued_mails, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="outgoingmail",
+            name="email",
+        ),
+    ]
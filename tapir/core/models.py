@@ -1,4 +1,7 @@
+from django.contrib.postgres.fields import ArrayField
+from django.core.mail import EmailMessage
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -27,3 +30,131 @@ class FeatureFlag(models.Model):
         if cls.objects.filter(flag_name=flag_name).exists():
             return
         cls.objects.create(flag_name=flag_name)
+
+
+class ReportJob(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    ACTIVE_STATUSES = [Status.PENDING, Status.RUNNING]
+
+    report_type = models.CharField(max_length=100)
+    parameters = models.JSONField(default=dict)
+    # Used to find identical requests, see ReportJobService.request_report
+    parameters_hash = models.CharField(max_length=64)
+    status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.PENDING
+    )
+    created_by = models.ForeignKey(
+        "accounts.TapirUser", on_delete=models.SET_NULL, null=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+    expires_at = models.DateTimeField(null=True)
+    processed_rows = models.PositiveIntegerField(default=0)
+    total_rows = models.PositiveIntegerField(null=True)
+    file_name = models.CharField(max_length=255, blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["report_type", "parameters_hash"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="unique_active_report_job",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.report_type} #{self.id} - {self.status}"
+
+    def get_progress(self) -> int | None:
+        if self.status == self.Status.DONE:
+            return 100
+        if not self.total_rows:
+            return None
+        return min(100, int(100 * self.processed_rows / self.total_rows))
+
+    def is_downloadable(self) -> bool:
+        return (
+            self.status == self.Status.DONE
+            and self.expires_at is not None
+            and self.expires_at > timezone.now()
+        )
+
+
+class OutgoingMail(models.Model):
+    """A rendered email waiting to be sent by MailOutboxService."""
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True)
+    # Set by the worker that is sending the mail, other workers leave the mail alone until then
+    claimed_until = models.DateTimeField(null=True)
+    subject = models.TextField()
+    body = models.TextField()
+    content_subtype = models.CharField(max_length=32)
+    from_email = models.CharField(max_length=256)
+    to = ArrayField(models.CharField(max_length=256))
+    email_id = models.CharField(max_length=128)
+    include_body_in_log_entry = models.BooleanField(default=True)
+    actor = models.ForeignKey(
+        "accounts.TapirUser", null=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    tapir_user = models.ForeignKey(
+        "accounts.TapirUser", null=True, on_delete=models.CASCADE, related_name="+"
+    )
+    share_owner = models.ForeignKey(
+        "coop.ShareOwner", null=True, on_delete=models.CASCADE, related_name="+"
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(sent_at__isnull=True),
+                name="outgoing_mail_unsent",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.email_id} #{self.id}"
+
+    @classmethod
+    def from_email_message(cls, email: EmailMessage, **kwargs) -> "OutgoingMail":
+        return cls(
+            subject=email.subject,
+            body=email.body,
+            content_subtype=email.content_subtype,
+            from_email=email.from_email,
+            to=email.to,
+            **kwargs,
+        )
+
+    def build_email_message(self) -> EmailMessage:
+        email = EmailMessage(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=self.to,
+            attachments=[
+                (attachment.filename, attachment.content, attachment.mimetype)
+                for attachment in self.attachments.all()
+            ],
+        )
+        email.content_subtype = self.content_subtype
+        return email
+
+
+class OutgoingMailAttachment(models.Model):
+    mail = models.ForeignKey(
+        OutgoingMail, on_delete=models.CASCADE, related_name="attachments"
+    )
+    filename = models.CharField(max_length=256)
+    content = models.BinaryField()
+    mimetype = models.CharField(max_length=128)
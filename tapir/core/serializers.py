@@ -0,0 +1,41 @@
+from django.urls import reverse
+from rest_framework import serializers
+
+from tapir.core.models import ReportJob
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    progress = serializers.SerializerMethodField()
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            "id",
+            "report_type",
+            "parameters",
+            "status",
+            "progress",
+            "processed_rows",
+            "total_rows",
+            "error",
+            "created_at",
+            "finished_at",
+            "expires_at",
+            "download_url",
+        ]
+
+    @staticmethod
+    def get_progress(report_job: ReportJob) -> int | None:
+        return report_job.get_progress()
+
+    @staticmethod
+    def get_download_url(report_job: ReportJob) -> str | None:
+        if not report_job.is_downloadable():
+            return None
+        return reverse("core:report_job_download", args=[report_job.id])
+
+
+class ReportJobRequestSerializer(serializers.Serializer):
+    report_type = serializers.CharField()
+    parameters = serializers.DictField(required=False, default=dict)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from tapir.settings import PERMISSION_COOP_MANAGE
+
+reports: dict[str, type[BaseReport]] = {}
+
+
+class BaseReport(ABC):
+    """A CSV report that is generated in the background by a ReportJob, see ReportJobService."""
+
+    @staticmethod
+    def raise_not_implemented():
+        raise NotImplementedError("Children of BaseReport must implement this method")
+
+    @classmethod
+    @abstractmethod
+    def get_report_type(cls) -> str:
+        cls.raise_not_implemented()
+
+    @classmethod
+    @abstractmethod
+    def get_file_name(cls, parameters: dict) -> str:
+        cls.raise_not_implemented()
+
+    @classmethod
+    @abstractmethod
+    def get_header(cls, parameters: dict) -> list[str]:
+        cls.raise_not_implemented()
+
+    @classmethod
+    @abstractmethod
+    def generate_rows(cls, parameters: dict) -> Iterable[list]:
+        cls.raise_not_implemented()
+
+    @classmethod
+    def get_row_count(cls, parameters: dict) -> int | None:
+        """Used to show the progress of the job. None if it can't be known in advance."""
+        return None
+
+    @classmethod
+    def get_required_permissions(cls) -> list[str]:
+        return [PERMISSION_COOP_MANAGE]
+
+    @classmethod
+    def validate_parameters(cls, parameters: dict):
+        """Should raise a ValueError if the parameters can't be used to generate the report."""
+        pass
+
+    @staticmethod
+    def register_report(report: type[BaseReport]):
+        reports[report.get_report_type()] = report
@@ -0,0 +1,152 @@
+import datetime
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from tapir.accounts.models import TapirUser
+from tapir.coop.models import ShareOwner
+from tapir.core.models import OutgoingMail, OutgoingMailAttachment
+from tapir.core.services.mail_rate_limiter import MailRateLimiter
+from tapir.log.models import EmailLogEntry
+
+
+class MailOutboxService:
+    """Sends the mails that got queued by SendMailService.queue_mails.
+
+    The mails are sent in batches over a single SMTP connection, within the limits of MailRateLimiter.
+    A batch is claimed in a short transaction, then sent outside of any transaction: the result of each mail
+    is saved as soon as it is known. Mails that fail get retried by the next run, up to MAIL_OUTBOX_MAX_ATTEMPTS times.
+    If a worker dies while sending, the mails it claimed get sent by another worker once CLAIM_DURATION is over.
+    """
+
+    SENT_MAILS_LIFETIME = datetime.timedelta(days=7)
+    # Must be longer than sending a batch can take under MAIL_RATE_LIMITS
+    CLAIM_DURATION = datetime.timedelta(hours=1)
+
+    @staticmethod
+    @transaction.atomic
+    def queue_mail(
+        email: EmailMessage,
+        email_id: str,
+        include_body_in_log_entry: bool,
+        actor: TapirUser | None,
+        tapir_user: TapirUser | None,
+        share_owner: ShareOwner | None,
+    ) -> OutgoingMail:
+        outgoing_mail = OutgoingMail.from_email_message(
+            email,
+            email_id=email_id,
+            include_body_in_log_entry=include_body_in_log_entry,
+            actor=actor,
+            tapir_user=tapir_user,
+            share_owner=share_owner,
+        )
+        outgoing_mail.save()
+        OutgoingMailAttachment.objects.bulk_create(
+            [
+                OutgoingMailAttachment(
+                    mail=outgoing_mail,
+                    filename=filename,
+                    content=content.encode() if isinstance(content, str) else content,
+                    mimetype=mimetype,
+                )
+                for filename, content, mimetype in email.attachments
+            ]
+        )
+        return outgoing_mail
+
+    @classmethod
+    def dispatch(cls):
+        if settings.MAIL_OUTBOX_SEND_IMMEDIATELY:
+            cls.send_queued_mails()
+            return
+
+        # Must import locally to avoid import loop.
+        from tapir.core.tasks import send_queued_mails
+
+        transaction.on_commit(lambda: send_queued_mails.delay())
+
+    @classmethod
+    def send_queued_mails(cls) -> int:
+        """Returns the number of mails that got sent."""
+        batch_size = settings.MAIL_OUTBOX_BATCH_SIZE
+
+        number_of_sent_mails = 0
+        last_id = 0
+        with get_connection() as connection:
+            while True:
+                mails = cls.claim_batch(last_id, batch_size)
+                for mail in mails:
+                    if cls.send_mail(connection, mail):
+                        number_of_sent_mails += 1
+                if len(mails) < batch_size:
+                    break
+                last_id = mails[-1].id
+
+        OutgoingMail.objects.filter(
+            sent_at__lt=timezone.now() - cls.SENT_MAILS_LIFETIME
+        ).delete()
+        return number_of_sent_mails
+
+    @classmethod
+    @transaction.atomic
+    def claim_batch(cls, after_id: int, batch_size: int) -> list[OutgoingMail]:
+        now = timezone.now()
+        # skip_locked: if another worker is claiming some of the mails at the same time, leave them to it.
+        mails = list(
+            OutgoingMail.objects.filter(
+                Q(claimed_until__isnull=True) | Q(claimed_until__lt=now),
+                sent_at__isnull=True,
+                attempts__lt=settings.MAIL_OUTBOX_MAX_ATTEMPTS,
+                id__gt=after_id,
+            )
+            .select_for_update(skip_locked=True)
+            .order_by("id")[:batch_size]
+        )
+        for mail in mails:
+            mail.attempts += 1
+            mail.claimed_until = now + cls.CLAIM_DURATION
+        OutgoingMail.objects.bulk_update(mails, ["attempts", "claimed_until"])
+        return mails
+
+    @classmethod
+    def send_mail(cls, connection, mail: OutgoingMail) -> bool:
+        """Returns True if the mail has been sent."""
+        email = mail.build_email_message()
+        MailRateLimiter.wait_for_token()
+        try:
+            # Reconnects if a previous error closed the connection
+            connection.open()
+            connection.send_messages([email])
+        except Exception as error:
+            # The connection may be in an unusable state, the next mail opens a new one
+            connection.close()
+            mail.last_error = repr(error)
+            mail.claimed_until = None
+            mail.save(update_fields=["last_error", "claimed_until"])
+            return False
+
+        with transaction.atomic():
+            mail.sent_at = timezone.now()
+            mail.last_error = ""
+            mail.claimed_until = None
+            mail.save(update_fields=["sent_at", "last_error", "claimed_until"])
+            cls.build_log_entry(mail, email).save()
+        return True
+
+    @staticmethod
+    def build_log_entry(mail: OutgoingMail, email: EmailMessage) -> EmailLogEntry:
+        log_entry = EmailLogEntry(
+            actor_id=mail.actor_id,
+            # Same as LogEntry.populate_base: prefer user over share_owner
+            user_id=mail.tapir_user_id,
+            share_owner_id=None if mail.tapir_user_id else mail.share_owner_id,
+            email_id=mail.email_id,
+        )
+        if mail.include_body_in_log_entry:
+            log_entry.subject = email.subject[:128]
+            log_entry.email_content = email.message().as_bytes()
+        return log_entry
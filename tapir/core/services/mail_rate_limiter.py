@@ -0,0 +1,99 @@
+import logging
+import time
+
+import redis
+from django.conf import settings
+
+LOG = logging.getLogger(__name__)
+
+# KEYS: one bucket per limit, ARGV: capacity and period in seconds of each bucket.
+# A token is taken from every bucket or from none. Returns how many seconds to wait before trying again,
+# as a string because redis would truncate a lua number to an integer.
+# The time of the redis server is used so that all workers share the same clock.
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local period = tonumber(ARGV[2 * i])
+    local state = redis.call("HMGET", key, "tokens", "updated_at")
+    local available = tonumber(state[1]) or capacity
+    local updated_at = tonumber(state[2]) or now
+    available = math.min(capacity, available + (now - updated_at) * capacity / period)
+    tokens[i] = available
+    if available < 1 then
+        wait = math.max(wait, (1 - available) * period / capacity)
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i, key in ipairs(KEYS) do
+    local period = tonumber(ARGV[2 * i])
+    redis.call("HSET", key, "tokens", tokens[i] - 1, "updated_at", now)
+    redis.call("EXPIRE", key, math.ceil(period) * 2)
+end
+return "0"
+"""
+
+
+class MailRateLimiter:
+    """Token buckets stored in redis, shared by all the processes that send mails.
+
+    The limits are configured with MAIL_RATE_LIMITS, for example "10/s,500/h".
+    A bucket starts full, so a sender only has to wait if the mails sent recently by all senders
+    together reached one of the limits."""
+
+    KEY_PREFIX = "tapir:mail_rate_limit"
+    PERIODS_IN_SECONDS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+    _client: redis.Redis | None = None
+    _script = None
+
+    @classmethod
+    def parse_limits(cls, limits: str) -> list[tuple[int, str]]:
+        parsed_limits = []
+        for limit in limits.split(","):
+            limit = limit.strip()
+            if not limit:
+                continue
+            count, period = limit.split("/")
+            if period not in cls.PERIODS_IN_SECONDS.keys():
+                raise ValueError(f"Unknown period in mail rate limit: {limit}")
+            parsed_limits.append((int(count), period))
+        return parsed_limits
+
+    @classmethod
+    def get_script(cls):
+        if cls._script is None:
+            cls._client = redis.Redis.from_url(settings.MAIL_RATE_LIMIT_REDIS_URL)
+            cls._script = cls._client.register_script(TOKEN_BUCKET_SCRIPT)
+        return cls._script
+
+    @classmethod
+    def try_acquire(cls, limits: list[tuple[int, str]]) -> float:
+        """Takes a token if possible. Returns 0 if a token was taken, otherwise the number of seconds to wait."""
+        keys = [f"{cls.KEY_PREFIX}:{count}/{period}" for count, period in limits]
+        args = []
+        for count, period in limits:
+            args.extend([count, cls.PERIODS_IN_SECONDS[period]])
+        return float(cls.get_script()(keys=keys, args=args))
+
+    @classmethod
+    def wait_for_token(cls):
+        limits = cls.parse_limits(settings.MAIL_RATE_LIMITS)
+        if not limits:
+            return
+
+        while True:
+            try:
+                wait = cls.try_acquire(limits)
+            except redis.exceptions.RedisError as error:
+                # Not sending the mail would be worse than going over the limit
+                LOG.error(f"Mail rate limiter not available, sending anyway: {error}")
+                return
+            if wait <= 0:
+                return
+            time.sleep(wait)
@@ -0,0 +1,153 @@
+import csv
+import datetime
+import hashlib
+import json
+import os
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from tapir.accounts.models import TapirUser
+from tapir.core.models import ReportJob
+from tapir.core.services.base_report import reports
+
+
+class ReportJobService:
+    PROGRESS_UPDATE_INTERVAL = 100
+
+    @staticmethod
+    def get_parameters_hash(parameters: dict) -> str:
+        return hashlib.sha256(
+            json.dumps(parameters, sort_keys=True, cls=DjangoJSONEncoder).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def get_file_path(report_job: ReportJob) -> str:
+        return os.path.join(
+            settings.REPORT_FILES_DIR, f"report_job_{report_job.id}.csv"
+        )
+
+    @staticmethod
+    def can_access_report(user, report_type: str) -> bool:
+        if report_type not in reports.keys():
+            return False
+        return user.has_perms(reports[report_type].get_required_permissions())
+
+    @classmethod
+    def request_report(
+        cls, report_type: str, parameters: dict, requested_by: TapirUser | None
+    ) -> ReportJob:
+        """Returns the job that is already pending or running for the same report and parameters if there is one,
+        otherwise creates a new job and starts it in the background."""
+        if report_type not in reports.keys():
+            raise ValueError(f"Unknown report type: {report_type}")
+        reports[report_type].validate_parameters(parameters)
+
+        parameters_hash = cls.get_parameters_hash(parameters)
+        identical_jobs = ReportJob.objects.filter(
+            report_type=report_type, parameters_hash=parameters_hash
+        )
+        active_job = identical_jobs.filter(status__in=ReportJob.ACTIVE_STATUSES).first()
+        if active_job is not None:
+            return active_job
+
+        try:
+            with transaction.atomic():
+                report_job = ReportJob.objects.create(
+                    report_type=report_type,
+                    parameters=parameters,
+                    parameters_hash=parameters_hash,
+                    created_by=requested_by,
+                )
+        except IntegrityError:
+            # An identical request created the job between the check above and the creation
+            return identical_jobs.order_by("-created_at").first()
+
+        # Must import locally to avoid import loop.
+        from tapir.core.tasks import generate_report
+
+        transaction.on_commit(lambda: generate_report.delay(report_job.id))
+        return report_job
+
+    @classmethod
+    def generate(cls, report_job_id: int):
+        # Claiming the job with a conditional update makes sure that it only runs once,
+        # even if the task gets delivered twice.
+        claimed = ReportJob.objects.filter(
+            id=report_job_id, status=ReportJob.Status.PENDING
+        ).update(status=ReportJob.Status.RUNNING, started_at=timezone.now())
+        if not claimed:
+            return
+
+        report_job = ReportJob.objects.get(id=report_job_id)
+        report = reports[report_job.report_type]
+        parameters = report_job.parameters
+        file_path = cls.get_file_path(report_job)
+        temporary_file_path = f"{file_path}.part"
+
+        try:
+            report_job.total_rows = report.get_row_count(parameters)
+            report_job.save(update_fields=["total_rows"])
+
+            os.makedirs(settings.REPORT_FILES_DIR, exist_ok=True)
+            processed_rows = 0
+            with open(temporary_file_path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(report.get_header(parameters))
+                for row in report.generate_rows(parameters):
+                    writer.writerow(row)
+                    processed_rows += 1
+                    if processed_rows % cls.PROGRESS_UPDATE_INTERVAL == 0:
+                        ReportJob.objects.filter(id=report_job.id).update(
+                            processed_rows=processed_rows
+                        )
+            os.replace(temporary_file_path, file_path)
+        except Exception as error:
+            if os.path.exists(temporary_file_path):
+                os.remove(temporary_file_path)
+            report_job.status = ReportJob.Status.FAILED
+            report_job.error = repr(error)
+            report_job.finished_at = timezone.now()
+            report_job.save()
+            raise
+
+        report_job.status = ReportJob.Status.DONE
+        report_job.processed_rows = processed_rows
+        report_job.file_name = report.get_file_name(parameters)
+        report_job.finished_at = timezone.now()
+        report_job.expires_at = report_job.finished_at + datetime.timedelta(
+            hours=settings.REPORT_FILES_LIFETIME_HOURS
+        )
+        report_job.save()
+
+    @classmethod
+    def delete_expired_jobs(cls) -> int:
+        now = timezone.now()
+        lifetime = datetime.timedelta(hours=settings.REPORT_FILES_LIFETIME_HOURS)
+
+        # Jobs that got lost, for example because the worker got restarted, would otherwise
+        # prevent any identical report from being requested again.
+        ReportJob.objects.filter(
+            status__in=ReportJob.ACTIVE_STATUSES, created_at__lt=now - lifetime
+        ).update(
+            status=ReportJob.Status.FAILED,
+            error="Timed out",
+            finished_at=now,
+        )
+
+        expired_jobs = ReportJob.objects.filter(expires_at__lt=now) | (
+            ReportJob.objects.filter(
+                status=ReportJob.Status.FAILED, finished_at__lt=now - lifetime
+            )
+        )
+        expired_jobs = list(expired_jobs)
+        for report_job in expired_jobs:
+            file_path = cls.get_file_path(report_job)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        ReportJob.objects.filter(
+            id__in=[report_job.id for report_job in expired_jobs]
+        ).delete()
+        return len(expired_jobs)
@@ -1,19 +1,48 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
+
 from django.contrib.auth.models import User
 from django.core.mail import EmailMultiAlternatives
 from django.utils import translation
 
 from tapir.accounts.models import TapirUser
 from tapir.coop.models import ShareOwner
+from tapir.core.services.mail_outbox_service import MailOutboxService
+from tapir.core.services.mail_rate_limiter import MailRateLimiter
 from tapir.core.services.optional_mails_for_user_service import (
     OptionalMailsForUserService,
 )
 from tapir.core.tapir_email_builder_base import TapirEmailBuilderBase
 from tapir.log.models import EmailLogEntry
 
+# IDs of the mails queued in the current SendMailService.queue_mails context, None outside of it.
+_queued_mail_ids: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar(
+    "queued_mail_ids", default=None
+)
+
 
 class SendMailService:
+    @staticmethod
+    @contextlib.contextmanager
+    def queue_mails():
+        """Mails sent within this context get stored in the outbox instead of being sent right away.
+        When the context exits, they get sent in batches by MailOutboxService.
+        Use this when sending many mails, for example from a management command."""
+        if _queued_mail_ids.get() is not None:
+            yield
+            return
+
+        queued_mail_ids = []
+        token = _queued_mail_ids.set(queued_mail_ids)
+        try:
+            yield
+        finally:
+            _queued_mail_ids.reset(token)
+        if queued_mail_ids:
+            MailOutboxService.dispatch()
+
     @staticmethod
     def create_log_entry(
         email: EmailMultiAlternatives,
@@ -62,6 +91,20 @@ class SendMailService:
         )
 
         email.content_subtype = "html"
+        queued_mail_ids = _queued_mail_ids.get()
+        if queued_mail_ids is not None:
+            outgoing_mail = MailOutboxService.queue_mail(
+                email=email,
+                email_id=email_builder.get_unique_id(),
+                include_body_in_log_entry=email_builder.include_email_body_in_log_entry(),
+                actor=actor,
+                tapir_user=tapir_user,
+                share_owner=share_owner,
+            )
+            queued_mail_ids.append(outgoing_mail.id)
+            return
+
+        MailRateLimiter.wait_for_token()
         email.send()
         cls.create_log_entry(
             email=email,
@@ -5,12 +5,30 @@ from celery.signals import task_failure
 from django.core.mail import mail_admins
 from django.core.management import call_command
 
+from tapir.core.services.mail_outbox_service import MailOutboxService
+from tapir.core.services.report_job_service import ReportJobService
+
 
 @shared_task
 def metabase_export():
     call_command("metabase_export")
 
 
+@shared_task
+def generate_report(report_job_id: int):
+    ReportJobService.generate(report_job_id)
+
+
+@shared_task
+def delete_expired_report_jobs():
+    call_command("delete_expired_report_jobs")
+
+
+@shared_task
+def send_queued_mails():
+    MailOutboxService.send_queued_mails()
+
+
 @task_failure.connect()
 def celery_task_failure_email(**kwargs):
     subject = (
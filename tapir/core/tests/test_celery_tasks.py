@@ -2,7 +2,11 @@ from unittest.mock import Mock, patch
 
 from django.test import SimpleTestCase
 
-from tapir.core.tasks import metabase_export
+from tapir.core.tasks import (
+    delete_expired_report_jobs,
+    metabase_export,
+    send_queued_mails,
+)
 
 
 class TestCeleryTasks(SimpleTestCase):
@@ -10,3 +14,13 @@ class TestCeleryTasks(SimpleTestCase):
     def test_metabaseExport(self, mock_call_command: Mock):
         metabase_export()
         mock_call_command.assert_called_once_with("metabase_export")
+
+    @patch("tapir.core.tasks.call_command")
+    def test_deleteExpiredReportJobs(self, mock_call_command: Mock):
+        delete_expired_report_jobs()
+        mock_call_command.assert_called_once_with("delete_expired_report_jobs")
+
+    @patch("tapir.core.tasks.MailOutboxService.send_queued_mails")
+    def test_sendQueuedMails(self, mock_send_queued_mails: Mock):
+        send_queued_mails()
+        mock_send_queued_mails.assert_called_once_with()
@@ -0,0 +1,227 @@
+import datetime
+from unittest.mock import Mock, patch
+
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.db import connection as db_connection
+from django.test import override_settings
+from django.utils import timezone
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.core.models import OutgoingMail
+from tapir.core.services.mail_outbox_service import MailOutboxService
+from tapir.core.services.mail_rate_limiter import MailRateLimiter
+from tapir.core.services.send_mail_service import SendMailService
+from tapir.log.models import EmailLogEntry
+from tapir.shifts.emails.flying_member_registration_reminder_email import (
+    FlyingMemberRegistrationReminderEmailBuilder,
+)
+from tapir.utils.tests_utils import TapirEmailTestMixin, TapirFactoryTestBase
+
+
+class TestMailOutboxService(TapirFactoryTestBase, TapirEmailTestMixin):
+    @override_settings(MAIL_OUTBOX_SEND_IMMEDIATELY=False)
+    @patch("tapir.core.tasks.send_queued_mails.delay")
+    def test_queueMails_default_mailsGetQueuedAndWorkerIsStarted(
+        self, mock_delay: Mock
+    ):
+        tapir_user = TapirUserFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with SendMailService.queue_mails():
+                SendMailService.send_to_tapir_user(
+                    actor=None,
+                    recipient=tapir_user,
+                    email_builder=FlyingMemberRegistrationReminderEmailBuilder(),
+                )
+                self.assertEqual(0, len(mail.outbox))
+
+        self.assertEqual(0, len(mail.outbox))
+        self.assertFalse(EmailLogEntry.objects.exists())
+        self.assertEqual(1, OutgoingMail.objects.filter(sent_at=None).count())
+        mock_delay.assert_called_once_with()
+
+    @override_settings(MAIL_OUTBOX_SEND_IMMEDIATELY=False)
+    @patch("tapir.core.tasks.send_queued_mails.delay")
+    def test_sendQueuedMails_default_sendsMailsAndCreatesLogEntries(self, _: Mock):
+        tapir_users = TapirUserFactory.create_batch(3)
+        with SendMailService.queue_mails():
+            for tapir_user in tapir_users:
+                SendMailService.send_to_tapir_user(
+                    actor=None,
+                    recipient=tapir_user,
+                    email_builder=FlyingMemberRegistrationReminderEmailBuilder(),
+                )
+
+        with override_settings(MAIL_OUTBOX_BATCH_SIZE=2):
+            self.assertEqual(3, MailOutboxService.send_queued_mails())
+
+        self.assertEqual(3, len(mail.outbox))
+        for tapir_user, sent_mail in zip(tapir_users, mail.outbox):
+            self.assertEmailOfClass_GotSentTo(
+                FlyingMemberRegistrationReminderEmailBuilder,
+                tapir_user.email,
+                sent_mail,
+            )
+        self.assertFalse(OutgoingMail.objects.filter(sent_at=None).exists())
+        self.assertEqual(
+            {tapir_user.id for tapir_user in tapir_users},
+            set(
+                EmailLogEntry.objects.filter(
+                    email_id=FlyingMemberRegistrationReminderEmailBuilder.get_unique_id()
+                ).values_list("user_id", flat=True)
+            ),
+        )
+        log_entry = EmailLogEntry.objects.get(user=tapir_users[0])
+        self.assertIsInstance(log_entry.as_leaf_class(), EmailLogEntry)
+        self.assertIsNotNone(log_entry.email_content)
+
+    @override_settings(MAIL_OUTBOX_SEND_IMMEDIATELY=False)
+    @patch("tapir.core.tasks.send_queued_mails.delay")
+    def test_sendQueuedMails_sendingFails_mailStaysQueuedWithError(self, _: Mock):
+        tapir_user = TapirUserFactory.create()
+        with SendMailService.queue_mails():
+            SendMailService.send_to_tapir_user(
+                actor=None,
+                recipient=tapir_user,
+                email_builder=FlyingMemberRegistrationReminderEmailBuilder(),
+            )
+
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=ConnectionError("Test error"),
+        ):
+            self.assertEqual(0, MailOutboxService.send_queued_mails())
+
+        outgoing_mail = OutgoingMail.objects.get()
+        self.assertIsNone(outgoing_mail.sent_at)
+        self.assertEqual(1, outgoing_mail.attempts)
+        self.assertIn("Test error", outgoing_mail.last_error)
+        self.assertFalse(EmailLogEntry.objects.exists())
+
+        self.assertEqual(1, MailOutboxService.send_queued_mails())
+        self.assertEqual(1, len(mail.outbox))
+
+    def test_queueMails_sendImmediately_mailsGetSentWhenLeavingTheContext(self):
+        tapir_user = TapirUserFactory.create()
+
+        with SendMailService.queue_mails():
+            SendMailService.send_to_tapir_user(
+                actor=None,
+                recipient=tapir_user,
+                email_builder=FlyingMemberRegistrationReminderEmailBuilder(),
+            )
+            self.assertEqual(0, len(mail.outbox))
+
+        self.assertEqual(1, len(mail.outbox))
+        self.assertTrue(EmailLogEntry.objects.filter(user=tapir_user).exists())
+
+    def test_sendQueuedMails_mailWithAttachment_attachmentGetsSent(self):
+        email = EmailMessage(
+            subject="Test subject",
+            body="<p>Test body</p>",
+            from_email="from@example.com",
+            to=["to@example.com"],
+            attachments=[("test.pdf", b"%PDF-test", "application/pdf")],
+        )
+        email.content_subtype = "html"
+        MailOutboxService.queue_mail(
+            email=email,
+            email_id="test_mail",
+            include_body_in_log_entry=True,
+            actor=None,
+            tapir_user=TapirUserFactory.create(),
+            share_owner=None,
+        )
+
+        self.assertEqual(1, MailOutboxService.send_queued_mails())
+
+        sent_mail = mail.outbox[0]
+        self.assertEqual("Test subject", sent_mail.subject)
+        self.assertEqual("<p>Test body</p>", sent_mail.body)
+        self.assertEqual("html", sent_mail.content_subtype)
+        self.assertEqual(["to@example.com"], sent_mail.to)
+        self.assertEqual(
+            [("test.pdf", b"%PDF-test", "application/pdf")],
+            [tuple(attachment) for attachment in sent_mail.attachments],
+        )
+
+    @override_settings(MAIL_OUTBOX_SEND_IMMEDIATELY=False)
+    @patch("tapir.core.tasks.send_queued_mails.delay")
+    def test_sendQueuedMails_connectionDropped_reconnectsForTheNextMail(self, _: Mock):
+        tapir_users = TapirUserFactory.create_batch(2)
+        with SendMailService.queue_mails():
+            for tapir_user in tapir_users:
+                SendMailService.send_to_tapir_user(
+                    actor=None,
+                    recipient=tapir_user,
+                    email_builder=FlyingMemberRegistrationReminderEmailBuilder(),
+                )
+
+        with (
+            patch(
+                "django.core.mail.backends.locmem.EmailBackend.send_messages",
+                side_effect=[ConnectionError("Test error"), 1],
+            ),
+            patch("django.core.mail.backends.locmem.EmailBackend.close") as mock_close,
+        ):
+            self.assertEqual(1, MailOutboxService.send_queued_mails())
+
+        # Once after the error and once when leaving the connection context
+        self.assertEqual(2, mock_close.call_count)
+        failed_mail, sent_mail = OutgoingMail.objects.order_by("id")
+        self.assertIsNone(failed_mail.sent_at)
+        self.assertIsNone(failed_mail.claimed_until)
+        self.assertIsNotNone(sent_mail.sent_at)
+        self.assertTrue(EmailLogEntry.objects.filter(user=tapir_users[1]).exists())
+
+    @override_settings(MAIL_OUTBOX_SEND_IMMEDIATELY=False)
+    @patch("tapir.core.tasks.send_queued_mails.delay")
+    def test_sendQueuedMails_mailClaimedByOtherWorker_mailIsSentOnceTheClaimExpired(
+        self, _: Mock
+    ):
+        with SendMailService.queue_mails():
+            SendMailService.send_to_tapir_user(
+                actor=None,
+                recipient=TapirUserFactory.create(),
+                email_builder=FlyingMemberRegistrationReminderEmailBuilder(),
+            )
+        OutgoingMail.objects.update(
+            claimed_until=timezone.now() + datetime.timedelta(minutes=5)
+        )
+
+        self.assertEqual(0, MailOutboxService.send_queued_mails())
+
+        OutgoingMail.objects.update(
+            claimed_until=timezone.now() - datetime.timedelta(minutes=5)
+        )
+        self.assertEqual(1, MailOutboxService.send_queued_mails())
+        self.assertEqual(1, len(mail.outbox))
+
+    @override_settings(MAIL_OUTBOX_SEND_IMMEDIATELY=False)
+    @patch("tapir.core.tasks.send_queued_mails.delay")
+    def test_sendQueuedMails_default_waitsForTheRateLimiterOutsideOfTransactions(
+        self, _: Mock
+    ):
+        with SendMailService.queue_mails():
+            SendMailService.send_to_tapir_user(
+                actor=None,
+                recipient=TapirUserFactory.create(),
+                email_builder=FlyingMemberRegistrationReminderEmailBuilder(),
+            )
+        # The test case itself runs in transactions
+        transaction_depth_of_the_test = len(db_connection.atomic_blocks)
+        transaction_depths_while_waiting = []
+
+        with patch.object(
+            MailRateLimiter,
+            "wait_for_token",
+            side_effect=lambda: transaction_depths_while_waiting.append(
+                len(db_connection.atomic_blocks)
+            ),
+        ):
+            MailOutboxService.send_queued_mails()
+
+        self.assertEqual(
+            [transaction_depth_of_the_test], transaction_depths_while_waiting
+        )
@@ -0,0 +1,67 @@
+from unittest.mock import Mock, patch
+
+import redis
+from django.test import SimpleTestCase, override_settings
+
+from tapir.core.services.mail_rate_limiter import MailRateLimiter
+
+
+class TestMailRateLimiter(SimpleTestCase):
+    def test_parseLimits_severalLimits_returnsAllLimits(self):
+        self.assertEqual(
+            [(10, "s"), (500, "h")], MailRateLimiter.parse_limits("10/s, 500/h")
+        )
+
+    def test_parseLimits_emptyString_returnsNoLimit(self):
+        self.assertEqual([], MailRateLimiter.parse_limits(""))
+
+    def test_parseLimits_unknownPeriod_raisesError(self):
+        with self.assertRaises(ValueError):
+            MailRateLimiter.parse_limits("10/w")
+
+    @override_settings(MAIL_RATE_LIMITS="")
+    @patch.object(MailRateLimiter, "try_acquire")
+    def test_waitForToken_noLimit_doesntUseRedis(self, mock_try_acquire: Mock):
+        MailRateLimiter.wait_for_token()
+        mock_try_acquire.assert_not_called()
+
+    @override_settings(MAIL_RATE_LIMITS="10/s")
+    @patch("tapir.core.services.mail_rate_limiter.time.sleep")
+    @patch.object(MailRateLimiter, "try_acquire")
+    def test_waitForToken_tokenAvailable_doesntSleep(
+        self, mock_try_acquire: Mock, mock_sleep: Mock
+    ):
+        mock_try_acquire.return_value = 0
+
+        MailRateLimiter.wait_for_token()
+
+        mock_try_acquire.assert_called_once_with([(10, "s")])
+        mock_sleep.assert_not_called()
+
+    @override_settings(MAIL_RATE_LIMITS="10/s")
+    @patch("tapir.core.services.mail_rate_limiter.time.sleep")
+    @patch.object(MailRateLimiter, "try_acquire")
+    def test_waitForToken_bucketEmpty_sleepsUntilTokenAvailable(
+        self, mock_try_acquire: Mock, mock_sleep: Mock
+    ):
+        mock_try_acquire.side_effect = [0.3, 0.05, 0]
+
+        MailRateLimiter.wait_for_token()
+
+        self.assertEqual(3, mock_try_acquire.call_count)
+        self.assertEqual(
+            [0.3, 0.05], [call.args[0] for call in mock_sleep.call_args_list]
+        )
+
+    @override_settings(MAIL_RATE_LIMITS="10/s")
+    @patch("tapir.core.services.mail_rate_limiter.time.sleep")
+    @patch.object(MailRateLimiter, "try_acquire")
+    def test_waitForToken_redisNotAvailable_doesntBlockSending(
+        self, mock_try_acquire: Mock, mock_sleep: Mock
+    ):
+        mock_try_acquire.side_effect = redis.exceptions.ConnectionError()
+
+        with self.assertLogs("tapir.core.services.mail_rate_limiter", "ERROR"):
+            MailRateLimiter.wait_for_token()
+
+        mock_sleep.assert_not_called()
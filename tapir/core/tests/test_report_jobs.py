@@ -0,0 +1,145 @@
+import datetime
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+from django.test import override_settings
+from django.urls import reverse
+
+from tapir.core.models import ReportJob
+from tapir.core.services.base_report import BaseReport, reports
+from tapir.core.services.report_job_service import ReportJobService
+from tapir.utils.tests_utils import TapirFactoryTestBase, mock_timezone_now
+
+
+class DummyReport(BaseReport):
+    @classmethod
+    def get_report_type(cls) -> str:
+        return "dummy_report"
+
+    @classmethod
+    def get_file_name(cls, parameters: dict) -> str:
+        return "dummy.csv"
+
+    @classmethod
+    def get_header(cls, parameters: dict) -> list[str]:
+        return ["value"]
+
+    @classmethod
+    def get_row_count(cls, parameters: dict) -> int | None:
+        return parameters["count"]
+
+    @classmethod
+    def generate_rows(cls, parameters: dict):
+        for index in range(parameters["count"]):
+            if parameters.get("fail"):
+                raise ValueError("Test error")
+            yield [index]
+
+
+class TestReportJobs(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2024, month=3, day=10, hour=12)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+        BaseReport.register_report(DummyReport)
+        self.addCleanup(reports.pop, DummyReport.get_report_type())
+
+        files_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(files_dir.cleanup)
+        settings_override = override_settings(REPORT_FILES_DIR=files_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    @patch("tapir.core.tasks.generate_report.delay")
+    def test_requestReport_identicalJobIsRunning_returnsRunningJob(
+        self, mock_delay: Mock
+    ):
+        with self.captureOnCommitCallbacks(execute=True):
+            first_job = ReportJobService.request_report(
+                "dummy_report", {"count": 3}, None
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            second_job = ReportJobService.request_report(
+                "dummy_report", {"count": 3}, None
+            )
+
+        self.assertEqual(first_job.id, second_job.id)
+        mock_delay.assert_called_once_with(first_job.id)
+
+    @patch("tapir.core.tasks.generate_report.delay")
+    def test_requestReport_differentParameters_createsNewJob(self, mock_delay: Mock):
+        first_job = ReportJobService.request_report("dummy_report", {"count": 3}, None)
+        second_job = ReportJobService.request_report("dummy_report", {"count": 4}, None)
+
+        self.assertNotEqual(first_job.id, second_job.id)
+
+    @patch("tapir.core.tasks.generate_report.delay")
+    def test_generate_default_writesFileAndMarksJobAsDone(self, _: Mock):
+        report_job = ReportJobService.request_report("dummy_report", {"count": 3}, None)
+
+        ReportJobService.generate(report_job.id)
+
+        report_job.refresh_from_db()
+        self.assertEqual(ReportJob.Status.DONE, report_job.status)
+        self.assertEqual(3, report_job.processed_rows)
+        self.assertEqual(100, report_job.get_progress())
+        self.assertTrue(report_job.is_downloadable())
+        with open(ReportJobService.get_file_path(report_job)) as file:
+            self.assertEqual("value\n0\n1\n2\n", file.read().replace("\r\n", "\n"))
+
+    @patch("tapir.core.tasks.generate_report.delay")
+    def test_generate_reportFails_marksJobAsFailed(self, _: Mock):
+        report_job = ReportJobService.request_report(
+            "dummy_report", {"count": 3, "fail": True}, None
+        )
+
+        with self.assertRaises(ValueError):
+            ReportJobService.generate(report_job.id)
+
+        report_job.refresh_from_db()
+        self.assertEqual(ReportJob.Status.FAILED, report_job.status)
+        self.assertFalse(os.path.exists(ReportJobService.get_file_path(report_job)))
+
+    @patch("tapir.core.tasks.generate_report.delay")
+    def test_reportJobDownloadView_jobIsDone_returnsFile(self, _: Mock):
+        self.login_as_member_office_user()
+        report_job = ReportJobService.request_report("dummy_report", {"count": 2}, None)
+        ReportJobService.generate(report_job.id)
+
+        response = self.client.get(
+            reverse("core:report_job_download", args=[report_job.id])
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            "value\n0\n1\n",
+            b"".join(response.streaming_content).decode().replace("\r\n", "\n"),
+        )
+
+    @patch("tapir.core.tasks.generate_report.delay")
+    def test_reportJobsApiView_normalUser_accessDenied(self, mock_delay: Mock):
+        self.login_as_normal_user()
+
+        response = self.client.post(
+            reverse("core:report_jobs"),
+            {"report_type": "dummy_report", "parameters": {"count": 2}},
+            content_type="application/json",
+        )
+
+        self.assertEqual(403, response.status_code)
+        self.assertFalse(ReportJob.objects.exists())
+        mock_delay.assert_not_called()
+
+    @patch("tapir.core.tasks.generate_report.delay")
+    def test_deleteExpiredJobs_default_deletesFilesOfExpiredJobs(self, _: Mock):
+        report_job = ReportJobService.request_report("dummy_report", {"count": 2}, None)
+        ReportJobService.generate(report_job.id)
+        file_path = ReportJobService.get_file_path(report_job)
+
+        mock_timezone_now(self, self.NOW + datetime.timedelta(days=2))
+        ReportJobService.delete_expired_jobs()
+
+        self.assertFalse(ReportJob.objects.exists())
+        self.assertFalse(os.path.exists(file_path))
@@ -25,6 +25,31 @@ urlpatterns = [
         views.ErrorView.as_view(),
         name="error",
     ),
+    path(
+        "report_jobs",
+        views.ReportJobsApiView.as_view(),
+        name="report_jobs",
+    ),
+    path(
+        "report_jobs/<int:pk>",
+        views.ReportJobApiView.as_view(),
+        name="report_job",
+    ),
+    path(
+        "report_jobs/start/<str:report_type>",
+        views.ReportJobStartView.as_view(),
+        name="report_job_start",
+    ),
+    path(
+        "report_jobs/<int:pk>/detail",
+        views.ReportJobDetailView.as_view(),
+        name="report_job_detail",
+    ),
+    path(
+        "report_jobs/<int:pk>/download",
+        views.ReportJobDownloadView.as_view(),
+        name="report_job_download",
+    ),
     path(
         "jsi18n/",
         JavaScriptCatalog.as_view(),
@@ -1,10 +1,23 @@
+import os
+
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.core.exceptions import PermissionDenied
+from django.http import FileResponse, HttpResponseBadRequest, HttpResponseGone
+from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.utils import translation
 from django.utils.translation import gettext_lazy as _
-from django.views.generic import ListView, TemplateView, UpdateView
-
-from tapir.core.models import FeatureFlag
+from django.views import View
+from django.views.generic import DetailView, ListView, TemplateView, UpdateView
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from tapir.core.models import FeatureFlag, ReportJob
+from tapir.core.serializers import ReportJobRequestSerializer, ReportJobSerializer
+from tapir.core.services.base_report import reports
+from tapir.core.services.report_job_service import ReportJobService
 from tapir.core.tapir_email_builder_base import TapirEmailBuilderBase, all_emails
 from tapir.log.models import EmailLogEntry
 from tapir.settings import PERMISSION_COOP_ADMIN, PERMISSION_COOP_MANAGE
@@ -93,3 +106,98 @@ class ErrorView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
     # This view that always triggers an error is only used to test tapir.core.middleware.SendExceptionsToSlackMiddleware
     def get(self, request, *args, **kwargs):
         raise NotImplementedError("Oh no! An error!")
+
+
+class ReportJobsApiView(LoginRequiredMixin, APIView):
+    @extend_schema(
+        request=ReportJobRequestSerializer,
+        responses={202: ReportJobSerializer},
+    )
+    def post(self, request):
+        serializer = ReportJobRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        report_type = serializer.validated_data["report_type"]
+
+        if report_type not in reports.keys():
+            return Response(
+                f"Unknown report type: {report_type}",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not ReportJobService.can_access_report(request.user, report_type):
+            raise PermissionDenied()
+
+        try:
+            report_job = ReportJobService.request_report(
+                report_type, serializer.validated_data["parameters"], request.user
+            )
+        except ValueError as error:
+            return Response(str(error), status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            ReportJobSerializer(report_job).data, status=status.HTTP_202_ACCEPTED
+        )
+
+
+class ReportJobMixin:
+    def get_report_job(self) -> ReportJob:
+        report_job = get_object_or_404(ReportJob, pk=self.kwargs["pk"])
+        if not ReportJobService.can_access_report(
+            self.request.user, report_job.report_type
+        ):
+            raise PermissionDenied()
+        return report_job
+
+
+class ReportJobApiView(LoginRequiredMixin, ReportJobMixin, APIView):
+    @extend_schema(responses={200: ReportJobSerializer})
+    def get(self, request, pk):
+        return Response(
+            ReportJobSerializer(self.get_report_job()).data,
+            status=status.HTTP_200_OK,
+        )
+
+
+class ReportJobStartView(LoginRequiredMixin, View):
+    def post(self, request, report_type):
+        if report_type not in reports.keys():
+            return HttpResponseBadRequest(f"Unknown report type: {report_type}")
+        if not ReportJobService.can_access_report(request.user, report_type):
+            raise PermissionDenied()
+
+        parameters = {
+            key: value
+            for key, value in request.POST.items()
+            if key != "csrfmiddlewaretoken"
+        }
+        try:
+            report_job = ReportJobService.request_report(
+                report_type, parameters, request.user
+            )
+        except ValueError as error:
+            return HttpResponseBadRequest(str(error))
+
+        return redirect("core:report_job_detail", pk=report_job.id)
+
+
+class ReportJobDetailView(LoginRequiredMixin, ReportJobMixin, DetailView):
+    template_name = "core/report_job_detail.html"
+
+    def get_object(self, queryset=None):
+        return self.get_report_job()
+
+
+class ReportJobDownloadView(LoginRequiredMixin, ReportJobMixin, View):
+    def get(self, request, pk):
+        report_job = self.get_report_job()
+        file_path = ReportJobService.get_file_path(report_job)
+        if not report_job.is_downloadable() or not os.path.exists(file_path):
+            return HttpResponseGone(
+                _("This report has expired, please request it again.")
+            )
+
+        return FileResponse(
+            open(file_path, "rb"),
+            as_attachment=True,
+            filename=report_job.file_name,
+            content_type="text/csv",
+        )
@@ -12,6 +12,12 @@ class LogConfig(AppConfig):
     def ready(self):
         self.register_sidebar_link_groups()
 
+        from tapir.log.services.attribute_history_service import (
+            AttributeHistoryService,
+        )
+
+        AttributeHistoryService.register_receivers()
+
     @staticmethod
     def register_sidebar_link_groups():
         sidebar_link_groups.get_group(_("Management")).add_link(
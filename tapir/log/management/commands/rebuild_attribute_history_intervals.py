@@ -0,0 +1,15 @@
+from django.core.management import BaseCommand
+
+from tapir.log.services.attribute_history_service import AttributeHistoryService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the attribute history intervals from the existing update log entries. "
+        "New log entries update the intervals automatically and the existing ones are converted by a migration, "
+        "this is only needed if the intervals got out of sync with the log entries."
+    )
+
+    def handle(self, *args, **options):
+        interval_count = AttributeHistoryService.rebuild_all_intervals()
+        self.stdout.write(f"Created {interval_count} intervals")
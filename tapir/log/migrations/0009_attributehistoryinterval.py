@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("log", "0008_logentry_log_logentr_user_id_c4ca60_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttributeHistoryInterval",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("object_id", models.PositiveIntegerField()),
+                ("attribute", models.CharField(max_length=64)),
+                ("value", models.TextField(null=True)),
+                ("valid_from", models.DateTimeField(null=True)),
+                ("valid_to", models.DateTimeField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["content_type", "attribute", "object_id", "valid_to"],
+                        name="log_attribu_content_0501c8_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,106 @@
+from django.db import migrations
+
+# Copy of AttributeHistoryService.get_tracked_attributes at the time of this migration:
+# (log entry model, owner model, attributes)
+TRACKED_ATTRIBUTES = [
+    (
+        "shifts.UpdateShiftUserDataLogEntry",
+        "shifts.ShiftUserData",
+        ["is_frozen", "shift_partner"],
+    ),
+    ("coop.UpdateShareOwnerLogEntry", "coop.ShareOwner", ["is_investing"]),
+    (
+        "accounts.UpdateTapirUserLogEntry",
+        "accounts.TapirUser",
+        ["co_purchaser", "co_purchaser_2"],
+    ),
+]
+
+
+def get_owner_ids_by_user_id(owner_model, owner_label, user_ids):
+    if owner_label == "accounts.TapirUser":
+        return {user_id: user_id for user_id in user_ids}
+    return dict(
+        owner_model.objects.filter(user_id__in=user_ids).values_list("user_id", "id")
+    )
+
+
+def get_owner_ids(owner_label, log_entry, owner_ids_by_user_id):
+    owner_ids = set()
+    if owner_label == "coop.ShareOwner" and log_entry.share_owner_id is not None:
+        owner_ids.add(log_entry.share_owner_id)
+    if log_entry.user_id in owner_ids_by_user_id.keys():
+        owner_ids.add(owner_ids_by_user_id[log_entry.user_id])
+    return owner_ids
+
+
+def build_attribute_history_intervals(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    AttributeHistoryInterval = apps.get_model("log", "AttributeHistoryInterval")
+
+    for log_entry_label, owner_label, attributes in TRACKED_ATTRIBUTES:
+        log_entry_model = apps.get_model(log_entry_label)
+        owner_model = apps.get_model(owner_label)
+        content_type = ContentType.objects.get_for_model(owner_model)
+
+        log_entries = list(
+            log_entry_model.objects.filter(old_values__has_any_keys=attributes)
+            .order_by("created_date", "id")
+            .only("created_date", "old_values", "user_id", "share_owner_id")
+        )
+        owner_ids_by_user_id = get_owner_ids_by_user_id(
+            owner_model,
+            owner_label,
+            {
+                log_entry.user_id
+                for log_entry in log_entries
+                if log_entry.user_id is not None
+            },
+        )
+
+        # The value of an attribute between two changes is the old value of the later change,
+        # see AttributeHistoryService.
+        intervals = []
+        previous_change_dates = {}
+        for log_entry in log_entries:
+            for owner_id in get_owner_ids(owner_label, log_entry, owner_ids_by_user_id):
+                for attribute in attributes:
+                    if attribute not in log_entry.old_values:
+                        continue
+                    intervals.append(
+                        AttributeHistoryInterval(
+                            content_type_id=content_type.id,
+                            object_id=owner_id,
+                            attribute=attribute,
+                            value=log_entry.old_values[attribute],
+                            valid_from=previous_change_dates.get((owner_id, attribute)),
+                            valid_to=log_entry.created_date,
+                        )
+                    )
+                    previous_change_dates[(owner_id, attribute)] = (
+                        log_entry.created_date
+                    )
+
+        AttributeHistoryInterval.objects.filter(
+            content_type_id=content_type.id, attribute__in=attributes
+        ).delete()
+        AttributeHistoryInterval.objects.bulk_create(intervals, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("log", "0009_attributehistoryinterval"),
+        ("shifts", "0076_recurringshiftwatch_watched_capabilities"),
+        ("coop", "0056_memberstatussnapshot"),
+        (
+            "accounts",
+            "0023_updatetapiruserlogentry_accounts_up_old_val_25b95f_gin_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            build_attribute_history_intervals, migrations.RunPython.noop
+        ),
+    ]
@@ -259,3 +259,27 @@ class ModelLogEntry(LogEntry):
             self.values.items() if hasattr(self.values, "items") else self.values
         )
         return context
+
+
+class AttributeHistoryInterval(models.Model):
+    """Value that an attribute of an object had during a time interval.
+
+    Derived from the old_values of UpdateModelLogEntry subclasses, see AttributeHistoryService.
+    The value was valid after valid_from (exclusive, null means since the beginning) and until valid_to (inclusive).
+    After the last interval, the current value of the object's field applies.
+    """
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["content_type", "attribute", "object_id", "valid_to"])
+        ]
+
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, related_name="+"
+    )
+    object_id = models.PositiveIntegerField()
+    attribute = models.CharField(max_length=64)
+    # HStoreField stores strings only, the value is stored as it is in the log entry
+    value = models.TextField(null=True)
+    valid_from = models.DateTimeField(null=True)
+    valid_to = models.DateTimeField()
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import OuterRef, Q, QuerySet
+from django.db.models.signals import post_delete, post_save
+
+from tapir.log.models import AttributeHistoryInterval
+
+if TYPE_CHECKING:
+    from tapir.log.models import UpdateModelLogEntry
+
+
+class AttributeHistoryService:
+    """Maintains AttributeHistoryInterval from the update log entries.
+
+    The value of an attribute at a given datetime is the old value of the first log entry
+    created at or after that datetime that contains the attribute, or the current value if there is none.
+    Each of those log entries therefore closes an interval that started with the previous log entry.
+    """
+
+    @staticmethod
+    def get_tracked_attributes() -> (
+        dict[type[UpdateModelLogEntry], tuple[type[models.Model], list[str]]]
+    ):
+        # Must import locally to avoid import loop.
+        from tapir.accounts.models import TapirUser, UpdateTapirUserLogEntry
+        from tapir.coop.models import ShareOwner, UpdateShareOwnerLogEntry
+        from tapir.shifts.models import ShiftUserData, UpdateShiftUserDataLogEntry
+
+        return {
+            UpdateShiftUserDataLogEntry: (
+                ShiftUserData,
+                ["is_frozen", "shift_partner"],
+            ),
+            UpdateShareOwnerLogEntry: (ShareOwner, ["is_investing"]),
+            UpdateTapirUserLogEntry: (TapirUser, ["co_purchaser", "co_purchaser_2"]),
+        }
+
+    @classmethod
+    def register_receivers(cls):
+        for log_entry_class in cls.get_tracked_attributes().keys():
+            post_save.connect(
+                cls.on_log_entry_changed,
+                sender=log_entry_class,
+                dispatch_uid=f"attribute_history_{log_entry_class.__name__}_saved",
+            )
+            post_delete.connect(
+                cls.on_log_entry_changed,
+                sender=log_entry_class,
+                dispatch_uid=f"attribute_history_{log_entry_class.__name__}_deleted",
+            )
+
+    @classmethod
+    def on_log_entry_changed(cls, sender, instance: UpdateModelLogEntry, **kwargs):
+        owner_model, attributes = cls.get_tracked_attributes()[sender]
+        if not any(attribute in instance.old_values for attribute in attributes):
+            return
+
+        for owner_id in cls.get_owner_ids(owner_model, [instance]):
+            cls.rebuild_intervals_for_object(sender, owner_model, owner_id)
+
+    @staticmethod
+    def get_owner_ids_by_user_id(
+        owner_model: type[models.Model], user_ids
+    ) -> dict[int, int]:
+        from tapir.accounts.models import TapirUser
+
+        if owner_model is TapirUser:
+            return {user_id: user_id for user_id in user_ids}
+        return dict(
+            owner_model.objects.filter(user_id__in=user_ids).values_list(
+                "user_id", "id"
+            )
+        )
+
+    @classmethod
+    def get_owner_ids(
+        cls,
+        owner_model: type[models.Model],
+        log_entries: list[UpdateModelLogEntry],
+        owner_ids_by_user_id: dict[int, int] | None = None,
+    ) -> set[int]:
+        from tapir.coop.models import ShareOwner
+
+        if owner_ids_by_user_id is None:
+            owner_ids_by_user_id = cls.get_owner_ids_by_user_id(
+                owner_model,
+                [
+                    log_entry.user_id
+                    for log_entry in log_entries
+                    if log_entry.user_id is not None
+                ],
+            )
+
+        owner_ids = set()
+        for log_entry in log_entries:
+            if owner_model is ShareOwner and log_entry.share_owner_id is not None:
+                owner_ids.add(log_entry.share_owner_id)
+            if log_entry.user_id in owner_ids_by_user_id.keys():
+                owner_ids.add(owner_ids_by_user_id[log_entry.user_id])
+        return owner_ids
+
+    @staticmethod
+    def get_log_entries_filter(owner_model: type[models.Model], owner_id: int) -> Q:
+        from tapir.accounts.models import TapirUser
+        from tapir.coop.models import ShareOwner
+
+        if owner_model is TapirUser:
+            return Q(user_id=owner_id)
+
+        user_id = (
+            owner_model.objects.filter(id=owner_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        filters = Q(user_id=user_id) if user_id is not None else Q(pk__in=[])
+        if owner_model is ShareOwner:
+            filters |= Q(share_owner_id=owner_id)
+        return filters
+
+    @classmethod
+    @transaction.atomic
+    def rebuild_intervals_for_object(
+        cls,
+        log_entry_class: type[UpdateModelLogEntry],
+        owner_model: type[models.Model],
+        owner_id: int,
+    ):
+        _, attributes = cls.get_tracked_attributes()[log_entry_class]
+        content_type = ContentType.objects.get_for_model(owner_model)
+
+        log_entries = (
+            log_entry_class.objects.filter(
+                cls.get_log_entries_filter(owner_model, owner_id),
+                old_values__has_any_keys=attributes,
+            )
+            .order_by("created_date", "id")
+            .only("created_date", "old_values")
+        )
+
+        AttributeHistoryInterval.objects.filter(
+            content_type=content_type, object_id=owner_id, attribute__in=attributes
+        ).delete()
+        AttributeHistoryInterval.objects.bulk_create(
+            cls.build_intervals(content_type, owner_id, attributes, log_entries)
+        )
+
+    @classmethod
+    @transaction.atomic
+    def rebuild_all_intervals(cls) -> int:
+        interval_count = 0
+        for log_entry_class, (
+            owner_model,
+            attributes,
+        ) in cls.get_tracked_attributes().items():
+            content_type = ContentType.objects.get_for_model(owner_model)
+            log_entries = list(
+                log_entry_class.objects.filter(old_values__has_any_keys=attributes)
+                .order_by("created_date", "id")
+                .only("created_date", "old_values", "user_id", "share_owner_id")
+            )
+            owner_ids_by_user_id = cls.get_owner_ids_by_user_id(
+                owner_model,
+                {
+                    log_entry.user_id
+                    for log_entry in log_entries
+                    if log_entry.user_id is not None
+                },
+            )
+
+            log_entries_by_owner_id = defaultdict(list)
+            for log_entry in log_entries:
+                for owner_id in cls.get_owner_ids(
+                    owner_model, [log_entry], owner_ids_by_user_id
+                ):
+                    log_entries_by_owner_id[owner_id].append(log_entry)
+
+            intervals = []
+            for owner_id, owner_log_entries in log_entries_by_owner_id.items():
+                intervals.extend(
+                    cls.build_intervals(
+                        content_type, owner_id, attributes, owner_log_entries
+                    )
+                )
+
+            AttributeHistoryInterval.objects.filter(
+                content_type=content_type, attribute__in=attributes
+            ).delete()
+            AttributeHistoryInterval.objects.bulk_create(intervals, batch_size=1000)
+            interval_count += len(intervals)
+
+        return interval_count
+
+    @staticmethod
+    def build_intervals(
+        content_type: ContentType,
+        owner_id: int,
+        attributes: list[str],
+        log_entries,
+    ) -> list[AttributeHistoryInterval]:
+        # log_entries must be sorted by created_date
+        intervals = []
+        previous_change_dates: dict[str, datetime.datetime | None] = {
+            attribute: None for attribute in attributes
+        }
+        for log_entry in log_entries:
+            for attribute in attributes:
+                if attribute not in log_entry.old_values:
+                    continue
+                intervals.append(
+                    AttributeHistoryInterval(
+                        content_type=content_type,
+                        object_id=owner_id,
+                        attribute=attribute,
+                        value=log_entry.old_values[attribute],
+                        valid_from=previous_change_dates[attribute],
+                        valid_to=log_entry.created_date,
+                    )
+                )
+                previous_change_dates[attribute] = log_entry.created_date
+        return intervals
+
+    @staticmethod
+    def get_intervals_at_datetime(
+        owner_model: type[models.Model],
+        attribute: str,
+        at_datetime: datetime.datetime,
+        owner_id_field: str = "id",
+    ) -> QuerySet[AttributeHistoryInterval]:
+        # Intervals of one object and attribute don't overlap: this returns at most one interval per object.
+        return AttributeHistoryInterval.objects.filter(
+            Q(valid_from__isnull=True) | Q(valid_from__lt=at_datetime),
+            content_type=ContentType.objects.get_for_model(owner_model),
+            attribute=attribute,
+            object_id=OuterRef(owner_id_field),
+            valid_to__gte=at_datetime,
+        )
+
+    @staticmethod
+    def get_values_at_datetimes(
+        owner_model: type[models.Model],
+        attribute: str,
+        at_datetimes: list[datetime.datetime],
+    ) -> dict[datetime.datetime, dict[int, str | None]]:
+        """Returns {at_datetime: {object_id: value}} in a single query.
+        Objects that are missing for a datetime had the current value of their field at that datetime.
+        """
+        values_by_datetime = {at_datetime: {} for at_datetime in at_datetimes}
+        if not at_datetimes:
+            return values_by_datetime
+
+        sorted_datetimes = sorted(at_datetimes)
+        intervals = AttributeHistoryInterval.objects.filter(
+            Q(valid_from__isnull=True) | Q(valid_from__lt=sorted_datetimes[-1]),
+            content_type=ContentType.objects.get_for_model(owner_model),
+            attribute=attribute,
+            valid_to__gte=sorted_datetimes[0],
+        ).values_list("object_id", "value", "valid_from", "valid_to")
+        for object_id, value, valid_from, valid_to in intervals:
+            first_index = (
+                0
+                if valid_from is None
+                else bisect.bisect_right(sorted_datetimes, valid_from)
+            )
+            last_index = bisect.bisect_right(sorted_datetimes, valid_to)
+            for at_datetime in sorted_datetimes[first_index:last_index]:
+                values_by_datetime[at_datetime][object_id] = value
+        return values_by_datetime
@@ -0,0 +1,131 @@
+import datetime
+
+from django.contrib.contenttypes.models import ContentType
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.coop.models import ShareOwner, UpdateShareOwnerLogEntry
+from tapir.coop.tests.factories import ShareOwnerFactory
+from tapir.log.models import AttributeHistoryInterval
+from tapir.log.services.attribute_history_service import AttributeHistoryService
+from tapir.shifts.models import ShiftUserData, UpdateShiftUserDataLogEntry
+from tapir.utils.tests_utils import TapirFactoryTestBase, mock_timezone_now
+
+
+class TestAttributeHistoryService(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2023, month=3, day=10, hour=12)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+
+    def create_is_frozen_log_entry(self, tapir_user, old_value, created_date):
+        log_entry = UpdateShiftUserDataLogEntry.objects.create(
+            user=tapir_user,
+            old_values={"is_frozen": old_value},
+            new_values={"is_frozen": not old_value},
+        )
+        log_entry.created_date = created_date
+        log_entry.save()
+        return log_entry
+
+    def get_intervals(self, owner_model, owner_id, attribute):
+        return list(
+            AttributeHistoryInterval.objects.filter(
+                content_type=ContentType.objects.get_for_model(owner_model),
+                object_id=owner_id,
+                attribute=attribute,
+            )
+            .order_by("valid_to")
+            .values_list("valid_from", "valid_to", "value")
+        )
+
+    def test_logEntrySaved_severalChanges_intervalsFollowEachOther(self):
+        tapir_user = TapirUserFactory.create()
+        first_change = self.NOW - datetime.timedelta(days=10)
+        second_change = self.NOW - datetime.timedelta(days=5)
+        self.create_is_frozen_log_entry(tapir_user, True, second_change)
+        self.create_is_frozen_log_entry(tapir_user, False, first_change)
+
+        self.assertEqual(
+            [(None, first_change, "False"), (first_change, second_change, "True")],
+            self.get_intervals(
+                ShiftUserData, tapir_user.shift_user_data.id, "is_frozen"
+            ),
+        )
+
+    def test_logEntryDeleted_default_intervalsUpdated(self):
+        tapir_user = TapirUserFactory.create()
+        first_change = self.NOW - datetime.timedelta(days=10)
+        second_change = self.NOW - datetime.timedelta(days=5)
+        self.create_is_frozen_log_entry(tapir_user, False, first_change)
+        self.create_is_frozen_log_entry(tapir_user, True, second_change).delete()
+
+        self.assertEqual(
+            [(None, first_change, "False")],
+            self.get_intervals(
+                ShiftUserData, tapir_user.shift_user_data.id, "is_frozen"
+            ),
+        )
+
+    def test_logEntrySaved_shareOwnerWithoutUser_intervalForShareOwner(self):
+        share_owner = ShareOwnerFactory.create(is_investing=True)
+        change_date = self.NOW - datetime.timedelta(days=2)
+        log_entry = UpdateShareOwnerLogEntry.objects.create(
+            share_owner=share_owner,
+            old_values={"is_investing": "False"},
+            new_values={"is_investing": "True"},
+        )
+        log_entry.created_date = change_date
+        log_entry.save()
+
+        self.assertEqual(
+            [(None, change_date, "False")],
+            self.get_intervals(ShareOwner, share_owner.id, "is_investing"),
+        )
+
+    def test_getIntervalsAtDatetime_datetimeOnIntervalBoundaries_returnsCorrectInterval(
+        self,
+    ):
+        tapir_user = TapirUserFactory.create()
+        first_change = self.NOW - datetime.timedelta(days=10)
+        second_change = self.NOW - datetime.timedelta(days=5)
+        self.create_is_frozen_log_entry(tapir_user, False, first_change)
+        self.create_is_frozen_log_entry(tapir_user, True, second_change)
+
+        for at_datetime, expected_value in [
+            (first_change - datetime.timedelta(days=1), "False"),
+            (first_change, "False"),
+            (first_change + datetime.timedelta(seconds=1), "True"),
+            (second_change, "True"),
+            (second_change + datetime.timedelta(seconds=1), None),
+        ]:
+            queryset = ShiftUserData.objects.filter(
+                id=tapir_user.shift_user_data.id
+            ).annotate(
+                value_at_datetime=AttributeHistoryService.get_intervals_at_datetime(
+                    ShiftUserData, "is_frozen", at_datetime
+                ).values("value")[:1]
+            )
+            self.assertEqual(expected_value, queryset.get().value_at_datetime)
+
+    def test_rebuildAllIntervals_intervalsDeleted_sameIntervalsAsFromSignals(self):
+        tapir_user = TapirUserFactory.create()
+        self.create_is_frozen_log_entry(
+            tapir_user, False, self.NOW - datetime.timedelta(days=10)
+        )
+        self.create_is_frozen_log_entry(
+            tapir_user, True, self.NOW - datetime.timedelta(days=5)
+        )
+        intervals_from_signals = self.get_intervals(
+            ShiftUserData, tapir_user.shift_user_data.id, "is_frozen"
+        )
+
+        AttributeHistoryInterval.objects.all().delete()
+        AttributeHistoryService.rebuild_all_intervals()
+
+        self.assertEqual(
+            intervals_from_signals,
+            self.get_intervals(
+                ShiftUserData, tapir_user.shift_user_data.id, "is_frozen"
+            ),
+        )
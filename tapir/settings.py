@@ -131,6 +131,15 @@ CELERY_BEAT_SCHEDULE = {
         "task": "tapir.shifts.tasks.apply_shift_cycle_start",
         "schedule": celery.schedules.crontab(hour="*/2", minute="20"),
     },
+    "update_member_status_snapshots": {
+        "task": "tapir.coop.tasks.update_member_status_snapshots",
+        "schedule": celery.schedules.crontab(minute=30, hour=2),
+    },
+    "rebuild_shopping_eligibilities": {
+        "task": "tapir.welcomedesk.tasks.rebuild_shopping_eligibilities",
+        # After the freeze checks and the member status snapshots
+        "schedule": celery.schedules.crontab(minute=0, hour=5),
+    },
     "send_accounting_recap": {
         "task": "tapir.coop.tasks.send_accounting_recap",
         "schedule": celery.schedules.crontab(
@@ -149,6 +158,11 @@ CELERY_BEAT_SCHEDULE = {
         "task": "tapir.accounts.tasks.clear_sessions",
         "schedule": celery.schedules.crontab(hour=23, minute=59, day_of_week=6),
     },
+    "reconcile_shift_account_balances": {
+        # Before run_freeze_checks, which relies on the balances
+        "task": "tapir.shifts.tasks.reconcile_shift_account_balances",
+        "schedule": celery.schedules.crontab(minute=45, hour=0),
+    },
     "run_freeze_checks": {
         "task": "tapir.shifts.tasks.run_freeze_checks",
         "schedule": celery.schedules.crontab(minute=0, hour=1),
@@ -161,6 +175,20 @@ CELERY_BEAT_SCHEDULE = {
         "task": "tapir.statistics.tasks.process_credit_account",
         "schedule": celery.schedules.crontab(minute=0, hour=3),
     },
+    "prewarm_fancy_graph_cache": {
+        "task": "tapir.statistics.tasks.prewarm_fancy_graph_cache",
+        # After update_member_status_snapshots
+        "schedule": celery.schedules.crontab(minute=0, hour=4),
+    },
+    "send_queued_mails": {
+        # The mails are normally sent as soon as they are queued, this catches the ones that failed or got lost.
+        "task": "tapir.core.tasks.send_queued_mails",
+        "schedule": celery.schedules.crontab(minute="*"),
+    },
+    "delete_expired_report_jobs": {
+        "task": "tapir.core.tasks.delete_expired_report_jobs",
+        "schedule": celery.schedules.crontab(minute=30, hour=5),
+    },
     "send_create_account_reminder": {
         "task": "tapir.accounts.tasks.send_create_account_reminder",
         "schedule": celery.schedules.crontab(minute=0, hour=12),
@@ -186,6 +214,10 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": celery.schedules.crontab(hour=20, minute=0, day_of_week="sunday"),
     },
 }
+CELERY_TASK_ROUTES = {
+    # Consumed by a dedicated worker, so that sending many mails doesn't delay the other tasks
+    "tapir.core.tasks.send_queued_mails": {"queue": "mails"},
+}
 
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
@@ -237,6 +269,22 @@ elif EMAIL_ENV == "prod":
     EMAIL_PORT = 587
     EMAIL_USE_TLS = True
 
+# Mails queued with SendMailService.queue_mails get sent by a celery worker listening on the "mails" queue.
+# Outside of production, they get sent right away instead so that no worker is needed.
+MAIL_OUTBOX_SEND_IMMEDIATELY = env.bool(
+    "MAIL_OUTBOX_SEND_IMMEDIATELY", default=EMAIL_ENV != "prod"
+)
+MAIL_OUTBOX_BATCH_SIZE = env.int("MAIL_OUTBOX_BATCH_SIZE", default=50)
+MAIL_OUTBOX_MAX_ATTEMPTS = env.int("MAIL_OUTBOX_MAX_ATTEMPTS", default=5)
+# Limits of the mail provider, shared by all processes sending mails, see MailRateLimiter.
+# Comma separated, for example "10/s,500/h". Empty means no limit.
+MAIL_RATE_LIMITS = env.str(
+    "MAIL_RATE_LIMITS", default="10/s" if EMAIL_ENV == "prod" else ""
+)
+MAIL_RATE_LIMIT_REDIS_URL = env.str(
+    "MAIL_RATE_LIMIT_REDIS_URL", default=CELERY_BROKER_URL
+)
+
 
 COOP_NAME = "SuperCoop Berlin"
 COOP_FULL_NAME = "SuperCoop Berlin eG"
@@ -382,6 +430,12 @@ if ENABLE_SILK_PROFILING:
     SILKY_META = True
     SILKY_PROFILE_DIR = "silk_profiling"
 
+# Files generated by background report jobs, see ReportJobService
+REPORT_FILES_DIR = env(
+    "REPORT_FILES_DIR", cast=str, default=os.path.join(BASE_DIR, "report_files")
+)
+REPORT_FILES_LIFETIME_HOURS = env("REPORT_FILES_LIFETIME_HOURS", cast=int, default=24)
+
 SLACK_BOT_TOKEN = env("SLACK_BOT_TOKEN", cast=str, default="")
 
 AUTHENTICATION_BACKENDS = ["tapir.accounts.custom_ldap_backend.CustomLdapBackend"]
@@ -31,6 +31,12 @@ class ShiftConfig(AppConfig):
             utils.get_ids_of_users_registered_to_a_shift_with_capability
         )
 
+        from tapir.shifts.services.dirty_shift_marker_service import (
+            DirtyShiftMarkerService,
+        )
+
+        DirtyShiftMarkerService.register_receivers()
+
     @classmethod
     def register_sidebar_links(cls):
         shifts_group = sidebar_link_groups.get_group(_("Shifts"), 4)
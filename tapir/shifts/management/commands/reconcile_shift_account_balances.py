@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from tapir.shifts.services.shift_account_balance_service import (
+    ShiftAccountBalanceService,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the account balance stored on each member to the sum of their shift account entries "
+        "and repairs the ones that don't match."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check-only",
+            action="store_true",
+            help="Only report the wrong balances, don't repair them.",
+        )
+
+    def handle(self, *args, **options):
+        drifted_shift_user_datas = ShiftAccountBalanceService.reconcile_balances(
+            fix=not options["check_only"]
+        )
+        for shift_user_data in drifted_shift_user_datas:
+            self.stdout.write(
+                f"User #{shift_user_data.user_id}: stored {shift_user_data.account_balance}, "
+                f"actual {getattr(shift_user_data, ShiftAccountBalanceService.ANNOTATION_ACTUAL_BALANCE)}"
+            )
+        self.stdout.write(
+            f"{len(drifted_shift_user_datas)} wrong balance(s) "
+            + ("found" if options["check_only"] else "repaired")
+        )
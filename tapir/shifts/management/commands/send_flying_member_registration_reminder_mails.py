@@ -44,7 +44,11 @@ class Command(BaseCommand):
         shift_user_datas = ShiftAttendanceModeService.annotate_shift_user_data_queryset_with_attendance_mode_at_datetime(
             ShiftUserData.objects.all(), reference_time
         )
-        shift_user_datas.select_related("user")
+        shift_user_datas = ShiftExpectationService.annotate_shift_user_data_queryset_with_working_status_at_datetime(
+            shift_user_datas, reference_time
+        ).select_related(
+            "user"
+        )
 
         for shift_user_data in shift_user_datas:
             if (
@@ -1,8 +1,8 @@
 import datetime
-import time
 
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.db.models import QuerySet
 from django.utils import timezone
 
 from tapir.core.services.send_mail_service import SendMailService
@@ -14,25 +14,49 @@ from tapir.shifts.models import ShiftAttendance, ShiftUserData
 class Command(BaseCommand):
     help = "Sends shift reminder emails to every member that has a shift in the coming week"
 
+    BATCH_SIZE = 100
+
     def handle(self, *args, **options):
-        for shift_user_data in ShiftUserData.objects.all():
-            self.send_shift_reminder_for_user(shift_user_data)
+        with SendMailService.queue_mails():
+            self.send_shift_reminders(self.get_attendances_that_need_a_reminder())
 
     @staticmethod
-    def send_shift_reminder_for_user(shift_user_data: ShiftUserData):
-        for attendance in ShiftAttendance.objects.with_valid_state().filter(
-            user=shift_user_data.user,
-            slot__shift__start_time__gte=timezone.now(),
-            slot__shift__start_time__lte=timezone.now()
-            + datetime.timedelta(days=config.REMINDER_EMAIL_DAYS_BEFORE_SHIFT),
-            reminder_email_sent=False,
-        ):
+    def get_attendances_that_need_a_reminder() -> QuerySet[ShiftAttendance]:
+        now = timezone.now()
+        return (
+            ShiftAttendance.objects.with_valid_state()
+            .filter(
+                slot__shift__start_time__gte=now,
+                slot__shift__start_time__lte=now
+                + datetime.timedelta(days=config.REMINDER_EMAIL_DAYS_BEFORE_SHIFT),
+                reminder_email_sent=False,
+            )
+            .select_related("user__share_owner", "slot__shift")
+            .order_by("id")
+        )
+
+    @classmethod
+    def send_shift_reminders(cls, attendances: QuerySet[ShiftAttendance]):
+        attendances = list(attendances)
+        for batch_start in range(0, len(attendances), cls.BATCH_SIZE):
+            batch = attendances[batch_start : batch_start + cls.BATCH_SIZE]
             with transaction.atomic():
-                email_builder = ShiftReminderEmailBuilder(shift=attendance.slot.shift)
-                SendMailService.send_to_tapir_user(
-                    actor=None, recipient=attendance.user, email_builder=email_builder
-                )
-
-                attendance.reminder_email_sent = True
-                attendance.save()
-            time.sleep(0.1)
+                for attendance in batch:
+                    email_builder = ShiftReminderEmailBuilder(
+                        shift=attendance.slot.shift
+                    )
+                    SendMailService.send_to_tapir_user(
+                        actor=None,
+                        recipient=attendance.user,
+                        email_builder=email_builder,
+                    )
+
+                ShiftAttendance.objects.filter(
+                    id__in=[attendance.id for attendance in batch]
+                ).update(reminder_email_sent=True)
+
+    @classmethod
+    def send_shift_reminder_for_user(cls, shift_user_data: ShiftUserData):
+        cls.send_shift_reminders(
+            cls.get_attendances_that_need_a_reminder().filter(user=shift_user_data.user)
+        )
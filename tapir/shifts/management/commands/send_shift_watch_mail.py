@@ -1,5 +1,3 @@
-import time
-
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
@@ -8,15 +6,20 @@ from tapir.shifts.emails.shift_watch_mail import (
     ShiftWatchEmailBuilder,
 )
 from tapir.shifts.models import (
+    DirtyShiftMarker,
+    ShiftSlot,
     ShiftWatch,
     StaffingStatusChoices,
 )
-from tapir.shifts.services.shift_watch_creation_service import ShiftWatchCreator
+from tapir.shifts.services.shift_watch_creation_service import (
+    ShiftStaffing,
+    ShiftWatchCreator,
+)
 
 
 def check_staffing_status(
     shift_watch_data: ShiftWatch,
-    valid_attendances_count: int,
+    staffing: ShiftStaffing,
     notification_reasons: list[str],
 ) -> None:
     """Check for staffing status changes and add notifications if needed."""
@@ -24,11 +27,8 @@ def check_staffing_status(
         return
 
     # Determine staffing status
-    current_status = ShiftWatchCreator.get_staffing_status_if_changed(
-        number_of_available_slots=shift_watch_data.shift.slots.count(),
-        valid_attendances=valid_attendances_count,
-        required_attendances=shift_watch_data.shift.num_required_attendances,
-        last_status=shift_watch_data.last_staffing_status,
+    current_status = ShiftWatchCreator.get_staffing_status_from_staffing(
+        staffing, last_status=shift_watch_data.last_staffing_status
     )
     if current_status:
         notification_reasons.append(current_status.label)
@@ -36,15 +36,16 @@ def check_staffing_status(
 
     # General attendance change notifications
     if not notification_reasons:
-        if valid_attendances_count > len(shift_watch_data.last_valid_slot_ids):
+        if staffing.valid_attendances > len(shift_watch_data.last_valid_slot_ids):
             notification_reasons.append(StaffingStatusChoices.ATTENDANCE_PLUS.label)
-        elif valid_attendances_count < len(shift_watch_data.last_valid_slot_ids):
+        elif staffing.valid_attendances < len(shift_watch_data.last_valid_slot_ids):
             notification_reasons.append(StaffingStatusChoices.ATTENDANCE_MINUS.label)
 
 
 def check_watched_capabilities(
     shift_watch_data: ShiftWatch,
     this_valid_slot_ids: list,
+    capabilities_by_slot_id: dict[int, list[str]],
     notification_reasons: list[str],
 ) -> None:
     """Check for watched capability changes and add notifications if needed."""
@@ -55,6 +56,7 @@ def check_watched_capabilities(
         this_valid_slot_ids=this_valid_slot_ids,
         last_valid_slot_ids=shift_watch_data.last_valid_slot_ids,
         watched_capabilities=shift_watch_data.watched_capabilities,
+        capabilities_by_slot_id=capabilities_by_slot_id,
     )
     if capability_notifications:
         notification_reasons.extend(capability_notifications)
@@ -64,33 +66,73 @@ class Command(BaseCommand):
     help = "Sent to a member when there is a relevant change in shift staffing and the member wants to know about it."
 
     def handle(self, *args, **options):
-        for shift_watch_data in ShiftWatch.objects.filter(
-            shift__end_time__gte=timezone.now()
-        ).select_related("user", "shift"):
-            self.send_shift_watch_mail_per_user_and_shift(shift_watch_data)
-
-    def send_shift_watch_mail_per_user_and_shift(self, shift_watch_data: ShiftWatch):
-        notification_reasons: list[str] = []
-
-        this_valid_slot_ids = ShiftWatchCreator.get_valid_slot_ids(
-            shift_watch_data.shift
+        with SendMailService.queue_mails():
+            self.process_dirty_shifts()
+
+    def process_dirty_shifts(self):
+        """Only the watches of shifts that changed since the last run are checked, see DirtyShiftMarkerService."""
+        markers = list(DirtyShiftMarker.objects.values_list("id", "shift_id"))
+        if not markers:
+            return
+
+        shift_watches = list(
+            ShiftWatch.objects.filter(
+                shift_id__in={shift_id for _, shift_id in markers},
+                shift__end_time__gte=timezone.now(),
+            ).select_related("user__share_owner", "shift")
+        )
+        if shift_watches:
+            self.process_shift_watches(shift_watches)
+
+        # Only the markers that have been read are deleted: markers created in the meantime are processed by the next run.
+        DirtyShiftMarker.objects.filter(
+            id__in=[marker_id for marker_id, _ in markers]
+        ).delete()
+
+    def process_shift_watches(self, shift_watches: list[ShiftWatch]):
+        shift_ids = {shift_watch.shift_id for shift_watch in shift_watches}
+        staffing_by_shift_id = ShiftWatchCreator.get_staffing_for_shifts(shift_ids)
+
+        capabilities_by_slot_id = {}
+        if any(shift_watch.watched_capabilities for shift_watch in shift_watches):
+            capabilities_by_slot_id = dict(
+                ShiftSlot.objects.filter(shift_id__in=shift_ids).values_list(
+                    "id", "required_capabilities"
+                )
+            )
+
+        for shift_watch_data in shift_watches:
+            self.send_shift_watch_mail_per_user_and_shift(
+                shift_watch_data=shift_watch_data,
+                staffing=staffing_by_shift_id[shift_watch_data.shift_id],
+                capabilities_by_slot_id=capabilities_by_slot_id,
+            )
+
+        ShiftWatch.objects.bulk_update(
+            shift_watches, ["last_valid_slot_ids", "last_staffing_status"]
         )
 
-        valid_attendances_count = len(this_valid_slot_ids)
+    def send_shift_watch_mail_per_user_and_shift(
+        self,
+        shift_watch_data: ShiftWatch,
+        staffing: ShiftStaffing,
+        capabilities_by_slot_id: dict[int, list[str]],
+    ):
+        notification_reasons: list[str] = []
 
-        check_staffing_status(
-            shift_watch_data, valid_attendances_count, notification_reasons
-        )
+        check_staffing_status(shift_watch_data, staffing, notification_reasons)
 
         check_watched_capabilities(
-            shift_watch_data, this_valid_slot_ids, notification_reasons
+            shift_watch_data,
+            staffing.valid_slot_ids,
+            capabilities_by_slot_id,
+            notification_reasons,
         )
 
         for reason in notification_reasons:
             self.send_shift_watch_mail(shift_watch=shift_watch_data, reason=reason)
 
-        shift_watch_data.last_valid_slot_ids = this_valid_slot_ids
-        shift_watch_data.save()
+        shift_watch_data.last_valid_slot_ids = staffing.valid_slot_ids
 
     @staticmethod
     def send_shift_watch_mail(shift_watch: ShiftWatch, reason: str):
@@ -103,4 +145,3 @@ class Command(BaseCommand):
             recipient=shift_watch.user,
             email_builder=email_builder,
         )
-        time.sleep(0.1)
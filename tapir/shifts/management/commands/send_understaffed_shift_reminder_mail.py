@@ -3,12 +3,11 @@ from datetime import timedelta
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
+from tapir.core.services.send_mail_service import SendMailService
 from tapir.shifts.management.commands.send_shift_watch_mail import (
     Command as SendShiftWatchCommand,
 )
 from tapir.shifts.models import (
-    ShiftAttendance,
-    ShiftSlot,
     ShiftWatch,
     StaffingStatusChoices,
 )
@@ -21,25 +20,22 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         tomorrow = timezone.now().date() + timedelta(days=1)
 
-        for shift_watch_data in ShiftWatch.objects.filter(
-            shift__end_time__date=tomorrow
-        ):
-            this_valid_slot_ids = list(
-                ShiftSlot.objects.filter(
-                    shift=shift_watch_data.shift,
-                    attendances__state=ShiftAttendance.State.PENDING,
-                ).values_list("id", flat=True)
+        shift_watches = list(
+            ShiftWatch.objects.filter(shift__end_time__date=tomorrow).select_related(
+                "user__share_owner", "shift"
             )
-            number_of_available_slots = shift_watch_data.shift.slots.count()
-            valid_attendances_count = len(this_valid_slot_ids)
-            required_attendances_count = shift_watch_data.shift.num_required_attendances
-            current_status = ShiftWatchCreator.get_staffing_status_if_changed(
-                number_of_available_slots=number_of_available_slots,
-                valid_attendances=valid_attendances_count,
-                required_attendances=required_attendances_count,
-                last_status=shift_watch_data.last_staffing_status,
-            )
-            if current_status == StaffingStatusChoices.UNDERSTAFFED:
-                SendShiftWatchCommand.send_shift_watch_mail(
-                    shift_watch_data, reason=StaffingStatusChoices.UNDERSTAFFED
+        )
+        staffing_by_shift_id = ShiftWatchCreator.get_staffing_for_shifts(
+            {shift_watch.shift_id for shift_watch in shift_watches}
+        )
+
+        with SendMailService.queue_mails():
+            for shift_watch_data in shift_watches:
+                current_status = ShiftWatchCreator.get_staffing_status_from_staffing(
+                    staffing_by_shift_id[shift_watch_data.shift_id],
+                    last_status=shift_watch_data.last_staffing_status,
                 )
+                if current_status == StaffingStatusChoices.UNDERSTAFFED:
+                    SendShiftWatchCommand.send_shift_watch_mail(
+                        shift_watch_data, reason=StaffingStatusChoices.UNDERSTAFFED
+                    )
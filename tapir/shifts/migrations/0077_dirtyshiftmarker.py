@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:11
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def mark_watched_shifts_as_dirty(apps, schema_editor):
+    # Changes that happened since the last run of send_shift_watch_mail have not been tracked
+    ShiftWatch = apps.get_model("shifts", "ShiftWatch")
+    DirtyShiftMarker = apps.get_model("shifts", "DirtyShiftMarker")
+    shift_ids = (
+        ShiftWatch.objects.filter(shift__end_time__gte=timezone.now())
+        .values_list("shift_id", flat=True)
+        .distinct()
+    )
+    DirtyShiftMarker.objects.bulk_create(
+        [DirtyShiftMarker(shift_id=shift_id) for shift_id in shift_ids]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shifts", "0076_recurringshiftwatch_watched_capabilities"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DirtyShiftMarker",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("shift_id", models.PositiveIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.RunPython(mark_watched_shifts_as_dirty, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:21
+
+from django.db import migrations, models
+from django.db.models import IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def compute_account_balances(apps, schema_editor):
+    ShiftUserData = apps.get_model("shifts", "ShiftUserData")
+    ShiftAccountEntry = apps.get_model("shifts", "ShiftAccountEntry")
+    ShiftUserData.objects.update(
+        account_balance=Coalesce(
+            Subquery(
+                ShiftAccountEntry.objects.filter(user_id=OuterRef("user_id"))
+                .order_by()
+                .values("user_id")
+                .annotate(total=Sum("value"))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shifts", "0077_dirtyshiftmarker"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shiftuserdata",
+            name="account_balance",
+            field=models.IntegerField(
+                db_index=True, default=0, verbose_name="Account balance"
+            ),
+        ),
+        migrations.RunPython(compute_account_balances, migrations.RunPython.noop),
+    ]
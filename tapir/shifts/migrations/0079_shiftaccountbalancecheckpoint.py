@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:24
+
+import datetime
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Sum
+from django.utils import timezone
+
+
+def create_checkpoints_at_past_cycle_starts(apps, schema_editor):
+    ShiftAccountBalanceCheckpoint = apps.get_model(
+        "shifts", "ShiftAccountBalanceCheckpoint"
+    )
+    ShiftAccountEntry = apps.get_model("shifts", "ShiftAccountEntry")
+    ShiftCycleEntry = apps.get_model("shifts", "ShiftCycleEntry")
+
+    cycle_start_dates = (
+        ShiftCycleEntry.objects.order_by("cycle_start_date")
+        .values_list("cycle_start_date", flat=True)
+        .distinct()
+    )
+    for cycle_start_date in cycle_start_dates:
+        checkpoint_date = timezone.make_aware(
+            datetime.datetime(
+                cycle_start_date.year, cycle_start_date.month, cycle_start_date.day
+            )
+        )
+        ShiftAccountBalanceCheckpoint.objects.bulk_create(
+            [
+                ShiftAccountBalanceCheckpoint(
+                    user_id=user_id, date=checkpoint_date, balance=balance
+                )
+                for user_id, balance in ShiftAccountEntry.objects.filter(
+                    date__lte=checkpoint_date
+                )
+                .order_by()
+                .values("user_id")
+                .annotate(balance=Sum("value"))
+                .values_list("user_id", "balance")
+            ]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shifts", "0078_shiftuserdata_account_balance"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShiftAccountBalanceCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateTimeField()),
+                ("balance", models.IntegerField()),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="shift_account_balance_checkpoints",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["date"], name="shifts_shif_date_d87664_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "date"),
+                        name="shift_account_balance_checkpoint_unique_user_date",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            create_checkpoints_at_past_cycle_starts, migrations.RunPython.noop
+        ),
+    ]
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import calendar
 import datetime
+from collections import defaultdict
 
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
-from django.db.models import Sum
+from django.db.models import F, Sum, Value, Window
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
 from django.urls import reverse
@@ -386,7 +387,12 @@ class ShiftSlotTemplate(RequiredCapabilitiesMixin, models.Model):
             slot.update_attendance_from_template()
 
     def create_slot_from_template(self, shift: Shift):
-        return ShiftSlot.objects.create(
+        slot = self.build_slot_from_template(shift)
+        slot.save()
+        return slot
+
+    def build_slot_from_template(self, shift: Shift):
+        return ShiftSlot(
             slot_template=self,
             name=self.name,
             shift=shift,
@@ -775,6 +781,40 @@ class ShiftSlot(RequiredCapabilitiesMixin, models.Model):
         return f"{self.name}, {self.shift} (#{self.id})"
 
 
+class ShiftAccountEntryQuerySet(models.QuerySet):
+    # Keep ShiftUserData.account_balance and the checkpoints in sync for bulk operations. QuerySet.update() is
+    # not covered, the reconcile_shift_account_balances command repairs the balances if it gets used.
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic():
+            entries = super().bulk_create(objs, *args, **kwargs)
+            ShiftAccountEntry.apply_balance_changes(
+                [(entry.user_id, entry.date, entry.value) for entry in entries]
+            )
+        return entries
+
+    def delete(self):
+        with transaction.atomic():
+            changes = [
+                (user_id, date, -value)
+                for user_id, date, value in self.values_list("user_id", "date", "value")
+            ]
+            result = super().delete()
+            ShiftAccountEntry.apply_balance_changes(changes)
+        return result
+
+    def with_balance_at_date(self, initial_balance: int = 0):
+        """Annotates each entry with the balance of its user at the date of the entry, in the same query.
+
+        The running sum only sees the entries of the queryset: if older entries got filtered out,
+        their sum must be given as initial_balance."""
+        return self.annotate(
+            balance_at_date=Window(
+                Sum("value"), partition_by=F("user_id"), order_by=F("date").asc()
+            )
+            + Value(initial_balance)
+        )
+
+
 class ShiftAccountEntry(models.Model):
     """ShiftAccountEntry represents and entry to the shift "bank account" of a user.
 
@@ -782,8 +822,13 @@ class ShiftAccountEntry(models.Model):
 
     Based on the account balance and the dates of the entries, the penalties are calculated. For example, if the
     balance has been -2 for four weeks (TBD, this is just an example), the cooperator's right to shop will be revoked.
+
+    Creating, updating or deleting entries updates ShiftUserData.account_balance and the
+    ShiftAccountBalanceCheckpoint in the same transaction.
     """
 
+    objects = ShiftAccountEntryQuerySet.as_manager()
+
     user = models.ForeignKey(
         TapirUser, related_name="shift_account_entries", on_delete=models.CASCADE
     )
@@ -798,6 +843,120 @@ class ShiftAccountEntry(models.Model):
     )
     is_solidarity_used = models.BooleanField(blank=False, null=False, default=False)
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            previous = None
+            if not self._state.adding:
+                previous = (
+                    ShiftAccountEntry.objects.filter(id=self.id)
+                    .values_list("user_id", "date", "value")
+                    .first()
+                )
+            super().save(*args, **kwargs)
+
+            changes = [(self.user_id, self.date, self.value)]
+            if previous is not None:
+                previous_user_id, previous_date, previous_value = previous
+                changes.append((previous_user_id, previous_date, -previous_value))
+            ShiftAccountEntry.apply_balance_changes(changes)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            ShiftAccountEntry.apply_balance_changes(
+                [(self.user_id, self.date, -self.value)]
+            )
+        return result
+
+    @staticmethod
+    def apply_balance_changes(changes: list[tuple[int, datetime.datetime, int]]):
+        """The changes are (user id, date of the entry, value added to the balance) tuples."""
+        balance_changes = defaultdict(int)
+        for user_id, _date, value in changes:
+            balance_changes[user_id] += value
+        ShiftUserData.add_to_account_balances(balance_changes)
+        ShiftAccountBalanceCheckpoint.apply_balance_changes(changes)
+
+
+class ShiftAccountBalanceCheckpoint(models.Model):
+    """Balance of a user at a given time, so that historical balances don't need to sum all entries since the
+    beginning. They are created at each cycle start, see ShiftAccountBalanceService.create_checkpoints.
+
+    The balance includes the entries with a date lower or equal to the date of the checkpoint.
+    """
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "date"],
+                name="shift_account_balance_checkpoint_unique_user_date",
+            )
+        ]
+        indexes = [models.Index(fields=["date"])]
+
+    user = models.ForeignKey(
+        TapirUser,
+        related_name="shift_account_balance_checkpoints",
+        on_delete=models.CASCADE,
+    )
+    date = models.DateTimeField(null=False, blank=False)
+    balance = models.IntegerField(null=False, blank=False)
+
+    @staticmethod
+    def apply_balance_changes(changes: list[tuple[int, datetime.datetime, int]]):
+        if not changes:
+            return
+
+        # Entries are almost always created at the current date, after the last checkpoint
+        if not ShiftAccountBalanceCheckpoint.objects.filter(
+            date__gte=min(date for _user_id, date, _value in changes)
+        ).exists():
+            return
+
+        # Several changes for the same user and date must be summed first,
+        # otherwise the user would only appear once in the user_id__in filter
+        value_by_user_id_and_date = defaultdict(int)
+        for user_id, date, value in changes:
+            value_by_user_id_and_date[(user_id, date)] += value
+
+        user_ids_by_date_and_value = defaultdict(list)
+        for (user_id, date), value in value_by_user_id_and_date.items():
+            if value != 0:
+                user_ids_by_date_and_value[(date, value)].append(user_id)
+
+        for (date, value), user_ids in user_ids_by_date_and_value.items():
+            ShiftAccountBalanceCheckpoint.objects.filter(
+                user_id__in=user_ids, date__gte=date
+            ).update(balance=F("balance") + value)
+
+    @staticmethod
+    def get_balance_at_datetime(
+        user_id: int, at_datetime: datetime.datetime, including: bool = True
+    ) -> int:
+        """Returns the sum of the user's entries up to the given date.
+        If including is False, the entries at exactly that date are not counted."""
+        checkpoints = ShiftAccountBalanceCheckpoint.objects.filter(user_id=user_id)
+        checkpoints = (
+            checkpoints.filter(date__lte=at_datetime)
+            if including
+            else checkpoints.filter(date__lt=at_datetime)
+        )
+        checkpoint = checkpoints.order_by("-date").first()
+
+        entries = ShiftAccountEntry.objects.filter(user_id=user_id)
+        entries = (
+            entries.filter(date__lte=at_datetime)
+            if including
+            else entries.filter(date__lt=at_datetime)
+        )
+        balance = 0
+        if checkpoint is not None:
+            entries = entries.filter(date__gt=checkpoint.date)
+            balance = checkpoint.balance
+
+        # Might return None if no objects, so "or 0"
+        return balance + (entries.aggregate(balance=Sum("value"))["balance"] or 0)
+
 
 class ShiftAttendance(models.Model):
     class Meta:
@@ -886,6 +1045,18 @@ class ShiftAttendance(models.Model):
             self.save()
             previous_entry.delete()
 
+        entry = self.build_shift_account_entry(entry_description)
+        if entry is None:
+            return
+
+        entry.save()
+        self.account_entry = entry
+        self.save()
+
+    def build_shift_account_entry(
+        self, entry_description=""
+    ) -> ShiftAccountEntry | None:
+        """Returns the unsaved entry corresponding to the current state, None if the state doesn't need an entry."""
         entry_value = None
         if self.state == ShiftAttendance.State.MISSED:
             entry_value = -1
@@ -899,20 +1070,18 @@ class ShiftAttendance(models.Model):
                 entry_value = 1
 
         if entry_value is None:
-            return
+            return None
 
         is_solidarity_str = "Solidarity" if self.is_solidarity else ""
 
         description = f"{is_solidarity_str} Shift {SHIFT_ATTENDANCE_STATES[self.state]} {self.slot.get_display_name()} {entry_description}"
 
-        entry = ShiftAccountEntry.objects.create(
-            user=self.user,
+        return ShiftAccountEntry(
+            user_id=self.user_id,
             value=entry_value,
             date=timezone.now(),
             description=description,
         )
-        self.account_entry = entry
-        self.save()
 
 
 @receiver(pre_save, sender=ShiftAttendance)
@@ -1001,9 +1170,40 @@ class ShiftUserData(models.Model):
         related_name="shift_partner_of",
     )
     is_frozen = models.BooleanField(default=False, verbose_name=_("Is frozen"))
+    # Sum of the values of the user's ShiftAccountEntry, maintained by ShiftAccountEntry.
+    # Don't write it directly, see ShiftAccountBalanceService to repair it.
+    account_balance = models.IntegerField(
+        default=0, db_index=True, verbose_name=_("Account balance")
+    )
 
     objects = ShiftUserDataQuerySet.as_manager()
 
+    def save(self, *args, **kwargs):
+        # A stale instance must not overwrite the balance that got updated by new account entries
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred_fields = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name != "account_balance"
+                and field.attname not in deferred_fields
+            ]
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def add_to_account_balances(changes: dict[int, int]):
+        """The keys of the changes are user ids, the values are added to the balance of the corresponding user."""
+        user_ids_by_change = defaultdict(list)
+        for user_id, change in changes.items():
+            if change != 0:
+                user_ids_by_change[change].append(user_id)
+
+        for change, user_ids in user_ids_by_change.items():
+            ShiftUserData.objects.filter(user_id__in=user_ids).update(
+                account_balance=F("account_balance") + change
+            )
+
     def get_capabilities_display(self):
         return ", ".join(
             [str(SHIFT_USER_CAPABILITY_CHOICES[c]) for c in self.capabilities]
@@ -1015,11 +1215,14 @@ class ShiftUserData(models.Model):
         ).with_valid_state()
 
     def get_account_balance(self, at_date: datetime.datetime | None = None):
-        entries = self.user.shift_account_entries
-        if at_date:
-            entries = entries.filter(date__lte=at_date)
-        # Might return None if no objects, so "or 0"
-        return entries.aggregate(balance=Sum("value"))["balance"] or 0
+        if not at_date:
+            # Reloaded because the balance may have been updated since this instance was loaded
+            self.refresh_from_db(fields=["account_balance"])
+            return self.account_balance
+
+        return ShiftAccountBalanceCheckpoint.get_balance_at_datetime(
+            self.user_id, at_date
+        )
 
     def is_balance_ok(self):
         balance = self.get_account_balance()
@@ -1284,6 +1487,17 @@ class ShiftWatch(models.Model):
         ]
 
 
+class DirtyShiftMarker(models.Model):
+    """Records that the attendances or slots of a shift changed since the last run of send_shift_watch_mail.
+
+    See DirtyShiftMarkerService. There can be several markers for the same shift.
+    Not a foreign key so that markers can be created while the shift is getting deleted.
+    """
+
+    shift_id = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+
 class RecurringShiftWatch(models.Model):
     """
     class to generate recurring ShiftWatches from.
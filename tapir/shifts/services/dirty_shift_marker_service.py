@@ -0,0 +1,63 @@
+from typing import Iterable
+
+from django.db.models.signals import post_delete, post_save
+
+from tapir.shifts.models import DirtyShiftMarker, Shift, ShiftAttendance, ShiftSlot
+
+
+class DirtyShiftMarkerService:
+    """Keeps track of the shifts whose staffing may have changed, so that send_shift_watch_mail only has to look
+    at the watches of those shifts.
+
+    Changes done through the ORM are tracked with signals. Code that changes attendances or slots with
+    QuerySet.update() must call mark_shifts_as_dirty itself."""
+
+    @staticmethod
+    def mark_shifts_as_dirty(shift_ids: Iterable[int]):
+        DirtyShiftMarker.objects.bulk_create(
+            [DirtyShiftMarker(shift_id=shift_id) for shift_id in set(shift_ids)]
+        )
+
+    @classmethod
+    def register_receivers(cls):
+        for model, receiver in [
+            (ShiftAttendance, cls.on_attendance_changed),
+            (ShiftSlot, cls.on_slot_changed),
+        ]:
+            post_save.connect(
+                receiver,
+                sender=model,
+                dispatch_uid=f"dirty_shift_marker_{model.__name__}_saved",
+            )
+            post_delete.connect(
+                receiver,
+                sender=model,
+                dispatch_uid=f"dirty_shift_marker_{model.__name__}_deleted",
+            )
+        post_save.connect(
+            cls.on_shift_saved,
+            sender=Shift,
+            dispatch_uid="dirty_shift_marker_Shift_saved",
+        )
+
+    @classmethod
+    def on_attendance_changed(cls, sender, instance: ShiftAttendance, **kwargs):
+        if ShiftAttendance.slot.is_cached(instance):
+            shift_ids = [instance.slot.shift_id]
+        else:
+            # If the slot is getting deleted, it marks the shift itself.
+            shift_ids = ShiftSlot.objects.filter(id=instance.slot_id).values_list(
+                "shift_id", flat=True
+            )
+        cls.mark_shifts_as_dirty(shift_ids)
+
+    @classmethod
+    def on_slot_changed(cls, sender, instance: ShiftSlot, **kwargs):
+        cls.mark_shifts_as_dirty([instance.shift_id])
+
+    @classmethod
+    def on_shift_saved(cls, sender, instance: Shift, created: bool, **kwargs):
+        # A new shift can't have been watched yet
+        if created:
+            return
+        cls.mark_shifts_as_dirty([instance.id])
@@ -0,0 +1,209 @@
+import datetime
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from tapir.coop.models import MemberStatus, ShareOwner
+from tapir.log.models import EmailLogEntry
+from tapir.shifts.config import (
+    FREEZE_AFTER_DAYS,
+    FREEZE_THRESHOLD,
+    NB_WEEKS_IN_THE_FUTURE_FOR_MAKE_UP_SHIFTS,
+)
+from tapir.shifts.emails.freeze_warning_email import FreezeWarningEmailBuilder
+from tapir.shifts.models import ShiftAccountEntry, ShiftAttendance, ShiftUserData
+from tapir.shifts.services.frozen_status_management_service import (
+    FrozenStatusManagementService,
+)
+from tapir.shifts.services.shift_expectation_service import ShiftExpectationService
+
+
+class FreezeCheckBatchService:
+    """Does the same checks as the should_* methods of FrozenStatusManagementService, but for all members at once.
+
+    The data needed by the checks is loaded with a fixed number of queries,
+    then each member is classified in memory."""
+
+    ACTION_FREEZE = "freeze"
+    ACTION_SEND_FREEZE_WARNING = "send_freeze_warning"
+    ACTION_UNFREEZE = "unfreeze"
+
+    @dataclass
+    class FreezeCheckData:
+        shift_user_data: ShiftUserData
+        is_expected_to_do_shifts: bool
+        is_active_member: bool
+        balance: int
+        nb_upcoming_attendances: int
+        last_freeze_warning_date: datetime.date | None
+        # (date, value), most recent first. Only loaded for members that are below the threshold.
+        account_entries: list[tuple[datetime.datetime, int]] = field(
+            default_factory=list
+        )
+
+    @classmethod
+    def run_freeze_checks(cls):
+        reference_time = timezone.now()
+        for data in cls.get_freeze_check_data(reference_time):
+            action = cls.get_action(data, reference_time.date())
+            if action == cls.ACTION_FREEZE:
+                FrozenStatusManagementService.freeze_member_and_send_email(
+                    data.shift_user_data, actor=None
+                )
+            elif action == cls.ACTION_SEND_FREEZE_WARNING:
+                FrozenStatusManagementService.send_freeze_warning_email(
+                    data.shift_user_data
+                )
+            elif action == cls.ACTION_UNFREEZE:
+                FrozenStatusManagementService.unfreeze_and_send_notification_email(
+                    data.shift_user_data
+                )
+
+    @classmethod
+    def get_action(cls, data: FreezeCheckData, today: datetime.date) -> str | None:
+        if cls.should_freeze_member(data, today):
+            return cls.ACTION_FREEZE
+        if cls.should_send_freeze_warning(data, today):
+            return cls.ACTION_SEND_FREEZE_WARNING
+        if cls.should_unfreeze_member(data):
+            return cls.ACTION_UNFREEZE
+        return None
+
+    @classmethod
+    def should_freeze_member(cls, data: FreezeCheckData, today: datetime.date):
+        if data.shift_user_data.is_frozen:
+            return False
+
+        if not data.is_expected_to_do_shifts:
+            return False
+
+        if not FrozenStatusManagementService.is_balance_below_threshold_since_long_enough(
+            data.balance, data.account_entries, today
+        ):
+            return False
+
+        return not cls._is_member_registered_to_enough_shifts(data)
+
+    @staticmethod
+    def should_send_freeze_warning(data: FreezeCheckData, today: datetime.date):
+        if data.balance > FREEZE_THRESHOLD:
+            return False
+
+        if not data.is_expected_to_do_shifts:
+            return False
+
+        if data.last_freeze_warning_date is None:
+            return True
+
+        return (today - data.last_freeze_warning_date).days > FREEZE_AFTER_DAYS
+
+    @classmethod
+    def should_unfreeze_member(cls, data: FreezeCheckData):
+        if not data.shift_user_data.is_frozen:
+            return False
+
+        if not data.is_active_member:
+            return False
+
+        if data.balance > FREEZE_THRESHOLD:
+            return True
+
+        return cls._is_member_registered_to_enough_shifts(data)
+
+    @staticmethod
+    def _is_member_registered_to_enough_shifts(data: FreezeCheckData):
+        return data.nb_upcoming_attendances + data.balance > FREEZE_THRESHOLD
+
+    @classmethod
+    def get_freeze_check_data(
+        cls, reference_time: datetime.datetime
+    ) -> list[FreezeCheckData]:
+        shift_user_datas = ShiftExpectationService.annotate_shift_user_data_queryset_with_working_status_at_datetime(
+            ShiftUserData.objects.all(), reference_time
+        ).select_related(
+            "user"
+        )
+
+        active_share_owner_ids = set(
+            ShareOwner.objects.with_status(
+                MemberStatus.ACTIVE, reference_time
+            ).values_list("id", flat=True)
+        )
+        share_owner_id_by_user_id = dict(
+            ShareOwner.objects.filter(user__isnull=False).values_list("user_id", "id")
+        )
+
+        nb_upcoming_attendances_by_user_id = dict(
+            ShiftAttendance.objects.filter(
+                state__in=ShiftAttendance.STATES_WHERE_THE_MEMBER_IS_EXPECTED_TO_SHOW_UP,
+                slot__shift__start_time__lt=reference_time
+                + datetime.timedelta(weeks=NB_WEEKS_IN_THE_FUTURE_FOR_MAKE_UP_SHIFTS),
+                slot__shift__start_time__gt=reference_time
+                - datetime.timedelta(weeks=4),
+            )
+            .values("user_id")
+            .annotate(nb_attendances=Count("id"))
+            .values_list("user_id", "nb_attendances")
+        )
+
+        last_freeze_warning_by_user_id = dict(
+            EmailLogEntry.objects.filter(
+                email_id=FreezeWarningEmailBuilder.get_unique_id(),
+                user__isnull=False,
+            )
+            .values("user_id")
+            .annotate(last_warning=Max("created_date"))
+            .values_list("user_id", "last_warning")
+        )
+
+        data_list = []
+        for shift_user_data in shift_user_datas:
+            user_id = shift_user_data.user_id
+            last_freeze_warning = last_freeze_warning_by_user_id.get(user_id)
+            data_list.append(
+                cls.FreezeCheckData(
+                    shift_user_data=shift_user_data,
+                    is_expected_to_do_shifts=getattr(
+                        shift_user_data,
+                        ShiftExpectationService.ANNOTATION_IS_WORKING_AT_DATE,
+                    ),
+                    is_active_member=share_owner_id_by_user_id.get(user_id)
+                    in active_share_owner_ids,
+                    balance=shift_user_data.account_balance,
+                    nb_upcoming_attendances=nb_upcoming_attendances_by_user_id.get(
+                        user_id, 0
+                    ),
+                    last_freeze_warning_date=(
+                        last_freeze_warning.date() if last_freeze_warning else None
+                    ),
+                )
+            )
+
+        cls._load_account_entries(
+            [
+                data
+                for data in data_list
+                if data.balance <= FREEZE_THRESHOLD
+                and not data.shift_user_data.is_frozen
+            ]
+        )
+
+        return data_list
+
+    @staticmethod
+    def _load_account_entries(data_list: list[FreezeCheckData]):
+        # The entry history is only needed for the members that may get frozen
+        entries_by_user_id = defaultdict(list)
+        for user_id, date, value in (
+            ShiftAccountEntry.objects.filter(
+                user_id__in=[data.shift_user_data.user_id for data in data_list]
+            )
+            .order_by("user_id", "-date")
+            .values_list("user_id", "date", "value")
+        ):
+            entries_by_user_id[user_id].append((date, value))
+
+        for data in data_list:
+            data.account_entries = entries_by_user_id[data.shift_user_data.user_id]
@@ -3,7 +3,6 @@ import datetime
 from django.db.models import (
     Case,
     CharField,
-    OuterRef,
     QuerySet,
     Subquery,
     Value,
@@ -13,10 +12,8 @@ from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from tapir.coop.models import ShareOwner
-from tapir.shifts.models import (
-    ShiftUserData,
-    UpdateShiftUserDataLogEntry,
-)
+from tapir.log.services.attribute_history_service import AttributeHistoryService
+from tapir.shifts.models import ShiftUserData
 from tapir.utils.shortcuts import ensure_datetime
 
 
@@ -60,13 +57,16 @@ class FrozenStatusHistoryService:
         )
         queryset = queryset.annotate(
             is_frozen_from_log_entry_as_string=Subquery(
-                UpdateShiftUserDataLogEntry.objects.filter(
-                    user_id=OuterRef("user_id"),
-                    created_date__gte=at_datetime,
-                    old_values__has_key="is_frozen",
-                )
-                .order_by("created_date")
-                .values("old_values__is_frozen")[:1],
+                AttributeHistoryService.get_intervals_at_datetime(
+                    ShiftUserData,
+                    "is_frozen",
+                    at_datetime,
+                    (
+                        "id"
+                        if attendance_mode_prefix is None
+                        else f"{attendance_mode_prefix}__id"
+                    ),
+                ).values("value")[:1],
                 output_field=CharField(),
             )
         )
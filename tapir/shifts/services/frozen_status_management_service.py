@@ -1,4 +1,5 @@
 import datetime
+from typing import Iterable
 
 from django.contrib.auth.models import User
 from django.db import transaction
@@ -61,12 +62,29 @@ class FrozenStatusManagementService:
         entries = ShiftAccountEntry.objects.filter(user=shift_user_data.user).order_by(
             "-date"
         )
-        for entry in entries:
-            if (timezone.now().date() - entry.date.date()).days > FREEZE_AFTER_DAYS:
+        return cls.is_balance_below_threshold_since_long_enough(
+            balance,
+            ((entry.date, entry.value) for entry in entries),
+            timezone.now().date(),
+        )
+
+    @staticmethod
+    def is_balance_below_threshold_since_long_enough(
+        balance: int,
+        entries: Iterable[tuple[datetime.datetime, int]],
+        today: datetime.date,
+    ) -> bool:
+        """The entries are (date, value) tuples of the member's account entries, most recent first."""
+        if balance > FREEZE_THRESHOLD:
+            return False
+
+        for date, value in entries:
+            if (today - date.date()).days > FREEZE_AFTER_DAYS:
                 return True
-            balance -= entry.value
+            balance -= value
             if balance > FREEZE_THRESHOLD:
                 return False
+        return False
 
     @classmethod
     def _is_member_registered_to_enough_shifts_to_compensate_for_negative_shift_account(
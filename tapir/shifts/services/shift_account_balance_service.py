@@ -0,0 +1,125 @@
+import datetime
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F, IntegerField, Max, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from tapir.shifts.models import (
+    ShiftAccountBalanceCheckpoint,
+    ShiftAccountEntry,
+    ShiftUserData,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ShiftAccountBalanceService:
+    """ShiftUserData.account_balance is maintained by ShiftAccountEntry whenever entries get created, updated or
+    deleted. Changes that bypass the model, like QuerySet.update() or raw SQL, can make it drift from the sum of
+    the entries: this service finds and repairs those.
+
+    It also creates the ShiftAccountBalanceCheckpoint used to compute historical balances.
+    """
+
+    ANNOTATION_ACTUAL_BALANCE = "actual_account_balance"
+
+    @classmethod
+    def get_actual_balance_expression(cls):
+        return Coalesce(
+            Subquery(
+                ShiftAccountEntry.objects.filter(user_id=OuterRef("user_id"))
+                .order_by()
+                .values("user_id")
+                .annotate(total=Sum("value"))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+
+    @classmethod
+    def get_drifted_shift_user_datas(cls):
+        return (
+            ShiftUserData.objects.annotate(
+                **{cls.ANNOTATION_ACTUAL_BALANCE: cls.get_actual_balance_expression()}
+            )
+            .exclude(account_balance=F(cls.ANNOTATION_ACTUAL_BALANCE))
+            .select_related("user")
+            .order_by("id")
+        )
+
+    @classmethod
+    @transaction.atomic
+    def reconcile_balances(cls, fix: bool = True) -> list[ShiftUserData]:
+        """Returns the ShiftUserData whose stored balance was wrong, annotated with the actual balance.
+        If fix is True, the stored balances are set to the actual ones."""
+        drifted_shift_user_datas = list(
+            cls.get_drifted_shift_user_datas().select_for_update(of=("self",))
+        )
+        for shift_user_data in drifted_shift_user_datas:
+            logger.warning(
+                f"Account balance of user #{shift_user_data.user_id} is {shift_user_data.account_balance}, "
+                f"expected {getattr(shift_user_data, cls.ANNOTATION_ACTUAL_BALANCE)}"
+            )
+
+        if fix and drifted_shift_user_datas:
+            ShiftUserData.objects.filter(
+                id__in=[
+                    shift_user_data.id for shift_user_data in drifted_shift_user_datas
+                ]
+            ).update(account_balance=cls.get_actual_balance_expression())
+            # The checkpoints of those users are probably wrong as well. Without checkpoints,
+            # their historical balances get computed from the entries again.
+            ShiftAccountBalanceCheckpoint.objects.filter(
+                user_id__in=[
+                    shift_user_data.user_id
+                    for shift_user_data in drifted_shift_user_datas
+                ]
+            ).delete()
+
+        return drifted_shift_user_datas
+
+    @staticmethod
+    @transaction.atomic
+    def create_checkpoints(at_datetime: datetime.datetime):
+        """Creates a ShiftAccountBalanceCheckpoint at the given date for every user that has entries until then.
+
+        The balances are computed from the previous checkpoints plus the entries since then,
+        instead of summing all entries since the beginning."""
+        previous_date = ShiftAccountBalanceCheckpoint.objects.filter(
+            date__lt=at_datetime
+        ).aggregate(Max("date"))["date__max"]
+
+        balances = defaultdict(int)
+        entries_to_sum = ShiftAccountEntry.objects.filter(date__lte=at_datetime)
+        if previous_date is not None:
+            previous_checkpoints = ShiftAccountBalanceCheckpoint.objects.filter(
+                date=previous_date
+            )
+            balances.update(previous_checkpoints.values_list("user_id", "balance"))
+            # Users that have no previous checkpoint, for example because their first entry got created
+            # after the checkpoint with an older date, get all their entries summed.
+            entries_to_sum = entries_to_sum.exclude(
+                user_id__in=previous_checkpoints.values("user_id"),
+                date__lte=previous_date,
+            )
+
+        for user_id, total in (
+            entries_to_sum.order_by()
+            .values("user_id")
+            .annotate(total=Sum("value"))
+            .values_list("user_id", "total")
+        ):
+            balances[user_id] += total
+
+        ShiftAccountBalanceCheckpoint.objects.bulk_create(
+            [
+                ShiftAccountBalanceCheckpoint(
+                    user_id=user_id, date=at_datetime, balance=balance
+                )
+                for user_id, balance in balances.items()
+            ],
+            ignore_conflicts=True,
+        )
@@ -49,12 +49,26 @@ class ShiftCancellationService:
                 attendance.save()
                 user_is_registered_to_an_abcd_shift = False
 
-            email_builder = ShiftCancelledEmail(
+            ShiftCancellationService.send_shift_cancelled_mail(
                 shift=shift,
+                recipient=attendance.user,
                 user_is_registered_to_an_abcd_shift=user_is_registered_to_an_abcd_shift,
-            )
-            SendMailService.send_to_tapir_user(
                 actor=actor,
-                recipient=attendance.user,
-                email_builder=email_builder,
             )
+
+    @staticmethod
+    def send_shift_cancelled_mail(
+        shift: Shift,
+        recipient: TapirUser,
+        user_is_registered_to_an_abcd_shift: bool,
+        actor: TapirUser | User | None = None,
+    ):
+        email_builder = ShiftCancelledEmail(
+            shift=shift,
+            user_is_registered_to_an_abcd_shift=user_is_registered_to_an_abcd_shift,
+        )
+        SendMailService.send_to_tapir_user(
+            actor=actor,
+            recipient=recipient,
+            email_builder=email_builder,
+        )
@@ -1,7 +1,7 @@
 import datetime
 
 from django.db import transaction
-from django.db.models import Max
+from django.db.models import Max, QuerySet
 from django.utils import timezone
 
 from tapir.shifts.config import cycle_start_dates
@@ -12,18 +12,64 @@ from tapir.shifts.models import (
     ShiftTemplateGroup,
     ShiftUserData,
 )
+from tapir.shifts.services.shift_account_balance_service import (
+    ShiftAccountBalanceService,
+)
 from tapir.shifts.services.shift_expectation_service import ShiftExpectationService
-from tapir.utils.shortcuts import get_monday
+from tapir.utils.shortcuts import get_monday, get_timezone_aware_datetime
 
 
 class ShiftCycleService:
     @classmethod
-    def apply_cycle_start(cls, cycle_start_date: datetime.date, shift_user_datas=None):
+    def apply_cycle_start(
+        cls,
+        cycle_start_date: datetime.date,
+        shift_user_datas: QuerySet[ShiftUserData] | None = None,
+    ):
+        """Same as apply_cycle_start_for_user for each of the given members, but with a fixed number of queries."""
         if shift_user_datas is None:
             shift_user_datas = ShiftUserData.objects.all()
 
-        for shift_user_data in shift_user_datas:
-            cls.apply_cycle_start_for_user(shift_user_data, cycle_start_date)
+        shift_user_datas = shift_user_datas.exclude(
+            shift_cycle_logs__cycle_start_date=cycle_start_date
+        )
+        if not shift_user_datas.exists():
+            return
+
+        shift_user_datas = ShiftExpectationService.annotate_shift_user_data_queryset_with_working_status_at_datetime(
+            shift_user_datas,
+            get_timezone_aware_datetime(cycle_start_date, timezone.now().time()),
+        )
+
+        with transaction.atomic():
+            shift_cycle_entries = []
+            shift_account_entries = []
+            for shift_user_data_id, user_id, is_working in shift_user_datas.values_list(
+                "id", "user_id", ShiftExpectationService.ANNOTATION_IS_WORKING_AT_DATE
+            ):
+                shift_cycle_entry = ShiftCycleEntry(
+                    shift_user_data_id=shift_user_data_id,
+                    cycle_start_date=cycle_start_date,
+                )
+                shift_cycle_entries.append(shift_cycle_entry)
+                if not is_working:
+                    continue
+                shift_cycle_entry.shift_account_entry = cls.build_cycle_account_entry(
+                    user_id, cycle_start_date, credit_requirement=1
+                )
+                shift_account_entries.append(shift_cycle_entry.shift_account_entry)
+
+            ShiftAccountEntry.objects.bulk_create(shift_account_entries)
+            ShiftCycleEntry.objects.bulk_create(shift_cycle_entries)
+            ShiftAccountBalanceService.create_checkpoints(
+                timezone.make_aware(
+                    datetime.datetime(
+                        cycle_start_date.year,
+                        cycle_start_date.month,
+                        cycle_start_date.day,
+                    )
+                )
+            )
 
     @staticmethod
     @transaction.atomic
@@ -45,8 +91,19 @@ class ShiftCycleService:
         if credit_requirement <= 0:
             return
 
-        shift_account_entry = ShiftAccountEntry.objects.create(
-            user=shift_user_data.user,
+        shift_account_entry = ShiftCycleService.build_cycle_account_entry(
+            shift_user_data.user_id, cycle_start_date, credit_requirement
+        )
+        shift_account_entry.save()
+        shift_cycle_log.shift_account_entry = shift_account_entry
+        shift_cycle_log.save()
+
+    @staticmethod
+    def build_cycle_account_entry(
+        user_id: int, cycle_start_date: datetime.date, credit_requirement: int
+    ) -> ShiftAccountEntry:
+        return ShiftAccountEntry(
+            user_id=user_id,
             value=-credit_requirement,
             date=timezone.make_aware(
                 datetime.datetime(
@@ -56,8 +113,6 @@ class ShiftCycleService:
             description="Shift cycle starting the "
             + cycle_start_date.strftime("%d.%m.%y"),
         )
-        shift_cycle_log.shift_account_entry = shift_account_entry
-        shift_cycle_log.save()
 
     @classmethod
     def get_next_cycle_start_date(cls):
@@ -1,4 +1,5 @@
 import datetime
+from typing import Iterable
 
 from django.db.models import Case, Q, QuerySet, Value, When
 from django.utils import timezone
@@ -23,6 +24,18 @@ class ShiftExpectationService:
         if at_datetime is None:
             at_datetime = timezone.now()
 
+        if (
+            getattr(
+                shift_user_data,
+                ShiftExpectationService.ANNOTATION_IS_WORKING_DATE_CHECK,
+                None,
+            )
+            == at_datetime
+        ):
+            return getattr(
+                shift_user_data, ShiftExpectationService.ANNOTATION_IS_WORKING_AT_DATE
+            )
+
         if (
             not hasattr(shift_user_data.user, "share_owner")
             or shift_user_data.user.share_owner is None
@@ -114,6 +127,18 @@ class ShiftExpectationService:
             }
         )
 
+    @classmethod
+    def evaluate_many(
+        cls, shift_user_data_ids: Iterable[int], at_datetime: datetime.datetime
+    ) -> dict[int, bool]:
+        """Returns, for each given ShiftUserData id, whether the member is expected to do shifts at the given time.
+        The number of queries doesn't depend on the number of members."""
+        return dict(
+            cls.annotate_shift_user_data_queryset_with_working_status_at_datetime(
+                ShiftUserData.objects.filter(id__in=shift_user_data_ids), at_datetime
+            ).values_list("id", cls.ANNOTATION_IS_WORKING_AT_DATE)
+        )
+
     @classmethod
     def get_credit_requirement_for_cycle(
         cls, shift_user_data: ShiftUserData, cycle_start_date: datetime.date
@@ -1,13 +1,25 @@
 import datetime
+from collections import defaultdict
 
 import holidays
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Q
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
 from tapir.core.models import FeatureFlag
+from tapir.core.services.send_mail_service import SendMailService
 from tapir.shifts.config import FEATURE_FLAG_AUTO_CANCEL_HOLIDAYS, GENERATE_UP_TO
-from tapir.shifts.models import Shift, ShiftTemplate, ShiftTemplateGroup
+from tapir.shifts.models import (
+    Shift,
+    ShiftAccountEntry,
+    ShiftAttendance,
+    ShiftSlot,
+    ShiftSlotTemplate,
+    ShiftTemplate,
+    ShiftTemplateGroup,
+)
 from tapir.shifts.services.shift_cancellation_service import ShiftCancellationService
 from tapir.shifts.services.shift_watch_creation_service import ShiftWatchCreator
 from tapir.shifts.templatetags.shifts import get_week_group
@@ -51,41 +63,192 @@ class ShiftGenerator:
         group: ShiftTemplateGroup,
         filter_shift_template_ids: set[int] = None,
     ):
+        """Same result as calling ShiftTemplate.create_shift_if_necessary on each template of the group,
+        but the shifts, slots and attendances of the whole week are created in bulk."""
         if at_date.weekday() != 0:
             raise ValueError("Start date for shift generation must be a Monday")
 
         start_date_in_the_past_or_null = Q(start_date__lte=at_date) | Q(
             start_date__isnull=True
         )
-        shift_templates = ShiftTemplate.objects.filter(group=group).filter(
-            start_date_in_the_past_or_null
+        shift_templates = (
+            ShiftTemplate.objects.filter(group=group)
+            .filter(start_date_in_the_past_or_null)
+            .select_related("group")
         )
 
         if filter_shift_template_ids is not None:
             shift_templates = shift_templates.filter(id__in=filter_shift_template_ids)
 
-        created_shifts = [
-            shift_template.create_shift_if_necessary(start_date=at_date)
+        country_holidays = (
+            cls.get_country_holidays()
+            if FeatureFlag.get_flag_value(FEATURE_FLAG_AUTO_CANCEL_HOLIDAYS)
+            else None
+        )
+
+        with SendMailService.queue_mails(), transaction.atomic():
+            created_shifts, new_shifts = cls.build_shifts(
+                list(shift_templates), at_date
+            )
+
+            if country_holidays is not None:
+                for shift in new_shifts:
+                    if shift.start_time.date() in country_holidays:
+                        shift.cancelled = True
+                        shift.cancelled_reason = country_holidays[
+                            shift.start_time.date()
+                        ]
+
+            Shift.objects.bulk_create(new_shifts)
+            cls.create_slots_and_attendances(new_shifts)
+
+            if country_holidays is not None:
+                # Shifts that existed before the holiday cancellation got enabled
+                cls.cancel_holiday_shifts(
+                    [
+                        shift
+                        for shift in created_shifts
+                        if shift not in new_shifts and not shift.cancelled
+                    ],
+                    country_holidays,
+                )
+
+        ShiftWatchCreator.create_shift_watches_for_shifts_based_on_recurring(
+            created_shifts
+        )
+
+        return created_shifts
+
+    @staticmethod
+    def build_shifts(
+        shift_templates: list[ShiftTemplate], at_date: datetime.date
+    ) -> tuple[list[Shift], list[Shift]]:
+        """Returns the shift of each template at the given date, and the shifts among those that don't exist yet.
+        The shifts that don't exist yet are not saved."""
+        built_shifts = [
+            shift_template._build_shift(start_date=at_date)
             for shift_template in shift_templates
         ]
 
-        if FeatureFlag.get_flag_value(FEATURE_FLAG_AUTO_CANCEL_HOLIDAYS):
-            cls.cancel_holiday_shifts(created_shifts)
+        # start_time__date and TruncDate both use the current time zone.
+        # Ordered by descending id so that, like .first(), the oldest shift wins if there are duplicates.
+        existing_shifts = {
+            (shift.shift_template_id, shift.generation_date): shift
+            for shift in Shift.objects.filter(
+                shift_template__in=shift_templates,
+                start_time__date__in={
+                    shift.start_time.date() for shift in built_shifts
+                },
+            )
+            .annotate(generation_date=TruncDate("start_time"))
+            .select_related("shift_template__group")
+            .order_by("-id")
+        }
+
+        shifts = []
+        new_shifts = []
+        for built_shift in built_shifts:
+            existing_shift = existing_shifts.get(
+                (built_shift.shift_template_id, built_shift.start_time.date())
+            )
+            if existing_shift is not None:
+                shifts.append(existing_shift)
+                continue
+            shifts.append(built_shift)
+            new_shifts.append(built_shift)
+        return shifts, new_shifts
+
+    @staticmethod
+    def create_slots_and_attendances(shifts: list[Shift]):
+        """Same as ShiftSlotTemplate.create_slot_from_template followed by ShiftSlot.update_attendance_from_template,
+        for all slots of the given newly created shifts.
+
+        For shifts that are already cancelled, the attendances are excused and the members get notified,
+        like ShiftCancellationService.cancel does."""
+        slot_templates_by_shift_template_id = defaultdict(list)
+        for slot_template in (
+            ShiftSlotTemplate.objects.filter(
+                shift_template_id__in={shift.shift_template_id for shift in shifts}
+            )
+            .select_related("attendance_template__user__shift_user_data")
+            .prefetch_related(
+                "attendance_template__user__shift_user_data__shift_exemptions"
+            )
+            .order_by("id")
+        ):
+            slot_templates_by_shift_template_id[slot_template.shift_template_id].append(
+                slot_template
+            )
+
+        slots = [
+            slot_template.build_slot_from_template(shift)
+            for shift in shifts
+            for slot_template in slot_templates_by_shift_template_id[
+                shift.shift_template_id
+            ]
+        ]
+        ShiftSlot.objects.bulk_create(slots)
+
+        now = timezone.now()
+        attendances = []
+        for slot in slots:
+            attendance_template = slot.slot_template.get_attendance_template()
+            if (
+                not attendance_template
+                or attendance_template.user.shift_user_data.is_currently_exempted_from_shifts(
+                    slot.shift.start_time.date()
+                )
+            ):
+                continue
+            attendances.append(
+                ShiftAttendance(
+                    user=attendance_template.user,
+                    slot=slot,
+                    custom_time=attendance_template.custom_time,
+                    state=(
+                        ShiftAttendance.State.MISSED_EXCUSED
+                        if slot.shift.cancelled
+                        else ShiftAttendance.State.PENDING
+                    ),
+                    excused_reason="Shift cancelled" if slot.shift.cancelled else "",
+                    last_state_update=now,
+                )
+            )
+
+        cancelled_attendances = [
+            attendance for attendance in attendances if attendance.slot.shift.cancelled
+        ]
+        account_entries = [
+            attendance.build_shift_account_entry()
+            for attendance in cancelled_attendances
+        ]
+        ShiftAccountEntry.objects.bulk_create(account_entries)
+        for attendance, account_entry in zip(cancelled_attendances, account_entries):
+            attendance.account_entry = account_entry
 
-        for shift in created_shifts:
-            ShiftWatchCreator.create_shift_watches_for_shift_based_on_recurring(shift)
+        ShiftAttendance.objects.bulk_create(attendances)
 
-        return created_shifts
+        for attendance in cancelled_attendances:
+            ShiftCancellationService.send_shift_cancelled_mail(
+                shift=attendance.slot.shift,
+                recipient=attendance.user,
+                user_is_registered_to_an_abcd_shift=True,
+            )
 
-    @classmethod
-    def cancel_holiday_shifts(cls, shifts: list[Shift]):
+    @staticmethod
+    def get_country_holidays():
         subdiv = settings.SUBDIV_FOR_HOLIDAYS_AUTO_CANCEL
         if subdiv == "":
             subdiv = None
-        country_holidays = holidays.country_holidays(
+        return holidays.country_holidays(
             settings.COUNTRY_FOR_HOLIDAYS_AUTO_CANCEL, subdiv=subdiv
         )
 
+    @classmethod
+    def cancel_holiday_shifts(cls, shifts: list[Shift], country_holidays=None):
+        if country_holidays is None:
+            country_holidays = cls.get_country_holidays()
+
         for shift in shifts:
             if shift.start_time.date() in country_holidays:
                 shift.cancelled_reason = country_holidays[shift.start_time.date()]
@@ -5,7 +5,6 @@ import datetime
 from django.db.models import (
     Case,
     Exists,
-    OuterRef,
     QuerySet,
     Subquery,
     Value,
@@ -14,7 +13,8 @@ from django.db.models import (
 from django.db.models.fields import CharField
 from django.utils import timezone
 
-from tapir.shifts.models import ShiftUserData, UpdateShiftUserDataLogEntry
+from tapir.log.services.attribute_history_service import AttributeHistoryService
+from tapir.shifts.models import ShiftUserData
 
 
 class ShiftPartnerHistoryService:
@@ -30,15 +30,11 @@ class ShiftPartnerHistoryService:
         if at_datetime is None:
             at_datetime = timezone.now()
 
-        relevant_logs = UpdateShiftUserDataLogEntry.objects.filter(
-            user_id=OuterRef("user_id"),
-            created_date__gte=at_datetime,
-            old_values__has_key="shift_partner",
+        relevant_logs = AttributeHistoryService.get_intervals_at_datetime(
+            ShiftUserData, "shift_partner", at_datetime
         )
         subquery_shift_partner_from_log = Subquery(
-            relevant_logs.order_by("created_date").values("old_values__shift_partner")[
-                :1
-            ],
+            relevant_logs.values("value")[:1],
             output_field=CharField(),
         )
 
@@ -1,4 +1,7 @@
-from django.db.models import Q
+from typing import Iterable, NamedTuple
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, Q
 
 from tapir.shifts.models import (
     RecurringShiftWatch,
@@ -10,7 +13,51 @@ from tapir.shifts.models import (
 )
 
 
+class ShiftStaffing(NamedTuple):
+    number_of_available_slots: int
+    valid_attendances: int
+    required_attendances: int
+    # Slots with a pending attendance
+    valid_slot_ids: list[int]
+
+
 class ShiftWatchCreator:
+    @staticmethod
+    def get_staffing_for_shifts(shift_ids: Iterable[int]) -> dict[int, ShiftStaffing]:
+        """Computes the staffing of all the given shifts with a single query."""
+        staffing_by_shift_id = {}
+        for (
+            shift_id,
+            number_of_available_slots,
+            required_attendances,
+            valid_slot_ids,
+        ) in (
+            Shift.objects.filter(id__in=shift_ids)
+            .annotate(
+                number_of_available_slots=Count("slots", distinct=True),
+                valid_slot_ids=ArrayAgg(
+                    "slots__id",
+                    filter=Q(slots__attendances__state=ShiftAttendance.State.PENDING),
+                    distinct=True,
+                ),
+            )
+            .values_list(
+                "id",
+                "number_of_available_slots",
+                "num_required_attendances",
+                "valid_slot_ids",
+            )
+        ):
+            # ArrayAgg returns null if no slot matches the filter
+            valid_slot_ids = valid_slot_ids or []
+            staffing_by_shift_id[shift_id] = ShiftStaffing(
+                number_of_available_slots=number_of_available_slots,
+                valid_attendances=len(valid_slot_ids),
+                required_attendances=required_attendances,
+                valid_slot_ids=valid_slot_ids,
+            )
+        return staffing_by_shift_id
+
     @classmethod
     def get_staffing_status_for_shift(
         cls, shift: Shift, last_status: str | None = None
@@ -19,21 +66,20 @@ class ShiftWatchCreator:
         Compute the staffing status for a Shift instance by extracting the required
         counts and calling get_staffing_status_if_changed. Returns the status string or None.
         """
-        valid_attendances_count = ShiftSlot.objects.filter(
-            shift=shift,
-            attendances__state=ShiftAttendance.State.PENDING,
-        ).count()
-        required_attendances_count = shift.num_required_attendances
-        number_of_available_slots = shift.slots.count()
-
-        staffing_status = cls.get_staffing_status_if_changed(
-            number_of_available_slots=number_of_available_slots,
-            valid_attendances=valid_attendances_count,
-            required_attendances=required_attendances_count,
-            last_status=last_status,
+        return cls.get_staffing_status_from_staffing(
+            cls.get_staffing_for_shifts([shift.id])[shift.id], last_status
         )
 
-        return staffing_status
+    @classmethod
+    def get_staffing_status_from_staffing(
+        cls, staffing: ShiftStaffing, last_status: str | None = None
+    ) -> str | None:
+        return cls.get_staffing_status_if_changed(
+            number_of_available_slots=staffing.number_of_available_slots,
+            valid_attendances=staffing.valid_attendances,
+            required_attendances=staffing.required_attendances,
+            last_status=last_status,
+        )
 
     @classmethod
     def get_initial_staffing_status_for_shift(cls, shift: Shift) -> str | None:
@@ -45,7 +91,15 @@ class ShiftWatchCreator:
         returns StaffingStatusChoices.ALL_CLEAR as the default. Otherwise, it
         returns the status returned by get_staffing_status_for_shift.
         """
-        staffing_status = cls.get_staffing_status_for_shift(shift=shift)
+        return cls.get_initial_staffing_status_from_staffing(
+            cls.get_staffing_for_shifts([shift.id])[shift.id]
+        )
+
+    @classmethod
+    def get_initial_staffing_status_from_staffing(
+        cls, staffing: ShiftStaffing
+    ) -> str | None:
+        staffing_status = cls.get_staffing_status_from_staffing(staffing)
 
         if staffing_status is None:
             return StaffingStatusChoices.ALL_CLEAR
@@ -126,78 +180,111 @@ class ShiftWatchCreator:
         existing_ids = ShiftWatch.objects.filter(
             user=recurring.user, shift__in=shifts_qs
         ).values_list("shift_id", flat=True)
-        shifts_to_create = shifts_qs.exclude(pk__in=list(existing_ids))
+        shifts_to_create = list(shifts_qs.exclude(pk__in=list(existing_ids)))
+        staffing_by_shift_id = cls.get_staffing_for_shifts(
+            [shift.id for shift in shifts_to_create]
+        )
 
         new_watches = []
         for shift in shifts_to_create:
+            staffing = staffing_by_shift_id[shift.id]
             new_watches.append(
                 ShiftWatch(
                     user=recurring.user,
                     shift=shift,
                     staffing_status=recurring.staffing_status,
                     watched_capabilities=recurring.watched_capabilities,
-                    last_staffing_status=ShiftWatchCreator.get_initial_staffing_status_for_shift(
-                        shift=shift
+                    last_staffing_status=cls.get_initial_staffing_status_from_staffing(
+                        staffing
                     ),
                     recurring_template=recurring,
-                    last_valid_slot_ids=cls.get_valid_slot_ids(shift),
+                    last_valid_slot_ids=staffing.valid_slot_ids,
                 )
             )
 
         if new_watches:
             ShiftWatch.objects.bulk_create(new_watches)
 
-    @classmethod
-    def get_valid_slot_ids(cls, shift: Shift) -> list[int]:
-        return list(
-            ShiftSlot.objects.filter(
-                shift=shift,
-                attendances__state=ShiftAttendance.State.PENDING,
-            ).values_list("id", flat=True)
-        )
-
     @classmethod
     def create_shift_watches_for_shift_based_on_recurring(cls, shift: Shift) -> None:
         """For a shift, find relevant RecurringShiftWatches and create Shift-Watches."""
-        filter_by_weekday = Q(weekdays=[]) | Q(
-            weekdays__contains=[shift.start_time.weekday()]
+        cls.create_shift_watches_for_shifts_based_on_recurring([shift])
+
+    @classmethod
+    def create_shift_watches_for_shifts_based_on_recurring(
+        cls, shifts: list[Shift]
+    ) -> None:
+        """Same as create_shift_watches_for_shift_based_on_recurring, with a constant number of queries.
+
+        The shift templates and their group should be loaded with the shifts (select_related).
+        """
+        if not shifts:
+            return
+
+        recurring_shift_watches = list(
+            RecurringShiftWatch.objects.prefetch_related("shift_templates")
         )
+        if not recurring_shift_watches:
+            return
 
-        filter_by_shift_template_group = Q(shift_template_group=[])
-        if shift.shift_template is not None and shift.shift_template.group is not None:
-            filter_by_shift_template_group |= Q(
-                shift_template_group__contains=[shift.shift_template.group.name]
+        existing_watches = set(
+            ShiftWatch.objects.filter(shift__in=shifts).values_list(
+                "user_id", "shift_id"
             )
+        )
 
-        filter_by_shift_template = Q(shift_templates=None)
-        if shift.shift_template is not None:
-            filter_by_shift_template |= Q(shift_templates=shift.shift_template)
-
-        relevant_recurring_shift_watches = RecurringShiftWatch.objects.filter(
-            filter_by_weekday
-            & filter_by_shift_template_group
-            & filter_by_shift_template
-        ).distinct()
+        watches_to_create = []
+        for shift in shifts:
+            for recurring in recurring_shift_watches:
+                if (recurring.user_id, shift.id) in existing_watches:
+                    continue
+                if not cls.recurring_shift_watch_applies_to_shift(recurring, shift):
+                    continue
+                existing_watches.add((recurring.user_id, shift.id))
+                watches_to_create.append((recurring, shift))
+
+        if not watches_to_create:
+            return
 
+        staffing_by_shift_id = cls.get_staffing_for_shifts(
+            {shift.id for _, shift in watches_to_create}
+        )
         new_watches = []
-        for recurring in relevant_recurring_shift_watches:
-            if ShiftWatch.objects.filter(user=recurring.user, shift=shift).exists():
-                continue
+        for recurring, shift in watches_to_create:
+            staffing = staffing_by_shift_id[shift.id]
             new_watches.append(
                 ShiftWatch(
-                    user=recurring.user,
+                    user_id=recurring.user_id,
                     shift=shift,
                     staffing_status=recurring.staffing_status,
                     recurring_template=recurring,
-                    last_staffing_status=ShiftWatchCreator.get_initial_staffing_status_for_shift(
-                        shift=shift,
+                    last_staffing_status=cls.get_initial_staffing_status_from_staffing(
+                        staffing
                     ),
-                    last_valid_slot_ids=cls.get_valid_slot_ids(shift),
+                    last_valid_slot_ids=staffing.valid_slot_ids,
                 )
             )
+        ShiftWatch.objects.bulk_create(new_watches)
 
-        if new_watches:
-            ShiftWatch.objects.bulk_create(new_watches)
+    @staticmethod
+    def recurring_shift_watch_applies_to_shift(
+        recurring: RecurringShiftWatch, shift: Shift
+    ) -> bool:
+        if recurring.weekdays and shift.start_time.weekday() not in recurring.weekdays:
+            return False
+
+        if recurring.shift_template_group and (
+            shift.shift_template is None
+            or shift.shift_template.group is None
+            or shift.shift_template.group.name not in recurring.shift_template_group
+        ):
+            return False
+
+        shift_templates = recurring.shift_templates.all()
+        if shift_templates and shift.shift_template not in shift_templates:
+            return False
+
+        return True
 
     @classmethod
     def get_capability_status_changes(
@@ -205,19 +292,34 @@ class ShiftWatchCreator:
         this_valid_slot_ids: list[int],
         last_valid_slot_ids: list[int],
         watched_capabilities: list[str],
+        capabilities_by_slot_id: dict[int, list[str]] | None = None,
     ) -> list[str]:
+        """capabilities_by_slot_id can be given to avoid querying the slots.
+        It must contain the required capabilities of all existing slots in this_valid_slot_ids and last_valid_slot_ids.
+        """
         if not watched_capabilities:
             return []
 
         notifications = []
 
-        current_slots = ShiftSlot.objects.filter(
-            id__in=this_valid_slot_ids
-        ).values_list("required_capabilities", flat=True)
-
-        last_slots = ShiftSlot.objects.filter(id__in=last_valid_slot_ids).values_list(
-            "required_capabilities", flat=True
-        )
+        if capabilities_by_slot_id is None:
+            current_slots = ShiftSlot.objects.filter(
+                id__in=this_valid_slot_ids
+            ).values_list("required_capabilities", flat=True)
+            last_slots = ShiftSlot.objects.filter(
+                id__in=last_valid_slot_ids
+            ).values_list("required_capabilities", flat=True)
+        else:
+            current_slots = [
+                capabilities_by_slot_id[slot_id]
+                for slot_id in this_valid_slot_ids
+                if slot_id in capabilities_by_slot_id
+            ]
+            last_slots = [
+                capabilities_by_slot_id[slot_id]
+                for slot_id in last_valid_slot_ids
+                if slot_id in capabilities_by_slot_id
+            ]
 
         current_capabilities_set = set()
         for capabilities in current_slots:
@@ -16,6 +16,7 @@ from tapir.shifts.models import (
     ShiftSlotTemplate,
     ShiftTemplate,
 )
+from tapir.shifts.services.dirty_shift_marker_service import DirtyShiftMarkerService
 from tapir.utils.user_utils import UserUtils
 
 
@@ -109,7 +110,13 @@ class SlotModificationService:
         if parameter_set.target_capabilities is None:
             return
 
-        slot_template.generated_slots.filter(shift_is_in_the_future_filter).update(
+        slots_to_update = slot_template.generated_slots.filter(
+            shift_is_in_the_future_filter
+        )
+        DirtyShiftMarkerService.mark_shifts_as_dirty(
+            slots_to_update.values_list("shift_id", flat=True)
+        )
+        slots_to_update.update(
             required_capabilities=list(parameter_set.target_capabilities)
         )
         slot_template.required_capabilities = list(parameter_set.target_capabilities)
@@ -0,0 +1,57 @@
+import datetime
+
+from django.utils import timezone
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.shifts.models import ShiftUserData
+from tapir.shifts.services.shift_expectation_service import ShiftExpectationService
+from tapir.utils.tests_utils import (
+    TapirFactoryTestBase,
+    create_member_that_is_working,
+    mock_timezone_now,
+)
+
+
+class TestEvaluateMany(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2024, month=10, day=5)
+    REFERENCE_DATETIME = timezone.make_aware(
+        datetime.datetime(year=2024, month=6, day=10)
+    )
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+
+    def test_evaluateMany_default_returnsStatusOfEachGivenMember(self):
+        working_user = create_member_that_is_working(self, self.REFERENCE_DATETIME)
+        frozen_user = create_member_that_is_working(self, self.REFERENCE_DATETIME)
+        frozen_user.shift_user_data.is_frozen = True
+        frozen_user.shift_user_data.save()
+        not_requested_user = TapirUserFactory.create()
+
+        result = ShiftExpectationService.evaluate_many(
+            [working_user.shift_user_data.id, frozen_user.shift_user_data.id],
+            self.REFERENCE_DATETIME,
+        )
+
+        self.assertEqual(
+            {
+                working_user.shift_user_data.id: True,
+                frozen_user.shift_user_data.id: False,
+            },
+            result,
+        )
+        self.assertNotIn(not_requested_user.shift_user_data.id, result)
+
+    def test_isMemberExpectedToDoShifts_annotatedQueryset_doesntDoAnyQuery(self):
+        create_member_that_is_working(self, self.REFERENCE_DATETIME)
+        shift_user_data = ShiftExpectationService.annotate_shift_user_data_queryset_with_working_status_at_datetime(
+            ShiftUserData.objects.all(), self.REFERENCE_DATETIME
+        ).get()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                ShiftExpectationService.is_member_expected_to_do_shifts(
+                    shift_user_data, self.REFERENCE_DATETIME
+                )
+            )
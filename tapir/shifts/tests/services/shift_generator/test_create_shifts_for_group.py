@@ -1,8 +1,15 @@
 import datetime
 from unittest.mock import Mock
 
+from tapir.accounts.tests.factories.factories import TapirUserFactory
 from tapir.shifts.config import FEATURE_FLAG_AUTO_CANCEL_HOLIDAYS
-from tapir.shifts.models import Shift, ShiftTemplateGroup
+from tapir.shifts.models import (
+    Shift,
+    ShiftAttendance,
+    ShiftAttendanceTemplate,
+    ShiftExemption,
+    ShiftTemplateGroup,
+)
 from tapir.shifts.services.shift_generator import ShiftGenerator
 from tapir.shifts.tests.factories import ShiftTemplateFactory
 from tapir.utils.tests_utils import FeatureFlagTestMixin, TapirFactoryTestBase
@@ -113,3 +120,61 @@ class TestCreateShiftsForGroup(FeatureFlagTestMixin, TapirFactoryTestBase):
         )
         self.assertFalse(shift.cancelled)
         self.assertIsNone(shift.cancelled_reason)
+
+    def test_createShiftsForGroup_default_createsSlotsAndAttendancesFromTemplates(
+        self,
+    ):
+        group_a = ShiftTemplateGroup.objects.create(name="A")
+        shift_template = ShiftTemplateFactory.create(group=group_a, nb_slots=3)
+        slot_template_registered, slot_template_exempted, slot_template_empty = (
+            shift_template.slot_templates.order_by("id")
+        )
+        registered_user = TapirUserFactory.create()
+        ShiftAttendanceTemplate.objects.create(
+            user=registered_user, slot_template=slot_template_registered
+        )
+        exempted_user = TapirUserFactory.create()
+        ShiftAttendanceTemplate.objects.create(
+            user=exempted_user, slot_template=slot_template_exempted
+        )
+        ShiftExemption.objects.create(
+            shift_user_data=exempted_user.shift_user_data,
+            start_date=datetime.date(2025, 11, 1),
+            end_date=datetime.date(2025, 12, 1),
+            description="Lorem ipsum",
+        )
+
+        ShiftGenerator.create_shifts_for_group(
+            at_date=datetime.date(2025, 11, 10),
+            group=group_a,
+        )
+
+        shift = Shift.objects.get()
+        self.assertEqual(
+            {
+                slot_template_registered.id,
+                slot_template_exempted.id,
+                slot_template_empty.id,
+            },
+            set(shift.slots.values_list("slot_template_id", flat=True)),
+        )
+        attendance = ShiftAttendance.objects.get()
+        self.assertEqual(registered_user, attendance.user)
+        self.assertEqual(slot_template_registered, attendance.slot.slot_template)
+        self.assertEqual(ShiftAttendance.State.PENDING, attendance.state)
+
+    def test_createShiftsForGroup_shiftAlreadyExists_returnsExistingShift(self):
+        group_a = ShiftTemplateGroup.objects.create(name="A")
+        shift_template = ShiftTemplateFactory.create(group=group_a, nb_slots=2)
+        existing_shift = shift_template.create_shift_if_necessary(
+            start_date=datetime.date(2025, 11, 10)
+        )
+
+        shifts = ShiftGenerator.create_shifts_for_group(
+            at_date=datetime.date(2025, 11, 10),
+            group=group_a,
+        )
+
+        self.assertEqual([existing_shift], shifts)
+        self.assertEqual(1, shift_template.generated_shifts.count())
+        self.assertEqual(2, existing_shift.slots.count())
@@ -133,6 +133,38 @@ class TestShiftCycleService(TapirFactoryTestBase):
             "The user joined the coop after the cycle started, they should not have lost a point.",
         )
 
+    def test_applyCycleStart_severalUsers_onlyWorkingUsersLosePoints(self):
+        working_user = self.get_user_that_joined_before_first_cycle()
+        investing_user = TapirUserFactory.create(
+            share_owner__is_investing=True,
+            date_joined=date_to_datetime(self.FIRST_CYCLE_START_DATE)
+            - datetime.timedelta(days=7),
+        )
+
+        ShiftCycleService.apply_cycle_start(self.FIRST_CYCLE_START_DATE)
+
+        self.assertEqual(-1, working_user.shift_user_data.get_account_balance())
+        self.assertEqual(0, investing_user.shift_user_data.get_account_balance())
+        self.assertEqual(
+            2,
+            ShiftCycleEntry.objects.filter(
+                cycle_start_date=self.FIRST_CYCLE_START_DATE
+            ).count(),
+        )
+        self.assertIsNone(
+            ShiftCycleEntry.objects.get(
+                shift_user_data=investing_user.shift_user_data
+            ).shift_account_entry
+        )
+
+    def test_applyCycleStart_cycleAlreadyApplied_doesASingleQuery(self):
+        self.get_user_that_joined_before_first_cycle()
+        self.get_user_that_joined_before_first_cycle()
+        ShiftCycleService.apply_cycle_start(self.FIRST_CYCLE_START_DATE)
+
+        with self.assertNumQueries(1):
+            ShiftCycleService.apply_cycle_start(self.FIRST_CYCLE_START_DATE)
+
     def get_user_that_joined_before_first_cycle(self) -> TapirUser:
         return TapirUserFactory.create(
             share_owner__is_investing=False,
@@ -0,0 +1,89 @@
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tapir.accounts.models import TapirUser
+from tapir.shifts.models import ShiftAccountEntry
+from tapir.shifts.services.freeze_check_batch_service import FreezeCheckBatchService
+from tapir.utils.tests_utils import (
+    TapirFactoryTestBase,
+    create_member_that_is_working,
+    mock_timezone_now,
+)
+
+
+class TestFreezeCheckBatchService(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2020, month=1, day=30, hour=16, minute=37)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+
+    def create_member_with_balance(
+        self, balance: int, days_since_last_entry: int
+    ) -> TapirUser:
+        tapir_user = create_member_that_is_working(
+            self, self.NOW - datetime.timedelta(days=365)
+        )
+        ShiftAccountEntry.objects.create(
+            user=tapir_user,
+            value=balance,
+            date=self.NOW - datetime.timedelta(days=days_since_last_entry),
+        )
+        return tapir_user
+
+    def get_action_by_user(self):
+        return {
+            data.shift_user_data.user: FreezeCheckBatchService.get_action(
+                data, self.NOW.date()
+            )
+            for data in FreezeCheckBatchService.get_freeze_check_data(self.NOW)
+        }
+
+    def test_getAction_memberBelowThresholdSinceLongEnough_returnsFreeze(self):
+        tapir_user = self.create_member_with_balance(-5, days_since_last_entry=20)
+
+        self.assertEqual(
+            FreezeCheckBatchService.ACTION_FREEZE,
+            self.get_action_by_user()[tapir_user],
+        )
+
+    def test_getAction_memberBelowThresholdSinceRecently_returnsSendFreezeWarning(
+        self,
+    ):
+        tapir_user = self.create_member_with_balance(-5, days_since_last_entry=2)
+
+        self.assertEqual(
+            FreezeCheckBatchService.ACTION_SEND_FREEZE_WARNING,
+            self.get_action_by_user()[tapir_user],
+        )
+
+    def test_getAction_frozenMemberWithPositiveBalance_returnsUnfreeze(self):
+        tapir_user = self.create_member_with_balance(1, days_since_last_entry=20)
+        tapir_user.shift_user_data.is_frozen = True
+        tapir_user.shift_user_data.save()
+
+        self.assertEqual(
+            FreezeCheckBatchService.ACTION_UNFREEZE,
+            self.get_action_by_user()[tapir_user],
+        )
+
+    def test_getAction_memberWithOkBalance_returnsNone(self):
+        tapir_user = self.create_member_with_balance(-1, days_since_last_entry=20)
+
+        self.assertIsNone(self.get_action_by_user()[tapir_user])
+
+    def test_getFreezeCheckData_manyMembers_numberOfQueriesDoesntDependOnMembers(
+        self,
+    ):
+        self.create_member_with_balance(-5, days_since_last_entry=20)
+        with CaptureQueriesContext(connection) as context:
+            FreezeCheckBatchService.get_freeze_check_data(self.NOW)
+        nb_queries = len(context.captured_queries)
+
+        for _ in range(3):
+            self.create_member_with_balance(-5, days_since_last_entry=20)
+
+        with self.assertNumQueries(nb_queries):
+            FreezeCheckBatchService.get_freeze_check_data(self.NOW)
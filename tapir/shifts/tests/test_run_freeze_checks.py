@@ -1,9 +1,9 @@
-from unittest import mock
 from unittest.mock import Mock, patch
 
 from django.core.management import call_command
 
 from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.shifts.services.freeze_check_batch_service import FreezeCheckBatchService
 from tapir.shifts.services.frozen_status_management_service import (
     FrozenStatusManagementService,
 )
@@ -16,7 +16,11 @@ class TestRunFreezeChecks(TapirFactoryTestBase):
         self.mock_get_flag_value = patcher.start()
         self.addCleanup(patcher.stop)
 
-    @patch.object(FrozenStatusManagementService, "should_freeze_member")
+    @staticmethod
+    def get_checked_shift_user_datas(mock_check: Mock):
+        return [call.args[0].shift_user_data for call in mock_check.call_args_list]
+
+    @patch.object(FreezeCheckBatchService, "should_freeze_member")
     def test_should_freeze_member_gets_called_once_per_member(
         self, mock_should_freeze_member: Mock
     ):
@@ -24,23 +28,20 @@ class TestRunFreezeChecks(TapirFactoryTestBase):
         tapir_user_2 = TapirUserFactory.create()
         call_command("run_freeze_checks")
         self.assertEqual(2, mock_should_freeze_member.call_count)
-        mock_should_freeze_member.assert_has_calls(
-            [
-                mock.call(tapir_user_1.shift_user_data),
-                mock.call(tapir_user_2.shift_user_data),
-            ],
-            any_order=True,
+        self.assertCountEqual(
+            [tapir_user_1.shift_user_data, tapir_user_2.shift_user_data],
+            self.get_checked_shift_user_datas(mock_should_freeze_member),
         )
 
     @patch.object(FrozenStatusManagementService, "freeze_member_and_send_email")
-    @patch.object(FrozenStatusManagementService, "should_freeze_member")
+    @patch.object(FreezeCheckBatchService, "should_freeze_member")
     def test_member_that_should_be_frozen_gets_frozen(
         self, mock_should_freeze_member, mock_freeze_member_and_send_email
     ):
         _ = TapirUserFactory.create()
         tapir_user_2 = TapirUserFactory.create()
         mock_should_freeze_member.side_effect = (
-            lambda shift_user_data: shift_user_data == tapir_user_2.shift_user_data
+            lambda data, today: data.shift_user_data == tapir_user_2.shift_user_data
         )
         call_command("run_freeze_checks")
         self.assertEqual(1, mock_freeze_member_and_send_email.call_count)
@@ -48,24 +49,24 @@ class TestRunFreezeChecks(TapirFactoryTestBase):
             tapir_user_2.shift_user_data, actor=None
         )
 
-    @patch.object(FrozenStatusManagementService, "should_freeze_member")
-    @patch.object(FrozenStatusManagementService, "should_send_freeze_warning")
+    @patch.object(FreezeCheckBatchService, "should_freeze_member")
+    @patch.object(FreezeCheckBatchService, "should_send_freeze_warning")
     def test_only_relevant_members_get_checked_for_freeze_warning(
         self, mock_should_send_freeze_warning, mock_should_freeze_member
     ):
         tapir_user_1 = TapirUserFactory.create()
         tapir_user_2 = TapirUserFactory.create()
         mock_should_freeze_member.side_effect = (
-            lambda shift_user_data: shift_user_data == tapir_user_1.shift_user_data
+            lambda data, today: data.shift_user_data == tapir_user_1.shift_user_data
         )
         call_command("run_freeze_checks")
-        self.assertEqual(1, mock_should_send_freeze_warning.call_count)
-        mock_should_send_freeze_warning.assert_called_once_with(
-            tapir_user_2.shift_user_data
+        self.assertEqual(
+            [tapir_user_2.shift_user_data],
+            self.get_checked_shift_user_datas(mock_should_send_freeze_warning),
         )
 
-    @patch.object(FrozenStatusManagementService, "should_freeze_member")
-    @patch.object(FrozenStatusManagementService, "should_send_freeze_warning")
+    @patch.object(FreezeCheckBatchService, "should_freeze_member")
+    @patch.object(FreezeCheckBatchService, "should_send_freeze_warning")
     @patch.object(FrozenStatusManagementService, "send_freeze_warning_email")
     def test_member_that_should_receive_freeze_warning_receives_freeze_warning(
         self,
@@ -77,7 +78,7 @@ class TestRunFreezeChecks(TapirFactoryTestBase):
         _ = TapirUserFactory.create()
         mock_should_freeze_member.return_value = False
         mock_should_send_freeze_warning.side_effect = (
-            lambda shift_user_data: shift_user_data == tapir_user_1.shift_user_data
+            lambda data, today: data.shift_user_data == tapir_user_1.shift_user_data
         )
         call_command("run_freeze_checks")
         self.assertEqual(1, mock_send_freeze_warning_email.call_count)
@@ -85,8 +86,8 @@ class TestRunFreezeChecks(TapirFactoryTestBase):
             tapir_user_1.shift_user_data
         )
 
-    @patch.object(FrozenStatusManagementService, "should_freeze_member")
-    @patch.object(FrozenStatusManagementService, "should_send_freeze_warning")
+    @patch.object(FreezeCheckBatchService, "should_freeze_member")
+    @patch.object(FreezeCheckBatchService, "should_send_freeze_warning")
     @patch.object(FrozenStatusManagementService, "send_freeze_warning_email")
     def test_member_that_should_get_frozen_does_not_get_warning(
         self,
@@ -100,9 +101,9 @@ class TestRunFreezeChecks(TapirFactoryTestBase):
         mock_should_send_freeze_warning.assert_not_called()
         mock_send_freeze_warning_email.assert_not_called()
 
-    @patch.object(FrozenStatusManagementService, "should_freeze_member")
-    @patch.object(FrozenStatusManagementService, "should_send_freeze_warning")
-    @patch.object(FrozenStatusManagementService, "should_unfreeze_member")
+    @patch.object(FreezeCheckBatchService, "should_freeze_member")
+    @patch.object(FreezeCheckBatchService, "should_send_freeze_warning")
+    @patch.object(FreezeCheckBatchService, "should_unfreeze_member")
     def test_only_relevant_members_get_checked_for_unfreeze(
         self,
         mock_should_unfreeze_member,
@@ -113,20 +114,20 @@ class TestRunFreezeChecks(TapirFactoryTestBase):
         tapir_user_2 = TapirUserFactory.create()
         tapir_user_3 = TapirUserFactory.create()
         mock_should_freeze_member.side_effect = (
-            lambda shift_user_data: shift_user_data == tapir_user_1.shift_user_data
+            lambda data, today: data.shift_user_data == tapir_user_1.shift_user_data
         )
         mock_should_send_freeze_warning.side_effect = (
-            lambda shift_user_data: shift_user_data == tapir_user_2.shift_user_data
+            lambda data, today: data.shift_user_data == tapir_user_2.shift_user_data
         )
         call_command("run_freeze_checks")
-        self.assertEqual(1, mock_should_unfreeze_member.call_count)
-        mock_should_unfreeze_member.assert_called_once_with(
-            tapir_user_3.shift_user_data
+        self.assertEqual(
+            [tapir_user_3.shift_user_data],
+            self.get_checked_shift_user_datas(mock_should_unfreeze_member),
         )
 
-    @patch.object(FrozenStatusManagementService, "should_freeze_member")
-    @patch.object(FrozenStatusManagementService, "should_send_freeze_warning")
-    @patch.object(FrozenStatusManagementService, "should_unfreeze_member")
+    @patch.object(FreezeCheckBatchService, "should_freeze_member")
+    @patch.object(FreezeCheckBatchService, "should_send_freeze_warning")
+    @patch.object(FreezeCheckBatchService, "should_unfreeze_member")
     @patch.object(FrozenStatusManagementService, "unfreeze_and_send_notification_email")
     def test_member_who_should_get_unfrozen_gets_unfrozen(
         self,
@@ -140,7 +141,7 @@ class TestRunFreezeChecks(TapirFactoryTestBase):
         mock_should_freeze_member.return_value = False
         mock_should_send_freeze_warning.return_value = False
         mock_should_unfreeze_member.side_effect = (
-            lambda shift_user_data: shift_user_data == tapir_user_2.shift_user_data
+            lambda data: data.shift_user_data == tapir_user_2.shift_user_data
         )
         call_command("run_freeze_checks")
         self.assertEqual(1, mock_unfreeze_and_send_notification_email.call_count)
@@ -0,0 +1,112 @@
+from django.core.management import call_command
+from django.utils import timezone
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.shifts.models import ShiftAccountEntry, ShiftUserData
+from tapir.shifts.services.shift_account_balance_service import (
+    ShiftAccountBalanceService,
+)
+from tapir.utils.tests_utils import TapirFactoryTestBase
+
+
+class TestShiftAccountBalance(TapirFactoryTestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tapir_user = TapirUserFactory.create()
+
+    def create_entry(self, value: int, user=None):
+        return ShiftAccountEntry.objects.create(
+            user=user or self.tapir_user, value=value, date=timezone.now()
+        )
+
+    def get_stored_balance(self, user=None):
+        return ShiftUserData.objects.get(user=user or self.tapir_user).account_balance
+
+    def test_save_newEntries_balanceIsUpdated(self):
+        self.create_entry(-1)
+        self.create_entry(3)
+
+        self.assertEqual(2, self.get_stored_balance())
+
+    def test_save_valueOfExistingEntryChanged_balanceIsUpdated(self):
+        entry = self.create_entry(-1)
+        self.create_entry(-1)
+
+        entry.value = 1
+        entry.save()
+
+        self.assertEqual(0, self.get_stored_balance())
+
+    def test_save_userOfExistingEntryChanged_bothBalancesAreUpdated(self):
+        other_user = TapirUserFactory.create()
+        entry = self.create_entry(2)
+
+        entry.user = other_user
+        entry.save()
+
+        self.assertEqual(0, self.get_stored_balance())
+        self.assertEqual(2, self.get_stored_balance(other_user))
+
+    def test_delete_default_balanceIsUpdated(self):
+        entry = self.create_entry(-1)
+        self.create_entry(-1)
+
+        entry.delete()
+
+        self.assertEqual(-1, self.get_stored_balance())
+
+    def test_bulkCreate_entriesOfSeveralUsers_allBalancesAreUpdated(self):
+        other_user = TapirUserFactory.create()
+
+        ShiftAccountEntry.objects.bulk_create(
+            [
+                ShiftAccountEntry(user=self.tapir_user, value=-1, date=timezone.now()),
+                ShiftAccountEntry(user=self.tapir_user, value=-1, date=timezone.now()),
+                ShiftAccountEntry(user=other_user, value=1, date=timezone.now()),
+            ]
+        )
+
+        self.assertEqual(-2, self.get_stored_balance())
+        self.assertEqual(1, self.get_stored_balance(other_user))
+
+    def test_querysetDelete_default_balanceIsUpdated(self):
+        self.create_entry(-1)
+        self.create_entry(-2)
+        self.create_entry(5)
+
+        ShiftAccountEntry.objects.filter(value__lt=0).delete()
+
+        self.assertEqual(5, self.get_stored_balance())
+
+    def test_shiftUserDataSave_staleInstance_doesntOverwriteBalance(self):
+        shift_user_data = ShiftUserData.objects.get(user=self.tapir_user)
+        self.create_entry(-3)
+
+        shift_user_data.is_frozen = True
+        shift_user_data.save()
+
+        self.assertEqual(-3, self.get_stored_balance())
+        self.assertTrue(ShiftUserData.objects.get(user=self.tapir_user).is_frozen)
+
+    def test_getAccountBalance_staleInstance_returnsCurrentBalance(self):
+        shift_user_data = ShiftUserData.objects.get(user=self.tapir_user)
+        self.create_entry(-3)
+
+        self.assertEqual(-3, shift_user_data.get_account_balance())
+
+    def test_reconcileBalances_balanceDrifted_repairsBalance(self):
+        self.create_entry(-1)
+        ShiftAccountEntry.objects.update(value=4)
+
+        drifted = ShiftAccountBalanceService.reconcile_balances()
+
+        self.assertEqual([self.tapir_user.shift_user_data.id], [s.id for s in drifted])
+        self.assertEqual(4, self.get_stored_balance())
+
+    def test_reconcileShiftAccountBalancesCommand_checkOnly_doesntRepair(self):
+        self.create_entry(-1)
+        ShiftAccountEntry.objects.update(value=4)
+
+        call_command("reconcile_shift_account_balances", check_only=True)
+
+        self.assertEqual(-1, self.get_stored_balance())
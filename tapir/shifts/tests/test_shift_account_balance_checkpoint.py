@@ -0,0 +1,129 @@
+import datetime
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.shifts.models import ShiftAccountBalanceCheckpoint, ShiftAccountEntry
+from tapir.shifts.services.shift_account_balance_service import (
+    ShiftAccountBalanceService,
+)
+from tapir.utils.shortcuts import get_timezone_aware_datetime
+from tapir.utils.tests_utils import TapirFactoryTestBase
+
+
+class TestShiftAccountBalanceCheckpoint(TapirFactoryTestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tapir_user = TapirUserFactory.create()
+
+    @staticmethod
+    def get_datetime(day: int):
+        return get_timezone_aware_datetime(
+            datetime.date(2024, 3, day), datetime.time(hour=10)
+        )
+
+    def create_entry(self, value: int, day: int):
+        return ShiftAccountEntry.objects.create(
+            user=self.tapir_user, value=value, date=self.get_datetime(day)
+        )
+
+    def get_checkpoint_balance(self, day: int):
+        return ShiftAccountBalanceCheckpoint.objects.get(
+            user=self.tapir_user, date=self.get_datetime(day)
+        ).balance
+
+    def test_createCheckpoints_noPreviousCheckpoint_sumsAllEntries(self):
+        self.create_entry(-1, day=1)
+        self.create_entry(3, day=2)
+        self.create_entry(5, day=10)
+
+        ShiftAccountBalanceService.create_checkpoints(self.get_datetime(5))
+
+        self.assertEqual(2, self.get_checkpoint_balance(5))
+
+    def test_createCheckpoints_previousCheckpointExists_addsEntriesSinceThen(self):
+        self.create_entry(-1, day=1)
+        ShiftAccountBalanceService.create_checkpoints(self.get_datetime(5))
+        self.create_entry(2, day=7)
+        ShiftAccountBalanceCheckpoint.objects.filter(user=self.tapir_user).update(
+            balance=10
+        )
+
+        ShiftAccountBalanceService.create_checkpoints(self.get_datetime(10))
+
+        self.assertEqual(
+            12,
+            self.get_checkpoint_balance(10),
+            "The entries before the previous checkpoint should not be summed again",
+        )
+
+    def test_save_entryBeforeExistingCheckpoint_checkpointIsUpdated(self):
+        self.create_entry(-1, day=1)
+        ShiftAccountBalanceService.create_checkpoints(self.get_datetime(5))
+
+        entry = self.create_entry(3, day=2)
+        self.assertEqual(2, self.get_checkpoint_balance(5))
+
+        entry.delete()
+        self.assertEqual(-1, self.get_checkpoint_balance(5))
+
+    def test_applyBalanceChanges_severalChangesForSameUserAndDate_allChangesAreApplied(
+        self,
+    ):
+        self.create_entry(-1, day=1)
+        ShiftAccountBalanceService.create_checkpoints(self.get_datetime(5))
+
+        ShiftAccountEntry.apply_balance_changes(
+            [
+                (self.tapir_user.id, self.get_datetime(2), 1),
+                (self.tapir_user.id, self.get_datetime(2), 1),
+                (self.tapir_user.id, self.get_datetime(3), -3),
+            ]
+        )
+
+        self.assertEqual(-2, self.get_checkpoint_balance(5))
+        self.tapir_user.shift_user_data.refresh_from_db()
+        self.assertEqual(-2, self.tapir_user.shift_user_data.account_balance)
+
+    def test_getAccountBalance_withCheckpoints_sameResultAsSumOfEntries(self):
+        self.create_entry(-1, day=1)
+        self.create_entry(3, day=3)
+        ShiftAccountBalanceService.create_checkpoints(self.get_datetime(2))
+        self.create_entry(-2, day=6)
+        ShiftAccountBalanceService.create_checkpoints(self.get_datetime(7))
+        self.create_entry(4, day=8)
+
+        shift_user_data = self.tapir_user.shift_user_data
+        for day in range(1, 10):
+            at_datetime = self.get_datetime(day)
+            expected = sum(
+                ShiftAccountEntry.objects.filter(
+                    user=self.tapir_user, date__lte=at_datetime
+                ).values_list("value", flat=True)
+            )
+            self.assertEqual(
+                expected, shift_user_data.get_account_balance(at_datetime), day
+            )
+
+    def test_getBalanceAtDatetime_notIncluding_ignoresEntriesAtThatDate(self):
+        self.create_entry(-1, day=1)
+        self.create_entry(3, day=2)
+        ShiftAccountBalanceService.create_checkpoints(self.get_datetime(2))
+
+        self.assertEqual(
+            -1,
+            ShiftAccountBalanceCheckpoint.get_balance_at_datetime(
+                self.tapir_user.id, self.get_datetime(2), including=False
+            ),
+        )
+
+    def test_withBalanceAtDate_default_annotatesRunningBalance(self):
+        self.create_entry(-1, day=1)
+        self.create_entry(3, day=2)
+        self.create_entry(-1, day=3)
+
+        entries = (
+            ShiftAccountEntry.objects.filter(user=self.tapir_user)
+            .with_balance_at_date(initial_balance=5)
+            .order_by("date")
+        )
+
+        self.assertEqual([4, 7, 6], [entry.balance_at_date for entry in entries])
@@ -76,3 +76,29 @@ class TestShiftReminder(TapirFactoryTestBase, TapirEmailTestMixin):
         )
         attendance.refresh_from_db()
         self.assertTrue(attendance.reminder_email_sent)
+
+    def test_handle_several_members_with_upcoming_shifts_each_get_a_reminder(self):
+        users_with_shift = TapirUserFactory.create_batch(3)
+        TapirUserFactory.create_batch(2)
+        shift: Shift = ShiftFactory.create(
+            start_time=timezone.now() + datetime.timedelta(days=2), nb_slots=3
+        )
+        for user, slot in zip(users_with_shift, shift.slots.all()):
+            ShiftAttendance.objects.create(user=user, slot=slot)
+
+        Command().handle()
+
+        self.assertEqual(3, len(mail.outbox))
+        self.assertEqual(
+            {user.email for user in users_with_shift},
+            {sent_mail.to[0] for sent_mail in mail.outbox},
+        )
+        self.assertFalse(
+            ShiftAttendance.objects.filter(reminder_email_sent=False).exists()
+        )
+
+        Command().handle()
+
+        self.assertEqual(
+            3, len(mail.outbox), "Reminders should only be sent once per attendance."
+        )
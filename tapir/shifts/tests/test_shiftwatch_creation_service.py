@@ -6,6 +6,7 @@ from tapir.accounts.tests.factories.factories import TapirUserFactory
 from tapir.shifts.models import (
     RecurringShiftWatch,
     Shift,
+    ShiftAttendance,
     ShiftWatch,
     StaffingStatusChoices,
 )
@@ -149,3 +150,34 @@ class TestShiftWatchCreationEdgeCases(TapirFactoryTestBase):
 
         self.assertEqual(shift_watch_1.recurring_template, recurring_template)
         self.assertEqual(shift_watch_3.recurring_template, recurring_template_2)
+
+    def test_getStaffingForShifts_severalShifts_returnsStaffingOfEachShift(self):
+        other_shift = ShiftFactory.create(nb_slots=4)
+        slots = list(other_shift.slots.all())
+        ShiftAttendance.objects.create(user=TapirUserFactory.create(), slot=slots[0])
+        ShiftAttendance.objects.create(
+            user=TapirUserFactory.create(),
+            slot=slots[1],
+            state=ShiftAttendance.State.CANCELLED,
+        )
+        ShiftAttendance.objects.create(user=TapirUserFactory.create(), slot=slots[2])
+
+        with self.assertNumQueries(1):
+            staffing_by_shift_id = ShiftWatchCreator.get_staffing_for_shifts(
+                [self.base_shift.id, other_shift.id]
+            )
+
+        self.assertEqual(
+            {self.base_shift.id, other_shift.id}, set(staffing_by_shift_id.keys())
+        )
+        base_shift_staffing = staffing_by_shift_id[self.base_shift.id]
+        self.assertEqual(1, base_shift_staffing.number_of_available_slots)
+        self.assertEqual(0, base_shift_staffing.valid_attendances)
+        self.assertEqual([], base_shift_staffing.valid_slot_ids)
+        other_shift_staffing = staffing_by_shift_id[other_shift.id]
+        self.assertEqual(4, other_shift_staffing.number_of_available_slots)
+        self.assertEqual(2, other_shift_staffing.valid_attendances)
+        self.assertEqual(2, other_shift_staffing.required_attendances)
+        self.assertEqual(
+            {slots[0].id, slots[2].id}, set(other_shift_staffing.valid_slot_ids)
+        )
@@ -7,6 +7,7 @@ from tapir.accounts.tests.factories.factories import TapirUserFactory
 from tapir.shifts.emails.shift_watch_mail import ShiftWatchEmailBuilder
 from tapir.shifts.management.commands.send_shift_watch_mail import Command
 from tapir.shifts.models import (
+    DirtyShiftMarker,
     RecurringShiftWatch,
     ShiftAttendance,
     ShiftSlot,
@@ -297,3 +298,45 @@ class ShiftWatchCommandTests(TapirFactoryTestBase, TapirEmailTestMixin):
         self.unregister_slot(slot=slot_to_unregister)
         Command().handle()
         self.assertEqual(0, len(mail.outbox))
+
+    def test_handle_noShiftChanged_onlyChecksForChangedShifts(self):
+        create_shift_watch(
+            user=self.user,
+            shift=self.shift_ok_first,
+            last_valid_slot_ids=self.slots,
+            staffing_status=[StaffingStatusChoices.UNDERSTAFFED],
+        )
+        Command().handle()
+        self.assertFalse(DirtyShiftMarker.objects.exists())
+
+        with self.assertNumQueries(1):
+            Command().handle()
+
+    def test_handle_attendanceChanged_shiftGetsMarkedAsDirty(self):
+        Command().handle()
+
+        self.unregister_slot()
+
+        self.assertEqual(
+            {self.shift_ok_first.id},
+            set(DirtyShiftMarker.objects.values_list("shift_id", flat=True)),
+        )
+
+    def test_handle_severalWatchersOnTheSameShift_allGetNotified(self):
+        other_user = TapirUserFactory.create()
+        for user in [self.user, other_user]:
+            create_shift_watch(
+                user=user,
+                shift=self.shift_ok_first,
+                last_valid_slot_ids=self.slots,
+                staffing_status=[StaffingStatusChoices.UNDERSTAFFED],
+            )
+        Command().handle()
+
+        self.unregister_slot()
+        Command().handle()
+
+        self.assertEqual(
+            {self.USER_EMAIL_ADDRESS, other_user.email},
+            {sent_mail.to[0] for sent_mail in mail.outbox},
+        )
@@ -5,7 +5,7 @@ from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.management import call_command
 from django.db import transaction
-from django.db.models import Count, Q, Sum
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404, redirect
 from django.template.defaulttags import register
 from django.urls import reverse, reverse_lazy
@@ -174,11 +174,11 @@ class UserShiftAccountLog(LoginRequiredMixin, PermissionRequiredMixin, TemplateV
         context["entries_data"] = [
             {
                 "entry": entry,
-                "balance_at_date": user.shift_user_data.get_account_balance(
-                    at_date=entry.date
-                ),
+                "balance_at_date": entry.balance_at_date,
             }
-            for entry in ShiftAccountEntry.objects.filter(user=user).order_by("-date")
+            for entry in ShiftAccountEntry.objects.filter(user=user)
+            .with_balance_at_date()
+            .order_by("-date")
         ]
         return context
 
@@ -378,7 +378,6 @@ class MembersOnAlertView(
             super()
             .get_queryset()
             .prefetch_related("user")
-            .annotate(account_balance=Sum("user__shift_account_entries__value"))
             .filter(account_balance__lt=-1)
             .order_by("user__date_joined")
         )
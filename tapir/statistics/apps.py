@@ -23,6 +23,19 @@ class StatsConfig(AppConfig):
 
         self.register_data_providers()
 
+        from tapir.statistics.services.fancy_graph_cache_service import (
+            FancyGraphCacheService,
+        )
+
+        FancyGraphCacheService.register_receivers()
+
+        from tapir.core.services.base_report import BaseReport
+        from tapir.statistics.services.dataset_export_report import (
+            DatasetExportReport,
+        )
+
+        BaseReport.register_report(DatasetExportReport)
+
     @classmethod
     def register_data_providers(cls):
         from tapir.statistics.services.data_providers.data_provider_abcd_members import (
@@ -0,0 +1,20 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from tapir.statistics.services.data_providers.base_data_provider import (
+    data_providers,
+)
+from tapir.statistics.services.fancy_graph_cache_service import (
+    FancyGraphCacheService,
+)
+
+
+class Command(BaseCommand):
+    help = "Computes yesterday's value of every dataset of the fancy graph and stores it in the cache."
+
+    def handle(self, *args, **options):
+        yesterday = timezone.now().date() - datetime.timedelta(days=1)
+        for data_provider in data_providers.values():
+            FancyGraphCacheService.get_values(data_provider, [yesterday])
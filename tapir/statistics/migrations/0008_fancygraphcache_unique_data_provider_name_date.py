@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:08
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def delete_duplicated_values(apps, schema_editor):
+    # Concurrent requests could cache the same date twice. It's only a cache: the values get computed again.
+    FancyGraphCache = apps.get_model("statistics", "FancyGraphCache")
+    duplicates = (
+        FancyGraphCache.objects.values("data_provider_name", "date")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        FancyGraphCache.objects.filter(
+            data_provider_name=duplicate["data_provider_name"], date=duplicate["date"]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "statistics",
+            "0007_rename_data_provider_name_name_fancygraphcache_data_provider_name",
+        ),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicated_values, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="fancygraphcache",
+            constraint=models.UniqueConstraint(
+                fields=("data_provider_name", "date"),
+                name="fancy_graph_cache_unique_data_provider_name_date",
+            ),
+        ),
+    ]
@@ -33,6 +33,14 @@ class PurchaseBasket(models.Model):
 
 
 class FancyGraphCache(models.Model):
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["data_provider_name", "date"],
+                name="fancy_graph_cache_unique_data_provider_name_date",
+            )
+        ]
+
     data_provider_name = models.CharField(max_length=500)
     date = models.DateField()
     value = models.IntegerField()
@@ -59,3 +59,8 @@ class DatapointExportSerializer(serializers.Serializer):
 
 class ColumnSerializer(serializers.Serializer):
     column_name = serializers.CharField()
+
+
+class DatasetGraphSeriesPointSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    value = serializers.IntegerField()
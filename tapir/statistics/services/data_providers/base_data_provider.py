@@ -3,9 +3,18 @@ from __future__ import annotations
 import datetime
 from abc import ABC, abstractmethod
 
+from django.db import models
 from django.db.models import QuerySet
 
-from tapir.coop.models import ShareOwner
+from tapir.accounts.models import TapirUser
+from tapir.coop.models import (
+    MembershipPause,
+    MembershipResignation,
+    ShareOwner,
+    ShareOwnership,
+)
+from tapir.shifts.models import ShiftExemption
+from tapir.utils.shortcuts import ensure_datetime
 
 data_providers: dict[str, type[BaseDataProvider]] = {}
 
@@ -32,6 +41,44 @@ class BaseDataProvider(ABC):
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         cls.raise_not_implemented()
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        """Models whose changes affect the results of this provider in the past, with the date fields that tell
+        from which date on. Saving or deleting one of those models invalidates the cached values of this provider
+        from the earliest changed date on, see FancyGraphCacheService.
+        An empty list of fields means that creating or deleting an instance affects all dates.
+        For the models in FancyGraphCacheService.MODELS_WHERE_ONLY_THE_WATCHED_FIELDS_MATTER,
+        only creating, deleting or changing one of the fields invalidates the cache.
+        """
+        return {}
+
+    @staticmethod
+    def get_member_status_dependencies() -> dict[type[models.Model], list[str]]:
+        # Resignations update the end date of the shares without saving them individually,
+        # the new end dates are always after the cancellation date.
+        return {
+            ShareOwnership: ["start_date", "end_date"],
+            MembershipPause: ["start_date", "end_date"],
+            MembershipResignation: ["cancellation_date"],
+        }
+
+    @classmethod
+    def get_working_status_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return {
+            **cls.get_member_status_dependencies(),
+            ShiftExemption: ["start_date", "end_date"],
+            TapirUser: ["date_joined"],
+        }
+
+    @classmethod
+    def get_counts(cls, dates: list[datetime.date]) -> dict[datetime.date, int]:
+        # Evaluates get_queryset once per date.
+        # Children should override this if they can compute several dates with a few set-based queries.
+        return {
+            date: cls.get_queryset(ensure_datetime(date)).distinct().count()
+            for date in dates
+        }
+
     @staticmethod
     def register_data_provider(data_provider: type[BaseDataProvider]):
         data_providers[data_provider.__name__] = data_provider
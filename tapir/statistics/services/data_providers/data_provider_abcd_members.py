@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import Q, QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -23,6 +24,10 @@ class DataProviderAbcdMembers(BaseDataProvider):
             "Only members who work are counted: members that are exempted, paused, frozen... are not counted"
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_working_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         working_members = (
@@ -1,9 +1,13 @@
 import datetime
 
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
 from tapir.coop.models import MemberStatus, ShareOwner
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
 from tapir.statistics.services.data_providers.base_data_provider import BaseDataProvider
 
 
@@ -18,7 +22,17 @@ class DataProviderActiveMembers(BaseDataProvider):
             "Active in the sense of their membership: paused and investing members are not active, but frozen members are active"
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_member_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         reference_date = reference_time.date()
         return ShareOwner.objects.with_status(MemberStatus.ACTIVE, reference_date)
+
+    @classmethod
+    def get_counts(cls, dates: list[datetime.date]) -> dict[datetime.date, int]:
+        return MemberStatusSnapshotService.count_members_by_date(
+            [MemberStatus.ACTIVE], dates
+        )
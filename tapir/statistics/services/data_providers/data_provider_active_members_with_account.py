@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -19,6 +20,13 @@ class DataProviderActiveMembersWithAccount(BaseDataProvider):
             "Same as active members, but also had an account at the given date. Some members declare themselves active when joining the coop but never come to activate their account."
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return {
+            **cls.get_member_status_dependencies(),
+            TapirUser: ["date_joined"],
+        }
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         reference_date = reference_time.date()
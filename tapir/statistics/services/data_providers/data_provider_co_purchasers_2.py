@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import Q, QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -23,6 +24,10 @@ class DataProviderCoPurchasers2(BaseDataProvider):
             "Only members who can shop are counted: members that have a second co-purchaser but are not allowed to shop are not counted"
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_member_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         share_owners_that_can_shop = MemberCanShopService.annotate_share_owner_queryset_with_shopping_status_at_datetime(
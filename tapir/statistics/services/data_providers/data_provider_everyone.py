@@ -1,3 +1,6 @@
+import datetime
+
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -14,6 +17,15 @@ class DataProviderEveryone(BaseDataProvider):
     def get_description(cls):
         return _("Every past, present or future members. Anyone that is in the system.")
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return {ShareOwner: []}
+
     @classmethod
     def get_queryset(cls, _) -> QuerySet[ShareOwner]:
         return ShareOwner.objects.all()
+
+    @classmethod
+    def get_counts(cls, dates: list[datetime.date]) -> dict[datetime.date, int]:
+        count = ShareOwner.objects.count()
+        return {date: count for date in dates}
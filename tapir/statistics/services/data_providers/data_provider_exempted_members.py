@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import Q, QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -22,6 +23,10 @@ class DataProviderExemptedMembers(BaseDataProvider):
             "Counting only members that would work if they were not exempted: frozen and investing members with an exemption are not counted."
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_working_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         reference_date = reference_time.date()
@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import Q, QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -19,6 +20,13 @@ class DataProviderExemptedMembersThatWork(BaseDataProvider):
             "Counting all exempted members (ignoring if they are frozen or investing) that actually did a shift in the past 60 days. Just registering to the shift doesn't count, the attendance must be confirmed."
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return {
+            ShiftExemption: ["start_date", "end_date"],
+            ShiftAttendance: ["slot__shift__start_time"],
+        }
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         reference_date = reference_time.date()
@@ -1,13 +1,20 @@
 import datetime
 
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
 from tapir.coop.models import MemberStatus, ShareOwner
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
+from tapir.log.services.attribute_history_service import AttributeHistoryService
+from tapir.shifts.models import ShiftUserData
 from tapir.shifts.services.frozen_status_history_service import (
     FrozenStatusHistoryService,
 )
 from tapir.statistics.services.data_providers.base_data_provider import BaseDataProvider
+from tapir.utils.shortcuts import ensure_datetime
 
 
 class DataProviderFrozenMembers(BaseDataProvider):
@@ -21,6 +28,10 @@ class DataProviderFrozenMembers(BaseDataProvider):
             "Counted out of 'active' members: paused and investing members not counted."
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_member_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         share_owners = ShareOwner.objects.with_status(
@@ -34,3 +45,46 @@ class DataProviderFrozenMembers(BaseDataProvider):
         return share_owners.filter(
             **{FrozenStatusHistoryService.ANNOTATION_IS_FROZEN_AT_DATE: True}
         )
+
+    @classmethod
+    def get_counts(cls, dates: list[datetime.date]) -> dict[datetime.date, int]:
+        active_member_ids_by_date = MemberStatusSnapshotService.get_member_ids_by_date(
+            [MemberStatus.ACTIVE], dates
+        )
+        reference_times = {
+            date: ensure_datetime(date) for date in active_member_ids_by_date.keys()
+        }
+        frozen_values_by_time = AttributeHistoryService.get_values_at_datetimes(
+            ShiftUserData, "is_frozen", list(reference_times.values())
+        )
+        shift_user_data_by_share_owner_id = {}
+        for (
+            share_owner_id,
+            shift_user_data_id,
+            is_frozen,
+        ) in ShiftUserData.objects.filter(user__share_owner__isnull=False).values_list(
+            "user__share_owner__id", "id", "is_frozen"
+        ):
+            shift_user_data_by_share_owner_id[share_owner_id] = (
+                shift_user_data_id,
+                is_frozen,
+            )
+
+        counts = {}
+        for date, active_member_ids in active_member_ids_by_date.items():
+            frozen_values = frozen_values_by_time[reference_times[date]]
+            counts[date] = 0
+            for share_owner_id in active_member_ids:
+                if share_owner_id not in shift_user_data_by_share_owner_id.keys():
+                    continue
+                shift_user_data_id, is_frozen = shift_user_data_by_share_owner_id[
+                    share_owner_id
+                ]
+                # Same as FrozenStatusHistoryService: unexpected values fall back to the current value
+                frozen_value = frozen_values.get(shift_user_data_id)
+                if frozen_value in ["True", "False"]:
+                    is_frozen = frozen_value == "True"
+                if is_frozen:
+                    counts[date] += 1
+
+        return counts
@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -22,6 +23,10 @@ class DataProviderFrozenMembersLongTerm(BaseDataProvider):
             'Members that are frozen since more than 180 days (roughly 6 month). Long-term frozen members are included in the "Frozen members" dataset'
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_member_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         share_owners_frozen = DataProviderFrozenMembers.get_queryset(reference_time)
@@ -1,9 +1,10 @@
 import datetime
 
+from django.db import models
 from django.db.models import F, QuerySet
 from django.utils.translation import gettext_lazy as _
 
-from tapir.coop.models import ShareOwner
+from tapir.coop.models import IncomingPayment, ShareOwner, ShareOwnership
 from tapir.coop.services.payment_status_service import PaymentStatusService
 from tapir.statistics.services.data_providers.base_data_provider import BaseDataProvider
 
@@ -19,6 +20,13 @@ class DataProviderPaymentsPaidTooMuch(BaseDataProvider):
             "Members that have paid more than expected relative to their number of shares"
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return {
+            IncomingPayment: ["payment_date"],
+            ShareOwnership: ["start_date", "end_date"],
+        }
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         queryset = PaymentStatusService.annotate_with_payments_at_date(
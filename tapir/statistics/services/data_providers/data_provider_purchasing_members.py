@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -19,6 +20,10 @@ class DataProviderPurchasingMembers(BaseDataProvider):
             'Members who are allowed to shop. To be allowed to shop, a member must be active (see the description for "Active members"), have a Tapir account, and not be frozen.'
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_member_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         share_owners = MemberCanShopService.annotate_share_owner_queryset_with_shopping_status_at_datetime(
@@ -1,6 +1,8 @@
 import datetime
 
-from django.db.models import QuerySet
+from django.db import models
+from django.db.models import Count, QuerySet
+from django.db.models.functions import TruncMonth
 from django.utils.translation import gettext_lazy as _
 
 from tapir.coop.models import MembershipResignation, ShareOwner
@@ -20,6 +22,10 @@ class DataProviderResignationsCreated(BaseDataProvider):
             "this is relative to when the resignation is created."
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return {MembershipResignation: ["cancellation_date"]}
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         reference_date = reference_time.date()
@@ -31,3 +37,19 @@ class DataProviderResignationsCreated(BaseDataProvider):
         return ShareOwner.objects.filter(
             id__in=resignations.values_list("share_owner__id", flat=True)
         )
+
+    @classmethod
+    def get_counts(cls, dates: list[datetime.date]) -> dict[datetime.date, int]:
+        if not dates:
+            return {}
+
+        counts_by_month = dict(
+            MembershipResignation.objects.filter(
+                cancellation_date__gte=min(dates).replace(day=1)
+            )
+            .annotate(month=TruncMonth("cancellation_date"))
+            .values("month")
+            .annotate(count=Count("share_owner", distinct=True))
+            .values_list("month", "count")
+        )
+        return {date: counts_by_month.get(date.replace(day=1), 0) for date in dates}
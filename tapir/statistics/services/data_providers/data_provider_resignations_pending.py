@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -18,6 +19,10 @@ class DataProviderResignationsPending(BaseDataProvider):
             "Members who want to get their money back and are waiting for the 3 year term"
         )
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return {MembershipResignation: ["cancellation_date", "pay_out_day"]}
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         reference_date = reference_time.date()
@@ -1,9 +1,13 @@
 import datetime
 
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
 from tapir.coop.models import MemberStatus, ShareOwner
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
 from tapir.statistics.services.data_providers.base_data_provider import BaseDataProvider
 
 
@@ -16,6 +20,10 @@ class DataProviderTotalMembers(BaseDataProvider):
     def get_description(cls):
         return _("Ignoring status: investing and paused members are included")
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_member_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         reference_date = reference_time.date()
@@ -31,3 +39,14 @@ class DataProviderTotalMembers(BaseDataProvider):
                 .values_list("id", flat=True)
             )
         return ShareOwner.objects.filter(id__in=share_owner_ids)
+
+    @classmethod
+    def get_counts(cls, dates: list[datetime.date]) -> dict[datetime.date, int]:
+        return MemberStatusSnapshotService.count_members_by_date(
+            [
+                MemberStatus.ACTIVE,
+                MemberStatus.PAUSED,
+                MemberStatus.INVESTING,
+            ],
+            dates,
+        )
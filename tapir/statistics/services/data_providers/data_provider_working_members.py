@@ -1,5 +1,6 @@
 import datetime
 
+from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
@@ -18,6 +19,10 @@ class DataProviderWorkingMembers(BaseDataProvider):
     def get_description(cls):
         return ""
 
+    @classmethod
+    def get_dependencies(cls) -> dict[type[models.Model], list[str]]:
+        return cls.get_working_status_dependencies()
+
     @classmethod
     def get_queryset(cls, reference_time: datetime.datetime) -> QuerySet[ShareOwner]:
         queryset = ShiftExpectationService.annotate_shift_user_data_queryset_with_working_status_at_datetime(
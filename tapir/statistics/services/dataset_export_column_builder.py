@@ -2,8 +2,11 @@ import datetime
 import math
 from decimal import Decimal
 
+from django.db.models import OuterRef, Prefetch, QuerySet, Subquery, Value
+
 from tapir.coop.config import COOP_ENTRY_AMOUNT, COOP_SHARE_PRICE
 from tapir.coop.models import ShareOwner
+from tapir.coop.services.investing_status_service import InvestingStatusService
 from tapir.coop.services.member_can_shop_service import MemberCanShopService
 from tapir.coop.services.membership_pause_service import MembershipPauseService
 from tapir.coop.services.number_of_shares_service import NumberOfSharesService
@@ -15,12 +18,202 @@ from tapir.shifts.services.frozen_status_history_service import (
 from tapir.shifts.services.shift_attendance_mode_service import (
     ShiftAttendanceModeService,
 )
-from tapir.shifts.services.shift_exemption_service import ShiftExemptionService
 from tapir.shifts.services.shift_expectation_service import ShiftExpectationService
 from tapir.utils.user_utils import UserUtils
 
 
 class DatasetExportColumnBuilder:
+    # Columns declare what they need through requirements, see get_column_requirements.
+    # prepare_queryset applies them once to the whole queryset instead of one query per member and column.
+    REQUIREMENT_USER = "user"
+    REQUIREMENT_SHARE_OWNERSHIPS = "share_ownerships"
+    REQUIREMENT_NUMBER_OF_SHARES = "number_of_shares"
+    REQUIREMENT_PAUSE = "pause"
+    REQUIREMENT_MEMBER_STATUS = "member_status"
+    REQUIREMENT_PAYMENTS = "payments"
+    REQUIREMENT_FROZEN = "frozen"
+    REQUIREMENT_FROZEN_SINCE = "frozen_since"
+    REQUIREMENT_SHIFT_USER_DATA = "shift_user_data"
+    REQUIREMENT_SHIFT_USER_DATA_WORKING_STATUS = "shift_user_data_working_status"
+    REQUIREMENT_SHIFT_USER_DATA_ATTENDANCE_MODE = "shift_user_data_attendance_mode"
+
+    ANNOTATION_FROZEN_SINCE = "frozen_since"
+    ANNOTATION_FROZEN_SINCE_DATE_CHECK = "frozen_since_date_check"
+
+    @classmethod
+    def get_column_requirements(cls) -> dict[str, list[str]]:
+        """Columns that are not listed don't need anything more than the ShareOwner itself."""
+        user = [cls.REQUIREMENT_USER]
+        working_status = [
+            cls.REQUIREMENT_USER,
+            cls.REQUIREMENT_MEMBER_STATUS,
+            cls.REQUIREMENT_SHIFT_USER_DATA,
+            cls.REQUIREMENT_SHIFT_USER_DATA_WORKING_STATUS,
+        ]
+        shares_and_payments = [
+            cls.REQUIREMENT_NUMBER_OF_SHARES,
+            cls.REQUIREMENT_PAYMENTS,
+        ]
+        return {
+            "display_name": user,
+            "first_name": user,
+            "last_name": user,
+            "usage_name": user,
+            "pronouns": user,
+            "email": user,
+            "phone_number": user,
+            "birthdate": user,
+            "street": user,
+            "street_2": user,
+            "postcode": user,
+            "city": user,
+            "country": user,
+            "preferred_language": user,
+            "co_purchaser": user,
+            "allows_purchase_tracking": user,
+            "legal_name": user,
+            "full_address": user,
+            "shift_capabilities": [
+                cls.REQUIREMENT_USER,
+                cls.REQUIREMENT_SHIFT_USER_DATA,
+            ],
+            "shift_partner": [cls.REQUIREMENT_USER, cls.REQUIREMENT_SHIFT_USER_DATA],
+            "shift_status": working_status
+            + [cls.REQUIREMENT_SHIFT_USER_DATA_ATTENDANCE_MODE],
+            "is_working": working_status,
+            "is_exempted": [
+                cls.REQUIREMENT_USER,
+                cls.REQUIREMENT_SHIFT_USER_DATA,
+                cls.REQUIREMENT_SHIFT_USER_DATA_WORKING_STATUS,
+            ],
+            "is_paused": [cls.REQUIREMENT_PAUSE],
+            "can_shop": [
+                cls.REQUIREMENT_USER,
+                cls.REQUIREMENT_MEMBER_STATUS,
+                cls.REQUIREMENT_FROZEN,
+            ],
+            "currently_paid": [cls.REQUIREMENT_PAYMENTS],
+            "expected_payment": [cls.REQUIREMENT_PAYMENTS],
+            "payment_difference": [cls.REQUIREMENT_PAYMENTS],
+            "frozen_since": [
+                cls.REQUIREMENT_USER,
+                cls.REQUIREMENT_FROZEN,
+                cls.REQUIREMENT_FROZEN_SINCE,
+            ],
+            "member_status": [cls.REQUIREMENT_MEMBER_STATUS],
+            "is_member_since": [cls.REQUIREMENT_SHARE_OWNERSHIPS],
+            "compulsory_share": [cls.REQUIREMENT_NUMBER_OF_SHARES],
+            "additional_shares": [cls.REQUIREMENT_NUMBER_OF_SHARES],
+            "amount_paid_for_entry_fee": shares_and_payments,
+            "amount_paid_for_shares": shares_and_payments,
+            "number_of_paid_shares": shares_and_payments,
+            "number_of_unpaid_shares": shares_and_payments,
+        }
+
+    @classmethod
+    def prepare_queryset(
+        cls,
+        queryset: QuerySet[ShareOwner],
+        export_columns: list[str],
+        reference_time: datetime.datetime,
+    ) -> QuerySet[ShareOwner]:
+        requirements = set()
+        for column_name in export_columns:
+            requirements.update(cls.get_column_requirements().get(column_name, []))
+
+        if cls.REQUIREMENT_MEMBER_STATUS in requirements:
+            requirements.update(
+                [cls.REQUIREMENT_NUMBER_OF_SHARES, cls.REQUIREMENT_PAUSE]
+            )
+
+        reference_date = reference_time.date()
+        # The count and sum annotations build subqueries from the given queryset: apply them first
+        # so that the subqueries don't contain the other annotations
+        if cls.REQUIREMENT_NUMBER_OF_SHARES in requirements:
+            queryset = NumberOfSharesService.annotate_share_owner_queryset_with_nb_of_active_shares(
+                queryset, reference_date
+            )
+        if cls.REQUIREMENT_PAUSE in requirements:
+            queryset = MembershipPauseService.annotate_share_owner_queryset_with_has_active_pause(
+                queryset, reference_date
+            )
+        if cls.REQUIREMENT_PAYMENTS in requirements:
+            queryset = PaymentStatusService.annotate_with_payments_at_date(
+                queryset, reference_date
+            )
+        if cls.REQUIREMENT_MEMBER_STATUS in requirements:
+            queryset = InvestingStatusService.annotate_share_owner_queryset_with_investing_status_at_datetime(
+                queryset, reference_time
+            )
+        if cls.REQUIREMENT_FROZEN in requirements:
+            queryset = FrozenStatusHistoryService.annotate_share_owner_queryset_with_is_frozen_at_datetime(
+                queryset, reference_time
+            )
+        if cls.REQUIREMENT_FROZEN_SINCE in requirements:
+            queryset = cls.annotate_share_owner_queryset_with_frozen_since(
+                queryset, reference_time
+            )
+        if cls.REQUIREMENT_SHARE_OWNERSHIPS in requirements:
+            queryset = queryset.prefetch_related("share_ownerships")
+        if cls.REQUIREMENT_USER in requirements:
+            queryset = queryset.select_related("user")
+        if cls.REQUIREMENT_SHIFT_USER_DATA in requirements:
+            # Not select_related: the annotations are on the ShiftUserData objects
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "user__shift_user_data",
+                    queryset=cls.build_shift_user_data_queryset(
+                        requirements, reference_time
+                    ),
+                )
+            )
+
+        return queryset
+
+    @classmethod
+    def build_shift_user_data_queryset(
+        cls, requirements: set[str], reference_time: datetime.datetime
+    ) -> QuerySet[ShiftUserData]:
+        queryset = ShiftUserData.objects.select_related("shift_partner__user")
+        if cls.REQUIREMENT_SHIFT_USER_DATA_WORKING_STATUS in requirements:
+            queryset = FrozenStatusHistoryService.annotate_shift_user_data_queryset_with_is_frozen_at_datetime(
+                queryset, reference_time
+            ).prefetch_related(
+                "shift_exemptions"
+            )
+        if cls.REQUIREMENT_SHIFT_USER_DATA_ATTENDANCE_MODE in requirements:
+            queryset = ShiftAttendanceModeService.annotate_shift_user_data_queryset_with_attendance_mode_at_datetime(
+                queryset, reference_time
+            )
+        return queryset
+
+    @classmethod
+    def annotate_share_owner_queryset_with_frozen_since(
+        cls, queryset: QuerySet[ShareOwner], reference_time: datetime.datetime
+    ) -> QuerySet[ShareOwner]:
+        return queryset.annotate(
+            **{
+                cls.ANNOTATION_FROZEN_SINCE: Subquery(
+                    UpdateShiftUserDataLogEntry.objects.filter(
+                        user_id=OuterRef("user_id"),
+                        created_date__lte=reference_time,
+                        new_values__has_key="is_frozen",
+                    )
+                    .order_by("-created_date")
+                    .values("created_date")[:1]
+                ),
+                cls.ANNOTATION_FROZEN_SINCE_DATE_CHECK: Value(reference_time),
+            }
+        )
+
+    @staticmethod
+    def build_column(
+        share_owner: ShareOwner, column_name: str, reference_time: datetime.datetime
+    ):
+        return getattr(DatasetExportColumnBuilder, f"build_column_{column_name}")(
+            share_owner=share_owner, reference_time=reference_time
+        )
+
     @staticmethod
     def build_column_member_number(share_owner: ShareOwner, **_):
         return share_owner.id
@@ -169,19 +362,17 @@ class DatasetExportColumnBuilder:
         if not tapir_user:
             return False
 
-        queryset = ShiftExemptionService.annotate_shift_user_data_queryset_with_has_exemption_at_date(
-            ShiftUserData.objects.filter(id=share_owner.user.shift_user_data.id),
-            reference_time,
-        )
-        return getattr(
-            queryset.first(), ShiftExemptionService.ANNOTATION_HAS_EXEMPTION_AT_DATE
+        return share_owner.user.shift_user_data.is_currently_exempted_from_shifts(
+            reference_time.date()
         )
 
     @staticmethod
     def build_column_is_paused(
         share_owner: ShareOwner, reference_time: datetime.datetime
     ):
-        return MembershipPauseService.has_active_pause(share_owner, reference_time)
+        return MembershipPauseService.has_active_pause(
+            share_owner, reference_time.date()
+        )
 
     @staticmethod
     def build_column_can_shop(
@@ -198,24 +389,45 @@ class DatasetExportColumnBuilder:
         )
 
     @staticmethod
-    def build_column_expected_payment(
+    def get_share_owner_annotated_with_payments(
         share_owner: ShareOwner, reference_time: datetime.datetime
     ):
-        annotated_share_owner = PaymentStatusService.annotate_with_payments_at_date(
+        if hasattr(
+            share_owner, PaymentStatusService.ANNOTATION_EXPECTED_PAYMENTS_SUM_AT_DATE
+        ):
+            annotated_date = getattr(
+                share_owner, PaymentStatusService.ANNOTATION_PAYMENT_DATE_CHECK
+            )
+            if annotated_date != reference_time.date():
+                raise ValueError(
+                    f"Trying to get the payments at date {reference_time.date()}, but the queryset has been "
+                    f"annotated relative to {annotated_date}"
+                )
+            return share_owner
+
+        return PaymentStatusService.annotate_with_payments_at_date(
             ShareOwner.objects.filter(id=share_owner.id), reference_time.date()
         ).get()
+
+    @classmethod
+    def build_column_expected_payment(
+        cls, share_owner: ShareOwner, reference_time: datetime.datetime
+    ):
+        annotated_share_owner = cls.get_share_owner_annotated_with_payments(
+            share_owner, reference_time
+        )
         return getattr(
             annotated_share_owner,
             PaymentStatusService.ANNOTATION_EXPECTED_PAYMENTS_SUM_AT_DATE,
         )
 
-    @staticmethod
+    @classmethod
     def build_column_payment_difference(
-        share_owner: ShareOwner, reference_time: datetime.datetime
+        cls, share_owner: ShareOwner, reference_time: datetime.datetime
     ):
-        annotated_share_owner = PaymentStatusService.annotate_with_payments_at_date(
-            ShareOwner.objects.filter(id=share_owner.id), reference_time.date()
-        ).get()
+        annotated_share_owner = cls.get_share_owner_annotated_with_payments(
+            share_owner, reference_time
+        )
         return Decimal(
             getattr(
                 annotated_share_owner,
@@ -226,37 +438,50 @@ class DatasetExportColumnBuilder:
             PaymentStatusService.ANNOTATION_EXPECTED_PAYMENTS_SUM_AT_DATE,
         )
 
-    @staticmethod
+    @classmethod
     def build_column_frozen_since(
-        share_owner: ShareOwner, reference_time: datetime.datetime
+        cls, share_owner: ShareOwner, reference_time: datetime.datetime
     ):
         tapir_user = getattr(share_owner, "user", None)
         if not tapir_user:
             return None
 
-        share_owner = FrozenStatusHistoryService.annotate_share_owner_queryset_with_is_frozen_at_datetime(
-            ShareOwner.objects.filter(id=share_owner.id), reference_time
-        ).first()
-        is_frozen = getattr(
-            share_owner, FrozenStatusHistoryService.ANNOTATION_IS_FROZEN_AT_DATE
-        )
-        if not is_frozen:
+        member_object = share_owner
+        if not hasattr(
+            member_object, FrozenStatusHistoryService.ANNOTATION_IS_FROZEN_AT_DATE
+        ):
+            member_object = tapir_user.shift_user_data
+        if not FrozenStatusHistoryService.is_frozen_at_datetime(
+            member_object, reference_time
+        ):
             return None
 
-        log_entry = (
-            UpdateShiftUserDataLogEntry.objects.filter(
-                user_id=tapir_user.id,
-                created_date__lte=reference_time,
-                new_values__has_key="is_frozen",
+        if hasattr(share_owner, cls.ANNOTATION_FROZEN_SINCE):
+            annotated_date = getattr(
+                share_owner, cls.ANNOTATION_FROZEN_SINCE_DATE_CHECK
+            )
+            if annotated_date != reference_time:
+                raise ValueError(
+                    f"Trying to get the frozen since date at date {reference_time}, but the queryset has been "
+                    f"annotated relative to {annotated_date}"
+                )
+            frozen_since = getattr(share_owner, cls.ANNOTATION_FROZEN_SINCE)
+        else:
+            frozen_since = (
+                UpdateShiftUserDataLogEntry.objects.filter(
+                    user_id=tapir_user.id,
+                    created_date__lte=reference_time,
+                    new_values__has_key="is_frozen",
+                )
+                .order_by("-created_date")
+                .values_list("created_date", flat=True)
+                .first()
             )
-            .order_by("-created_date")
-            .first()
-        )
 
-        if not log_entry:
+        if not frozen_since:
             return None
 
-        return log_entry.created_date.date()
+        return frozen_since.date()
 
     @staticmethod
     def build_column_member_status(
@@ -268,13 +493,16 @@ class DatasetExportColumnBuilder:
     def build_column_is_member_since(
         share_owner: ShareOwner, reference_time: datetime.datetime
     ):
-        shares_that_exist_at_date = share_owner.share_ownerships.filter(
-            start_date__lte=reference_time.date()
-        )
-        if not shares_that_exist_at_date.exists():
+        # Filtering in python to use the prefetched shares if available
+        start_dates = [
+            share_ownership.start_date
+            for share_ownership in share_owner.share_ownerships.all()
+            if share_ownership.start_date <= reference_time.date()
+        ]
+        if not start_dates:
             return None
 
-        return shares_that_exist_at_date.order_by("start_date").first().start_date
+        return min(start_dates)
 
     @staticmethod
     def build_column_legal_name(share_owner: ShareOwner, **_):
@@ -0,0 +1,83 @@
+import datetime
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from tapir.coop.models import ShareOwner
+from tapir.core.services.base_report import BaseReport
+from tapir.statistics.services.data_providers.base_data_provider import data_providers
+from tapir.statistics.services.dataset_export_column_builder import (
+    DatasetExportColumnBuilder,
+)
+
+
+class DatasetExportReport(BaseReport):
+    """Same as DatasetExportView, for exports that are too big to be done during a request."""
+
+    PARAMETER_AT_DATE = "at_date"
+    PARAMETER_DATASET = "dataset"
+    PARAMETER_EXPORT_COLUMNS = "export_columns"
+
+    @classmethod
+    def get_report_type(cls) -> str:
+        return "dataset_export"
+
+    @classmethod
+    def get_file_name(cls, parameters: dict) -> str:
+        return f"{parameters[cls.PARAMETER_DATASET]}_{parameters[cls.PARAMETER_AT_DATE]}.csv"
+
+    @classmethod
+    def validate_parameters(cls, parameters: dict):
+        try:
+            cls.get_reference_time(parameters)
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"Invalid date: {parameters.get(cls.PARAMETER_AT_DATE)}")
+
+        if parameters.get(cls.PARAMETER_DATASET) not in data_providers.keys():
+            raise ValueError(
+                f"Unknown dataset: {parameters.get(cls.PARAMETER_DATASET)}"
+            )
+
+        export_columns = parameters.get(cls.PARAMETER_EXPORT_COLUMNS)
+        if not isinstance(export_columns, list) or not export_columns:
+            raise ValueError("At least one export column is required")
+        for column_name in export_columns:
+            if not hasattr(DatasetExportColumnBuilder, f"build_column_{column_name}"):
+                raise ValueError(f"Unknown export column: {column_name}")
+
+    @classmethod
+    def get_reference_time(cls, parameters: dict) -> datetime.datetime:
+        return timezone.make_aware(
+            datetime.datetime.strptime(parameters[cls.PARAMETER_AT_DATE], "%Y-%m-%d")
+        )
+
+    @classmethod
+    def get_queryset(cls, parameters: dict) -> QuerySet[ShareOwner]:
+        return (
+            data_providers[parameters[cls.PARAMETER_DATASET]]
+            .get_queryset(cls.get_reference_time(parameters))
+            .order_by("id")
+        )
+
+    @classmethod
+    def get_header(cls, parameters: dict) -> list[str]:
+        return parameters[cls.PARAMETER_EXPORT_COLUMNS]
+
+    @classmethod
+    def get_row_count(cls, parameters: dict) -> int | None:
+        return cls.get_queryset(parameters).count()
+
+    @classmethod
+    def generate_rows(cls, parameters: dict):
+        reference_time = cls.get_reference_time(parameters)
+        export_columns = parameters[cls.PARAMETER_EXPORT_COLUMNS]
+        queryset = DatasetExportColumnBuilder.prepare_queryset(
+            cls.get_queryset(parameters), export_columns, reference_time
+        )
+        for share_owner in queryset.iterator(chunk_size=500):
+            yield [
+                DatasetExportColumnBuilder.build_column(
+                    share_owner, column_name, reference_time
+                )
+                for column_name in export_columns
+            ]
@@ -0,0 +1,249 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections, models
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from tapir.accounts.models import TapirUser
+from tapir.statistics.models import FancyGraphCache
+from tapir.statistics.services.data_providers.base_data_provider import (
+    BaseDataProvider,
+    data_providers,
+)
+
+
+class FancyGraphCacheService:
+    DATES_PER_CHUNK = 12
+    MAX_WORKERS = 4
+    # Those models are saved often for reasons that don't affect any graph, for example TapirUser.last_login
+    # or the profile sync from the LDAP: saving them only invalidates the cache if a watched field changed.
+    MODELS_WHERE_ONLY_THE_WATCHED_FIELDS_MATTER = {TapirUser}
+
+    @staticmethod
+    def get_data_provider_name(data_provider: type[BaseDataProvider]) -> str:
+        return f"{data_provider.__module__}.{data_provider.__name__}"
+
+    @classmethod
+    def get_values(
+        cls, data_provider: type[BaseDataProvider], dates: list[datetime.date]
+    ) -> dict[datetime.date, int]:
+        data_provider_name = cls.get_data_provider_name(data_provider)
+        # Only use the cache for dates in the past:
+        # someone may make changes and check the results on the graph on the same day.
+        today = timezone.now().date()
+        cacheable_dates = {date for date in dates if date < today}
+
+        values = dict(
+            FancyGraphCache.objects.filter(
+                data_provider_name=data_provider_name, date__in=cacheable_dates
+            ).values_list("date", "value")
+        )
+
+        missing_dates = sorted(set(dates) - values.keys())
+        computed_values = cls.compute_values(data_provider, missing_dates)
+        values.update(computed_values)
+
+        # Another request may have computed the same values in the meantime
+        FancyGraphCache.objects.bulk_create(
+            [
+                FancyGraphCache(
+                    data_provider_name=data_provider_name, date=date, value=value
+                )
+                for date, value in computed_values.items()
+                if date in cacheable_dates
+            ],
+            ignore_conflicts=True,
+        )
+
+        return values
+
+    @classmethod
+    def compute_values(
+        cls, data_provider: type[BaseDataProvider], dates: list[datetime.date]
+    ) -> dict[datetime.date, int]:
+        chunks = [
+            dates[index : index + cls.DATES_PER_CHUNK]
+            for index in range(0, len(dates), cls.DATES_PER_CHUNK)
+        ]
+        if len(chunks) <= 1:
+            return data_provider.get_counts(dates)
+
+        values = {}
+        with ThreadPoolExecutor(max_workers=cls.MAX_WORKERS) as executor:
+            for chunk_values in executor.map(
+                lambda chunk: cls.compute_values_in_thread(data_provider, chunk),
+                chunks,
+            ):
+                values.update(chunk_values)
+        return values
+
+    @staticmethod
+    def compute_values_in_thread(
+        data_provider: type[BaseDataProvider], dates: list[datetime.date]
+    ) -> dict[datetime.date, int]:
+        try:
+            return data_provider.get_counts(dates)
+        finally:
+            # Each thread opens its own database connection, Django doesn't close them automatically outside of requests
+            connections.close_all()
+
+    @staticmethod
+    def get_dependent_data_providers(
+        model: type[models.Model],
+    ) -> dict[type[BaseDataProvider], list[str]]:
+        return {
+            data_provider: data_provider.get_dependencies()[model]
+            for data_provider in data_providers.values()
+            if model in data_provider.get_dependencies().keys()
+        }
+
+    @classmethod
+    def get_watched_fields(cls, model: type[models.Model]) -> set[str]:
+        return {
+            field
+            for fields in cls.get_dependent_data_providers(model).values()
+            for field in fields
+        }
+
+    @classmethod
+    def register_receivers(cls):
+        watched_models = {
+            model
+            for data_provider in data_providers.values()
+            for model in data_provider.get_dependencies().keys()
+        }
+        for model in watched_models:
+            pre_save.connect(
+                cls.on_dependency_pre_save,
+                sender=model,
+                dispatch_uid=f"fancy_graph_cache_{model.__name__}_pre_save",
+            )
+            post_save.connect(
+                cls.on_dependency_post_save,
+                sender=model,
+                dispatch_uid=f"fancy_graph_cache_{model.__name__}_post_save",
+            )
+            post_delete.connect(
+                cls.on_dependency_post_delete,
+                sender=model,
+                dispatch_uid=f"fancy_graph_cache_{model.__name__}_post_delete",
+            )
+
+    @classmethod
+    def on_dependency_pre_save(
+        cls, sender, instance, raw=False, update_fields=None, **kwargs
+    ):
+        instance._fancy_graph_cache_previous_values = None
+        instance._fancy_graph_cache_watched_fields_changed = False
+        if raw or instance.pk is None:
+            return
+
+        watched_fields = cls.get_watched_fields(sender)
+        if not watched_fields:
+            return
+        if update_fields is not None and not watched_fields & set(update_fields):
+            # The watched fields keep the values that are already in the database, no need to read them
+            return
+
+        previous_values = (
+            sender.objects.filter(pk=instance.pk).values(*watched_fields).first()
+        )
+        instance._fancy_graph_cache_previous_values = previous_values
+        instance._fancy_graph_cache_watched_fields_changed = (
+            previous_values is not None
+            and any(
+                previous_values[field] != cls.get_field_value(instance, field)
+                for field in watched_fields
+            )
+        )
+
+    @classmethod
+    def on_dependency_post_save(cls, sender, instance, created, raw=False, **kwargs):
+        if raw:
+            return
+
+        if (
+            not created
+            and sender in cls.MODELS_WHERE_ONLY_THE_WATCHED_FIELDS_MATTER
+            and not getattr(
+                instance, "_fancy_graph_cache_watched_fields_changed", False
+            )
+        ):
+            return
+
+        previous_values = getattr(instance, "_fancy_graph_cache_previous_values", None)
+        cls.invalidate_after_change(
+            sender,
+            instance,
+            None if created else previous_values,
+            created_or_deleted=created,
+        )
+
+    @classmethod
+    def on_dependency_post_delete(cls, sender, instance, **kwargs):
+        cls.invalidate_after_change(sender, instance, None, created_or_deleted=True)
+
+    @classmethod
+    def invalidate_after_change(
+        cls,
+        model: type[models.Model],
+        instance: models.Model,
+        previous_values: dict | None,
+        created_or_deleted: bool,
+    ):
+        for data_provider, fields in cls.get_dependent_data_providers(model).items():
+            if not fields:
+                if created_or_deleted:
+                    cls.invalidate(data_provider)
+                continue
+
+            # Any change to the instance can change the counts (for example the state of an attendance
+            # or the amount of a payment), the fields only tell from which date the cache is affected.
+            affected_values = []
+            for field in fields:
+                affected_values.append(cls.get_field_value(instance, field))
+                if previous_values is not None:
+                    affected_values.append(previous_values.get(field))
+
+            affected_dates = [
+                cls.as_date(value) for value in affected_values if value is not None
+            ]
+            if affected_dates:
+                cls.invalidate(data_provider, min(affected_dates))
+
+    @classmethod
+    def invalidate(
+        cls,
+        data_provider: type[BaseDataProvider],
+        from_date: datetime.date | None = None,
+    ):
+        cached_values = FancyGraphCache.objects.filter(
+            data_provider_name=cls.get_data_provider_name(data_provider)
+        )
+        if from_date is not None:
+            cached_values = cached_values.filter(date__gte=from_date)
+        cached_values.delete()
+
+    @classmethod
+    def invalidate_for_model(cls, model: type[models.Model], from_date: datetime.date):
+        # For changes that don't send signals, like bulk_create or update
+        for data_provider in cls.get_dependent_data_providers(model).keys():
+            cls.invalidate(data_provider, from_date)
+
+    @staticmethod
+    def get_field_value(instance: models.Model, field_path: str):
+        value = instance
+        for field_name in field_path.split("__"):
+            if value is None:
+                return None
+            value = getattr(value, field_name)
+        return value
+
+    @staticmethod
+    def as_date(value: datetime.date | datetime.datetime) -> datetime.date:
+        if not isinstance(value, datetime.datetime):
+            return value
+        if timezone.is_aware(value):
+            return timezone.localtime(value).date()
+        return value.date()
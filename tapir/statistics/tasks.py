@@ -10,3 +10,8 @@ def process_purchase_files():
 @shared_task
 def process_credit_account():
     call_command("process_credit_account")
+
+
+@shared_task
+def prewarm_fancy_graph_cache():
+    call_command("prewarm_fancy_graph_cache")
@@ -3,6 +3,9 @@ import datetime
 from django.utils import timezone
 
 from tapir.coop.models import ShareOwnership
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
 from tapir.coop.tests.factories import ShareOwnerFactory
 from tapir.statistics.services.data_providers.data_provider_active_members import (
     DataProviderActiveMembers,
@@ -40,3 +43,20 @@ class TestDataProviderActiveMembers(TapirFactoryTestBase):
 
         self.assertEqual(1, queryset.count())
         self.assertIn(share_owner, queryset)
+
+    def test_getCounts_onlySomeDatesSnapshotted_sameResultAsGetQueryset(self):
+        ShareOwnerFactory.create(nb_shares=1, is_investing=False)
+        ShareOwnership.objects.update(
+            start_date=self.REFERENCE_TIME.date() - datetime.timedelta(days=1)
+        )
+        dates = [
+            self.REFERENCE_TIME.date() - datetime.timedelta(days=10),
+            self.REFERENCE_TIME.date(),
+            self.REFERENCE_TIME.date() + datetime.timedelta(days=10),
+        ]
+        MemberStatusSnapshotService.build_snapshot(dates[0])
+        MemberStatusSnapshotService.build_snapshot(dates[1])
+
+        counts = DataProviderActiveMembers.get_counts(dates)
+
+        self.assertEqual({dates[0]: 0, dates[1]: 1, dates[2]: 1}, counts)
@@ -3,7 +3,10 @@ import datetime
 from django.utils import timezone
 
 from tapir.accounts.tests.factories.factories import TapirUserFactory
-from tapir.shifts.models import ShiftUserData
+from tapir.coop.services.member_status_snapshot_service import (
+    MemberStatusSnapshotService,
+)
+from tapir.shifts.models import ShiftUserData, UpdateShiftUserDataLogEntry
 from tapir.statistics.services.data_providers.data_provider_frozen_members import (
     DataProviderFrozenMembers,
 )
@@ -53,3 +56,28 @@ class TestDataProviderFrozenMembers(TapirFactoryTestBase):
 
         self.assertEqual(1, queryset.count())
         self.assertIn(tapir_user.share_owner, queryset)
+
+    def test_getCounts_frozenStatusChangedBetweenDates_countsStatusAtEachDate(self):
+        tapir_user = TapirUserFactory.create(
+            date_joined=self.REFERENCE_TIME - datetime.timedelta(days=30),
+            share_owner__is_investing=False,
+        )
+        ShiftUserData.objects.update(is_frozen=True)
+        log_entry = UpdateShiftUserDataLogEntry.objects.create(
+            user=tapir_user,
+            old_values={"is_frozen": False},
+            new_values={"is_frozen": True},
+        )
+        log_entry.created_date = self.REFERENCE_TIME
+        log_entry.save()
+
+        dates = [
+            self.REFERENCE_TIME.date(),
+            self.REFERENCE_TIME.date() + datetime.timedelta(days=1),
+        ]
+        for date in dates:
+            MemberStatusSnapshotService.build_snapshot(date)
+
+        counts = DataProviderFrozenMembers.get_counts(dates)
+
+        self.assertEqual({dates[0]: 0, dates[1]: 1}, counts)
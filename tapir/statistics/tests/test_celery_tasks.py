@@ -2,7 +2,11 @@ from unittest.mock import Mock, patch
 
 from django.test import SimpleTestCase
 
-from tapir.statistics.tasks import process_credit_account, process_purchase_files
+from tapir.statistics.tasks import (
+    prewarm_fancy_graph_cache,
+    process_credit_account,
+    process_purchase_files,
+)
 
 
 class TestCeleryTasks(SimpleTestCase):
@@ -15,3 +19,8 @@ class TestCeleryTasks(SimpleTestCase):
     def test_processCreditAccount(self, mock_call_command: Mock):
         process_credit_account()
         mock_call_command.assert_called_once_with("process_credit_account")
+
+    @patch("tapir.statistics.tasks.call_command")
+    def test_prewarmFancyGraphCache(self, mock_call_command: Mock):
+        prewarm_fancy_graph_cache()
+        mock_call_command.assert_called_once_with("prewarm_fancy_graph_cache")
@@ -4,7 +4,7 @@ from decimal import Decimal
 from django.utils import timezone
 
 from tapir.accounts.tests.factories.factories import TapirUserFactory
-from tapir.coop.models import MembershipPause
+from tapir.coop.models import MembershipPause, ShareOwner
 from tapir.coop.tests.factories import ShareOwnerFactory
 from tapir.coop.tests.incoming_payment_factory import IncomingPaymentFactory
 from tapir.shifts.models import (
@@ -430,3 +430,38 @@ class TestDatasetExportColumnBuilder(TapirFactoryTestBase):
         )
 
         self.assertEqual(datetime.date(year=2025, month=1, day=6), result)
+
+    def test_prepareQueryset_allColumns_sameResultsAsWithoutPreparation(self):
+        frozen_user = create_member_that_is_working(self, self.REFERENCE_TIME)
+        frozen_user.shift_user_data.is_frozen = True
+        frozen_user.shift_user_data.save()
+        UpdateShiftUserDataLogEntry.objects.create(
+            user=frozen_user,
+            old_values={"is_frozen": False},
+            new_values={"is_frozen": True},
+        )
+        create_member_that_can_shop(self, self.REFERENCE_TIME)
+        ShareOwnerFactory.create(nb_shares=2)
+        export_columns = list(DatasetExportColumnBuilder.get_column_requirements())
+
+        prepared_queryset = DatasetExportColumnBuilder.prepare_queryset(
+            ShareOwner.objects.order_by("id"), export_columns, self.REFERENCE_TIME
+        )
+
+        for prepared_share_owner, share_owner in zip(
+            prepared_queryset, ShareOwner.objects.order_by("id"), strict=True
+        ):
+            for column_name in export_columns:
+                build_column = getattr(
+                    DatasetExportColumnBuilder, f"build_column_{column_name}"
+                )
+                self.assertEqual(
+                    build_column(
+                        share_owner=share_owner, reference_time=self.REFERENCE_TIME
+                    ),
+                    build_column(
+                        share_owner=prepared_share_owner,
+                        reference_time=self.REFERENCE_TIME,
+                    ),
+                    column_name,
+                )
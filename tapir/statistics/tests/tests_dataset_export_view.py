@@ -1,4 +1,5 @@
 import datetime
+import json
 
 from django.urls import reverse
 
@@ -29,3 +30,34 @@ class TestDatasetExportView(TapirFactoryTestBase):
 
         expected_result = [{"first_name": f"first_name_{i}"} for i in range(5)]
         self.assertEqual(expected_result, response.json())
+
+    def test_dataSetExportView_csvOutputFormat_streamsCsv(self):
+        self.login_as_member_office_user()
+
+        response = self.client.get(
+            reverse("statistics:export_dataset")
+            + "?at_date=2023-03-01&export_columns=first_name&export_columns=member_number"
+            + "&dataset=DummyDataProvider&output_format=csv"
+        )
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual("first_name,member_number", lines[0])
+        self.assertEqual(
+            [f"first_name_{i}" for i in range(5)],
+            [line.split(",")[0] for line in lines[1:]],
+        )
+
+    def test_dataSetExportView_ndjsonOutputFormat_streamsOneObjectPerLine(self):
+        self.login_as_member_office_user()
+
+        response = self.client.get(
+            reverse("statistics:export_dataset")
+            + "?at_date=2023-03-01&export_columns=first_name&dataset=DummyDataProvider"
+            + "&output_format=ndjson"
+        )
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [{"first_name": f"first_name_{i}"} for i in range(5)],
+            [json.loads(line) for line in lines],
+        )
@@ -0,0 +1,83 @@
+import datetime
+from unittest.mock import Mock, patch
+
+from django.test import RequestFactory
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.coop.tests.factories import ShareOwnerFactory
+from tapir.statistics.models import FancyGraphCache
+from tapir.statistics.services.data_providers.base_data_provider import BaseDataProvider
+from tapir.statistics.services.fancy_graph_cache_service import (
+    FancyGraphCacheService,
+)
+from tapir.statistics.tests.tests_dataset_graph_point_view import DummyDataProvider
+from tapir.statistics.views.dataset_graph_series_view import DatasetGraphSeriesView
+from tapir.utils.tests_utils import TapirFactoryTestBase, mock_timezone_now
+
+
+class TestDatasetGraphSeriesView(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2023, month=4, day=10, hour=12)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+        for _ in range(10):
+            ShareOwnerFactory.create()
+
+        BaseDataProvider.register_data_provider(DummyDataProvider)
+
+    def get_response(self, dates: list[str], relative: bool):
+        request_factory = RequestFactory()
+        request = request_factory.get(
+            "",
+            query_params={
+                "relative": "true" if relative else "false",
+                "dates": dates,
+                "dataset": "DummyDataProvider",
+            },
+        )
+        request.user = TapirUserFactory.create(is_in_member_office=True)
+        return DatasetGraphSeriesView.as_view()(request)
+
+    def test_viewGet_notRelative_returnsAllDatapoints(self):
+        response = self.get_response(["2023-03-01", "2023-04-01"], relative=False)
+
+        self.assertEqual(
+            [
+                {"date": "2023-03-01", "value": 5},
+                {"date": "2023-04-01", "value": 8},
+            ],
+            response.data,
+        )
+
+    def test_viewGet_relative_returnsDiffToPreviousMonth(self):
+        response = self.get_response(["2023-04-01", "2023-04-05"], relative=True)
+
+        self.assertEqual(
+            [
+                {"date": "2023-04-01", "value": 3},
+                {"date": "2023-04-05", "value": 2},
+            ],
+            response.data,
+        )
+
+    @patch.object(DummyDataProvider, "get_counts")
+    def test_viewGet_somePointsCached_onlyComputesMissingPoints(
+        self, mock_get_counts: Mock
+    ):
+        FancyGraphCache.objects.create(
+            data_provider_name=FancyGraphCacheService.get_data_provider_name(
+                DummyDataProvider
+            ),
+            date=datetime.date(year=2023, month=3, day=1),
+            value=5,
+        )
+        mock_get_counts.return_value = {datetime.date(year=2023, month=4, day=1): 8}
+
+        response = self.get_response(["2023-03-01", "2023-04-01"], relative=False)
+
+        mock_get_counts.assert_called_once_with(
+            [datetime.date(year=2023, month=4, day=1)]
+        )
+        self.assertEqual([5, 8], [point["value"] for point in response.data])
+        self.assertEqual(2, FancyGraphCache.objects.count())
@@ -0,0 +1,213 @@
+import datetime
+from unittest.mock import patch
+
+from django.contrib.auth.models import update_last_login
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.coop.models import IncomingPayment, MembershipPause, ShareOwnership
+from tapir.coop.tests.factories import ShareOwnerFactory
+from tapir.shifts.models import ShiftAttendance
+from tapir.shifts.tests.factories import ShiftFactory
+from tapir.statistics.models import FancyGraphCache
+from tapir.statistics.services.data_providers.data_provider_active_members import (
+    DataProviderActiveMembers,
+)
+from tapir.statistics.services.data_providers.data_provider_active_members_with_account import (
+    DataProviderActiveMembersWithAccount,
+)
+from tapir.statistics.services.data_providers.data_provider_exempted_members_that_work import (
+    DataProviderExemptedMembersThatWork,
+)
+from tapir.statistics.services.data_providers.data_provider_payments_not_fully_paid import (
+    DataProviderPaymentsNotFullyPaid,
+)
+from tapir.statistics.services.data_providers.data_provider_resignations_created import (
+    DataProviderResignationsCreated,
+)
+from tapir.statistics.services.fancy_graph_cache_service import (
+    FancyGraphCacheService,
+)
+from tapir.utils.tests_utils import TapirFactoryTestBase, mock_timezone_now
+
+
+class TestFancyGraphCacheService(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2023, month=6, day=15, hour=12)
+    CACHED_DATES = [
+        datetime.date(year=2023, month=month, day=1) for month in range(1, 7)
+    ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+
+    def fill_cache(self, data_provider):
+        FancyGraphCache.objects.bulk_create(
+            [
+                FancyGraphCache(
+                    data_provider_name=FancyGraphCacheService.get_data_provider_name(
+                        data_provider
+                    ),
+                    date=date,
+                    value=1,
+                )
+                for date in self.CACHED_DATES
+            ]
+        )
+
+    def get_cached_dates(self, data_provider):
+        return list(
+            FancyGraphCache.objects.filter(
+                data_provider_name=FancyGraphCacheService.get_data_provider_name(
+                    data_provider
+                )
+            )
+            .order_by("date")
+            .values_list("date", flat=True)
+        )
+
+    def test_pauseCreated_backdated_invalidatesDependentValuesFromStartDate(self):
+        share_owner = ShareOwnerFactory.create()
+        self.fill_cache(DataProviderActiveMembers)
+        self.fill_cache(DataProviderResignationsCreated)
+
+        MembershipPause.objects.create(
+            share_owner=share_owner,
+            description="Test",
+            start_date=datetime.date(year=2023, month=3, day=15),
+        )
+
+        self.assertEqual(
+            self.CACHED_DATES[:3], self.get_cached_dates(DataProviderActiveMembers)
+        )
+        self.assertEqual(
+            self.CACHED_DATES, self.get_cached_dates(DataProviderResignationsCreated)
+        )
+
+    def test_shareOwnershipUpdated_endDateMovedLater_invalidatesFromPreviousEndDate(
+        self,
+    ):
+        share_owner = ShareOwnerFactory.create(nb_shares=1)
+        share_ownership = ShareOwnership.objects.get(share_owner=share_owner)
+        share_ownership.end_date = datetime.date(year=2023, month=2, day=10)
+        share_ownership.save()
+        self.fill_cache(DataProviderActiveMembers)
+
+        share_ownership.end_date = datetime.date(year=2023, month=5, day=10)
+        share_ownership.save()
+
+        self.assertEqual(
+            self.CACHED_DATES[:2], self.get_cached_dates(DataProviderActiveMembers)
+        )
+
+    def test_shareOwnershipUpdated_noDateChanged_invalidatesFromEarliestDate(self):
+        share_owner = ShareOwnerFactory.create(nb_shares=1)
+        share_ownership = ShareOwnership.objects.get(share_owner=share_owner)
+        share_ownership.start_date = datetime.date(year=2023, month=4, day=10)
+        share_ownership.end_date = None
+        share_ownership.save()
+        self.fill_cache(DataProviderActiveMembers)
+
+        share_ownership.save()
+
+        self.assertEqual(
+            self.CACHED_DATES[:4], self.get_cached_dates(DataProviderActiveMembers)
+        )
+
+    def test_incomingPaymentUpdated_onlyAmountChanged_invalidatesFromPaymentDate(
+        self,
+    ):
+        share_owner = ShareOwnerFactory.create()
+        payment = IncomingPayment.objects.create(
+            paying_member=share_owner,
+            credited_member=share_owner,
+            amount=100,
+            payment_date=datetime.date(year=2023, month=3, day=15),
+            creation_date=datetime.date(year=2023, month=3, day=16),
+            created_by=TapirUserFactory.create(),
+        )
+        self.fill_cache(DataProviderPaymentsNotFullyPaid)
+
+        payment.amount = 50
+        payment.save()
+
+        self.assertEqual(
+            self.CACHED_DATES[:3],
+            self.get_cached_dates(DataProviderPaymentsNotFullyPaid),
+        )
+
+    def test_shiftAttendanceUpdated_onlyStateChanged_invalidatesFromShiftDate(self):
+        shift = ShiftFactory.create(
+            start_time=datetime.datetime(
+                year=2023, month=2, day=15, hour=10, tzinfo=datetime.UTC
+            )
+        )
+        attendance = ShiftAttendance.objects.create(
+            user=TapirUserFactory.create(), slot=shift.slots.first()
+        )
+        self.fill_cache(DataProviderExemptedMembersThatWork)
+
+        attendance.state = ShiftAttendance.State.DONE
+        attendance.save()
+
+        self.assertEqual(
+            self.CACHED_DATES[:2],
+            self.get_cached_dates(DataProviderExemptedMembersThatWork),
+        )
+
+    def test_tapirUserUpdated_onlyLastLoginChanged_keepsCache(self):
+        tapir_user = TapirUserFactory.create()
+        self.fill_cache(DataProviderActiveMembersWithAccount)
+
+        update_last_login(None, tapir_user)
+
+        self.assertEqual(
+            self.CACHED_DATES,
+            self.get_cached_dates(DataProviderActiveMembersWithAccount),
+        )
+
+    def test_tapirUserUpdated_noWatchedFieldChanged_keepsCache(self):
+        tapir_user = TapirUserFactory.create()
+        self.fill_cache(DataProviderActiveMembersWithAccount)
+
+        tapir_user.first_name = "Changed"
+        tapir_user.save()
+
+        self.assertEqual(
+            self.CACHED_DATES,
+            self.get_cached_dates(DataProviderActiveMembersWithAccount),
+        )
+
+    def test_tapirUserUpdated_dateJoinedChanged_invalidatesFromEarliestDate(self):
+        tapir_user = TapirUserFactory.create(
+            date_joined=datetime.datetime(
+                year=2023, month=5, day=15, hour=10, tzinfo=datetime.UTC
+            )
+        )
+        self.fill_cache(DataProviderActiveMembersWithAccount)
+
+        tapir_user.date_joined = datetime.datetime(
+            year=2023, month=2, day=15, hour=10, tzinfo=datetime.UTC
+        )
+        tapir_user.save()
+
+        self.assertEqual(
+            self.CACHED_DATES[:2],
+            self.get_cached_dates(DataProviderActiveMembersWithAccount),
+        )
+
+    @patch.object(FancyGraphCacheService, "DATES_PER_CHUNK", 2)
+    def test_getValues_severalChunks_mergesTheValuesOfAllChunks(self):
+        dates = [datetime.date(year=2023, month=month, day=1) for month in range(1, 8)]
+
+        with patch.object(
+            DataProviderActiveMembers,
+            "get_counts",
+            side_effect=lambda chunk: {date: date.month for date in chunk},
+        ) as mock_get_counts:
+            values = FancyGraphCacheService.get_values(DataProviderActiveMembers, dates)
+
+        self.assertEqual({date: date.month for date in dates}, values)
+        self.assertEqual(4, mock_get_counts.call_count)
+        self.assertEqual(
+            self.CACHED_DATES, self.get_cached_dates(DataProviderActiveMembers)
+        )
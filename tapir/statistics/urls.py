@@ -8,6 +8,7 @@ from tapir.statistics.views.available_columns_view import AvailableColumnsView
 from tapir.statistics.views.available_datasets_view import AvailableDatasetsView
 from tapir.statistics.views.dataset_export_view import DatasetExportView
 from tapir.statistics.views.dataset_graph_point_view import DatasetGraphPointView
+from tapir.statistics.views.dataset_graph_series_view import DatasetGraphSeriesView
 from tapir.statistics.views.fancy_export_view import FancyExportView
 from tapir.statistics.views.fancy_graph_view import FancyGraphView
 
@@ -83,6 +84,11 @@ urlpatterns = [
         DatasetGraphPointView.as_view(),
         name="graph_point",
     ),
+    path(
+        "graph_series",
+        DatasetGraphSeriesView.as_view(),
+        name="graph_series",
+    ),
     path(
         "available_colourblindness_types",
         AvailableColourblindnessTypes.as_view(),
@@ -1,6 +1,10 @@
+import csv
 import datetime
+import json
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
@@ -14,10 +18,23 @@ from tapir.statistics.services.data_providers.base_data_provider import data_pro
 from tapir.statistics.services.dataset_export_column_builder import (
     DatasetExportColumnBuilder,
 )
+from tapir.utils.shortcuts import set_header_for_file_download
+
+
+class Echo:
+    """Used as file by csv.writer: returns the written line instead of storing it"""
+
+    @staticmethod
+    def write(value):
+        return value
 
 
 class DatasetExportView(LoginRequiredMixin, PermissionRequiredMixin, APIView):
     permission_required = PERMISSION_COOP_MANAGE
+    OUTPUT_FORMAT_JSON = "json"
+    OUTPUT_FORMAT_CSV = "csv"
+    OUTPUT_FORMAT_NDJSON = "ndjson"
+    CHUNK_SIZE = 500
 
     @extend_schema(
         responses={200: DatapointExportSerializer(many=True)},
@@ -25,6 +42,13 @@ class DatasetExportView(LoginRequiredMixin, PermissionRequiredMixin, APIView):
             OpenApiParameter(name="at_date", required=True, type=datetime.date),
             OpenApiParameter(name="export_columns", required=True, type=str, many=True),
             OpenApiParameter(name="dataset", required=True, type=str),
+            OpenApiParameter(
+                name="output_format",
+                required=False,
+                type=str,
+                enum=[OUTPUT_FORMAT_JSON, OUTPUT_FORMAT_CSV, OUTPUT_FORMAT_NDJSON],
+                default=OUTPUT_FORMAT_JSON,
+            ),
         ],
     )
     def get(self, request):
@@ -36,22 +60,53 @@ class DatasetExportView(LoginRequiredMixin, PermissionRequiredMixin, APIView):
             .get_queryset(reference_time)
             .order_by("id")
         )
+        queryset = DatasetExportColumnBuilder.prepare_queryset(
+            queryset, export_columns, reference_time
+        )
+        rows = self.build_serializer_data(queryset, export_columns, reference_time)
+
+        output_format = request.query_params.get(
+            "output_format", self.OUTPUT_FORMAT_JSON
+        )
+        if output_format == self.OUTPUT_FORMAT_CSV:
+            response = StreamingHttpResponse(
+                self.stream_csv(rows, export_columns), content_type="text/csv"
+            )
+            set_header_for_file_download(response, "export.csv")
+            return response
+        if output_format == self.OUTPUT_FORMAT_NDJSON:
+            return StreamingHttpResponse(
+                self.stream_ndjson(rows), content_type="application/x-ndjson"
+            )
 
         return Response(
-            DatapointExportSerializer(
-                self.build_serializer_data(queryset, export_columns, reference_time),
-                many=True,
-            ).data,
+            list(rows),
             status=status.HTTP_200_OK,
         )
 
     def build_serializer_data(
         self, queryset, export_columns: list[str], reference_time: datetime.datetime
     ):
-        return [
-            self.build_single_entry_data(share_owner, export_columns, reference_time)
-            for share_owner in queryset
-        ]
+        # The iterator avoids loading all members at once,
+        # the prefetches from prepare_queryset are done once per chunk.
+        for share_owner in queryset.iterator(chunk_size=self.CHUNK_SIZE):
+            yield DatapointExportSerializer(
+                self.build_single_entry_data(
+                    share_owner, export_columns, reference_time
+                )
+            ).data
+
+    @staticmethod
+    def stream_csv(rows, export_columns: list[str]):
+        writer = csv.writer(Echo())
+        yield writer.writerow(export_columns)
+        for row in rows:
+            yield writer.writerow([row.get(column) for column in export_columns])
+
+    @staticmethod
+    def stream_ndjson(rows):
+        for row in rows:
+            yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
 
     def build_single_entry_data(
         self,
@@ -70,9 +125,8 @@ class DatasetExportView(LoginRequiredMixin, PermissionRequiredMixin, APIView):
     def build_column_data(
         share_owner: ShareOwner, column_name: str, reference_time: datetime.datetime
     ):
-        function_name = f"build_column_{column_name}"
-        return getattr(DatasetExportColumnBuilder, function_name)(
-            share_owner=share_owner, reference_time=reference_time
+        return DatasetExportColumnBuilder.build_column(
+            share_owner, column_name, reference_time
         )
 
     @staticmethod
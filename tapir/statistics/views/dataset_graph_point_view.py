@@ -14,6 +14,9 @@ from tapir.statistics.services.data_providers.base_data_provider import (
     BaseDataProvider,
     data_providers,
 )
+from tapir.statistics.services.fancy_graph_cache_service import (
+    FancyGraphCacheService,
+)
 
 
 class DatasetGraphPointView(LoginRequiredMixin, PermissionRequiredMixin, APIView, ABC):
@@ -23,13 +26,16 @@ class DatasetGraphPointView(LoginRequiredMixin, PermissionRequiredMixin, APIView
     def calculate_datapoint(
         data_provider: type[BaseDataProvider], reference_time: datetime.datetime
     ) -> int:
-        return data_provider.get_queryset(reference_time).distinct().count()
+        reference_date = reference_time.date()
+        return data_provider.get_counts([reference_date])[reference_date]
 
     def get_datapoint(
         self, data_provider: type[BaseDataProvider], reference_time: datetime.datetime
     ):
         reference_date = reference_time.date()
-        data_provider_name = f"{data_provider.__module__}.{data_provider.__name__}"
+        data_provider_name = FancyGraphCacheService.get_data_provider_name(
+            data_provider
+        )
         use_cache = reference_date < timezone.now().date()
         if use_cache:
             # Only use the cache for dates in the past:
@@ -0,0 +1,65 @@
+import datetime
+
+from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from tapir.settings import PERMISSION_COOP_MANAGE
+from tapir.statistics.serializers import DatasetGraphSeriesPointSerializer
+from tapir.statistics.services.data_providers.base_data_provider import (
+    data_providers,
+)
+from tapir.statistics.services.fancy_graph_cache_service import (
+    FancyGraphCacheService,
+)
+
+
+class DatasetGraphSeriesView(LoginRequiredMixin, PermissionRequiredMixin, APIView):
+    permission_required = PERMISSION_COOP_MANAGE
+
+    @staticmethod
+    def get_previous_datapoint_date(date: datetime.date) -> datetime.date:
+        # Same as in DatasetGraphPointView
+        return (date - datetime.timedelta(days=1)).replace(day=1)
+
+    @extend_schema(
+        responses={200: DatasetGraphSeriesPointSerializer(many=True)},
+        parameters=[
+            OpenApiParameter(
+                name="dates", required=True, type=datetime.date, many=True
+            ),
+            OpenApiParameter(name="relative", required=True, type=bool),
+            OpenApiParameter(name="dataset", required=True, type=str),
+        ],
+    )
+    def get(self, request):
+        dates = [
+            datetime.datetime.strptime(date, "%Y-%m-%d").date()
+            for date in request.query_params.getlist("dates")
+        ]
+        relative = request.query_params.get("relative") == "true"
+        data_provider = data_providers[request.query_params.get("dataset")]
+
+        dates_to_compute = set(dates)
+        if relative:
+            dates_to_compute.update(
+                [self.get_previous_datapoint_date(date) for date in dates]
+            )
+
+        values = FancyGraphCacheService.get_values(
+            data_provider, sorted(dates_to_compute)
+        )
+
+        points = []
+        for date in dates:
+            value = values[date]
+            if relative:
+                value -= values[self.get_previous_datapoint_date(date)]
+            points.append({"date": date, "value": value})
+
+        return Response(
+            DatasetGraphSeriesPointSerializer(points, many=True).data,
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,168 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import ldap
+from ldap.ldapobject import SimpleLDAPObject
+
+from tapir.settings import (
+    AUTH_LDAP_BIND_DN,
+    AUTH_LDAP_BIND_PASSWORD,
+    AUTH_LDAP_SERVER_URI,
+)
+
+LOG = logging.getLogger(__name__)
+
+
+class LdapConnectionPool:
+    """Admin connections to the LDAP server, bound once and reused across requests.
+
+    A connection is borrowed with `with LdapConnectionPool.borrow() as connection:` and used by one thread at a time.
+    The pool never blocks: if all connections are in use, a new one is created,
+    and only MAX_IDLE_CONNECTIONS are kept once they are given back.
+    A connection that stayed idle for more than HEALTH_CHECK_AFTER_SECONDS is checked before being lent,
+    and replaced by a newly bound one if the server doesn't answer anymore or forgot the bind.
+    """
+
+    MAX_IDLE_CONNECTIONS = 4
+    HEALTH_CHECK_AFTER_SECONDS = 30
+    SLOW_OPERATION_THRESHOLD_SECONDS = 1
+    CONNECTION_ERRORS = (ldap.SERVER_DOWN, ldap.CONNECT_ERROR, ldap.TIMEOUT)
+
+    _lock = threading.Lock()
+    # Connections that are not borrowed, with the time.monotonic() at which they have been given back
+    _idle_connections: list[tuple["InstrumentedLdapObject", float]] = []
+    # Operation name -> count, total_seconds and max_seconds
+    _latencies: dict[str, dict[str, float]] = {}
+
+    @classmethod
+    @contextmanager
+    def borrow(cls):
+        connection = cls.acquire()
+        is_healthy = True
+        try:
+            yield connection
+        except cls.CONNECTION_ERRORS:
+            is_healthy = False
+            raise
+        finally:
+            if is_healthy:
+                cls.release(connection)
+            else:
+                cls.close(connection)
+
+    @classmethod
+    def acquire(cls) -> "InstrumentedLdapObject":
+        while True:
+            with cls._lock:
+                if not cls._idle_connections:
+                    break
+                connection, released_at = cls._idle_connections.pop()
+
+            if time.monotonic() - released_at < cls.HEALTH_CHECK_AFTER_SECONDS:
+                return connection
+            if cls.is_healthy(connection):
+                return connection
+            cls.close(connection)
+
+        return cls.create_connection()
+
+    @classmethod
+    def release(cls, connection: "InstrumentedLdapObject"):
+        with cls._lock:
+            if len(cls._idle_connections) < cls.MAX_IDLE_CONNECTIONS:
+                cls._idle_connections.append((connection, time.monotonic()))
+                return
+        cls.close(connection)
+
+    @staticmethod
+    def create_connection() -> "InstrumentedLdapObject":
+        connection = InstrumentedLdapObject(AUTH_LDAP_SERVER_URI)
+        connection.simple_bind_s(AUTH_LDAP_BIND_DN, AUTH_LDAP_BIND_PASSWORD)
+        return connection
+
+    @staticmethod
+    def is_healthy(connection: "InstrumentedLdapObject") -> bool:
+        try:
+            # An empty answer means that the connection is not bound anymore
+            return connection.whoami_s() != ""
+        except ldap.LDAPError:
+            return False
+
+    @staticmethod
+    def close(connection: "InstrumentedLdapObject"):
+        try:
+            connection.unbind_s()
+        except ldap.LDAPError:
+            pass
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            idle_connections = cls._idle_connections
+            cls._idle_connections = []
+        for connection, _released_at in idle_connections:
+            cls.close(connection)
+
+    @classmethod
+    def forget_connections_after_fork(cls):
+        # The sockets are shared with the parent process, they must not be used or closed by the child
+        cls._lock = threading.Lock()
+        cls._idle_connections = []
+        cls._latencies = {}
+
+    @classmethod
+    def reset_latency_metrics(cls):
+        with cls._lock:
+            cls._latencies = {}
+
+    @classmethod
+    def record_latency(cls, operation: str, duration_in_seconds: float):
+        with cls._lock:
+            latency = cls._latencies.setdefault(
+                operation, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            latency["count"] += 1
+            latency["total_seconds"] += duration_in_seconds
+            latency["max_seconds"] = max(latency["max_seconds"], duration_in_seconds)
+
+        if duration_in_seconds > cls.SLOW_OPERATION_THRESHOLD_SECONDS:
+            LOG.warning(
+                f"Slow LDAP {operation}: {duration_in_seconds:.3f}s. Latencies in this process: {cls.get_latency_metrics()}"
+            )
+
+    @classmethod
+    def get_latency_metrics(cls) -> dict[str, dict[str, float]]:
+        """Returns the count, total, average and maximum duration of the binds and searches done by this process."""
+        with cls._lock:
+            return {
+                operation: {
+                    **latency,
+                    "average_seconds": latency["total_seconds"] / latency["count"],
+                }
+                for operation, latency in cls._latencies.items()
+            }
+
+
+class InstrumentedLdapObject(SimpleLDAPObject):
+    """Reports the duration of binds and searches to LdapConnectionPool.record_latency.
+    LDAPSearch.execute and search_s both go through search_ext_s."""
+
+    def simple_bind_s(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().simple_bind_s(*args, **kwargs)
+        finally:
+            LdapConnectionPool.record_latency("bind", time.perf_counter() - start)
+
+    def search_ext_s(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().search_ext_s(*args, **kwargs)
+        finally:
+            LdapConnectionPool.record_latency("search", time.perf_counter() - start)
+
+
+os.register_at_fork(after_in_child=LdapConnectionPool.forget_connections_after_fork)
@@ -12,6 +12,9 @@ from ldap.ldapobject import LDAPObject
 
 from tapir import settings
 from tapir.accounts.models import TapirUser, UpdateTapirUserLogEntry
+from tapir.accounts.services.ldap_group_membership_service import (
+    LdapGroupMembershipService,
+)
 from tapir.accounts.tests.factories.factories import TapirUserFactory
 from tapir.accounts.tests.factories.user_data_factory import UserDataFactory
 from tapir.coop.models import (
@@ -24,6 +27,7 @@ from tapir.coop.models import (
     ShareOwner,
     ShareOwnership,
 )
+from tapir.coop.services.member_search_service import MemberSearchService
 from tapir.coop.services.membership_pause_service import MembershipPauseService
 from tapir.coop.services.number_of_shares_service import NumberOfSharesService
 from tapir.log.models import LogEntry
@@ -51,10 +55,10 @@ from tapir.statistics.models import (
     PurchaseBasket,
 )
 from tapir.utils.json_user import JsonUser
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
 from tapir.utils.models import copy_user_info
 from tapir.utils.shortcuts import (
     build_ldap_group_dn,
-    get_admin_ldap_connection,
     get_timezone_aware_datetime,
     set_group_membership,
 )
@@ -179,6 +183,8 @@ def generate_share_owners(json_users, tapir_users):
         share_owners.append(share_owner)
 
     ShareOwner.objects.bulk_create(share_owners)
+    # bulk_create doesn't send the post_save signals that usually build the search documents
+    MemberSearchService.update_search_documents(share_owners)
 
     return share_owners
 
@@ -438,22 +444,23 @@ def remove_users_from_group(connection: LDAPObject, group_name: str, tapir_users
 
 def clear_ldap():
     TapirUser.objects.all()
-    connection = get_admin_ldap_connection()
-    for group_name in settings.LDAP_GROUPS:
-        search = LDAPSearch(
-            "ou=groups,dc=supercoop,dc=de", ldap.SCOPE_SUBTREE, f"(cn={group_name})"
-        )
-        result = search.execute(connection)
-        if result:
-            connection.delete_s(build_ldap_group_dn(group_name))
-
-    search = LDAPSearch("ou=people,dc=supercoop,dc=de", ldap.SCOPE_SUBTREE)
-    search_results = search.execute(connection)
-    for search_result in search_results:
-        user_dn = search_result[0]
-        if not user_dn.startswith("uid="):
-            continue
-        connection.delete_s(user_dn)
+    with LdapConnectionPool.borrow() as connection:
+        for group_name in settings.LDAP_GROUPS:
+            search = LDAPSearch(
+                "ou=groups,dc=supercoop,dc=de", ldap.SCOPE_SUBTREE, f"(cn={group_name})"
+            )
+            result = search.execute(connection)
+            if result:
+                connection.delete_s(build_ldap_group_dn(group_name))
+
+        search = LDAPSearch("ou=people,dc=supercoop,dc=de", ldap.SCOPE_SUBTREE)
+        search_results = search.execute(connection)
+        for search_result in search_results:
+            user_dn = search_result[0]
+            if not user_dn.startswith("uid="):
+                continue
+            connection.delete_s(user_dn)
+    LdapGroupMembershipService.invalidate()
 
 
 def clear_django_db():
@@ -19,7 +19,7 @@ from django_auth_ldap.config import LDAPSearch
 from ldap import modlist
 
 from tapir import settings
-from tapir.settings import AUTH_LDAP_BIND_PASSWORD, AUTH_LDAP_SERVER_URI
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
 
 if TYPE_CHECKING:
     from tapir.accounts.models import TapirUser
@@ -174,62 +174,63 @@ def create_ldap_group(connection, group_cn, tapir_users: list[TapirUser]):
 def set_group_membership(
     tapir_users: list[TapirUser], group_cn, is_member_of_group: bool
 ):
-    connection = get_admin_ldap_connection()
-
-    current_group_members = get_group_members(connection, group_cn)
-    groups_exists = (
-        len(current_group_members) > 0
-    )  # Empty groups can't exist in LDAP, if get_group_members returns an empty list the group has not been found
+    # Must import locally to avoid import loop.
+    from tapir.accounts.services.ldap_group_membership_service import (
+        LdapGroupMembershipService,
+    )
 
-    if not groups_exists:
-        if not is_member_of_group:
+    with LdapConnectionPool.borrow() as connection:
+        current_group_members = get_group_members(connection, group_cn)
+        groups_exists = (
+            len(current_group_members) > 0
+        )  # Empty groups can't exist in LDAP, if get_group_members returns an empty list the group has not been found
+
+        if not groups_exists:
+            if not is_member_of_group:
+                return
+            create_ldap_group(connection, group_cn, tapir_users)
+            LdapGroupMembershipService.invalidate()
             return
-        create_ldap_group(connection, group_cn, tapir_users)
-        return
-
-    current_group_members = get_group_members(connection, group_cn)
-    tapir_users_dns = [tapir_user.build_ldap_dn() for tapir_user in tapir_users]
 
-    if is_member_of_group:
-        members_to_update = [
-            user_dn
-            for user_dn in tapir_users_dns
-            if user_dn not in current_group_members
-        ]
-    else:
-        members_to_update = [
-            user_dn for user_dn in tapir_users_dns if user_dn in current_group_members
-        ]
-
-    if not members_to_update:
-        return
-
-    if not is_member_of_group and set(members_to_update) == set(current_group_members):
-        # Here we would remove all members of the group, so instead we delete the group
-        connection.delete_s(build_ldap_group_dn(group_cn))
-        return
-
-    group_dn = build_ldap_group_dn(group_cn)
-    connection.modify_s(
-        group_dn,
-        [
-            (
-                ldap.MOD_ADD if is_member_of_group else ldap.MOD_DELETE,
-                "member",
-                [member_dn.encode("utf-8") for member_dn in members_to_update],
-            )
-        ],
-    )
+        current_group_members = get_group_members(connection, group_cn)
+        tapir_users_dns = [tapir_user.build_ldap_dn() for tapir_user in tapir_users]
 
+        if is_member_of_group:
+            members_to_update = [
+                user_dn
+                for user_dn in tapir_users_dns
+                if user_dn not in current_group_members
+            ]
+        else:
+            members_to_update = [
+                user_dn
+                for user_dn in tapir_users_dns
+                if user_dn in current_group_members
+            ]
 
-def get_admin_ldap_connection():
-    connection = ldap.initialize(AUTH_LDAP_SERVER_URI)
-    connection.simple_bind_s("cn=admin,dc=supercoop,dc=de", AUTH_LDAP_BIND_PASSWORD)
-    return connection
+        if not members_to_update:
+            return
 
+        if not is_member_of_group and set(members_to_update) == set(
+            current_group_members
+        ):
+            # Here we would remove all members of the group, so instead we delete the group
+            connection.delete_s(build_ldap_group_dn(group_cn))
+            LdapGroupMembershipService.invalidate()
+            return
 
-def is_member_in_group(connection, tapir_user: TapirUser, group_cn: str):
-    return tapir_user.build_ldap_dn() in get_group_members(connection, group_cn)
+        group_dn = build_ldap_group_dn(group_cn)
+        connection.modify_s(
+            group_dn,
+            [
+                (
+                    ldap.MOD_ADD if is_member_of_group else ldap.MOD_DELETE,
+                    "member",
+                    [member_dn.encode("utf-8") for member_dn in members_to_update],
+                )
+            ],
+        )
+        LdapGroupMembershipService.invalidate()
 
 
 def ensure_date(obj: datetime.date | datetime.datetime):
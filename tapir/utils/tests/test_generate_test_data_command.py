@@ -1,5 +1,6 @@
 from django.core.management import call_command
 
+from tapir.coop.models import ShareOwner
 from tapir.utils.tests_utils import TapirFactoryTestBase
 
 
@@ -8,3 +9,8 @@ class TestGenerateTestDataCommand(TapirFactoryTestBase):
         # We simply check that the command succeeds as it often fails after changes to models.
         # We don't check that the generated data is valid.
         call_command("generate_test_data", "--reset_all")
+
+    def test_generateTestData_default_membersCanBeSearched(self):
+        call_command("generate_test_data", "--reset_all")
+
+        self.assertFalse(ShareOwner.objects.filter(search_document="").exists())
@@ -0,0 +1,85 @@
+import time
+from unittest.mock import Mock, patch
+
+import ldap
+from django.test import SimpleTestCase
+
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
+
+
+class TestLdapConnectionPool(SimpleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        LdapConnectionPool.clear()
+        patcher = patch.object(
+            LdapConnectionPool,
+            "create_connection",
+            side_effect=lambda: Mock(whoami_s=Mock(return_value="dn:cn=admin")),
+        )
+        self.mock_create_connection = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(LdapConnectionPool.clear)
+        self.addCleanup(LdapConnectionPool.reset_latency_metrics)
+
+    def test_borrow_calledTwice_reusesTheConnection(self):
+        with LdapConnectionPool.borrow() as first_connection:
+            pass
+        with LdapConnectionPool.borrow() as second_connection:
+            pass
+
+        self.assertIs(first_connection, second_connection)
+        self.mock_create_connection.assert_called_once()
+
+    def test_borrow_nested_returnsDifferentConnections(self):
+        with LdapConnectionPool.borrow() as first_connection:
+            with LdapConnectionPool.borrow() as second_connection:
+                self.assertIsNot(first_connection, second_connection)
+
+    def test_borrow_serverDown_connectionIsNotReused(self):
+        with self.assertRaises(ldap.SERVER_DOWN):
+            with LdapConnectionPool.borrow() as first_connection:
+                raise ldap.SERVER_DOWN()
+
+        with LdapConnectionPool.borrow() as second_connection:
+            pass
+
+        self.assertIsNot(first_connection, second_connection)
+        first_connection.unbind_s.assert_called_once()
+
+    def test_borrow_otherLdapError_connectionIsReused(self):
+        with self.assertRaises(ldap.NO_SUCH_OBJECT):
+            with LdapConnectionPool.borrow() as first_connection:
+                raise ldap.NO_SUCH_OBJECT()
+
+        with LdapConnectionPool.borrow() as second_connection:
+            pass
+
+        self.assertIs(first_connection, second_connection)
+
+    def test_borrow_idleConnectionFailsHealthCheck_connectsAgain(self):
+        with LdapConnectionPool.borrow() as first_connection:
+            first_connection.whoami_s.side_effect = ldap.SERVER_DOWN()
+
+        with patch.object(
+            time,
+            "monotonic",
+            return_value=time.monotonic()
+            + LdapConnectionPool.HEALTH_CHECK_AFTER_SECONDS
+            + 1,
+        ):
+            with LdapConnectionPool.borrow() as second_connection:
+                pass
+
+        self.assertIsNot(first_connection, second_connection)
+        self.assertEqual(2, self.mock_create_connection.call_count)
+
+    def test_recordLatency_default_metricsContainCountAndAverage(self):
+        LdapConnectionPool.reset_latency_metrics()
+
+        LdapConnectionPool.record_latency("search", 0.2)
+        LdapConnectionPool.record_latency("search", 0.4)
+
+        metrics = LdapConnectionPool.get_latency_metrics()["search"]
+        self.assertEqual(2, metrics["count"])
+        self.assertAlmostEqual(0.3, metrics["average_seconds"])
+        self.assertAlmostEqual(0.4, metrics["max_seconds"])
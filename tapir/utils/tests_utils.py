@@ -23,6 +23,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from tapir import settings
 from tapir.accounts.models import TapirUser
+from tapir.accounts.services.ldap_group_membership_service import (
+    LdapGroupMembershipService,
+)
 from tapir.accounts.tests.factories.factories import TapirUserFactory
 from tapir.coop.models import ShareOwnership
 from tapir.coop.pdfs import CONTENT_TYPE_PDF
@@ -36,7 +39,8 @@ from tapir.shifts.services.shift_expectation_service import ShiftExpectationServ
 from tapir.shifts.tests.factories import ShiftTemplateFactory
 from tapir.utils.expection_utils import TapirException
 from tapir.utils.json_user import JsonUser
-from tapir.utils.shortcuts import get_admin_ldap_connection, set_group_membership
+from tapir.utils.ldap_connection_pool import LdapConnectionPool
+from tapir.utils.shortcuts import set_group_membership
 
 
 @override_settings(ALLOWED_HOSTS=["*"])
@@ -204,9 +208,10 @@ class TapirFactoryTestBase(TestCase):
         return user
 
     def tearDown(self):
-        connection = get_admin_ldap_connection()
-        for tapir_user in TapirUser.objects.all():
-            connection.delete_s(tapir_user.build_ldap_dn())
+        with LdapConnectionPool.borrow() as connection:
+            for tapir_user in TapirUser.objects.all():
+                connection.delete_s(tapir_user.build_ldap_dn())
+        LdapGroupMembershipService.invalidate()
 
     def assertStatusCode(self, response, expected_status_code):
         try:
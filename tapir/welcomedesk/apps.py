@@ -12,6 +12,16 @@ class WelcomedeskConfig(AppConfig):
     def ready(self):
         self.register_sidebar_link_groups()
 
+        from tapir.welcomedesk.services.shopping_eligibility_service import (
+            ShoppingEligibilityService,
+        )
+        from tapir.welcomedesk.services.users_currently_on_shift_service import (
+            UsersCurrentlyOnShiftService,
+        )
+
+        ShoppingEligibilityService.register_receivers()
+        UsersCurrentlyOnShiftService.register_receivers()
+
     @staticmethod
     def register_sidebar_link_groups():
         welcomedesk_group = sidebar_link_groups.get_group(_("Welcome Desk"), 3)
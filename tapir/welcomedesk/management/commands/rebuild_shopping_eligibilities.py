@@ -0,0 +1,15 @@
+from django.core.management import BaseCommand
+
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Computes the shopping eligibility of every member for today, "
+        "so that the welcome desk doesn't have to compute them during the first searches of the day."
+    )
+
+    def handle(self, *args, **options):
+        ShoppingEligibilityService.rebuild_all()
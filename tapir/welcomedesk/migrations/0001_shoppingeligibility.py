@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:28
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("coop", "0057_shareowner_search_document"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShoppingEligibility",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("can_shop", models.BooleanField()),
+                (
+                    "reasons_cannot_shop",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=50),
+                        blank=True,
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "warnings",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=50),
+                        blank=True,
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "share_owner",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="shopping_eligibility",
+                        to="coop.shareowner",
+                    ),
+                ),
+            ],
+        ),
+    ]
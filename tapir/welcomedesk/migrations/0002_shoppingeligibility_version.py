@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("welcomedesk", "0001_shoppingeligibility"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShoppingEligibilityVersion",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="shoppingeligibility",
+            name="version",
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+    ]
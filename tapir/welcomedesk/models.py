@@ -0,0 +1,41 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+from tapir.coop.models import ShareOwner
+
+
+class ShoppingEligibility(models.Model):
+    """What the welcome desk shows about a member, precomputed by ShoppingEligibilityService.
+
+    A record is only valid for the date it has been computed for: pauses and shares start and end on given dates.
+    Changes to the member during the day delete the record, see ShoppingEligibilityService.register_receivers.
+    """
+
+    share_owner = models.OneToOneField(
+        ShareOwner,
+        related_name="shopping_eligibility",
+        on_delete=models.CASCADE,
+    )
+    date = models.DateField()
+    can_shop = models.BooleanField()
+    # Codes from WelcomeDeskReasonsCannotShopService.REASON_*
+    reasons_cannot_shop = ArrayField(
+        models.CharField(max_length=50), blank=True, default=list
+    )
+    # Codes from WelcomeDeskWarningsService.WARNING_*
+    warnings = ArrayField(models.CharField(max_length=50), blank=True, default=list)
+    # Value of ShoppingEligibilityVersion when the content of this record last changed
+    version = models.BigIntegerField(default=0, db_index=True)
+
+
+class ShoppingEligibilityVersion(models.Model):
+    """Single row counter used to version the ShoppingEligibility records,
+    so that the welcome desk can download only the records that changed since its last sync.
+
+    The row is locked while eligibilities are being built: versions are committed in increasing order,
+    which guarantees that a client that has seen version N will get every later change by asking for
+    the records with a version greater than N."""
+
+    SINGLETON_ID = 1
+
+    version = models.BigIntegerField(default=0)
@@ -1,17 +1,16 @@
-import datetime
-
 from django.core.handlers.wsgi import WSGIRequest
 from rest_framework import serializers
 
 from tapir.coop.models import ShareOwner
-from tapir.coop.services.member_can_shop_service import MemberCanShopService
 from tapir.utils.user_utils import UserUtils
+from tapir.welcomedesk.models import ShoppingEligibility
 from tapir.welcomedesk.services.welcome_desk_reasons_cannot_shop_service import (
     WelcomeDeskReasonsCannotShopService,
 )
 from tapir.welcomedesk.services.welcome_desk_warnings_service import (
     WelcomeDeskWarningsService,
 )
+from tapir.welcomedesk.utils import get_display_name_for_welcome_desk
 
 
 class ShareOwnerForWelcomeDeskSerializer(serializers.ModelSerializer):
@@ -37,8 +36,9 @@ class ShareOwnerForWelcomeDeskSerializer(serializers.ModelSerializer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.request: WSGIRequest = self.context.get("request")
-        self.reference_time: datetime.datetime = self.context.get("reference_time")
-        self.reference_date: datetime.date = self.context.get("reference_date")
+        self.eligibilities: dict[int, ShoppingEligibility] = self.context.get(
+            "eligibilities"
+        )
 
     def get_display_name(self, share_owner: ShareOwner) -> str:
         display_type = UserUtils.should_viewer_see_short_or_long_display_type(
@@ -49,7 +49,7 @@ class ShareOwnerForWelcomeDeskSerializer(serializers.ModelSerializer):
         return UserUtils.build_display_name(share_owner, display_type)
 
     def get_can_shop(self, share_owner: ShareOwner) -> bool:
-        return MemberCanShopService.can_shop(share_owner, self.reference_time)
+        return self.eligibilities[share_owner.id].can_shop
 
     @staticmethod
     def get_co_purchaser(share_owner: ShareOwner) -> str | None:
@@ -64,14 +64,44 @@ class ShareOwnerForWelcomeDeskSerializer(serializers.ModelSerializer):
         return share_owner.user.co_purchaser_2
 
     def get_warnings(self, share_owner: ShareOwner) -> list[str]:
-        return WelcomeDeskWarningsService.build_warnings(
-            share_owner=share_owner, request_user=self.request.user
+        return WelcomeDeskWarningsService.build_messages(
+            self.eligibilities[share_owner.id].warnings,
+            share_owner=share_owner,
+            request_user=self.request.user,
         )
 
     def get_reasons_cannot_shop(self, share_owner: ShareOwner) -> list[str]:
-        return WelcomeDeskReasonsCannotShopService.build_reasons_why_this_member_cannot_shop(
+        return WelcomeDeskReasonsCannotShopService.build_messages(
+            self.eligibilities[share_owner.id].reasons_cannot_shop,
             share_owner=share_owner,
             request_user=self.request.user,
-            reference_time=self.reference_time,
-            reference_date=self.reference_date,
         )
+
+
+class ShoppingEligibilityForWelcomeDeskSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source="share_owner_id")
+    display_name = serializers.SerializerMethodField()
+    search_key = serializers.CharField(source="share_owner.search_document")
+
+    class Meta:
+        model = ShoppingEligibility
+        fields = [
+            "id",
+            "display_name",
+            "search_key",
+            "can_shop",
+            "reasons_cannot_shop",
+            "warnings",
+        ]
+
+    def get_display_name(self, eligibility: ShoppingEligibility) -> str:
+        return get_display_name_for_welcome_desk(
+            eligibility.share_owner, self.context["request"].user
+        )
+
+
+class WelcomeDeskEligibilitySnapshotSerializer(serializers.Serializer):
+    version = serializers.IntegerField()
+    # Lets the client notice deleted members, which are not part of the changes
+    nb_members = serializers.IntegerField()
+    members = ShoppingEligibilityForWelcomeDeskSerializer(many=True)
@@ -0,0 +1,280 @@
+import datetime
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from tapir.accounts.models import TapirUser
+from tapir.coop.models import (
+    MembershipPause,
+    ShareOwner,
+    ShareOwnership,
+    UpdateShareOwnerLogEntry,
+)
+from tapir.coop.services.member_can_shop_service import MemberCanShopService
+from tapir.coop.services.number_of_shares_service import NumberOfSharesService
+from tapir.shifts.models import ShiftUserData, UpdateShiftUserDataLogEntry
+from tapir.welcomedesk.models import ShoppingEligibility, ShoppingEligibilityVersion
+from tapir.welcomedesk.services.welcome_desk_reasons_cannot_shop_service import (
+    WelcomeDeskReasonsCannotShopService,
+)
+from tapir.welcomedesk.services.welcome_desk_warnings_service import (
+    WelcomeDeskWarningsService,
+)
+
+
+class ShoppingEligibilityService:
+    """Stores what the welcome desk shows about each member, so that a search only has to read
+    the ShoppingEligibility of the found members instead of computing their status.
+
+    The records get deleted when the member, their shares, pauses, account or frozen status change,
+    and are computed again the next time the member is looked up.
+    Changes done with QuerySet.update() must call invalidate themselves."""
+
+    @classmethod
+    def get_eligibilities(
+        cls, share_owner_ids: Iterable[int], reference_time: datetime.datetime
+    ) -> dict[int, ShoppingEligibility]:
+        eligibilities = {
+            eligibility.share_owner_id: eligibility
+            for eligibility in ShoppingEligibility.objects.filter(
+                share_owner_id__in=share_owner_ids, date=reference_time.date()
+            )
+        }
+
+        missing_ids = set(share_owner_ids) - eligibilities.keys()
+        if missing_ids:
+            eligibilities.update(
+                cls.build_eligibilities(
+                    ShareOwner.objects.filter(id__in=missing_ids), reference_time
+                )
+            )
+
+        return eligibilities
+
+    @classmethod
+    @transaction.atomic
+    def build_eligibilities(
+        cls, share_owners: QuerySet[ShareOwner], reference_time: datetime.datetime
+    ) -> dict[int, ShoppingEligibility]:
+        reference_date = reference_time.date()
+        share_owners = cls.optimize_queryset(share_owners, reference_time)
+
+        eligibilities = [
+            ShoppingEligibility(
+                share_owner_id=share_owner.id,
+                date=reference_date,
+                can_shop=MemberCanShopService.can_shop(share_owner, reference_time),
+                reasons_cannot_shop=WelcomeDeskReasonsCannotShopService.get_reason_codes(
+                    share_owner, reference_time, reference_date
+                ),
+                warnings=WelcomeDeskWarningsService.get_warning_codes(share_owner),
+            )
+            for share_owner in share_owners
+        ]
+
+        version = cls.lock_and_increment_version()
+        previous_eligibilities = {
+            previous_eligibility.share_owner_id: previous_eligibility
+            for previous_eligibility in ShoppingEligibility.objects.filter(
+                share_owner_id__in=[
+                    eligibility.share_owner_id for eligibility in eligibilities
+                ]
+            )
+        }
+        for eligibility in eligibilities:
+            previous_eligibility = previous_eligibilities.get(
+                eligibility.share_owner_id
+            )
+            if previous_eligibility is not None and cls.have_same_content(
+                eligibility, previous_eligibility
+            ):
+                # Only the date changes, the welcome desk doesn't need to download it again
+                eligibility.version = previous_eligibility.version
+            else:
+                eligibility.version = version
+
+        ShoppingEligibility.objects.bulk_create(
+            eligibilities,
+            update_conflicts=True,
+            unique_fields=["share_owner"],
+            update_fields=[
+                "date",
+                "can_shop",
+                "reasons_cannot_shop",
+                "warnings",
+                "version",
+            ],
+            batch_size=1000,
+        )
+
+        return {
+            eligibility.share_owner_id: eligibility for eligibility in eligibilities
+        }
+
+    @staticmethod
+    def have_same_content(
+        eligibility: ShoppingEligibility, other: ShoppingEligibility
+    ) -> bool:
+        return (
+            eligibility.can_shop == other.can_shop
+            and eligibility.reasons_cannot_shop == other.reasons_cannot_shop
+            and eligibility.warnings == other.warnings
+        )
+
+    @staticmethod
+    def lock_and_increment_version() -> int:
+        # The lock is held until the end of the transaction, see ShoppingEligibilityVersion
+        (
+            version_counter,
+            _,
+        ) = ShoppingEligibilityVersion.objects.select_for_update().get_or_create(
+            id=ShoppingEligibilityVersion.SINGLETON_ID
+        )
+        version_counter.version += 1
+        version_counter.save()
+        return version_counter.version
+
+    @staticmethod
+    def get_current_version() -> int:
+        return (
+            ShoppingEligibilityVersion.objects.filter(
+                id=ShoppingEligibilityVersion.SINGLETON_ID
+            )
+            .values_list("version", flat=True)
+            .first()
+            or 0
+        )
+
+    @classmethod
+    def get_version_if_up_to_date(cls, reference_time: datetime.datetime) -> int | None:
+        """Returns the current version if all members have an eligibility for the given date, None otherwise.
+        The version only changes when eligibilities get built: while some are missing, it may be outdated.
+        """
+        # Each member has at most one eligibility
+        nb_members_up_to_date = ShoppingEligibility.objects.filter(
+            date=reference_time.date()
+        ).count()
+        if nb_members_up_to_date != ShareOwner.objects.count():
+            return None
+        return cls.get_current_version()
+
+    @classmethod
+    def get_changed_eligibilities(
+        cls, since_version: int, reference_time: datetime.datetime
+    ) -> tuple[int, QuerySet[ShoppingEligibility]]:
+        """Returns the current version and the eligibilities that changed after the given version.
+        The eligibilities of all members are brought up to date first."""
+        members_without_eligibility = ShareOwner.objects.exclude(
+            shopping_eligibility__date=reference_time.date()
+        )
+        if members_without_eligibility.exists():
+            cls.build_eligibilities(members_without_eligibility, reference_time)
+
+        # The version must be read before the eligibilities:
+        # changes committed in between will be sent again with the next sync, but none get lost.
+        current_version = cls.get_current_version()
+        changed_eligibilities = ShoppingEligibility.objects.filter(
+            version__gt=since_version
+        ).select_related("share_owner__user")
+
+        return current_version, changed_eligibilities
+
+    @staticmethod
+    def optimize_queryset(
+        queryset: QuerySet[ShareOwner], reference_time: datetime.datetime
+    ) -> QuerySet[ShareOwner]:
+        reference_date = reference_time.date()
+        queryset = WelcomeDeskWarningsService.optimize_queryset_for_this_service(
+            queryset, reference_time
+        )
+        queryset = (
+            WelcomeDeskReasonsCannotShopService.optimize_queryset_for_this_service(
+                queryset, reference_time=reference_time, reference_date=reference_date
+            )
+        )
+        queryset = NumberOfSharesService.annotate_share_owner_queryset_with_nb_of_active_shares(
+            queryset, reference_date
+        )
+        return queryset
+
+    @classmethod
+    def rebuild_all(cls):
+        cls.build_eligibilities(ShareOwner.objects.all(), timezone.now())
+
+    @staticmethod
+    def invalidate(share_owner_ids: Iterable[int]):
+        ShoppingEligibility.objects.filter(share_owner_id__in=share_owner_ids).delete()
+
+    @staticmethod
+    def invalidate_for_users(user_ids: Iterable[int]):
+        ShoppingEligibility.objects.filter(share_owner__user_id__in=user_ids).delete()
+
+    @classmethod
+    def register_receivers(cls):
+        for model, receiver in [
+            (ShareOwner, cls.on_share_owner_changed),
+            (ShareOwnership, cls.on_share_owner_related_object_changed),
+            (MembershipPause, cls.on_share_owner_related_object_changed),
+            (UpdateShareOwnerLogEntry, cls.on_share_owner_log_entry_changed),
+            (TapirUser, cls.on_tapir_user_changed),
+            (ShiftUserData, cls.on_user_related_object_changed),
+            (UpdateShiftUserDataLogEntry, cls.on_user_related_object_changed),
+        ]:
+            post_save.connect(
+                receiver,
+                sender=model,
+                dispatch_uid=f"shopping_eligibility_{model.__name__}_saved",
+            )
+            post_delete.connect(
+                receiver,
+                sender=model,
+                dispatch_uid=f"shopping_eligibility_{model.__name__}_deleted",
+            )
+
+    @classmethod
+    def on_share_owner_changed(cls, sender, instance: ShareOwner, raw=False, **kwargs):
+        if raw:
+            return
+        cls.invalidate([instance.id])
+
+    @classmethod
+    def on_share_owner_related_object_changed(
+        cls, sender, instance: ShareOwnership | MembershipPause, raw=False, **kwargs
+    ):
+        if raw:
+            return
+        cls.invalidate([instance.share_owner_id])
+
+    @classmethod
+    def on_share_owner_log_entry_changed(
+        cls, sender, instance: UpdateShareOwnerLogEntry, raw=False, **kwargs
+    ):
+        if raw:
+            return
+        # The investing status history is read from those log entries, see InvestingStatusService
+        if instance.share_owner_id is not None:
+            cls.invalidate([instance.share_owner_id])
+        if instance.user_id is not None:
+            cls.invalidate_for_users([instance.user_id])
+
+    @classmethod
+    def on_tapir_user_changed(cls, sender, instance: TapirUser, raw=False, **kwargs):
+        if raw:
+            return
+        cls.invalidate_for_users([instance.id])
+
+    @classmethod
+    def on_user_related_object_changed(
+        cls,
+        sender,
+        instance: ShiftUserData | UpdateShiftUserDataLogEntry,
+        raw=False,
+        **kwargs,
+    ):
+        if raw:
+            return
+        # The frozen status history is read from UpdateShiftUserDataLogEntry, see FrozenStatusHistoryService
+        cls.invalidate_for_users([instance.user_id])
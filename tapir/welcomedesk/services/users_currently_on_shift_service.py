@@ -0,0 +1,73 @@
+import datetime
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from tapir.shifts.models import Shift, ShiftAttendance
+
+
+class UsersCurrentlyOnShiftService:
+    """Members that are doing a shift get access to the welcome desk, see WelcomeDeskPermsMiddleware.
+
+    The IDs of those members are computed at most once per minute and kept in the cache,
+    so that the middleware doesn't need a database query on every request.
+    Changes to shifts and attendances clear the cache of the current process, other processes
+    see the change at the latest one minute later."""
+
+    CACHE_KEY = "welcomedesk_users_currently_on_shift"
+    MARGIN = datetime.timedelta(minutes=20)
+    WINDOW_DURATION = datetime.timedelta(minutes=1)
+
+    @classmethod
+    def is_user_currently_on_shift(cls, user_id: int) -> bool:
+        return user_id in cls.get_user_ids_currently_on_shift()
+
+    @classmethod
+    def get_user_ids_currently_on_shift(cls) -> frozenset[int]:
+        window_start = timezone.now().replace(second=0, microsecond=0)
+
+        cached_value = cache.get(cls.CACHE_KEY)
+        if cached_value is not None and cached_value[0] == window_start:
+            return cached_value[1]
+
+        user_ids = cls.compute_user_ids_on_shift_during_window(window_start)
+        cache.set(
+            cls.CACHE_KEY,
+            (window_start, user_ids),
+            timeout=cls.WINDOW_DURATION.total_seconds(),
+        )
+        return user_ids
+
+    @classmethod
+    def compute_user_ids_on_shift_during_window(
+        cls, window_start: datetime.datetime
+    ) -> frozenset[int]:
+        # Includes the members that are on shift at any point of the window
+        current_shifts = Shift.objects.filter(
+            start_time__lt=window_start + cls.WINDOW_DURATION + cls.MARGIN,
+            end_time__gt=window_start - cls.MARGIN,
+        )
+        return frozenset(
+            ShiftAttendance.objects.filter(slot__shift__in=current_shifts)
+            .with_valid_state()
+            .values_list("user_id", flat=True)
+        )
+
+    @classmethod
+    def clear_cache(cls, **kwargs):
+        cache.delete(cls.CACHE_KEY)
+
+    @classmethod
+    def register_receivers(cls):
+        for model in [Shift, ShiftAttendance]:
+            post_save.connect(
+                cls.clear_cache,
+                sender=model,
+                dispatch_uid=f"users_currently_on_shift_{model.__name__}_saved",
+            )
+            post_delete.connect(
+                cls.clear_cache,
+                sender=model,
+                dispatch_uid=f"users_currently_on_shift_{model.__name__}_deleted",
+            )
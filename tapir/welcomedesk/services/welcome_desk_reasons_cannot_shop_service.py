@@ -14,6 +14,12 @@ from tapir.welcomedesk.utils import get_display_name_for_welcome_desk
 
 
 class WelcomeDeskReasonsCannotShopService:
+    REASON_NO_ACCOUNT = "no_account"
+    REASON_INVESTING = "investing"
+    REASON_FROZEN = "frozen"
+    REASON_PAUSED = "paused"
+    REASON_NOT_A_MEMBER = "not_a_member"
+
     @classmethod
     def optimize_queryset_for_this_service(
         cls, queryset: QuerySet[ShareOwner], reference_time, reference_date
@@ -36,39 +42,59 @@ class WelcomeDeskReasonsCannotShopService:
         return queryset
 
     @classmethod
-    def build_reasons_why_this_member_cannot_shop(
-        cls, share_owner: ShareOwner, request_user, reference_time, reference_date
+    def get_reason_codes(
+        cls, share_owner: ShareOwner, reference_time, reference_date
     ) -> list[str]:
-        possible_reasons = {
-            cls.should_show_no_account_reason: _(
+        checks = {
+            cls.REASON_NO_ACCOUNT: cls.should_show_no_account_reason,
+            cls.REASON_INVESTING: cls.should_show_investing_reason,
+            cls.REASON_FROZEN: cls.should_show_frozen_reason,
+            cls.REASON_PAUSED: cls.should_show_paused_reason,
+            cls.REASON_NOT_A_MEMBER: cls.should_show_not_a_member_reason,
+        }
+
+        return [
+            reason_code
+            for reason_code, check in checks.items()
+            if check(
+                share_owner=share_owner,
+                reference_date=reference_date,
+                reference_time=reference_time,
+            )
+        ]
+
+    @classmethod
+    def get_message_templates(cls) -> dict[str, str]:
+        return {
+            cls.REASON_NO_ACCOUNT: _(
                 "%(name)s does not have a Tapir account. Contact a member of the management team."
             ),
-            cls.should_show_investing_reason: _(
+            cls.REASON_INVESTING: _(
                 "%(name)s is an investing member. If they want to shop, they have to become an active member. "
                 "Contact a member of the management team."
             ),
-            cls.should_show_frozen_reason: _(
+            cls.REASON_FROZEN: _(
                 "%(name)s has been frozen because they missed too many shifts."
                 "If they want to shop, they must first be re-activated."
                 "Contact a member of the management team."
             ),
-            cls.should_show_paused_reason: _(
+            cls.REASON_PAUSED: _(
                 "%(name)s has paused their membership. Contact a member of the management team."
             ),
-            cls.should_show_not_a_member_reason: _(
+            cls.REASON_NOT_A_MEMBER: _(
                 "%(name)s has is not a member of the cooperative. They may have transferred their shares to another member. Contact a member of the management team."
             ),
         }
 
+    @classmethod
+    def build_messages(
+        cls, reason_codes: list[str], share_owner: ShareOwner, request_user
+    ) -> list[str]:
+        message_templates = cls.get_message_templates()
         return [
-            message
+            message_templates[reason_code]
             % {"name": get_display_name_for_welcome_desk(share_owner, request_user)}
-            for check, message in possible_reasons.items()
-            if check(
-                share_owner=share_owner,
-                reference_date=reference_date,
-                reference_time=reference_time,
-            )
+            for reason_code in reason_codes
         ]
 
     @staticmethod
@@ -11,6 +11,8 @@ from tapir.welcomedesk.utils import get_display_name_for_welcome_desk
 
 
 class WelcomeDeskWarningsService:
+    WARNING_WELCOME_SESSION = "welcome_session"
+
     @classmethod
     def optimize_queryset_for_this_service(
         cls, queryset: QuerySet[ShareOwner], reference_time: datetime.datetime
@@ -28,18 +30,34 @@ class WelcomeDeskWarningsService:
         return queryset
 
     @classmethod
-    def build_warnings(cls, share_owner: ShareOwner, request_user) -> list[str]:
-        possible_warnings = {
-            cls.should_show_welcome_session_warning: _(
+    def get_warning_codes(cls, share_owner: ShareOwner) -> list[str]:
+        checks = {
+            cls.WARNING_WELCOME_SESSION: cls.should_show_welcome_session_warning,
+        }
+
+        return [
+            warning_code
+            for warning_code, check in checks.items()
+            if check(share_owner=share_owner)
+        ]
+
+    @classmethod
+    def get_message_templates(cls) -> dict[str, str]:
+        return {
+            cls.WARNING_WELCOME_SESSION: _(
                 "%(name)s has not attended a welcome session yet. Make sure they plan to do it!"
             ),
         }
 
+    @classmethod
+    def build_messages(
+        cls, warning_codes: list[str], share_owner: ShareOwner, request_user
+    ) -> list[str]:
+        message_templates = cls.get_message_templates()
         return [
-            message
+            message_templates[warning_code]
             % {"name": get_display_name_for_welcome_desk(share_owner, request_user)}
-            for check, message in possible_warnings.items()
-            if check(share_owner=share_owner)
+            for warning_code in warning_codes
         ]
 
     @staticmethod
@@ -0,0 +1,7 @@
+from celery import shared_task
+from django.core.management import call_command
+
+
+@shared_task
+def rebuild_shopping_eligibilities():
+    call_command("rebuild_shopping_eligibilities")
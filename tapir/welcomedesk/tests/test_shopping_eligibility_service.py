@@ -0,0 +1,90 @@
+import datetime
+
+from django.utils import timezone
+
+from tapir.coop.models import MembershipPause
+from tapir.utils.tests_utils import (
+    TapirFactoryTestBase,
+    create_member_that_is_working,
+    mock_timezone_now,
+)
+from tapir.welcomedesk.models import ShoppingEligibility
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
+)
+from tapir.welcomedesk.services.welcome_desk_reasons_cannot_shop_service import (
+    WelcomeDeskReasonsCannotShopService,
+)
+
+
+class TestShoppingEligibilityService(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2024, month=6, day=12, hour=10)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+        self.tapir_user = create_member_that_is_working(self, self.NOW)
+        self.share_owner = self.tapir_user.share_owner
+
+    def get_eligibility(self) -> ShoppingEligibility:
+        return ShoppingEligibilityService.get_eligibilities(
+            [self.share_owner.id], timezone.now()
+        )[self.share_owner.id]
+
+    def test_getEligibilities_noStoredEligibility_buildsAndStoresIt(self):
+        eligibility = self.get_eligibility()
+
+        self.assertTrue(eligibility.can_shop)
+        self.assertEqual([], eligibility.reasons_cannot_shop)
+        self.assertEqual(
+            eligibility.can_shop,
+            ShoppingEligibility.objects.get(share_owner=self.share_owner).can_shop,
+        )
+
+    def test_getEligibilities_eligibilityFromPreviousDay_buildsItAgain(self):
+        self.get_eligibility()
+        ShoppingEligibility.objects.update(
+            can_shop=False, date=self.NOW.date() - datetime.timedelta(days=1)
+        )
+
+        self.assertTrue(self.get_eligibility().can_shop)
+        self.assertEqual(
+            self.NOW.date(),
+            ShoppingEligibility.objects.get(share_owner=self.share_owner).date,
+        )
+
+    def test_getEligibilities_pauseCreated_eligibilityIsUpdated(self):
+        self.get_eligibility()
+
+        MembershipPause.objects.create(
+            share_owner=self.share_owner,
+            start_date=self.NOW.date() - datetime.timedelta(days=1),
+            description="Test",
+        )
+
+        eligibility = self.get_eligibility()
+        self.assertFalse(eligibility.can_shop)
+        self.assertEqual(
+            [WelcomeDeskReasonsCannotShopService.REASON_PAUSED],
+            eligibility.reasons_cannot_shop,
+        )
+
+    def test_save_shiftUserDataChanged_eligibilityIsDeleted(self):
+        self.get_eligibility()
+
+        self.tapir_user.shift_user_data.is_frozen = True
+        self.tapir_user.shift_user_data.save()
+
+        self.assertFalse(
+            ShoppingEligibility.objects.filter(share_owner=self.share_owner).exists()
+        )
+
+    def test_save_investingStatusChanged_eligibilityIsDeleted(self):
+        self.get_eligibility()
+
+        self.share_owner.is_investing = True
+        self.share_owner.save()
+
+        self.assertFalse(
+            ShoppingEligibility.objects.filter(share_owner=self.share_owner).exists()
+        )
@@ -0,0 +1,80 @@
+import datetime
+
+from django.core.cache import cache
+
+from tapir.accounts.tests.factories.factories import TapirUserFactory
+from tapir.shifts.models import ShiftAttendance
+from tapir.shifts.tests.factories import ShiftFactory
+from tapir.utils.tests_utils import TapirFactoryTestBase, mock_timezone_now
+from tapir.welcomedesk.services.users_currently_on_shift_service import (
+    UsersCurrentlyOnShiftService,
+)
+
+
+class TestUsersCurrentlyOnShiftService(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2024, month=6, day=12, hour=10, minute=5, second=30)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+        cache.delete(UsersCurrentlyOnShiftService.CACHE_KEY)
+        self.user = TapirUserFactory.create()
+
+    def create_shift_with_attendance(self, start_time: datetime.datetime):
+        shift = ShiftFactory.create(
+            start_time=start_time, end_time=start_time + datetime.timedelta(hours=3)
+        )
+        return ShiftAttendance.objects.create(user=self.user, slot=shift.slots.first())
+
+    def test_isUserCurrentlyOnShift_shiftStartsInLessThan20Minutes_returnsTrue(self):
+        self.create_shift_with_attendance(self.NOW + datetime.timedelta(minutes=15))
+
+        self.assertTrue(
+            UsersCurrentlyOnShiftService.is_user_currently_on_shift(self.user.id)
+        )
+
+    def test_isUserCurrentlyOnShift_shiftStartsLater_returnsFalse(self):
+        self.create_shift_with_attendance(self.NOW + datetime.timedelta(minutes=30))
+
+        self.assertFalse(
+            UsersCurrentlyOnShiftService.is_user_currently_on_shift(self.user.id)
+        )
+
+    def test_isUserCurrentlyOnShift_calledTwiceInTheSameMinute_secondCallDoesNoQuery(
+        self,
+    ):
+        self.create_shift_with_attendance(self.NOW - datetime.timedelta(hours=1))
+        UsersCurrentlyOnShiftService.is_user_currently_on_shift(self.user.id)
+        self.mock_now.return_value = self.NOW + datetime.timedelta(seconds=20)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                UsersCurrentlyOnShiftService.is_user_currently_on_shift(self.user.id)
+            )
+
+    def test_isUserCurrentlyOnShift_attendanceCancelled_returnsFalse(self):
+        attendance = self.create_shift_with_attendance(
+            self.NOW - datetime.timedelta(hours=1)
+        )
+        self.assertTrue(
+            UsersCurrentlyOnShiftService.is_user_currently_on_shift(self.user.id)
+        )
+
+        attendance.state = ShiftAttendance.State.CANCELLED
+        attendance.save()
+
+        self.assertFalse(
+            UsersCurrentlyOnShiftService.is_user_currently_on_shift(self.user.id)
+        )
+
+    def test_isUserCurrentlyOnShift_nextMinute_recomputesTheSet(self):
+        self.create_shift_with_attendance(self.NOW + datetime.timedelta(minutes=21))
+        self.assertFalse(
+            UsersCurrentlyOnShiftService.is_user_currently_on_shift(self.user.id)
+        )
+
+        self.mock_now.return_value = self.NOW + datetime.timedelta(minutes=2)
+
+        self.assertTrue(
+            UsersCurrentlyOnShiftService.is_user_currently_on_shift(self.user.id)
+        )
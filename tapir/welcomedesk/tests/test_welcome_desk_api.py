@@ -20,33 +20,37 @@ class TestWelcomeDeskAPI(TapirFactoryTestBase):
 
         self.assertEqual(HTTPStatus.FORBIDDEN, response.status_code)
 
-    @patch.object(WelcomeDeskWarningsService, "build_warnings")
-    @patch.object(
-        WelcomeDeskReasonsCannotShopService, "build_reasons_why_this_member_cannot_shop"
-    )
-    def test_searchMemberForWelcomeDeskView_default_callsServices(
+    @patch.object(WelcomeDeskWarningsService, "get_warning_codes")
+    @patch.object(WelcomeDeskReasonsCannotShopService, "get_reason_codes")
+    def test_searchMemberForWelcomeDeskView_default_returnsMessagesFromStoredCodes(
         self,
-        mock_build_reasons_why_this_member_cannot_shop: Mock,
-        mock_build_warnings: Mock,
+        mock_get_reason_codes: Mock,
+        mock_get_warning_codes: Mock,
     ):
         tapir_user = self.login_as_member_office_user()
-        mock_build_warnings.return_value = []
-        mock_build_reasons_why_this_member_cannot_shop.return_value = []
-
-        response = self.client.get(self.build_url(tapir_user.first_name))
-        self.assertEqual(HTTPStatus.OK, response.status_code)
-
-        mock_build_warnings.assert_called_once()
+        mock_get_warning_codes.return_value = [
+            WelcomeDeskWarningsService.WARNING_WELCOME_SESSION
+        ]
+        mock_get_reason_codes.return_value = [
+            WelcomeDeskReasonsCannotShopService.REASON_PAUSED
+        ]
+
+        for _ in range(2):
+            response = self.client.get(self.build_url(tapir_user.first_name))
+            self.assertEqual(HTTPStatus.OK, response.status_code)
+            result = response.json()[0]
+            self.assertEqual(tapir_user.share_owner.id, result["id"])
+            self.assertEqual(1, len(result["warnings"]))
+            self.assertEqual(1, len(result["reasons_cannot_shop"]))
+
+        # The second search reads the stored eligibility
+        mock_get_warning_codes.assert_called_once()
         self.assertEqual(
-            tapir_user.share_owner, mock_build_warnings.call_args.kwargs["share_owner"]
+            tapir_user.share_owner, mock_get_warning_codes.call_args.args[0]
         )
-
-        mock_build_reasons_why_this_member_cannot_shop.assert_called_once()
+        mock_get_reason_codes.assert_called_once()
         self.assertEqual(
-            tapir_user.share_owner,
-            mock_build_reasons_why_this_member_cannot_shop.call_args.kwargs[
-                "share_owner"
-            ],
+            tapir_user.share_owner, mock_get_reason_codes.call_args.args[0]
         )
 
     @staticmethod
@@ -0,0 +1,146 @@
+import datetime
+from http import HTTPStatus
+from unittest.mock import patch
+
+from rest_framework.reverse import reverse
+
+from tapir.coop.models import MembershipPause, ShareOwner
+from tapir.utils.tests_utils import (
+    TapirFactoryTestBase,
+    create_member_that_is_working,
+    mock_timezone_now,
+)
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
+)
+from tapir.welcomedesk.services.welcome_desk_reasons_cannot_shop_service import (
+    WelcomeDeskReasonsCannotShopService,
+)
+
+
+class TestWelcomeDeskEligibilitySnapshot(TapirFactoryTestBase):
+    NOW = datetime.datetime(year=2024, month=6, day=12, hour=10)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.NOW = mock_timezone_now(self, self.NOW)
+        self.member = create_member_that_is_working(self, self.NOW)
+        self.login_as_member_office_user()
+
+    def get_snapshot(self, since_version: int | None = None, headers=None):
+        url = reverse("welcomedesk:eligibility_snapshot")
+        if since_version is not None:
+            url += f"?since_version={since_version}"
+        return self.client.get(url, headers=headers)
+
+    def get_member_data(self, response_data: dict) -> dict | None:
+        for member_data in response_data["members"]:
+            if member_data["id"] == self.member.share_owner.id:
+                return member_data
+        return None
+
+    def test_get_noSinceVersion_returnsAllMembers(self):
+        response = self.get_snapshot()
+
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        data = response.json()
+        self.assertEqual(data["nb_members"], len(data["members"]))
+        member_data = self.get_member_data(data)
+        self.assertTrue(member_data["can_shop"])
+        self.assertEqual(
+            ShareOwner.objects.get(user=self.member).search_document,
+            member_data["search_key"],
+        )
+        self.assertTrue(response.headers["ETag"].startswith(f'"{data["version"]}-'))
+
+    def test_get_nothingChangedSinceVersion_returnsNoMembers(self):
+        version = self.get_snapshot().json()["version"]
+
+        data = self.get_snapshot(since_version=version).json()
+
+        self.assertEqual(version, data["version"])
+        self.assertEqual([], data["members"])
+
+    def test_get_memberChangedSinceVersion_returnsOnlyThatMember(self):
+        version = self.get_snapshot().json()["version"]
+        MembershipPause.objects.create(
+            share_owner=self.member.share_owner,
+            start_date=self.NOW.date() - datetime.timedelta(days=1),
+            description="Test",
+        )
+
+        data = self.get_snapshot(since_version=version).json()
+
+        self.assertGreater(data["version"], version)
+        self.assertEqual(1, len(data["members"]))
+        member_data = self.get_member_data(data)
+        self.assertFalse(member_data["can_shop"])
+        self.assertEqual(
+            [WelcomeDeskReasonsCannotShopService.REASON_PAUSED],
+            member_data["reasons_cannot_shop"],
+        )
+
+    def test_get_etagIsCurrentVersion_returnsNotModified(self):
+        etag = self.get_snapshot(since_version=0).headers["ETag"]
+
+        response = self.get_snapshot(since_version=0, headers={"If-None-Match": etag})
+
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status_code)
+
+    def test_get_etagIsCurrentVersion_doesntBuildEligibilities(self):
+        etag = self.get_snapshot(since_version=0).headers["ETag"]
+
+        with patch.object(
+            ShoppingEligibilityService,
+            "build_eligibilities",
+            wraps=ShoppingEligibilityService.build_eligibilities,
+        ) as mock_build_eligibilities:
+            response = self.get_snapshot(
+                since_version=0, headers={"If-None-Match": etag}
+            )
+
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status_code)
+        mock_build_eligibilities.assert_not_called()
+
+    def test_get_memberChangedSinceEtag_returnsChangedMember(self):
+        response = self.get_snapshot(since_version=0)
+        version = response.json()["version"]
+        etag = self.get_snapshot(since_version=version).headers["ETag"]
+        # Deletes the eligibility of the member,
+        # the version only changes when the eligibility is built again
+        MembershipPause.objects.create(
+            share_owner=self.member.share_owner,
+            start_date=self.NOW.date() - datetime.timedelta(days=1),
+            description="Test",
+        )
+
+        response = self.get_snapshot(
+            since_version=version, headers={"If-None-Match": etag}
+        )
+
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        member_data = self.get_member_data(response.json())
+        self.assertFalse(member_data["can_shop"])
+
+    def test_get_etagFromOtherSinceVersion_returnsFullResponse(self):
+        response = self.get_snapshot(since_version=0)
+        version = response.json()["version"]
+
+        response = self.get_snapshot(
+            since_version=version, headers={"If-None-Match": response.headers["ETag"]}
+        )
+
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertEqual(version, response.json()["version"])
+
+    def test_get_invalidSinceVersion_returnsBadRequest(self):
+        response = self.client.get(
+            reverse("welcomedesk:eligibility_snapshot") + "?since_version=abc"
+        )
+
+        self.assertEqual(HTTPStatus.BAD_REQUEST, response.status_code)
+
+    def test_get_normalMember_accessDenied(self):
+        self.login_as_normal_user()
+
+        self.assertEqual(HTTPStatus.FORBIDDEN, self.get_snapshot().status_code)
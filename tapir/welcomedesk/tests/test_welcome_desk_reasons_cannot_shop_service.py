@@ -160,16 +160,15 @@ class TestWelcomeDeskReasonsCannotShopService(TapirFactoryTestBase):
     @patch.object(WelcomeDeskReasonsCannotShopService, "should_show_investing_reason")
     @patch.object(WelcomeDeskReasonsCannotShopService, "should_show_frozen_reason")
     @patch.object(WelcomeDeskReasonsCannotShopService, "should_show_paused_reason")
-    def test_buildReasonsWhyThisMemberCannotShop_default_callsAllChecks(self, *mocks):
+    def test_getReasonCodes_default_callsAllChecks(self, *mocks):
         share_owner = ShareOwnerFactory.build()
-        request_user = TapirUserFactory.create()
         reference_time = datetime.datetime.now()
         reference_date = datetime.datetime.today()
         for mock in mocks:
             mock.return_value = True
 
-        reasons = WelcomeDeskReasonsCannotShopService.build_reasons_why_this_member_cannot_shop(
-            share_owner, request_user, reference_time, reference_date
+        reasons = WelcomeDeskReasonsCannotShopService.get_reason_codes(
+            share_owner, reference_time, reference_date
         )
 
         self.assertEqual(5, len(reasons))
@@ -1,6 +1,5 @@
 from unittest.mock import Mock, patch
 
-from tapir.accounts.tests.factories.factories import TapirUserFactory
 from tapir.coop.tests.factories import ShareOwnerFactory
 from tapir.utils.tests_utils import TapirFactoryTestBase
 from tapir.welcomedesk.services.welcome_desk_warnings_service import (
@@ -27,17 +26,16 @@ class TestWelcomeDeskWarningsService(TapirFactoryTestBase):
         )
 
     @patch.object(WelcomeDeskWarningsService, "should_show_welcome_session_warning")
-    def test_buildWarnings_default_callsAllChecks(
+    def test_getWarningCodes_default_callsAllChecks(
         self,
         mock_should_show_welcome_session_warning: Mock,
     ):
         share_owner = ShareOwnerFactory.build()
-        request_user = TapirUserFactory.create()
         mock_should_show_welcome_session_warning.return_value = True
 
-        warnings = WelcomeDeskWarningsService.build_warnings(share_owner, request_user)
+        warnings = WelcomeDeskWarningsService.get_warning_codes(share_owner)
 
-        self.assertEqual(1, len(warnings))
+        self.assertEqual([WelcomeDeskWarningsService.WARNING_WELCOME_SESSION], warnings)
         mock_should_show_welcome_session_warning.assert_called_once_with(
             share_owner=share_owner
         )
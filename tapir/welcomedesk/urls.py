@@ -14,4 +14,9 @@ urlpatterns = [
         views.SearchMemberForWelcomeDeskView.as_view(),
         name="search",
     ),
+    path(
+        "api/eligibility_snapshot",
+        views.WelcomeDeskEligibilitySnapshotView.as_view(),
+        name="eligibility_snapshot",
+    ),
 ]
@@ -7,15 +7,15 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from tapir.coop.models import ShareOwner
-from tapir.coop.services.number_of_shares_service import NumberOfSharesService
 from tapir.settings import PERMISSION_WELCOMEDESK_VIEW
-from tapir.welcomedesk.serializers import ShareOwnerForWelcomeDeskSerializer
-from tapir.welcomedesk.services.welcome_desk_reasons_cannot_shop_service import (
-    WelcomeDeskReasonsCannotShopService,
+from tapir.welcomedesk.serializers import (
+    ShareOwnerForWelcomeDeskSerializer,
+    WelcomeDeskEligibilitySnapshotSerializer,
 )
-from tapir.welcomedesk.services.welcome_desk_warnings_service import (
-    WelcomeDeskWarningsService,
+from tapir.welcomedesk.services.shopping_eligibility_service import (
+    ShoppingEligibilityService,
 )
+from tapir.welcomedesk.utils import get_display_type_for_welcome_desk
 
 
 class WelcomeDeskSearchView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
@@ -27,6 +27,7 @@ class SearchMemberForWelcomeDeskView(
     LoginRequiredMixin, PermissionRequiredMixin, APIView
 ):
     permission_required = PERMISSION_WELCOMEDESK_VIEW
+    MAX_NUMBER_OF_RESULTS = 20
 
     @extend_schema(
         responses={200: ShareOwnerForWelcomeDeskSerializer(many=True)},
@@ -37,17 +38,16 @@ class SearchMemberForWelcomeDeskView(
     def get(self, request):
         search_input = request.query_params.get("search_input")
 
-        reference_time = timezone.now()
-        reference_date = reference_time.date()
-
         share_owners = self.get_share_owners(search_input)
 
-        # Trying to run the annotations on a smaller queryset
         ids = [share_owner.id for share_owner in share_owners]
-        share_owners = ShareOwner.objects.filter(id__in=ids)
-
-        share_owners = self.optimize_queryset(
-            share_owners, reference_time, reference_date
+        eligibilities = ShoppingEligibilityService.get_eligibilities(
+            ids, timezone.now()
+        )
+        share_owners = ShareOwner.objects.filter(id__in=ids).select_related("user")
+        # Keep the order of the search results, best matches first
+        share_owners = sorted(
+            share_owners, key=lambda share_owner: ids.index(share_owner.id)
         )
 
         serializer = ShareOwnerForWelcomeDeskSerializer(
@@ -56,8 +56,7 @@ class SearchMemberForWelcomeDeskView(
             read_only=True,
             context={
                 "request": request,
-                "reference_time": reference_time,
-                "reference_date": reference_date,
+                "eligibilities": eligibilities,
             },
         )
 
@@ -66,23 +65,8 @@ class SearchMemberForWelcomeDeskView(
             status=status.HTTP_200_OK,
         )
 
-    @staticmethod
-    def optimize_queryset(queryset, reference_time, reference_date):
-        queryset = WelcomeDeskWarningsService.optimize_queryset_for_this_service(
-            queryset, reference_time
-        )
-        queryset = (
-            WelcomeDeskReasonsCannotShopService.optimize_queryset_for_this_service(
-                queryset, reference_time=reference_time, reference_date=reference_date
-            )
-        )
-        queryset = NumberOfSharesService.annotate_share_owner_queryset_with_nb_of_active_shares(
-            queryset, reference_date
-        )
-        return queryset
-
-    @staticmethod
-    def get_share_owners(search_input: str):
+    @classmethod
+    def get_share_owners(cls, search_input: str):
         queryset = ShareOwner.objects.all()
 
         if not search_input:
@@ -91,4 +75,64 @@ class SearchMemberForWelcomeDeskView(
         if search_input.isdigit():
             return queryset.filter(id=int(search_input))
 
-        return queryset.with_name(search_input)
+        return queryset.with_name(search_input, limit=cls.MAX_NUMBER_OF_RESULTS)
+
+
+class WelcomeDeskEligibilitySnapshotView(
+    LoginRequiredMixin, PermissionRequiredMixin, APIView
+):
+    """Lets the welcome desk keep a local copy of all members, to search them without a request per keystroke.
+
+    Without since_version, returns all members. With since_version, returns only the members whose
+    eligibility changed after that version. The ETag contains the current version."""
+
+    permission_required = PERMISSION_WELCOMEDESK_VIEW
+
+    @extend_schema(
+        responses={200: WelcomeDeskEligibilitySnapshotSerializer},
+        parameters=[
+            OpenApiParameter(name="since_version", required=False, type=int),
+        ],
+    )
+    def get(self, request):
+        since_version = request.query_params.get("since_version", "0")
+        if not since_version.isdigit():
+            return Response(
+                "since_version must be a positive integer",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        since_version = int(since_version)
+        now = timezone.now()
+
+        # Answering "not modified" must stay cheap: the clients poll this endpoint regularly
+        version = ShoppingEligibilityService.get_version_if_up_to_date(now)
+        if version is not None:
+            etag = self.build_etag(request, version, since_version)
+            if request.headers.get("If-None-Match") == etag:
+                return Response(
+                    status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
+        version, eligibilities = ShoppingEligibilityService.get_changed_eligibilities(
+            since_version, now
+        )
+        etag = self.build_etag(request, version, since_version)
+
+        serializer = WelcomeDeskEligibilitySnapshotSerializer(
+            {
+                "version": version,
+                "nb_members": ShareOwner.objects.count(),
+                "members": eligibilities,
+            },
+            context={"request": request},
+        )
+
+        return Response(
+            serializer.data, status=status.HTTP_200_OK, headers={"ETag": etag}
+        )
+
+    @staticmethod
+    def build_etag(request, version: int, since_version: int) -> str:
+        # The body also depends on the requested version and on how much of the names the viewer may see
+        return f'"{version}-{since_version}-{get_display_type_for_welcome_desk(request.user)}"'